@@ -0,0 +1,58 @@
+#%% CELL 00 — HEADER & OVERVIEW
+"""
+BehaviorClassifier/__init__.py
+
+Overview
+	Lazy package interface for the BehaviorClassifier bundles.
+	Each bundle is an immutable MappingProxyType built by its controller:
+
+	- BC_UTILS      → PARAM-derived dtypes, widths and column selection
+	- BC_LOADERS    → parallel / indexed readers for CSV artifacts
+	- BC_SCHEDULER  → per-stem task DAG + process-pool batch runner
+	- BC_STORAGE    → staging cache, atomic publish, recovery, Error copies, reports
+	- BC_CLASSIFIER → Layer / Resistant / Behavior classification kernels
+	- BC_SYNTHETIC  → PARAM-driven synthetic inputs, faults and experiment trees
+	- BC_BENCHMARK  → per-stage throughput / memory benchmarks + regression gate
+
+Usage
+	from BehaviorClassifier import BC_UTILS, BC_SCHEDULER
+
+Notes
+	* Bundles load on first attribute access (PEP 562); importing the
+	  package does not import NumPy/pandas or touch the filesystem.
+	* Controllers remain importable directly (BehaviorClassifier.scheduler).
+"""
+
+
+#%% CELL 01 — IMPORTS & LAZY EXPORTS
+
+from __future__ import annotations
+import importlib
+
+# Bundle name → controller module
+_LAZY: dict[str, str] = {
+	"BC_UTILS": ".utils",
+	"BC_LOADERS": ".loaders",
+	"BC_SCHEDULER": ".scheduler",
+	"BC_STORAGE": ".storage",
+	"BC_CLASSIFIER": ".classifier",
+	"BC_SYNTHETIC": ".synthetic",
+	"BC_BENCHMARK": ".benchmark",
+}
+
+
+def __getattr__(name: str):
+	"""Resolve bundles lazily (PEP 562)."""
+	if name in _LAZY:
+		module = importlib.import_module(_LAZY[name], __name__)
+		value = getattr(module, name)
+		globals()[name] = value
+		return value
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+	return sorted(list(globals()) + list(_LAZY))
+
+
+__all__ = list(_LAZY)
@@ -0,0 +1,196 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+_benchmark/__init__.py — Benchmark Coordinator
+===============================================
+
+Orchestrates benchmark workers and assembles the BC_BENCHMARK bundle.
+
+Architecture:
+    6 workers → coordinator → controller → BC_BENCHMARK export
+
+Workers (6):
+    1. stages.py: 3 stage functions (stage_names, register_stage,
+       prepare_stages)
+    2. measure.py: 3 measure functions (measure_stages, measure,
+       machine_info)
+    3. baseline.py: 5 baseline functions (load_baseline, save_baseline,
+       meta_mismatch, compare_results, format_report)
+    4. suite.py: 2 suite functions (run_benchmarks, check_regressions)
+    5. faults.py: 1 fault check function (check_faults)
+    6. sharing.py: 1 sharing check function (check_leases)
+
+Total Exports: 15 (validated)
+
+Design:
+    - Coordinator receives the pipeline bundles + benchmark constants from controller
+    - Calls workers in dependency order
+    - Assembles single immutable bundle
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Mapping
+
+from . import baseline, faults, measure, sharing, stages, suite
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for _benchmark coordinator.
+
+Why Empty?
+    Coordinator orchestrates workers (no direct configuration).
+    Sizes, tolerance and baseline file come from benchmark.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - pure orchestration)
+
+#%% CELL 03 — CONFIGURE
+
+def configure(
+    synthetic: Mapping,
+    utils: Mapping,
+    loaders: Mapping,
+    classifier: Mapping,
+    storage: Mapping,
+    scheduler: Mapping,
+    sizes: tuple[int, ...],
+    seed: int,
+    retries: int,
+    repeat: int,
+    min_sample_sec: float,
+    tolerance: float,
+    memory_slack_mb: float,
+    baseline_file: Path,
+    baseline_dir: Path,
+    match_keys: tuple[str, ...],
+    work_dir: Path,
+    publish_durability: str,
+    path_for: Callable[[Path], Mapping],
+    fault_check: Mapping[str, Mapping],
+    fault_frames: int,
+    fault_flies: int,
+    fault_dir: Path,
+    lease_procs: int,
+    lease_flies: int,
+    lease_dir: Path,
+) -> MappingProxyType:
+    """
+    Configure and return the immutable BC_BENCHMARK bundle.
+
+    Args:
+        synthetic: BC_SYNTHETIC bundle (generated inputs).
+        utils: BC_UTILS bundle (stimulus cleaning).
+        loaders: BC_LOADERS bundle (CSV reader).
+        classifier: BC_CLASSIFIER bundle (stage kernels).
+        storage: BC_STORAGE bundle (publish).
+        scheduler: BC_SCHEDULER bundle (leases, run_batch).
+        sizes: Default frames per generated recording.
+        seed: Default generator seed.
+        retries: Gate re-measurements of regressed stage × size pairs.
+        repeat: Interleaved timing rounds per stage.
+        min_sample_sec: Shortest timed sample (seconds).
+        tolerance: Allowed relative regression.
+        memory_slack_mb: Absolute peak-memory allowance (MB).
+        baseline_file: Per-user override baseline JSON.
+        baseline_dir: Committed reference baselines (one per setup key).
+        match_keys: meta keys a run must share with the baseline.
+        work_dir: Scratch folder (load / publish files).
+        publish_durability: Durability of the publish stage.
+        path_for: root → PATH mapping (fault round-trip experiment).
+        fault_check: Faults of the round trip per table kind.
+        fault_frames / fault_flies: Round-trip recording size.
+        fault_dir: Round-trip experiment root.
+        lease_procs / lease_flies: Shared-root check owners and stems.
+        lease_dir: Shared-root check experiment root.
+
+    Returns:
+        MappingProxyType with 15 benchmark exports.
+
+    Orchestration Order (respects dependencies):
+        1. stages → stage registry (needs pipeline bundles)
+        2. measure → timing / memory (needs BC_CLASSIFIER backend)
+        3. baseline → JSON baseline + comparison (needs measure machine_info)
+        4. suite → runner + gate (needs stages + measure + baseline)
+        5. faults → generate / load / score round trip (needs pipeline bundles)
+        6. sharing → multi-process lease check (needs BC_SCHEDULER)
+    """
+    stages_data = stages.configure(
+        synthetic=synthetic,
+        utils=utils,
+        loaders=loaders,
+        classifier=classifier,
+        storage=storage,
+        work_dir=work_dir,
+        publish_durability=publish_durability,
+    )
+
+    measure_data = measure.configure(
+        classifier=classifier,
+        repeat=repeat,
+        min_sample_sec=min_sample_sec,
+    )
+
+    baseline_data = baseline.configure(
+        baseline_file=baseline_file,
+        baseline_dir=baseline_dir,
+        tolerance=tolerance,
+        memory_slack_mb=memory_slack_mb,
+        match_keys=match_keys,
+        machine_info=measure_data["machine_info"],
+    )
+
+    suite_data = suite.configure(
+        stages=stages_data,
+        measure=measure_data,
+        baseline=baseline_data,
+        sizes=sizes,
+        seed=seed,
+        retries=retries,
+    )
+
+    faults_data = faults.configure(
+        synthetic=synthetic,
+        utils=utils,
+        loaders=loaders,
+        classifier=classifier,
+        path_for=path_for,
+        faults=fault_check,
+        n_frames=fault_frames,
+        n_flies=fault_flies,
+        seed=seed,
+        work_dir=fault_dir,
+    )
+
+    sharing_data = sharing.configure(
+        scheduler=scheduler,
+        path_for=path_for,
+        n_procs=lease_procs,
+        n_flies=lease_flies,
+        work_dir=lease_dir,
+    )
+
+    bundle = {
+        **stages_data,
+        **measure_data,
+        **baseline_data,
+        **suite_data,
+        **faults_data,
+        **sharing_data,
+    }
+
+    # Validation: 3 stages + 3 measure + 5 baseline + 2 suite + 1 faults + 1 sharing = 15
+    expected_count = 15
+    assert len(bundle) == expected_count, (
+        f"BC_BENCHMARK export count mismatch: expected {expected_count}, got {len(bundle)}. "
+        f"Keys: {sorted(bundle)}"
+    )
+
+    return MappingProxyType(bundle)
+
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,275 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+baseline.py — Benchmark Baseline and Regression Comparison
+==========================================================
+
+Stores benchmark results as JSON and compares a run against the
+baseline of this setup.
+
+Exports:
+    configure(baseline_file: Path, baseline_dir: Path, tolerance: float, memory_slack_mb: float,
+              match_keys: tuple[str, ...], machine_info: Callable[[], dict]) → dict[str, callable]
+
+Baseline Functions (5 total):
+    - load_baseline(file=None) → results dict
+    - save_baseline(results, file=None, reference=False) → Path
+    - meta_mismatch(results, baseline=None) → {key: (baseline, current)}
+    - compare_results(results, baseline=None, tolerance=None) → list[row]
+    - format_report(rows, only_regressed=False) → str
+
+Results Layout (run_benchmarks output, JSON as stored):
+    {"meta": {machine_info + sizes, seed, created},
+     "stages": {stage: {"<frames>": {"frames", "seconds", "fps", "peak_mb", "loops"}}}}
+
+Regression Rules (per stage × size present in both):
+    fps        regressed when current < baseline × (1 − tolerance)
+    peak_mb    regressed when current > baseline × (1 + tolerance) + memory_slack_mb
+
+Row:
+    {"stage", "frames", "metric", "baseline", "current", "change", "regressed"}
+    change = current / baseline − 1 (None for stages / sizes new to the run)
+
+Baseline Lookup (load_baseline with file=None):
+    1. baseline_file (per-user override, written by save_baseline / --update)
+    2. baseline_dir/<setup key>.json (committed reference of this setup;
+       key = match_keys values of meta, joined)
+    3. the committed reference sharing the most match_keys values → the
+       gate then names the differing facts (meta_mismatch)
+    4. nothing committed → FileNotFoundError
+
+Comparable Runs (meta_mismatch):
+    the run and the baseline must agree on every match_keys entry of meta
+    (machine, cpu_count, kernel_backend, python, numpy, pandas); fps
+    against a baseline from another host or library stack is not a
+    regression signal
+
+Notes:
+    - Throughput baselines are setup-specific: references are committed per
+      setup key (save_baseline(reference=True) / --reference); the cache
+      file only overrides them on one machine
+    - Stages / sizes only in the baseline are ignored (subset runs)
+    - The slack keeps tiny peaks (a few KB of bookkeeping) from flapping
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import json
+import os
+import re
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for baseline.py.
+
+Why Empty?
+    Baseline files, tolerance and memory slack come from benchmark.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — METRICS
+
+# metric → True when larger is better
+_METRICS: dict[str, bool] = {"fps": True, "peak_mb": False}
+
+
+def _setup_key(meta: Mapping, match_keys: tuple[str, ...]) -> str:
+    """File stem of a committed baseline: match_keys values of meta, joined ('x86_64_1_numpy_3.11.7_...')."""
+    return "_".join(re.sub(r"[^A-Za-z0-9.+-]+", "-", str(meta.get(k))) for k in match_keys)
+
+
+#%% CELL 04 — BASELINE FUNCTION FACTORY
+
+def _create_baseline_functions(
+    baseline_file: Path,
+    baseline_dir: Path,
+    tolerance: float,
+    memory_slack_mb: float,
+    match_keys: tuple[str, ...],
+    machine_info: Callable[[], dict],
+) -> dict[str, Callable]:
+    """
+    Create baseline I/O and comparison bound to the controller defaults.
+
+    Returns:
+        Dictionary with 5 baseline functions.
+    """
+    default_file, default_tol = baseline_file, tolerance
+
+    def load_baseline(file: Path | str | None = None) -> dict:
+        """
+        Read a stored result set (file=None → see Baseline Lookup).
+
+        Raises:
+            FileNotFoundError: `file` does not exist, or no baseline is committed.
+        """
+        if file is not None:
+            p = Path(file)
+        elif default_file.exists():
+            p = default_file
+        else:
+            now = machine_info()
+            p = baseline_dir / f"{_setup_key(now, match_keys)}.json"
+            committed = sorted(baseline_dir.glob("*.json"))
+            if not p.exists() and committed:
+                metas = {c: json.loads(c.read_text()).get("meta", {}) for c in committed}
+                p = max(committed, key=lambda c: sum(metas[c].get(k) == now.get(k) for k in match_keys))
+        if not p.exists():
+            raise FileNotFoundError(
+                f"No benchmark baseline at {p} (record one with save_baseline or "
+                f"python -m BehaviorClassifier.benchmark --update / --reference)"
+            )
+        return json.loads(p.read_text())
+
+    def save_baseline(results: Mapping, file: Path | str | None = None, reference: bool = False) -> Path:
+        """
+        Write a result set as the baseline (temp file + os.replace).
+
+        Args:
+            results: run_benchmarks output.
+            file: Target JSON (default: the per-user override).
+            reference: Write the committed reference of the run's setup instead.
+
+        Examples:
+            save_baseline(run_benchmarks())                   # override on this machine
+            save_baseline(run_benchmarks(), reference=True)   # baseline_dir/<setup key>.json
+        """
+        if reference:
+            p = baseline_dir / f"{_setup_key(results.get('meta', {}), match_keys)}.json"
+        else:
+            p = Path(default_file if file is None else file)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_name(f".{p.name}.tmp")
+        tmp.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        os.replace(tmp, p)
+        return p
+
+    def meta_mismatch(results: Mapping, baseline: Mapping | None = None) -> dict[str, tuple]:
+        """
+        Setup facts that differ between a run and the baseline (see Comparable Runs).
+
+        Returns:
+            key → (baseline value, current value); {} when comparable.
+
+        Examples:
+            meta_mismatch(run_benchmarks(sizes=[36_000]))   # {"cpu_count": (1, 8)}
+        """
+        base = load_baseline() if baseline is None else baseline
+        was, now = base.get("meta", {}), results.get("meta", {})
+        return {k: (was.get(k), now.get(k)) for k in match_keys if was.get(k) != now.get(k)}
+
+    def compare_results(
+        results: Mapping,
+        baseline: Mapping | None = None,
+        tolerance: float | None = None,
+    ) -> list[dict]:
+        """
+        Compare a run with the baseline (see Regression Rules).
+
+        Args:
+            results: run_benchmarks output.
+            baseline: Stored result set (default: load_baseline()).
+            tolerance: Allowed relative regression (default from controller).
+
+        Returns:
+            Rows (see Row) in run order.
+
+        Examples:
+            failed = [r for r in compare_results(run_benchmarks()) if r["regressed"]]
+        """
+        base = load_baseline() if baseline is None else baseline
+        tol = default_tol if tolerance is None else tolerance
+        rows = []
+        for stage, sizes in results["stages"].items():
+            for frames, cur in sizes.items():
+                ref = base.get("stages", {}).get(stage, {}).get(str(frames))
+                for metric, higher in _METRICS.items():
+                    now = float(cur[metric])
+                    if ref is None:
+                        rows.append({"stage": stage, "frames": int(frames), "metric": metric, "baseline": None,
+                                     "current": now, "change": None, "regressed": False})
+                        continue
+                    was = float(ref[metric])
+                    if higher:
+                        bad = now < was * (1.0 - tol)
+                    else:
+                        bad = now > was * (1.0 + tol) + memory_slack_mb
+                    rows.append({
+                        "stage": stage, "frames": int(frames), "metric": metric,
+                        "baseline": was, "current": now,
+                        "change": now / was - 1.0 if was else None,
+                        "regressed": bool(bad),
+                    })
+        return rows
+
+    def format_report(rows: Iterable[Mapping], only_regressed: bool = False) -> str:
+        """
+        Fixed-width table of comparison rows.
+
+        Examples:
+            print(format_report(compare_results(results)))
+        """
+        lines = [f"{'stage':<16}{'frames':>10}  {'metric':<8}{'baseline':>14}{'current':>14}{'change':>9}  status"]
+        for r in rows:
+            if only_regressed and not r["regressed"]:
+                continue
+            was = "-" if r["baseline"] is None else f"{r['baseline']:.4g}"
+            change = "-" if r["change"] is None else f"{r['change']:+.1%}"
+            status = "REGRESSED" if r["regressed"] else ("new" if r["baseline"] is None else "ok")
+            lines.append(f"{r['stage']:<16}{r['frames']:>10}  {r['metric']:<8}{was:>14}{r['current']:>14.4g}{change:>9}  {status}")
+        return "\n".join(lines)
+
+    return {
+        "load_baseline": load_baseline,
+        "save_baseline": save_baseline,
+        "meta_mismatch": meta_mismatch,
+        "compare_results": compare_results,
+        "format_report": format_report,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    baseline_file: Path,
+    baseline_dir: Path,
+    tolerance: float,
+    memory_slack_mb: float,
+    match_keys: tuple[str, ...],
+    machine_info: Callable[[], dict],
+) -> dict[str, Callable]:
+    """
+    Generate baseline functions.
+
+    Args:
+        baseline_file: Per-user override baseline JSON.
+        baseline_dir: Folder of committed reference baselines (one per setup key).
+        tolerance: Default allowed relative regression (0.05 = 5%).
+        memory_slack_mb: Absolute peak-memory allowance (MB).
+        match_keys: meta keys a run must share with the baseline.
+        machine_info: Current setup facts (measure worker).
+
+    Returns:
+        Dictionary with 5 baseline functions.
+
+    Validation:
+        Asserts 5 functions returned and 0 ≤ tolerance < 1.
+    """
+    assert 0.0 <= tolerance < 1.0, f"tolerance must be in [0, 1), got {tolerance}"
+    assert memory_slack_mb >= 0.0, f"memory_slack_mb must be ≥ 0, got {memory_slack_mb}"
+    functions = _create_baseline_functions(
+        Path(baseline_file), Path(baseline_dir), tolerance, memory_slack_mb, tuple(match_keys), machine_info,
+    )
+
+    # Validation
+    assert len(functions) == 5, f"Expected 5 baseline functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,213 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+faults.py — End-to-End Fault Round Trip
+=======================================
+
+Writes a generated experiment with every fault injected, then loads and
+scores it through the public loaders, so a generator fault the pipeline
+cannot read fails loudly instead of only in a real run.
+
+Exports:
+    configure(synthetic: Mapping, utils: Mapping, loaders: Mapping, classifier: Mapping, path_for: Callable, faults: Mapping, n_frames: int, n_flies: int, seed: int, work_dir: Path) → dict[str, callable]
+
+Fault Check Functions (1 total):
+    - check_faults(faults=None, n_frames=None, n_flies=None, seed=None, root=None) → {stem: summary}
+
+Round Trip (one BASE, every fly):
+    1. write_experiment with `faults` on base / tracked / sleap (fault_fraction=1)
+    2. tracked: read_csv_parallel (whole file) and load_stem with a frame
+       window (frame index + span read)
+    3. sleap: load_stem (whole file)
+    4. stem_stimulus_events of the tracked CSV
+    5. score_flies on all loaded tracked tables
+
+Checks (per stem):
+    - every step above runs without raising
+    - windowed rows == rows of the whole table inside the window
+    - scored rows == loaded tracked rows
+    - stimulus offsets lie within the loaded rows
+
+Summary:
+    {"rows", "window_rows", "sleap_rows", "nan_cells", "events", "scored_rows"}
+
+Notes:
+    - All failures are collected first, then raised together
+      (RuntimeError listing stem, step and error)
+    - The experiment root is rewritten on every call
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import shutil
+from pathlib import Path
+from typing import Callable, Mapping
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for faults.py.
+
+Why Empty?
+    Faults, recording size and root come from benchmark.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — FAULT CHECK FUNCTION FACTORY
+
+def _create_fault_check_functions(
+    synthetic: Mapping,
+    utils: Mapping,
+    loaders: Mapping,
+    classifier: Mapping,
+    path_for: Callable[[Path], Mapping],
+    faults: Mapping[str, Mapping],
+    n_frames: int,
+    n_flies: int,
+    seed: int,
+    work_dir: Path,
+) -> dict[str, Callable]:
+    """
+    Create the round-trip check bound to the pipeline bundles.
+
+    Returns:
+        Dictionary with 1 fault check function.
+    """
+    defaults = (faults, n_frames, n_flies, seed, work_dir)
+
+    def check_faults(
+        faults: Mapping[str, Mapping] | None = None,
+        n_frames: int | None = None,
+        n_flies: int | None = None,
+        seed: int | None = None,
+        root: Path | str | None = None,
+    ) -> dict[str, dict]:
+        """
+        Generate, load and score a fully faulted experiment (see Round Trip).
+
+        Args:
+            faults: {"base" | "tracked" | "sleap": inject_faults kwargs} (default from controller).
+            n_frames: Frames per fly (default from controller).
+            n_flies: Flies in the BASE (default from controller).
+            seed: Generator seed (default from controller).
+            root: Experiment root to (re)write (default from controller).
+
+        Returns:
+            stem → summary (see Summary).
+
+        Raises:
+            RuntimeError: A step failed or a check did not hold.
+
+        Examples:
+            BC_BENCHMARK["check_faults"]()
+            BC_BENCHMARK["check_faults"](faults={"tracked": {"nan_runs": 50}}, n_frames=100_000)
+        """
+        f, n, k, s, r = (d if v is None else v for d, v in zip(defaults, (faults, n_frames, n_flies, seed, root)))
+        root = Path(r)
+        shutil.rmtree(root, ignore_errors=True)
+        path = path_for(root)
+        truth = synthetic["write_experiment"](path, n_bases=1, n_flies=k, n_frames=n, seed=s, faults=f, fault_fraction=1.0)
+
+        failures: list[str] = []
+        summary: dict[str, dict] = {}
+        tables = {}
+
+        def step(stem: str, name: str, fn: Callable[[], object]):
+            try:
+                return fn()
+            except Exception as exc:
+                failures.append(f"{stem}: {name}: {type(exc).__name__}: {exc}")
+                return None
+
+        for stem in truth:
+            tracked = step(stem, "read_csv_parallel", lambda: loaders["read_csv_parallel"](path["tracked_path"](stem)))
+            sleap = step(stem, "load_stem sleap", lambda: loaders["load_stem"](stem, kind="sleap", path=path))
+            events = step(stem, "stem_stimulus_events", lambda: utils["stem_stimulus_events"](stem, path=path, refresh=True))
+            if tracked is None:
+                continue
+            tables[stem] = tracked
+            frames = tracked["FrameIndex"].to_numpy()
+            lo, hi = (int(frames[len(frames) // 4]), int(frames[len(frames) // 2])) if len(frames) else (0, 0)
+            window = step(stem, "load_stem window", lambda: loaders["load_stem"](stem, kind="tracked", frames=(lo, hi), path=path))
+            expect = int(((frames >= lo) & (frames < hi)).sum())
+            if window is not None and len(window) != expect:
+                failures.append(f"{stem}: load_stem window: {len(window)} rows, expected {expect}")
+            if events is not None:
+                late = [c for c, (_, off) in events.items() if len(off) and off.max() > len(tracked)]
+                if late:
+                    failures.append(f"{stem}: stem_stimulus_events: offsets past {len(tracked)} rows in {late}")
+            summary[stem] = {
+                "rows": len(tracked),
+                "window_rows": None if window is None else len(window),
+                "sleap_rows": None if sleap is None else len(sleap),
+                "nan_cells": int(tracked.isna().to_numpy().sum()),
+                "events": None if events is None else {c: len(on) for c, (on, _) in events.items()},
+                "scored_rows": None,
+            }
+
+        scored = step("*", "score_flies", lambda: classifier["score_flies"](list(tables.values()), stems=list(tables)))
+        if scored is not None:
+            for (stem, tracked), out in zip(tables.items(), scored):
+                summary[stem]["scored_rows"] = len(out)
+                if len(out) != len(tracked):
+                    failures.append(f"{stem}: score_flies: {len(out)} rows, expected {len(tracked)}")
+        if failures:
+            raise RuntimeError(f"{len(failures)} fault round-trip failure(s):\n" + "\n".join(failures))
+        return summary
+
+    return {
+        "check_faults": check_faults,
+    }
+
+
+#%% CELL 04 — CONFIGURE
+
+def configure(
+    synthetic: Mapping,
+    utils: Mapping,
+    loaders: Mapping,
+    classifier: Mapping,
+    path_for: Callable[[Path], Mapping],
+    faults: Mapping[str, Mapping],
+    n_frames: int,
+    n_flies: int,
+    seed: int,
+    work_dir: Path,
+) -> dict[str, Callable]:
+    """
+    Generate fault check functions.
+
+    Args:
+        synthetic: BC_SYNTHETIC bundle (write_experiment).
+        utils: BC_UTILS bundle (stem_stimulus_events).
+        loaders: BC_LOADERS bundle (read_csv_parallel, load_stem).
+        classifier: BC_CLASSIFIER bundle (score_flies).
+        path_for: root → PATH mapping (Config.path configure).
+        faults: Default {"base" | "tracked" | "sleap": inject_faults kwargs}.
+        n_frames: Default frames per fly.
+        n_flies: Default flies in the BASE.
+        seed: Default generator seed.
+        work_dir: Default experiment root of the round trip.
+
+    Returns:
+        Dictionary with 1 fault check function.
+
+    Validation:
+        Asserts 1 function returned, known fault kinds and positive sizes.
+    """
+    unknown = set(faults) - {"base", "tracked", "sleap"}
+    assert not unknown, f"Unknown fault kinds: {sorted(unknown)}"
+    assert n_frames > 0 and n_flies > 0, f"Round trip needs frames and flies, got {n_frames}, {n_flies}"
+    functions = _create_fault_check_functions(
+        synthetic, utils, loaders, classifier, path_for, faults, n_frames, n_flies, seed, Path(work_dir),
+    )
+
+    # Validation
+    assert len(functions) == 1, f"Expected 1 fault check function, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 05 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,202 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+measure.py — Stage Throughput and Peak Memory
+=============================================
+
+Times zero-argument stages and records their peak traced memory.
+
+Exports:
+    configure(classifier: Mapping, repeat: int, min_sample_sec: float) → dict[str, callable]
+
+Measure Functions (3 total):
+    - measure_stages(stages, frames, repeat=None) → {name: {"frames", "seconds", "fps", "peak_mb", "loops"}}
+    - measure(fn, frames, repeat=None) → {"frames", "seconds", "fps", "peak_mb", "loops"}
+    - machine_info() → {"python", "numpy", "pandas", "platform", "machine", "cpu_count", "kernel_backend"}
+
+Timing Rules:
+    1. One warm-up call per stage (caches, JIT compilation) is not timed
+    2. Calls are batched into samples of ≥ min_sample_sec (loops per sample)
+    3. Samples are interleaved: each of `repeat` rounds times every stage
+       once, so a slow spell of the host hits all stages a little instead
+       of one stage entirely
+    4. seconds = best sample per call (GC off while timing); fps = frames / seconds
+
+Memory Rule:
+    peak_mb = tracemalloc peak above the starting level during one extra
+    call (Python and NumPy allocations; buffers allocated outside the
+    Python allocator are not seen)
+
+Notes:
+    - The memory call is separate: tracing never slows the timed samples
+    - The best sample (not the mean) is the least noisy throughput estimate:
+      host noise only ever adds time
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import gc
+import math
+import os
+import platform
+import time
+import tracemalloc
+from typing import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for measure.py.
+
+Why Empty?
+    Repeat count and sample length come from benchmark.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — MEASURE KERNELS
+
+def _sample(fn: Callable[[], object], loops: int) -> float:
+    """Seconds per call over `loops` calls."""
+    t0 = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return (time.perf_counter() - t0) / loops
+
+
+def _peak_bytes(fn: Callable[[], object]) -> int:
+    """Traced peak above the current level during one call."""
+    gc.collect()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    try:
+        fn()
+        return max(0, tracemalloc.get_traced_memory()[1] - start)
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+
+#%% CELL 04 — MEASURE FUNCTION FACTORY
+
+def _create_measure_functions(classifier: Mapping, repeat: int, min_sample_sec: float) -> dict[str, Callable]:
+    """
+    Create measurement functions bound to the controller defaults.
+
+    Returns:
+        Dictionary with 3 measure functions.
+    """
+    default_repeat = repeat
+
+    def measure_stages(
+        stages: Mapping[str, Callable[[], object]],
+        frames: int,
+        repeat: int | None = None,
+    ) -> dict[str, dict[str, float]]:
+        """
+        Throughput and peak memory of several stages (see Timing / Memory Rules).
+
+        Args:
+            stages: name → zero-argument stage call (run order).
+            frames: Frames processed per call.
+            repeat: Timing rounds (default from controller).
+
+        Returns:
+            name → {"frames", "seconds", "fps", "peak_mb", "loops"}.
+
+        Examples:
+            m = measure_stages(prepare_stages(216_000), 216_000)
+            m["layer2"]["fps"]
+        """
+        rounds = max(1, default_repeat if repeat is None else repeat)
+        loops: dict[str, int] = {}
+        for name, fn in stages.items():
+            t0 = time.perf_counter()
+            fn()
+            warm = time.perf_counter() - t0
+            loops[name] = max(1, math.ceil(min_sample_sec / warm)) if warm > 0 else 1000
+        best = dict.fromkeys(stages, math.inf)
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(rounds):
+                for name, fn in stages.items():
+                    best[name] = min(best[name], _sample(fn, loops[name]))
+        finally:
+            if enabled:
+                gc.enable()
+        return {
+            name: {
+                "frames": int(frames),
+                "seconds": best[name],
+                "fps": frames / best[name] if best[name] > 0 else math.inf,
+                "peak_mb": _peak_bytes(fn) / 1024**2,
+                "loops": loops[name],
+            }
+            for name, fn in stages.items()
+        }
+
+    def measure(fn: Callable[[], object], frames: int, repeat: int | None = None) -> dict[str, float]:
+        """
+        Throughput and peak memory of one stage.
+
+        Examples:
+            m = measure(lambda: layer1_codes(speed, motion), len(speed))
+            m["fps"], m["peak_mb"]
+        """
+        return measure_stages({"stage": fn}, frames, repeat)["stage"]
+
+    def machine_info() -> dict[str, object]:
+        """Interpreter, library and host facts stored with every result set."""
+        return {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "kernel_backend": classifier["active_backend"](),
+        }
+
+    return {
+        "measure_stages": measure_stages,
+        "measure": measure,
+        "machine_info": machine_info,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(classifier: Mapping, repeat: int, min_sample_sec: float) -> dict[str, Callable]:
+    """
+    Generate measure functions.
+
+    Args:
+        classifier: BC_CLASSIFIER bundle (active_backend).
+        repeat: Default interleaved timing rounds.
+        min_sample_sec: Shortest timed sample (seconds).
+
+    Returns:
+        Dictionary with 3 measure functions.
+
+    Validation:
+        Asserts 3 functions returned and positive repeat / sample length.
+    """
+    assert repeat >= 1, f"repeat must be ≥ 1, got {repeat}"
+    assert min_sample_sec > 0, f"min_sample_sec must be > 0, got {min_sample_sec}"
+    functions = _create_measure_functions(classifier, repeat, min_sample_sec)
+
+    # Validation
+    assert len(functions) == 3, f"Expected 3 measure functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
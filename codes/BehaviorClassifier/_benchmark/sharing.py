@@ -0,0 +1,212 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+sharing.py — Shared-Root Lease Check
+====================================
+
+Runs several owner processes against one experiment root, each calling
+run_batch(leases=...), and checks that the stems were split between them
+with every stem scored exactly once.
+
+Exports:
+    configure(scheduler: Mapping, path_for: Callable, n_procs: int, n_flies: int, work_dir: Path) → dict[str, callable]
+
+Sharing Check Functions (1 total):
+    - check_leases(n_procs=None, n_flies=None, root=None) → {owner: stems scored}
+
+Round Trip:
+    1. Rewrite `root` with `n_flies` tiny tracked files (one BASE)
+    2. Start `n_procs` processes together; each opens its own LeaseManager
+       and runs run_batch inline (max_workers=0) with a slow score stage
+       that creates its output with O_EXCL (a second scorer fails)
+
+Checks:
+    - no task failed or errored (nobody scored a stem twice)
+    - every stem has its scored output
+    - more than one owner scored stems (claims are lazy, not up front)
+    - one journal per owner; no lease left behind
+
+Notes:
+    - Owners are forked processes (POSIX only); each behaves like a machine
+    - All failures are collected first, then raised together (RuntimeError)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import multiprocessing
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Callable, Mapping
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for sharing.py.
+
+Why Empty?
+    Process count, recording count and root come from benchmark.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — OWNER PROCESS
+
+# Score stage duration: long enough for owners to overlap
+_SCORE_SEC = 0.05
+
+# BASE of the generated stems
+_BASE = "20240101_LeaseCheck"
+
+
+def _preflight(stem: str, paths: dict[str, Path]) -> None:
+    return None
+
+
+def _score_once(stem: str, paths: dict[str, Path]) -> None:
+    """Create the scored output exclusively (FileExistsError → scored twice)."""
+    time.sleep(_SCORE_SEC)
+    out = paths["scored"]
+    out.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(out, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    try:
+        os.write(fd, str(os.getpid()).encode("ascii"))
+    finally:
+        os.close(fd)
+
+
+def _owner(scheduler: Mapping, path: Mapping, start, results) -> None:
+    """One owner (runs in a forked process): lease-driven run_batch, report to `results`."""
+    start.wait()
+    with scheduler["open_leases"](path=path) as leases:
+        r = scheduler["run_batch"](
+            {"preflight": _preflight, "score": _score_once},
+            path=path, leases=leases, max_workers=0, max_retries=0, record_digests=False,
+        )
+    scored = sorted(k.split(":")[0] for k, o in r["outcomes"].items() if k.endswith(":score") and o == "ok")
+    results.put((leases.owner, scored, r["counts"]))
+
+
+#%% CELL 04 — SHARING CHECK FUNCTION FACTORY
+
+def _create_sharing_functions(
+    scheduler: Mapping,
+    path_for: Callable[[Path], Mapping],
+    n_procs: int,
+    n_flies: int,
+    work_dir: Path,
+) -> dict[str, Callable]:
+    """
+    Create the shared-root check bound to BC_SCHEDULER.
+
+    Returns:
+        Dictionary with 1 sharing check function.
+    """
+    defaults = (n_procs, n_flies, work_dir)
+
+    def check_leases(
+        n_procs: int | None = None,
+        n_flies: int | None = None,
+        root: Path | str | None = None,
+    ) -> dict[str, list[str]]:
+        """
+        Split one root between several owner processes (see Round Trip).
+
+        Args:
+            n_procs: Owner processes (default from controller).
+            n_flies: Stems in the root (default from controller).
+            root: Experiment root to (re)write (default from controller).
+
+        Returns:
+            owner → stems it scored.
+
+        Raises:
+            RuntimeError: A check did not hold (see Checks).
+
+        Examples:
+            BC_BENCHMARK["check_leases"]()
+            BC_BENCHMARK["check_leases"](n_procs=4, n_flies=40)
+        """
+        n, k, r = (d if v is None else v for d, v in zip(defaults, (n_procs, n_flies, root)))
+        root = Path(r)
+        shutil.rmtree(root, ignore_errors=True)
+        path = path_for(root)
+        stems = [f"{_BASE}_fly{i}" for i in range(1, k + 1)]
+        for stem in stems:
+            tracked = path["tracked_path"](stem)
+            tracked.parent.mkdir(parents=True, exist_ok=True)
+            tracked.write_text("FrameIndex\n0\n", encoding="utf-8")
+
+        ctx = multiprocessing.get_context("fork")
+        start, results = ctx.Event(), ctx.Queue()
+        procs = [ctx.Process(target=_owner, args=(scheduler, path, start, results)) for _ in range(n)]
+        for proc in procs:
+            proc.start()
+        start.set()
+        reports = [results.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+
+        failures: list[str] = []
+        owners = {owner: scored for owner, scored, _ in reports}
+        for owner, _, counts in reports:
+            bad = {o: c for o, c in counts.items() if o in ("error", "failed")}
+            if bad:
+                failures.append(f"{owner}: {bad} (a stem was scored twice)")
+        missing = [s for s in stems if not path["scored_path"](s).exists()]
+        if missing:
+            failures.append(f"not scored: {missing}")
+        if n > 1 and k >= n and sum(1 for scored in owners.values() if scored) < 2:
+            failures.append(f"one owner took every stem: { {o: len(s) for o, s in owners.items()} }")
+        journals = list(path["pBehaviorClassification"].glob("*.jsonl"))
+        if len(journals) != n:
+            failures.append(f"expected {n} owner journals, found {[j.name for j in journals]}")
+        left = [s["stem"] for s in scheduler["lease_status"](path=path)]
+        if left:
+            failures.append(f"leases left behind: {left}")
+        if failures:
+            raise RuntimeError(f"{len(failures)} shared-root failure(s):\n" + "\n".join(failures))
+        return owners
+
+    return {
+        "check_leases": check_leases,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    scheduler: Mapping,
+    path_for: Callable[[Path], Mapping],
+    n_procs: int,
+    n_flies: int,
+    work_dir: Path,
+) -> dict[str, Callable]:
+    """
+    Generate sharing check functions.
+
+    Args:
+        scheduler: BC_SCHEDULER bundle (open_leases, run_batch, lease_status).
+        path_for: root → PATH mapping (Config.path configure).
+        n_procs: Default owner processes.
+        n_flies: Default stems in the root.
+        work_dir: Default experiment root of the check.
+
+    Returns:
+        Dictionary with 1 sharing check function.
+
+    Validation:
+        Asserts 1 function returned and positive sizes.
+    """
+    assert n_procs > 0 and n_flies > 0, f"Lease check needs owners and stems, got {n_procs}, {n_flies}"
+    functions = _create_sharing_functions(scheduler, path_for, n_procs, n_flies, Path(work_dir))
+
+    # Validation
+    assert len(functions) == 1, f"Expected 1 sharing check function, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
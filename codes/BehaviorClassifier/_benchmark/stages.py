@@ -0,0 +1,263 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+stages.py — Benchmark Stage Registry
+====================================
+
+Pipeline stages as zero-argument callables over one generated fly, so
+each stage can be timed on its own inputs (upstream results are
+computed once, untimed).
+
+Exports:
+    configure(synthetic: Mapping, utils: Mapping, loaders: Mapping, classifier: Mapping, storage: Mapping, work_dir: Path, publish_durability: str) → dict[str, callable]
+
+Stage Functions (3 total):
+    - stage_names() → list[str] (pipeline order)
+    - register_stage(name, prepare) → None
+    - prepare_stages(n_frames, seed=None, names=None, work_dir=None) → {name: callable}
+
+Stages (built in, pipeline order):
+    load            BC_LOADERS read_csv_parallel of the tracked CSV
+    stimulus_clean  BC_UTILS clean_stimuli (all stimulus channels)
+    features        build_features (Position, Speed, Motion)
+    layer1          layer1_codes from Speed / Motion
+    denoise         denoise_speed → Layer1_Denoised (remove_micro_bouts)
+    layer2          layer2 + layer2_denoised (windowed voting)
+    resistant       resistant_codes on Layer2 / Layer2_Denoised
+    behavior        behavior_codes + fill_gaps (Behavior_Denoised)
+    classify        score_flies end to end (stack → classify → unstack)
+    pose            BC_CLASSIFIER pose_table of the sleap table
+    qc              BC_CLASSIFIER qc_table of the scored table
+    publish         BC_STORAGE publish_batch of the scored CSV
+
+Context (passed to each prepare):
+    n_frames, tracked, sleap, csv, onsets, response, features, layer1,
+    layer1_denoised, layer2, layer2_denoised, resistant,
+    resistant_denoised, scored, work_dir
+
+Notes:
+    - The tracked and sleap tables come from BC_SYNTHETIC
+      recording(n_frames, seed=seed): the same seed gives the same inputs
+    - Other stages plug in with register_stage(name, prepare) and run
+      after the built-ins
+    - publish uses publish_durability (default "none": the CPU cost of
+      writing, not the disk's fsync latency)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for stages.py.
+
+Why Empty?
+    Work directory and publish durability come from benchmark.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — CONTEXT
+
+Prepare = Callable[[Mapping], Callable[[], object]]
+
+_CSV_NAME: str = "bench_tracked.csv"
+_PUBLISH_NAME: str = "bench_scored.csv"
+
+
+#%% CELL 04 — STAGE FUNCTION FACTORY
+
+def _create_stage_functions(
+    synthetic: Mapping,
+    utils: Mapping,
+    loaders: Mapping,
+    classifier: Mapping,
+    storage: Mapping,
+    work_dir: Path,
+    publish_durability: str,
+) -> dict[str, Callable]:
+    """
+    Create the stage registry bound to the pipeline bundles.
+
+    Returns:
+        Dictionary with 3 stage functions.
+    """
+    C = classifier
+
+    def _publish(ctx: Mapping) -> Callable[[], object]:
+        final = ctx["work_dir"] / _PUBLISH_NAME
+        write = lambda p: ctx["scored"].to_csv(p, index=False)
+        return lambda: storage["publish_batch"]([(final, write)], durability=publish_durability)
+
+    registry: dict[str, Prepare] = {
+        "load": lambda ctx: lambda: loaders["read_csv_parallel"](ctx["csv"]),
+        "stimulus_clean": lambda ctx: lambda: utils["clean_stimuli"](ctx["tracked"]),
+        "features": lambda ctx: lambda: C["build_features"](
+            ctx["tracked"]["NormalizedCentroidX"].to_numpy(np.float64),
+            ctx["tracked"]["NormalizedCentroidY"].to_numpy(np.float64),
+            ctx["tracked"]["PixelChange"].to_numpy(np.float64),
+        ),
+        "layer1": lambda ctx: lambda: C["layer1_codes"](ctx["features"]["Speed"], ctx["features"]["Motion"]),
+        "denoise": lambda ctx: lambda: C["remove_micro_bouts"](C["layer1_codes"](
+            C["denoise_speed"](ctx["features"]["Speed"], ctx["response"]), ctx["features"]["Motion"],
+        )),
+        "layer2": lambda ctx: lambda: (C["layer2"](ctx["layer1"]), C["layer2_denoised"](ctx["layer1_denoised"])),
+        "resistant": lambda ctx: lambda: (
+            C["resistant_codes"](ctx["layer2"], np.zeros_like(ctx["onsets"]), ctx["onsets"]),
+            C["resistant_codes"](ctx["layer2_denoised"], np.zeros_like(ctx["onsets"]), ctx["onsets"]),
+        ),
+        "behavior": lambda ctx: lambda: (
+            C["behavior_codes"](ctx["layer2"], ctx["resistant"]),
+            C["fill_gaps"](C["behavior_codes"](ctx["layer2_denoised"], ctx["resistant_denoised"]), skip=ctx["response"]),
+        ),
+        "classify": lambda ctx: lambda: C["score_flies"]([ctx["tracked"]]),
+        "pose": lambda ctx: lambda: C["pose_table"](ctx["sleap"]),
+        "qc": lambda ctx: lambda: C["qc_table"](ctx["scored"], tag="scored"),
+        "publish": _publish,
+    }
+    default_dir = work_dir
+
+    def _context(n_frames: int, seed: int | None, root: Path, write_csv: bool) -> dict:
+        rec = synthetic["recording"](n_frames, seed=seed)
+        tracked, sleap = rec["tracked"][0], rec["sleap"][0]
+        root.mkdir(parents=True, exist_ok=True)
+        csv = root / _CSV_NAME
+        if write_csv:
+            tracked.to_csv(csv, index=False)
+        events = utils["stimulus_events"](tracked)
+        onsets = np.concatenate([on for on, _ in events.values()] or [np.empty(0, dtype=np.int64)])
+        response = C["response_mask"](n_frames, onsets)
+        rows = np.zeros_like(onsets)
+        feat = C["build_features"](
+            tracked["NormalizedCentroidX"].to_numpy(np.float64),
+            tracked["NormalizedCentroidY"].to_numpy(np.float64),
+            tracked["PixelChange"].to_numpy(np.float64),
+        )
+        layer1 = C["layer1_codes"](feat["Speed"], feat["Motion"])
+        layer1_den = C["remove_micro_bouts"](C["layer1_codes"](C["denoise_speed"](feat["Speed"], response), feat["Motion"]))
+        layer2 = np.asarray(C["layer2"](layer1).codes, dtype=np.int16)
+        layer2_den = np.asarray(C["layer2_denoised"](layer1_den).codes, dtype=np.int16)
+        return {
+            "n_frames": n_frames,
+            "tracked": tracked,
+            "sleap": sleap,
+            "csv": csv,
+            "onsets": onsets,
+            "response": response,
+            "features": feat,
+            "layer1": layer1,
+            "layer1_denoised": layer1_den,
+            "layer2": layer2,
+            "layer2_denoised": layer2_den,
+            "resistant": C["resistant_codes"](layer2, rows, onsets),
+            "resistant_denoised": C["resistant_codes"](layer2_den, rows, onsets),
+            "scored": C["score_flies"]([tracked])[0],
+            "work_dir": root,
+        }
+
+    def stage_names() -> list[str]:
+        """Registered stages in run order (built-ins, then registered ones)."""
+        return list(registry)
+
+    def register_stage(name: str, prepare: Prepare) -> None:
+        """
+        Add (or replace) a stage.
+
+        Args:
+            name: Stage name (a replaced stage keeps its position).
+            prepare: ctx → zero-argument callable running the stage once
+                     (see Context).
+
+        Examples:
+            register_stage("scored_csv", lambda ctx: lambda: ctx["scored"].to_csv(ctx["work_dir"] / "scored.csv"))
+        """
+        if not callable(prepare):
+            raise TypeError(f"Stage {name!r}: prepare must be callable, got {type(prepare).__name__}")
+        registry[name] = prepare
+
+    def prepare_stages(
+        n_frames: int,
+        seed: int | None = None,
+        names: Iterable[str] | None = None,
+        work_dir: Path | str | None = None,
+    ) -> dict[str, Callable[[], object]]:
+        """
+        Generate one fly of n_frames and bind the requested stages to it.
+
+        Args:
+            n_frames: Frames of the generated recording.
+            seed: Generator seed.
+            names: Stages (default: all, run order).
+            work_dir: Scratch folder for the load / publish files
+                      (default from controller).
+
+        Returns:
+            name → zero-argument callable (run order).
+
+        Raises:
+            KeyError: Unknown stage name.
+
+        Examples:
+            run = prepare_stages(216_000, seed=0, names=["features", "layer2"])
+            run["layer2"]()
+        """
+        use = stage_names() if names is None else list(names)
+        unknown = [s for s in use if s not in registry]
+        if unknown:
+            raise KeyError(f"Unknown stages: {unknown}. Available: {stage_names()}")
+        root = Path(default_dir if work_dir is None else work_dir)
+        ctx = _context(n_frames, seed, root, write_csv="load" in use)
+        return {s: registry[s](ctx) for s in use}
+
+    return {
+        "stage_names": stage_names,
+        "register_stage": register_stage,
+        "prepare_stages": prepare_stages,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    synthetic: Mapping,
+    utils: Mapping,
+    loaders: Mapping,
+    classifier: Mapping,
+    storage: Mapping,
+    work_dir: Path,
+    publish_durability: str,
+) -> dict[str, Callable]:
+    """
+    Generate stage functions.
+
+    Args:
+        synthetic: BC_SYNTHETIC bundle (recording).
+        utils: BC_UTILS bundle (stimulus_events, clean_stimuli).
+        loaders: BC_LOADERS bundle (read_csv_parallel).
+        classifier: BC_CLASSIFIER bundle (stage kernels, score_flies, pose_table, qc_table).
+        storage: BC_STORAGE bundle (publish_batch).
+        work_dir: Default scratch folder.
+        publish_durability: Durability of the publish stage.
+
+    Returns:
+        Dictionary with 3 stage functions.
+
+    Validation:
+        Asserts 3 functions returned and a known durability mode.
+    """
+    assert publish_durability in ("batch", "file", "none"), f"Unknown durability: {publish_durability!r}"
+    functions = _create_stage_functions(synthetic, utils, loaders, classifier, storage, Path(work_dir), publish_durability)
+
+    # Validation
+    assert len(functions) == 3, f"Expected 3 stage functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,240 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+suite.py — Benchmark Suite Runner and Regression Gate
+=====================================================
+
+Runs every stage at every size and gates the results against the
+baseline of this setup (load_baseline lookup).
+
+Exports:
+    configure(stages: Mapping, measure: Mapping, baseline: Mapping, sizes: tuple[int, ...], seed: int, retries: int) → dict[str, callable]
+
+Suite Functions (2 total):
+    - run_benchmarks(sizes=None, stages=None, seed=None, repeat=None, progress=None) → results
+    - check_regressions(results=None, baseline=None, tolerance=None, retries=None, allow_mismatch=False) → list[row]
+
+Run Order:
+    for each size: generate one fly (prepare_stages), then measure all
+    stages together (measure_stages, interleaved rounds); inputs are
+    released before the next size
+
+Gate (check_regressions):
+    1. baseline meta must match the current setup (meta_mismatch) →
+       otherwise RuntimeError before anything is measured, unless
+       allow_mismatch=True
+    2. results=None → run the stages and sizes recorded in the baseline
+    3. compare_results against the baseline
+    4. regressed stage × size pairs are measured again (up to `retries`
+       times), keeping the best fps / smallest peak of all attempts
+    5. still regressed → RuntimeError with the report of regressed rows
+
+Notes:
+    - Results are JSON-ready (sizes as string keys) so a run can be saved
+      as the next baseline unchanged
+    - progress(stage, frames, metrics) is called after every measurement
+    - Retries only absorb host noise: a real slowdown is slow on every
+      attempt, while noise can only make a sample slower, never faster
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Mapping
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for suite.py.
+
+Why Empty?
+    Sizes and seed come from benchmark.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — SUITE FUNCTION FACTORY
+
+def _create_suite_functions(
+    stages: Mapping,
+    measure: Mapping,
+    baseline: Mapping,
+    sizes: tuple[int, ...],
+    seed: int,
+    retries: int,
+) -> dict[str, Callable]:
+    """
+    Create the runner and gate bound to the worker functions.
+
+    Returns:
+        Dictionary with 2 suite functions.
+    """
+    prepare_stages = stages["prepare_stages"]
+    stage_names = stages["stage_names"]
+    measure_stages = measure["measure_stages"]
+    machine_info = measure["machine_info"]
+    load_baseline = baseline["load_baseline"]
+    meta_mismatch = baseline["meta_mismatch"]
+    compare_results = baseline["compare_results"]
+    format_report = baseline["format_report"]
+    default_sizes, default_seed, default_retries = sizes, seed, retries
+
+    def _best(a: Mapping, b: Mapping) -> dict:
+        """Faster timing and smaller peak of two measurements."""
+        out = dict(a if a["fps"] >= b["fps"] else b)
+        out["peak_mb"] = min(a["peak_mb"], b["peak_mb"])
+        return out
+
+    def run_benchmarks(
+        sizes: Iterable[int] | None = None,
+        stages: Iterable[str] | None = None,
+        seed: int | None = None,
+        repeat: int | None = None,
+        progress: Callable[[str, int, Mapping], None] | None = None,
+    ) -> dict:
+        """
+        Measure stages at each size (see Run Order).
+
+        Args:
+            sizes: Frames per generated recording (default from controller).
+            stages: Stage names (default: all registered, run order).
+            seed: Generator seed (default from controller).
+            repeat: Timing rounds (default from controller).
+            progress: Optional callback after each measurement.
+
+        Returns:
+            {"meta": {...}, "stages": {stage: {"<frames>": metrics}}}.
+
+        Examples:
+            results = run_benchmarks(sizes=[36_000], stages=["layer1", "layer2"])
+        """
+        use_sizes = [int(n) for n in (default_sizes if sizes is None else sizes)]
+        use_seed = default_seed if seed is None else seed
+        out: dict[str, dict[str, dict]] = {}
+        for n in use_sizes:
+            run = prepare_stages(n, seed=use_seed, names=stages)
+            for name, m in measure_stages(run, n, repeat=repeat).items():
+                out.setdefault(name, {})[str(n)] = m
+                if progress is not None:
+                    progress(name, n, m)
+            del run
+        meta = {
+            **machine_info(),
+            "sizes": use_sizes,
+            "seed": use_seed,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        return {"meta": meta, "stages": out}
+
+    def check_regressions(
+        results: Mapping | None = None,
+        baseline: Mapping | None = None,
+        tolerance: float | None = None,
+        retries: int | None = None,
+        allow_mismatch: bool = False,
+    ) -> list[dict]:
+        """
+        Regression gate (see Gate).
+
+        Args:
+            results: run_benchmarks output (None → run the baseline's stages / sizes).
+            baseline: Stored result set (default: load_baseline()).
+            tolerance: Allowed relative regression (default from controller).
+            retries: Re-measurements of regressed pairs (default from controller).
+            allow_mismatch: Compare even when the baseline comes from another setup.
+
+        Returns:
+            All comparison rows (nothing regressed).
+
+        Raises:
+            FileNotFoundError: No baseline recorded or committed.
+            RuntimeError: Baseline from another setup, or at least one stage
+                          regressed beyond the tolerance.
+
+        Examples:
+            check_regressions()                          # full gate vs this setup's baseline
+            check_regressions(run_benchmarks(sizes=[36_000]))
+        """
+        base = load_baseline() if baseline is None else baseline
+        diff = meta_mismatch({"meta": machine_info()} if results is None else results, base)
+        if diff and not allow_mismatch:
+            facts = ", ".join(f"{k}: {was!r} → {now!r}" for k, (was, now) in diff.items())
+            raise RuntimeError(
+                f"Benchmark baseline was recorded on a different setup ({facts}); "
+                f"regenerate it on this machine (save_baseline / --update) or pass allow_mismatch=True"
+            )
+        if results is None:
+            recorded = base.get("stages", {})
+            results = run_benchmarks(
+                sizes=base.get("meta", {}).get("sizes"),
+                stages=[s for s in stage_names() if s in recorded],
+                seed=base.get("meta", {}).get("seed"),
+            )
+        rows = compare_results(results, base, tolerance)
+        current = {s: dict(v) for s, v in results["stages"].items()}
+        seed = results.get("meta", {}).get("seed")
+        for _ in range(default_retries if retries is None else retries):
+            suspect: dict[int, list[str]] = {}
+            for r in rows:
+                if r["regressed"] and r["stage"] not in suspect.get(r["frames"], []):
+                    suspect.setdefault(r["frames"], []).append(r["stage"])
+            if not suspect:
+                break
+            for n, names in suspect.items():
+                again = run_benchmarks(sizes=[n], stages=names, seed=seed)["stages"]
+                for name in names:
+                    current[name][str(n)] = _best(current[name][str(n)], again[name][str(n)])
+            rows = compare_results({**results, "stages": current}, base, tolerance)
+        failed = [r for r in rows if r["regressed"]]
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} benchmark regression(s) beyond tolerance:\n"
+                f"{format_report(failed)}"
+            )
+        return rows
+
+    return {
+        "run_benchmarks": run_benchmarks,
+        "check_regressions": check_regressions,
+    }
+
+
+#%% CELL 04 — CONFIGURE
+
+def configure(
+    stages: Mapping,
+    measure: Mapping,
+    baseline: Mapping,
+    sizes: tuple[int, ...],
+    seed: int,
+    retries: int,
+) -> dict[str, Callable]:
+    """
+    Generate suite functions.
+
+    Args:
+        stages: Stage functions (prepare_stages, stage_names).
+        measure: Measure functions (measure_stages, machine_info).
+        baseline: Baseline functions (load_baseline, meta_mismatch, compare_results, format_report).
+        sizes: Default frames per generated recording.
+        seed: Default generator seed.
+        retries: Default gate re-measurements of regressed pairs.
+
+    Returns:
+        Dictionary with 2 suite functions.
+
+    Validation:
+        Asserts 2 functions returned, positive sizes and retries ≥ 0.
+    """
+    assert sizes and all(int(n) > 0 for n in sizes), f"sizes must be positive frame counts, got {sizes}"
+    assert retries >= 0, f"retries must be ≥ 0, got {retries}"
+    functions = _create_suite_functions(stages, measure, baseline, tuple(sizes), seed, retries)
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 suite functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 05 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,186 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+_classifier/__init__.py — Classifier Coordinator
+=================================================
+
+Orchestrates classifier workers and assembles the BC_CLASSIFIER bundle.
+
+Architecture:
+    7 workers → coordinator → controller → BC_CLASSIFIER export
+
+Workers (7):
+    0. backends.py: 6 backend functions (kernel, available_backends,
+       active_backend, use_backend, register_backend, check_backends)
+    1. voting.py: 4 voting functions (window_votes, vote_codes, layer2,
+       layer2_denoised)
+    2. speed.py: 3 speed functions (response_mask, denoise_speed,
+       speed_denoised)
+    3. stages.py: 6 stage functions (build_features, layer1_codes,
+       remove_micro_bouts, fill_gaps, resistant_codes, behavior_codes)
+    4. batch.py: 4 batch functions (stack_flies, classify_batch,
+       unstack_flies, score_flies)
+    5. pose.py: 1 pose function (pose_table)
+    6. qc.py: 1 QC function (qc_table)
+
+Total Exports: 25 (validated)
+
+Design:
+    - Coordinator receives PARAM, BC_UTILS + classifier constants from controller
+    - Calls workers in dependency order
+    - Assembles single immutable bundle
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Mapping
+
+from . import backends, batch, pose, qc, speed, stages, voting
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for _classifier coordinator.
+
+Why Empty?
+    Coordinator orchestrates workers (no direct configuration).
+    Thresholds and windows come from classifier.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - pure orchestration)
+
+#%% CELL 03 — CONFIGURE
+
+def configure(
+    param: Mapping,
+    utils: Mapping,
+    fps: float,
+    frame_column: str,
+    arena_mm: tuple[float, float],
+    motion_threshold: float,
+    high_speed: float,
+    low_speed: float,
+    noise_tolerance: int,
+    max_gap_sec: float,
+    speed_window_sec: float,
+    layer2_window_sec: float,
+    layer2_min_valid_fraction: float,
+    vote_priority: tuple,
+    pre_stim_sec: float,
+    post_stim_sec: float,
+    skip_response_window: bool,
+    kernel_backend: str,
+    qc_max_nan_fraction: float,
+) -> MappingProxyType:
+    """
+    Configure and return the immutable BC_CLASSIFIER bundle.
+
+    Args:
+        param: PARAM registry (from Config.param).
+        utils: BC_UTILS bundle (stimulus events).
+        fps: Frames per second (seconds → frames).
+        frame_column: Shared timebase column (FrameIndex).
+        arena_mm: Arena (width, height) in mm.
+        motion_threshold: PixelChange above this → Motion 1.
+        high_speed / low_speed: Jump and Walk thresholds (mm/s).
+        noise_tolerance: Layer1_Denoised micro-bout length (frames).
+        max_gap_sec: Longest Behavior_Denoised gap filled (seconds).
+        speed_window_sec: Speed_Denoised smoothing window (seconds).
+        layer2_window_sec: Layer2 voting window (seconds).
+        layer2_min_valid_fraction: Layer2_Denoised validity threshold.
+        vote_priority: Tie order as label suffixes.
+        pre_stim_sec / post_stim_sec: Stimulus response window (seconds).
+        skip_response_window: Leave response windows unsmoothed.
+        kernel_backend: Initial kernel backend ('auto' | 'numpy' | 'numba').
+        qc_max_nan_fraction: Largest tolerated NaN share per column (qc_table).
+
+    Returns:
+        MappingProxyType with 25 classifier exports.
+
+    Orchestration Order (respects dependencies):
+        0. backends → kernel registry (hot kernels resolved at call time)
+        1. voting → Layer2 / Layer2_Denoised consensus (needs PARAM domains)
+        2. speed → Speed_Denoised (needs BC_UTILS stimulus events)
+        3. stages → features, Layer1, micro-bouts, gaps, Resistant, Behavior
+        4. batch → (flies, frames) scoring (needs voting + speed + stages)
+        5. pose → pose table from sleap (needs PARAM pose / sleap columns)
+        6. qc → ok / flag / error of a table (needs PARAM domains)
+    """
+    backends_data = backends.configure(backend=kernel_backend)
+    kernel = backends_data["kernel"]
+
+    voting_data = voting.configure(
+        param=param,
+        fps=fps,
+        window_sec=layer2_window_sec,
+        min_valid_fraction=layer2_min_valid_fraction,
+        priority=vote_priority,
+        kernel=kernel,
+    )
+
+    speed_data = speed.configure(
+        utils=utils,
+        fps=fps,
+        window_sec=speed_window_sec,
+        high_speed=high_speed,
+        pre_stim_sec=pre_stim_sec,
+        post_stim_sec=post_stim_sec,
+        skip_response=skip_response_window,
+        kernel=kernel,
+    )
+
+    stages_data = stages.configure(
+        param=param,
+        fps=fps,
+        arena_mm=arena_mm,
+        motion_threshold=motion_threshold,
+        high_speed=high_speed,
+        low_speed=low_speed,
+        noise_tolerance=noise_tolerance,
+        max_gap_sec=max_gap_sec,
+        pre_stim_sec=pre_stim_sec,
+        post_stim_sec=post_stim_sec,
+        kernel=kernel,
+    )
+
+    batch_data = batch.configure(
+        param=param,
+        utils=utils,
+        voting=voting_data,
+        speed=speed_data,
+        stages=stages_data,
+        frame_column=frame_column,
+        fps=fps,
+        min_valid_fraction=layer2_min_valid_fraction,
+        pre_stim_sec=pre_stim_sec,
+        post_stim_sec=post_stim_sec,
+        skip_response=skip_response_window,
+    )
+
+    pose_data = pose.configure(param=param, frame_column=frame_column, arena_mm=arena_mm)
+
+    qc_data = qc.configure(param=param, frame_column=frame_column, max_nan_fraction=qc_max_nan_fraction)
+
+    bundle = {
+        **backends_data,
+        **voting_data,
+        **speed_data,
+        **stages_data,
+        **batch_data,
+        **pose_data,
+        **qc_data,
+    }
+
+    # Validation: 6 backends + 4 voting + 3 speed + 6 stages + 4 batch + 1 pose + 1 qc = 25
+    expected_count = 25
+    assert len(bundle) == expected_count, (
+        f"BC_CLASSIFIER export count mismatch: expected {expected_count}, got {len(bundle)}. "
+        f"Keys: {sorted(bundle)}"
+    )
+
+    return MappingProxyType(bundle)
+
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["configure"]
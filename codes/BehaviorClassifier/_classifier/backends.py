@@ -0,0 +1,469 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+backends.py — Pluggable Kernel Backends (NumPy / optional Numba JIT)
+=====================================================================
+
+Registry of implementations for the hot classifier kernels; the other
+workers resolve kernels through it at call time, so backends can be
+switched at runtime.
+
+Exports:
+    configure(backend: str) → dict[str, callable]
+
+Backend Functions (6 total):
+    - kernel(name) → callable (active backend's implementation)
+    - available_backends() → list[str]
+    - active_backend() → str
+    - use_backend(name) → str
+    - register_backend(name, kernels) → None
+    - check_backends(backends=None, frames=2000, flies=3, seed=0) → {backend: {kernel: bool}}
+
+Kernels (5, same signatures in every backend):
+    denoise     speed.py   guarded rolling mean (Speed_Denoised)
+    vote        voting.py  window consensus (Layer2 / Layer2_Denoised)
+    micro       stages.py  micro-bout removal (Layer1_Denoised)
+    gaps        stages.py  gap fill (Behavior_Denoised)
+    resistant   stages.py  Resistant coverage
+
+Backends:
+    numpy   reference (array kernels of the workers; always available)
+    numba   @njit loops, compiled on first use (only if numba is installed)
+    auto    numba when installed, else numpy
+
+Notes:
+    - Every backend must be bit-identical to numpy: check_backends() runs
+      all kernels on random inputs (NaN, jumps, padding spans, responses)
+      and compares outputs, dtypes and shapes exactly
+    - Float reductions whose order differs between NumPy and loops (row
+      means) are computed in NumPy by the numba wrappers, so rounding matches
+    - The switch is per process (scheduler pool workers start from the
+      controller's KERNEL_BACKEND)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import importlib.util
+import threading
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+
+from .speed import _denoise
+from .stages import _gaps, _micro, _resistant
+from .voting import _vote
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for backends.py.
+
+Why Empty?
+    The default backend comes from classifier.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - backend choice passed via configure())
+
+#%% CELL 03 — KERNEL IMPLEMENTATIONS
+
+_KERNELS: tuple[str, ...] = ("denoise", "vote", "micro", "gaps", "resistant")
+
+_NUMPY: dict[str, Callable] = {
+    "denoise": _denoise,
+    "vote": _vote,
+    "micro": _micro,
+    "gaps": _gaps,
+    "resistant": _resistant,
+}
+
+
+def _build_numba() -> dict[str, Callable]:
+    """Compile-on-first-call Numba kernels wrapped to the NumPy signatures."""
+    from numba import njit  # optional dependency; ImportError → backend unavailable
+
+    @njit(cache=True)
+    def _vote_rows(codes, n_labels, window, jump, priority, use_frac, frac, starts, stops):
+        f, n = codes.shape
+        a, b = window // 2, (window - 1) // 2
+        out = np.empty((f, n), dtype=np.int16)
+        counts = np.zeros(n_labels, dtype=np.int64)
+        for r in range(f):
+            counts[:] = 0
+            lo = 0
+            hi = 0
+            for i in range(n):
+                want_lo = max(i - a, 0)
+                want_hi = min(i + b + 1, n)
+                while hi < want_hi:
+                    c = codes[r, hi]
+                    if 0 <= c < n_labels:
+                        counts[c] += 1
+                    hi += 1
+                while lo < want_lo:
+                    c = codes[r, lo]
+                    if 0 <= c < n_labels:
+                        counts[c] -= 1
+                    lo += 1
+                valid = 0
+                for k in range(n_labels):
+                    valid += counts[k]
+                best = priority[0]
+                for p in priority[1:]:
+                    if counts[p] > counts[best]:
+                        best = p
+                if jump >= 0 and counts[jump] > 0:
+                    best = jump
+                missing = valid == 0
+                if use_frac:
+                    length = max(min(i + b + 1, stops[r]) - max(i - a, starts[r]), 0)
+                    if valid <= frac * length:
+                        missing = True
+                out[r, i] = -1 if missing else best
+        return out
+
+    @njit(cache=True)
+    def _denoise_rows(speed, mean, window, high_speed, response, has_response):
+        f, n = speed.shape
+        a, b = window // 2, (window - 1) // 2
+        out = np.empty((f, n), dtype=np.float64)
+        cs = np.empty(n + 1, dtype=np.float64)
+        cv = np.empty(n + 1, dtype=np.int64)
+        ch = np.empty(n + 1, dtype=np.int64)
+        for r in range(f):
+            m = mean[r]
+            cs[0] = 0.0
+            cv[0] = 0
+            ch[0] = 0
+            for k in range(n):
+                x = speed[r, k]
+                ok = not np.isnan(x)
+                cs[k + 1] = cs[k] + ((x - m) if ok else 0.0)
+                cv[k + 1] = cv[k] + (1 if ok else 0)
+                ch[k + 1] = ch[k] + (1 if (ok and x >= high_speed) else 0)
+            for i in range(n):
+                lo = max(i - a, 0)
+                hi = min(i + b + 1, n)
+                x = speed[r, i]
+                if ch[hi] - ch[lo] > 0 or (has_response and response[r, i]):
+                    out[r, i] = x
+                elif cv[hi] - cv[lo] > 0:
+                    out[r, i] = (cs[hi] - cs[lo]) / (cv[hi] - cv[lo]) + m
+                else:
+                    out[r, i] = np.nan
+        return out
+
+    @njit(cache=True)
+    def _micro_rows(codes, max_length, keep):
+        f, n = codes.shape
+        for r in range(f):
+            i = 0
+            while i < n:
+                j = i + 1
+                while j < n and codes[r, j] == codes[r, i]:
+                    j += 1
+                c = codes[r, i]
+                if j - i <= max_length and c != -1:
+                    kept = False
+                    for k in keep:
+                        if c == k:
+                            kept = True
+                    if not kept:
+                        codes[r, i:j] = -1
+                i = j
+        return codes
+
+    @njit(cache=True)
+    def _gaps_rows(codes, max_length, skip, has_skip):
+        f, n = codes.shape
+        out = codes.copy()
+        starts = np.empty(n + 1, dtype=np.int64)
+        for r in range(f):
+            k = 0
+            for i in range(n):
+                if i == 0 or codes[r, i] != codes[r, i - 1]:
+                    starts[k] = i
+                    k += 1
+            starts[k] = n
+            for q in range(1, k - 1):
+                s, e = starts[q], starts[q + 1]
+                prev, nxt = codes[r, starts[q - 1]], codes[r, e]
+                if codes[r, s] != -1 or e - s > max_length or prev != nxt or prev == -1:
+                    continue
+                hit = False
+                if has_skip:
+                    for i in range(s, e):
+                        if skip[r, i]:
+                            hit = True
+                            break
+                if not hit:
+                    out[r, s:e] = prev
+        return out
+
+    @njit(cache=True)
+    def _resistant_rows(layer2, rows, onsets, pre, post, lut):
+        f, n = layer2.shape
+        out = np.full((f, n), -1, dtype=np.int16)
+        for q in range(len(rows)):
+            r = rows[q]
+            lo = onsets[q] - pre
+            hi = onsets[q] + post + 1
+            if lo < 0 or hi > n:
+                continue
+            label = layer2[r, lo]
+            if label < 0 or lut[label] < 0:
+                continue
+            covered = True
+            for i in range(lo + 1, hi):
+                if layer2[r, i] != label:
+                    covered = False
+                    break
+            if covered:
+                out[r, lo:hi] = lut[label]
+        return out
+
+    def _rows(x: np.ndarray) -> np.ndarray:
+        return np.ascontiguousarray(x.reshape(int(np.prod(x.shape[:-1])), x.shape[-1]))
+
+    def _mask(mask, shape) -> tuple[np.ndarray, bool]:
+        if mask is None:
+            return np.zeros((1, 1), dtype=np.bool_), False
+        return _rows(np.broadcast_to(np.asarray(mask, dtype=bool), shape)), True
+
+    def vote(codes, n_labels, window, jump, priority, min_valid_fraction, spans=None):
+        lead = codes.shape[:-1]
+        rows = int(np.prod(lead))
+        if spans is not None and min_valid_fraction is not None:
+            starts = np.broadcast_to(np.asarray(spans[0], dtype=np.int64), lead).reshape(-1)
+            stops = np.broadcast_to(np.asarray(spans[1], dtype=np.int64), lead).reshape(-1)
+        else:
+            starts = np.zeros(rows, dtype=np.int64)
+            stops = np.full(rows, codes.shape[-1], dtype=np.int64)
+        out = _vote_rows(
+            _rows(codes), n_labels, window, -1 if jump is None else jump,
+            np.asarray(priority, dtype=np.int64), min_valid_fraction is not None,
+            0.0 if min_valid_fraction is None else float(min_valid_fraction),
+            np.ascontiguousarray(starts), np.ascontiguousarray(stops),
+        )
+        return out.reshape(codes.shape)
+
+    def denoise(speed, window, high_speed, response):
+        valid = ~np.isnan(speed)
+        filled = speed if bool(valid.all()) else np.where(valid, speed, 0.0)
+        mean = filled.sum(axis=-1, keepdims=True) / np.maximum(valid.sum(axis=-1, keepdims=True), 1)  # NumPy order
+        resp, has = _mask(response, speed.shape)
+        out = _denoise_rows(_rows(speed), _rows(mean).reshape(-1), window, float(high_speed), resp, has)
+        return out.reshape(speed.shape)
+
+    def micro(codes, max_length, keep):
+        return _micro_rows(_rows(codes).copy(), max_length, np.asarray(keep, dtype=np.int64)).reshape(codes.shape)
+
+    def gaps(codes, max_length, skip):
+        mask, has = _mask(skip, codes.shape)
+        return _gaps_rows(_rows(codes), max_length, mask, has).reshape(codes.shape)
+
+    def resistant(layer2, rows, onsets, pre, post, lut):
+        out = _resistant_rows(
+            _rows(layer2), np.asarray(rows, dtype=np.int64), np.asarray(onsets, dtype=np.int64),
+            pre, post, np.asarray(lut, dtype=np.int16),
+        )
+        return out.reshape(layer2.shape)
+
+    return {"denoise": denoise, "vote": vote, "micro": micro, "gaps": gaps, "resistant": resistant}
+
+
+# Backend name → loader of its kernel dict (called once, on first use)
+_LOADERS: dict[str, Callable[[], dict[str, Callable]]] = {
+    "numpy": lambda: _NUMPY,
+    "numba": _build_numba,
+}
+
+
+def _installed(name: str) -> bool:
+    return name == "numpy" or importlib.util.find_spec(name) is not None
+
+
+def _cases(frames: int, flies: int, seed: int) -> list[tuple[str, tuple]]:
+    """Random kernel inputs covering NaN, jumps, missing codes, spans, masks."""
+    rng = np.random.default_rng(seed)
+    shape = (flies, frames)
+    runs = rng.integers(1, 12, size=flies * frames)
+    codes = np.repeat(rng.integers(-1, 4, size=len(runs)), runs)[: flies * frames].astype(np.int16).reshape(shape)
+    speed = rng.gamma(1.5, 6.0, size=shape)
+    speed[rng.random(shape) < 0.01] = rng.uniform(75.0, 150.0)
+    speed[rng.random(shape) < 0.05] = np.nan
+    speed[0, : frames // 10] = np.nan
+    response = rng.random(shape) < 0.02
+    starts = rng.integers(0, frames // 4, size=flies)
+    stops = frames - rng.integers(0, frames // 4, size=flies)
+    rows = rng.integers(0, flies, size=4 * flies)
+    onsets = rng.integers(0, frames, size=4 * flies)
+    freeze = np.where(codes == 1, 3, codes).astype(np.int16)
+    priority = np.array([0, 1, 2, 3], dtype=np.intp)
+    lut = np.array([-1, 0, 1, 2], dtype=np.int16)  # Jump has no Resistant tier
+    return [
+        ("vote", (codes, 4, 6, 0, priority, None)),
+        ("vote", (codes, 4, 7, 0, priority, 0.5, (starts, stops))),
+        ("vote", (codes[0], 4, 6, None, priority[::-1].copy(), 0.5)),
+        ("denoise", (speed, 30, 75.0, None)),
+        ("denoise", (speed, 31, 75.0, response)),
+        ("denoise", (speed[1], 30, 75.0, response[1])),
+        ("micro", (codes, 3, np.array([0], dtype=np.int16))),
+        ("micro", (codes[0], 5, np.array([], dtype=np.int16))),
+        ("gaps", (codes, 60, None)),
+        ("gaps", (codes, 10, response)),
+        ("resistant", (freeze, rows, onsets, 5, 5, lut)),
+        ("resistant", (codes, rows, onsets, 2, 2, lut)),
+        ("resistant", (freeze[0], np.zeros(4, dtype=np.int64), onsets[:4], 0, 3, lut)),
+    ]
+
+
+def _same(a: np.ndarray, b: np.ndarray) -> bool:
+    return a.dtype == b.dtype and a.shape == b.shape and np.array_equal(a, b, equal_nan=a.dtype.kind == "f")
+
+
+#%% CELL 04 — BACKEND FUNCTION FACTORY
+
+def _create_backend_functions(backend: str) -> dict[str, Callable]:
+    """
+    Create the backend registry (state lives in this closure).
+
+    Returns:
+        Dictionary with 6 backend functions.
+    """
+    loaders = dict(_LOADERS)
+    loaded: dict[str, dict[str, Callable]] = {}
+    lock = threading.Lock()
+    state = {"active": "numpy"}
+
+    def _load(name: str) -> dict[str, Callable]:
+        with lock:
+            if name not in loaded:
+                loaded[name] = loaders[name]()
+            return loaded[name]
+
+    def kernel(name: str) -> Callable:
+        """
+        Active backend's implementation of one kernel.
+
+        Examples:
+            out = kernel("vote")(codes, 4, 6, 0, priority, None)
+        """
+        if name not in _KERNELS:
+            raise KeyError(f"Unknown kernel {name!r}. Available: {list(_KERNELS)}")
+        return _load(state["active"])[name]
+
+    def available_backends() -> list[str]:
+        """Backends usable in this environment (registered and importable)."""
+        return [name for name in loaders if name not in _LOADERS or _installed(name)]
+
+    def active_backend() -> str:
+        """Name of the backend kernels resolve to."""
+        return state["active"]
+
+    def use_backend(name: str) -> str:
+        """
+        Switch the kernel backend for this process.
+
+        Args:
+            name: 'numpy' | 'numba' | 'auto' (numba if installed) | registered name.
+
+        Returns:
+            Resolved backend name.
+
+        Raises:
+            ValueError: Unknown or unavailable backend.
+
+        Examples:
+            use_backend("numpy")      # e.g. to compare timings
+        """
+        if name == "auto":
+            name = "numba" if "numba" in available_backends() else "numpy"
+        if name not in available_backends():
+            raise ValueError(f"Backend {name!r} not available. Available: {available_backends()}")
+        _load(name)
+        state["active"] = name
+        return name
+
+    def register_backend(name: str, kernels: Mapping[str, Callable]) -> None:
+        """
+        Register a custom backend (must implement all 5 kernels).
+
+        Examples:
+            register_backend("cupy", {"denoise": ..., "vote": ..., "micro": ..., "gaps": ..., "resistant": ...})
+        """
+        missing = [k for k in _KERNELS if k not in kernels]
+        if missing:
+            raise ValueError(f"Backend {name!r} lacks kernels: {missing}")
+        impl = dict(kernels)
+        with lock:
+            loaders[name] = lambda: impl
+            loaded.pop(name, None)
+
+    def check_backends(
+        backends: Iterable[str] | None = None,
+        frames: int = 2000,
+        flies: int = 3,
+        seed: int = 0,
+    ) -> dict[str, dict[str, bool]]:
+        """
+        Parity harness: run every kernel of every backend against numpy.
+
+        Args:
+            backends: Backends to check (default: all available).
+            frames / flies / seed: Random input size and seed.
+
+        Returns:
+            backend → kernel → True if bit-identical on all cases.
+
+        Examples:
+            report = check_backends()
+            assert all(all(r.values()) for r in report.values()), report
+        """
+        names = available_backends() if backends is None else list(backends)
+        cases = _cases(frames, flies, seed)
+        report: dict[str, dict[str, bool]] = {}
+        for name in names:
+            impl = _load(name)
+            result = {k: True for k in _KERNELS}
+            for k, args in cases:
+                result[k] &= _same(impl[k](*args), _NUMPY[k](*args))
+            report[name] = result
+        return report
+
+    use_backend(backend)
+
+    return {
+        "kernel": kernel,
+        "available_backends": available_backends,
+        "active_backend": active_backend,
+        "use_backend": use_backend,
+        "register_backend": register_backend,
+        "check_backends": check_backends,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(backend: str) -> dict[str, Callable]:
+    """
+    Generate backend registry functions.
+
+    Args:
+        backend: Initial backend ('auto' | 'numpy' | 'numba').
+
+    Returns:
+        Dictionary with 6 backend functions.
+
+    Validation:
+        Asserts 6 functions returned.
+    """
+    functions = _create_backend_functions(backend)
+
+    # Validation
+    assert len(functions) == 6, f"Expected 6 backend functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,357 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+batch.py — Multi-Fly Batched Classification
+============================================
+
+Stack the flies of one BASE into (flies, frames) matrices on the shared
+FrameIndex timebase and run feature construction plus every
+classification stage once over the whole matrix.
+
+Exports:
+    configure(param: Mapping, utils: Mapping, voting: Mapping, speed: Mapping, stages: Mapping, frame_column: str, fps: float, min_valid_fraction: float, pre_stim_sec: float, post_stim_sec: float, skip_response: bool) → dict[str, callable]
+
+Batch Functions (4 total):
+    - stack_flies(tables, stems=None) → FlyBatch
+    - classify_batch(batch) → FlyBatch
+    - unstack_flies(batch, columns=None) → list[DataFrame]
+    - score_flies(tables, stems=None) → list[DataFrame]
+
+FlyBatch Layout:
+    frames    int64[n]        shared FrameIndex axis (min → max over flies)
+    present   bool[F, n]      frames each fly's table has
+    starts    int64[F]        first / one-past-last frame position of each fly
+    stops     int64[F]
+    columns   {name: [F, n]}  float64 (NaN padded) or int16 codes (-1 padded)
+    stems     list | None     optional fly names
+
+Stages (each one call over the matrix):
+    stimuli (cleaned per fly, onsets as (row, frame) pairs) → features →
+    Layer1 → Speed_Denoised → Layer1_Denoised → Layer2 / Layer2_Denoised →
+    Resistant / Resistant_Denoised → Behavior / Behavior_Denoised
+
+Notes:
+    - Padding never leaks: frames outside a fly's table are NaN / missing in
+      every output, and voting validity uses per-fly window extents
+    - A single table is scored as a 1-row batch (same code path)
+    - Stimulus cleaning is the only per-fly step (one BC_UTILS call per
+      fly, all channels at once)
+    - Stimulus onsets of all channels drive the response and Resistant windows
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .stages import _row_windows
+from .voting import MISSING
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for batch.py.
+
+Why Empty?
+    Stage settings live in the other workers; this worker only composes them.
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - pure composition of stage kernels)
+
+#%% CELL 03 — FLY BATCH
+
+# Tracked inputs of feature construction
+_INPUTS: tuple[str, ...] = ("NormalizedCentroidX", "NormalizedCentroidY", "PixelChange")
+
+# Scored output order after the frame and stimulus columns
+_SCORED: tuple[str, ...] = (
+    "Position_X", "Position_Y", "Speed", "Speed_Denoised", "Motion",
+    "Layer1", "Layer1_Denoised", "Layer2", "Layer2_Denoised",
+    "Resistant", "Resistant_Denoised", "Behavior", "Behavior_Denoised",
+)
+
+
+class FlyBatch:
+    """
+    Flies of one BASE as (flies, frames) matrices.
+
+    Usage:
+        batch = BC_CLASSIFIER["stack_flies"](tables)
+        scored = BC_CLASSIFIER["classify_batch"](batch)
+        scored.columns["Layer2"]          # int16[flies, frames]
+    """
+
+    __slots__ = ("frames", "present", "starts", "stops", "columns", "stems")
+
+    def __init__(
+        self,
+        frames: np.ndarray,
+        present: np.ndarray,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        columns: dict[str, np.ndarray],
+        stems: list[str] | None = None,
+    ) -> None:
+        self.frames = frames
+        self.present = present
+        self.starts = starts
+        self.stops = stops
+        self.columns = columns
+        self.stems = stems
+
+    def __len__(self) -> int:
+        return len(self.present)
+
+    def __repr__(self) -> str:
+        return f"FlyBatch(flies={len(self)}, frames={len(self.frames)}, columns={len(self.columns)})"
+
+    def with_columns(self, columns: Mapping[str, np.ndarray]) -> "FlyBatch":
+        """New batch with columns added / replaced (arrays shared, not copied)."""
+        return FlyBatch(self.frames, self.present, self.starts, self.stops, {**self.columns, **columns}, self.stems)
+
+
+#%% CELL 04 — BATCH FUNCTION FACTORY
+
+def _create_batch_functions(
+    param: Mapping,
+    utils: Mapping,
+    voting: Mapping,
+    speed: Mapping,
+    stages: Mapping,
+    frame_column: str,
+    fps: float,
+    min_valid_fraction: float,
+    pre_stim_sec: float,
+    post_stim_sec: float,
+    skip_response: bool,
+) -> dict[str, Callable]:
+    """
+    Create batch stacking / scoring bound to the stage kernels.
+
+    Returns:
+        Dictionary with 4 batch functions.
+    """
+    stimulus_events = utils["stimulus_events"]
+    vote_codes = voting["vote_codes"]
+    denoise_speed = speed["denoise_speed"]
+    pre, post = int(round(pre_stim_sec * fps)), int(round(post_stim_sec * fps))
+    stim_cols = [c for c, spec in param.items() if "stimuli" in spec.get("tags", ())]
+    dtypes = {
+        c: pd.CategoricalDtype(param[c]["domain"])
+        for c in _SCORED if param.get(c, {}).get("type") == "string"
+    }
+
+    def stack_flies(tables: Sequence[pd.DataFrame], stems: Iterable[str] | None = None) -> FlyBatch:
+        """
+        Align fly tables on FrameIndex into NaN-padded (flies, frames) matrices.
+
+        Args:
+            tables: Tracked tables (FrameIndex, stimuli, NormalizedCentroidX/Y, PixelChange).
+            stems: Optional fly names (kept on the batch).
+
+        Returns:
+            FlyBatch with every numeric column shared by all tables.
+
+        Raises:
+            ValueError: No tables, or duplicate FrameIndex values in a table.
+            KeyError: A table lacks FrameIndex or a feature input.
+
+        Examples:
+            batch = stack_flies([pd.read_csv(PATH["tracked_path"](s)) for s in stems], stems)
+        """
+        if not tables:
+            raise ValueError("stack_flies needs at least one table")
+        for i, t in enumerate(tables):
+            missing = [c for c in (frame_column, *_INPUTS) if c not in t.columns]
+            if missing:
+                raise KeyError(f"Table {i} lacks columns {missing}")
+        index = [t[frame_column].to_numpy(dtype=np.int64) for t in tables]
+        nonempty = [ix for ix in index if len(ix)]
+        f0 = min(int(ix.min()) for ix in nonempty) if nonempty else 0
+        f1 = max(int(ix.max()) for ix in nonempty) if nonempty else -1
+        n, f = f1 - f0 + 1, len(tables)
+
+        shared = [c for c in tables[0].columns if c != frame_column and all(c in t.columns for t in tables[1:])]
+        shared = [c for c in shared if tables[0][c].dtype.kind in "iufb"]
+        columns = {c: np.full((f, n), np.nan) for c in shared}
+        present = np.zeros((f, n), dtype=bool)
+        starts = np.zeros(f, dtype=np.int64)
+        stops = np.zeros(f, dtype=np.int64)
+        for r, (t, ix) in enumerate(zip(tables, index)):
+            pos = ix - f0
+            if len(np.unique(pos)) != len(pos):
+                raise ValueError(f"Table {r} has duplicate {frame_column} values")
+            present[r, pos] = True
+            if len(pos):
+                starts[r], stops[r] = pos.min(), pos.max() + 1
+            for c in shared:
+                columns[c][r, pos] = t[c].to_numpy(dtype=np.float64)
+        frames = np.arange(f0, f1 + 1, dtype=np.int64)
+        return FlyBatch(frames, present, starts, stops, columns, None if stems is None else list(stems))
+
+    def classify_batch(batch: FlyBatch) -> FlyBatch:
+        """
+        Run features and all classification stages once over the batch.
+
+        Returns:
+            FlyBatch with cleaned stimuli and the scored columns (labels as
+            int16 codes, features as float64).
+
+        Examples:
+            scored = classify_batch(stack_flies(tables))
+        """
+        f, n = batch.present.shape
+        outside = ~batch.present
+        cols = batch.columns
+
+        # Stimuli: clean per fly (all channels in one call), onsets as (row, frame)
+        names = [c for c in stim_cols if c in cols]
+        parts: list[tuple[int, int, np.ndarray, np.ndarray]] = []
+        for r in range(f):
+            s, e = int(batch.starts[r]), int(batch.stops[r])
+            events = stimulus_events({c: np.nan_to_num(cols[c][r, s:e]) for c in names})
+            parts.extend((r, k, events[c][0] + s, events[c][1] + s) for k, c in enumerate(names))
+        rows = np.concatenate([np.full(len(on), r) for r, _, on, _ in parts] or [np.empty(0)]).astype(np.int64)
+        chans = np.concatenate([np.full(len(on), k) for _, k, on, _ in parts] or [np.empty(0)]).astype(np.int64)
+        ons = np.concatenate([on for *_, on, _ in parts] or [np.empty(0)]).astype(np.int64)
+        offs = np.concatenate([off for *_, off in parts] or [np.empty(0)]).astype(np.int64)
+        out: dict[str, np.ndarray] = {}
+        for k, c in enumerate(names):
+            on_mask = _row_windows(f, n, rows[chans == k], ons[chans == k], offs[chans == k])
+            out[c] = np.where(outside, np.nan, on_mask.astype(np.float64))
+        response = _row_windows(f, n, rows, ons - pre, ons + post + 1) if skip_response else None
+
+        # Features → Layer1 → Speed_Denoised → Layer1_Denoised
+        feat = stages["build_features"](cols["NormalizedCentroidX"], cols["NormalizedCentroidY"], cols["PixelChange"])
+        motion = feat["Motion"]
+        layer1 = stages["layer1_codes"](feat["Speed"], motion)
+        speed_den = denoise_speed(feat["Speed"], response)
+        speed_den[outside] = np.nan
+        layer1_den = stages["remove_micro_bouts"](stages["layer1_codes"](speed_den, motion))
+
+        # Layer2 voting (validity against each fly's own extent)
+        layer2 = vote_codes(layer1)
+        layer2_den = vote_codes(layer1_den, min_valid_fraction=min_valid_fraction, spans=(batch.starts, batch.stops))
+        layer2[outside] = MISSING
+        layer2_den[outside] = MISSING
+
+        # Resistant → Behavior
+        resistant = stages["resistant_codes"](layer2, rows, ons)
+        resistant_den = stages["resistant_codes"](layer2_den, rows, ons)
+        behavior = stages["behavior_codes"](layer2, resistant)
+        behavior_den = stages["fill_gaps"](stages["behavior_codes"](layer2_den, resistant_den), skip=response)
+
+        out.update(feat)
+        out.update({
+            "Speed_Denoised": speed_den,
+            "Layer1": layer1, "Layer1_Denoised": layer1_den,
+            "Layer2": layer2, "Layer2_Denoised": layer2_den,
+            "Resistant": resistant, "Resistant_Denoised": resistant_den,
+            "Behavior": behavior, "Behavior_Denoised": behavior_den,
+        })
+        return batch.with_columns(out)
+
+    def unstack_flies(batch: FlyBatch, columns: Iterable[str] | None = None) -> list[pd.DataFrame]:
+        """
+        One DataFrame per fly, rows = the fly's own frames.
+
+        Args:
+            batch: Stacked (optionally classified) batch.
+            columns: Columns to emit (default: stimuli + scored order once
+                     classified, else every batch column).
+
+        Returns:
+            DataFrames with FrameIndex first; labels as Categorical over the
+            PARAM domain; all-integer float columns (stimuli, Motion) as int8.
+        """
+        if columns is None:
+            scored = [c for c in (*stim_cols, *_SCORED) if c in batch.columns]
+            use = scored if "Layer1" in batch.columns else list(batch.columns)
+        else:
+            use = list(columns)
+        tables = []
+        for r in range(len(batch)):
+            s, e = int(batch.starts[r]), int(batch.stops[r])
+            sel = slice(s, e) if batch.present[r, s:e].all() else batch.present[r]  # views when gap-free
+            data: dict[str, object] = {frame_column: batch.frames[sel]}
+            for c in use:
+                v = batch.columns[c][r, sel]
+                if c in dtypes and v.dtype.kind == "i":
+                    data[c] = pd.Categorical.from_codes(v, dtype=dtypes[c], validate=False)
+                elif c in stim_cols or c == "Motion":
+                    data[c] = v.astype(np.int8) if not np.isnan(v).any() else v
+                else:
+                    data[c] = v
+            tables.append(pd.DataFrame(data, copy=False))
+        return tables
+
+    def score_flies(tables: Sequence[pd.DataFrame], stems: Iterable[str] | None = None) -> list[pd.DataFrame]:
+        """
+        Scored tables for flies sharing a timebase (stack → classify → unstack).
+
+        Examples:
+            scored = score_flies([tracked_a, tracked_b, tracked_c])
+            scored = score_flies([tracked])       # single fly = 1-row batch
+        """
+        return unstack_flies(classify_batch(stack_flies(tables, stems)))
+
+    return {
+        "stack_flies": stack_flies,
+        "classify_batch": classify_batch,
+        "unstack_flies": unstack_flies,
+        "score_flies": score_flies,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    param: Mapping,
+    utils: Mapping,
+    voting: Mapping,
+    speed: Mapping,
+    stages: Mapping,
+    frame_column: str,
+    fps: float,
+    min_valid_fraction: float,
+    pre_stim_sec: float,
+    post_stim_sec: float,
+    skip_response: bool,
+) -> dict[str, Callable]:
+    """
+    Generate batch functions.
+
+    Args:
+        param: PARAM registry (stimulus tag, label domains).
+        utils: BC_UTILS bundle (stimulus_events).
+        voting / speed / stages: Worker function dicts from this coordinator.
+        frame_column: Shared timebase column (FrameIndex).
+        fps: Frames per second.
+        min_valid_fraction: Layer2_Denoised validity threshold.
+        pre_stim_sec / post_stim_sec: Response window around each onset (seconds).
+        skip_response: Response windows guard smoothing and gap filling.
+
+    Returns:
+        Dictionary with 4 batch functions.
+
+    Validation:
+        Asserts 4 functions returned and PARAM defines every scored column
+        except Speed_Denoised.
+    """
+    missing = [c for c in _SCORED if c != "Speed_Denoised" and c not in param]
+    assert not missing, f"PARAM lacks scored columns: {missing}"
+    functions = _create_batch_functions(
+        param, utils, voting, speed, stages, frame_column, fps,
+        min_valid_fraction, pre_stim_sec, post_stim_sec, skip_response,
+    )
+
+    # Validation
+    assert len(functions) == 4, f"Expected 4 batch functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "FlyBatch"]
@@ -0,0 +1,146 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+pose.py — Pose Table (View Selection, Orientation, mm Positions)
+================================================================
+
+Builds the PARAM 'pose' columns of one fly from its sleap table.
+
+Exports:
+    configure(param: Mapping, frame_column: str, arena_mm: tuple[float, float]) → dict[str, callable]
+
+Pose Functions (1 total):
+    - pose_table(sleap: DataFrame) → DataFrame (PARAM 'pose' columns)
+
+Pose Rules:
+    View         per frame, the view keypoint (PARAM View domain present in
+                 sleap: Left, Right, Top) with the highest confidence;
+                 all confidences NaN → missing
+    View_X / _Y  selected view position × arena (mm)
+    Orientation  Thorax → View axis angle (deg, 0–360 wrap)
+    <Part>_X / _Y  body-part position × arena (mm)
+
+Notes:
+    - Positions keep NaN (no confidence masking)
+    - View is a pandas Categorical over the full PARAM domain
+    - FrameIndex is copied when the sleap table has it
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for pose.py.
+
+Why Empty?
+    Arena size and timebase column come from classifier.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — POSE KERNEL
+
+def _select_view(conf: np.ndarray) -> np.ndarray:
+    """Index of the most confident view per frame (-1 when all NaN); conf is (views, frames)."""
+    filled = np.where(np.isnan(conf), -np.inf, conf)
+    best = np.argmax(filled, axis=0)
+    best[np.isneginf(filled.max(axis=0))] = -1
+    return best
+
+
+#%% CELL 04 — POSE FUNCTION FACTORY
+
+def _create_pose_functions(
+    param: Mapping,
+    frame_column: str,
+    arena_mm: tuple[float, float],
+) -> dict[str, Callable]:
+    """
+    Create the pose table builder bound to PARAM and the arena size.
+
+    Returns:
+        Dictionary with 1 pose function.
+    """
+    domain = list(param["View"]["domain"])
+    views = [v for v in domain if f"{v}.Confidence" in param]
+    parts = [c[:-2] for c in param if c.endswith("_X") and "pose" in param[c].get("tags", ()) and c != "View_X"]
+    columns = [c for c, spec in param.items() if "pose" in spec.get("tags", ())]
+    view_codes = np.asarray([domain.index(v) for v in views], dtype=np.int64)
+    width, height = float(arena_mm[0]), float(arena_mm[1])
+
+    def pose_table(sleap: pd.DataFrame) -> pd.DataFrame:
+        """
+        PARAM pose columns of one fly (see Pose Rules).
+
+        Args:
+            sleap: sleap table (PARAM 'sleap' columns).
+
+        Returns:
+            DataFrame with the PARAM 'pose' columns, one row per sleap row.
+
+        Raises:
+            KeyError: A view or body-part column is missing.
+
+        Examples:
+            pose = BC_CLASSIFIER["pose_table"](BC_LOADERS["load_stem"](stem, kind="sleap"))
+        """
+        n = len(sleap)
+        f64 = lambda c: sleap[c].to_numpy(dtype=np.float64, na_value=np.nan)
+        best = _select_view(np.vstack([f64(f"{v}.Confidence") for v in views]))
+        found, at = best >= 0, (np.maximum(best, 0), np.arange(n))
+
+        def pick(axis: str) -> np.ndarray:
+            return np.where(found, np.vstack([f64(f"{v}.Position.{axis}") for v in views])[at], np.nan)
+
+        vx, vy = pick("X") * width, pick("Y") * height
+        tx, ty = f64("Thorax.Position.X") * width, f64("Thorax.Position.Y") * height
+        out: dict[str, object] = {}
+        if frame_column in sleap.columns:
+            out[frame_column] = sleap[frame_column].to_numpy()
+        out["View"] = pd.Categorical.from_codes(np.where(found, view_codes[at[0]], -1), categories=domain)
+        out["View_X"], out["View_Y"] = vx, vy
+        out["Orientation"] = np.degrees(np.arctan2(vy - ty, vx - tx)) % 360.0
+        for part in parts:
+            out[f"{part}_X"] = f64(f"{part}.Position.X") * width
+            out[f"{part}_Y"] = f64(f"{part}.Position.Y") * height
+        return pd.DataFrame(out, index=sleap.index)[[c for c in columns if c in out]]
+
+    return {
+        "pose_table": pose_table,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(param: Mapping, frame_column: str, arena_mm: tuple[float, float]) -> dict[str, Callable]:
+    """
+    Generate pose functions.
+
+    Args:
+        param: PARAM registry (pose / sleap columns, View domain).
+        frame_column: Shared timebase column (copied through).
+        arena_mm: Arena (width, height) in mm.
+
+    Returns:
+        Dictionary with 1 pose function.
+
+    Validation:
+        Asserts 1 function returned and a View domain with sleap keypoints.
+    """
+    assert any(f"{v}.Confidence" in param for v in param["View"]["domain"]), "No View domain entry has sleap keypoints"
+    functions = _create_pose_functions(param, frame_column, arena_mm)
+
+    # Validation
+    assert len(functions) == 1, f"Expected 1 pose function, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,152 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+qc.py — Table Quality Check (ok / flag / error)
+===============================================
+
+Decides the outcome of one table against its PARAM column set, the way a
+pipeline stage reports it to the scheduler (Error / Flag routing).
+
+Exports:
+    configure(param: Mapping, frame_column: str, max_nan_fraction: float) → dict[str, callable]
+
+QC Functions (1 total):
+    - qc_table(df, tag, max_nan_fraction=None) → {"outcome", "missing", "nan_fraction", "out_of_domain"}
+
+QC Rules:
+    error  a PARAM column of `tag` is missing
+    flag   a column's NaN share exceeds max_nan_fraction, or values lie
+           outside the PARAM domain ([lo, hi] for float ranges, members
+           for binary / categorical)
+    ok     otherwise
+
+Result:
+    missing        [column, ...] (PARAM order)
+    nan_fraction   {column: share} for columns with any NaN
+    out_of_domain  {column: count} for columns with any
+
+Notes:
+    - The timebase column (FrameIndex) is only checked for presence
+    - Columns outside the PARAM tag are ignored
+    - One vectorised pass per column (no row loops)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for qc.py.
+
+Why Empty?
+    The NaN threshold comes from classifier.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — DOMAIN CHECKS
+
+# Outcomes (the scheduler's stage contract)
+OK, FLAG, ERROR = "ok", "flag", "error"
+
+
+def _outside(col: pd.Series, spec: Mapping) -> int:
+    """Non-NaN values outside the PARAM domain (0 when the column has no domain)."""
+    dom = spec.get("domain")
+    if dom is None:
+        return 0
+    if spec.get("type") == "float" and len(dom) == 2:
+        values = col.to_numpy(dtype=np.float64, na_value=np.nan)
+        return int(((values < float(dom[0])) | (values > float(dom[1]))).sum())
+    present = col.dropna()
+    return int((~present.isin(list(dom))).sum())
+
+
+#%% CELL 04 — QC FUNCTION FACTORY
+
+def _create_qc_functions(param: Mapping, frame_column: str, max_nan_fraction: float) -> dict[str, Callable]:
+    """
+    Create the table check bound to PARAM and the NaN threshold.
+
+    Returns:
+        Dictionary with 1 QC function.
+    """
+    default_nan = max_nan_fraction
+
+    def qc_table(df: pd.DataFrame, tag: str, max_nan_fraction: float | None = None) -> dict:
+        """
+        Outcome of one table (see QC Rules / Result).
+
+        Args:
+            df: Table to check.
+            tag: PARAM tag of its column set ('tracked', 'sleap', 'scored', 'pose', ...).
+            max_nan_fraction: Largest tolerated NaN share per column (default from controller).
+
+        Returns:
+            {"outcome": "ok" | "flag" | "error", "missing", "nan_fraction", "out_of_domain"}.
+
+        Examples:
+            BC_CLASSIFIER["qc_table"](scored, tag="scored")["outcome"]
+        """
+        limit = default_nan if max_nan_fraction is None else max_nan_fraction
+        expected = [c for c, spec in param.items() if tag in spec.get("tags", ())]
+        missing = [c for c in expected if c not in df.columns]
+        nan_fraction: dict[str, float] = {}
+        out_of_domain: dict[str, int] = {}
+        n = len(df)
+        for c in expected:
+            if c not in df.columns or c == frame_column:
+                continue
+            col = df[c]
+            nan = int(col.isna().sum())
+            if nan:
+                nan_fraction[c] = nan / n
+            bad = _outside(col, param[c])
+            if bad:
+                out_of_domain[c] = bad
+        if missing:
+            outcome = ERROR
+        elif out_of_domain or any(f > limit for f in nan_fraction.values()):
+            outcome = FLAG
+        else:
+            outcome = OK
+        return {"outcome": outcome, "missing": missing, "nan_fraction": nan_fraction, "out_of_domain": out_of_domain}
+
+    return {
+        "qc_table": qc_table,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(param: Mapping, frame_column: str, max_nan_fraction: float) -> dict[str, Callable]:
+    """
+    Generate QC functions.
+
+    Args:
+        param: PARAM registry (tags, domains).
+        frame_column: Shared timebase column (presence only).
+        max_nan_fraction: Default largest tolerated NaN share per column.
+
+    Returns:
+        Dictionary with 1 QC function.
+
+    Validation:
+        Asserts 1 function returned and 0 ≤ max_nan_fraction ≤ 1.
+    """
+    assert 0.0 <= max_nan_fraction <= 1.0, f"max_nan_fraction must be in [0, 1], got {max_nan_fraction}"
+    functions = _create_qc_functions(param, frame_column, max_nan_fraction)
+
+    # Validation
+    assert len(functions) == 1, f"Expected 1 QC function, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
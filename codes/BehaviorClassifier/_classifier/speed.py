@@ -0,0 +1,240 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+speed.py — Guarded Rolling-Mean Speed Denoising (Speed_Denoised)
+=================================================================
+
+Centered rolling mean of Speed from cumulative sums, with the jump and
+stimulus-response guards applied as masks computed once per call.
+
+Exports:
+    configure(utils: Mapping, fps: float, window_sec: float, high_speed: float, pre_stim_sec: float, post_stim_sec: float, skip_response: bool, kernel: Callable) → dict[str, callable]
+
+Speed Functions (3 total):
+    - response_mask(n, onsets, pre=None, post=None) → bool[n]
+    - denoise_speed(speed, response=None, window=None) → float64[..., n]
+    - speed_denoised(df, window=None) → float64[n]
+
+Denoising Rules (per frame, centered window of `window` frames):
+    1. Mean of the non-NaN Speed values in the window (NaN if none)
+    2. Jump guard: window holds any frame ≥ high_speed → raw Speed kept
+    3. Response guard: frame inside a stimulus response window
+       [onset - pre, onset + post] → raw Speed kept
+
+Algorithm:
+    Speed - row mean (NaN → 0) and validity → two edge-padded cumsums
+    jump frames → third cumsum → every window's sum / count / jumps as
+    slice differences (no gather); count / jump sums skipped when no
+    NaN / no jump frame
+    response windows → ±1 difference array → cumsum > 0
+
+Notes:
+    - Reference semantics: pd.Series.rolling(window, center=True,
+      min_periods=1).mean(), then guards; cumulative sums (of mean-centered
+      values) agree with it to float rounding, not bit for bit
+    - Window alignment and edge truncation match voting.py
+    - Leading axes are independent rows (flies); response masks broadcast
+    - denoise_speed runs the active backend's "denoise" kernel (backends.py);
+      _denoise here is the NumPy reference
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .voting import _bounds
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for speed.py.
+
+Why Empty?
+    Window, jump threshold and response windows come from classifier.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — DENOISING KERNEL
+
+def _window_sums(x: np.ndarray, window: int) -> np.ndarray:
+    """Sum of x over every centered window (edge-padded cumsum, slices only)."""
+    n = x.shape[-1]
+    a, b = window // 2, (window - 1) // 2
+    cs = np.zeros(x.shape[:-1] + (n + 1 + a + b,), dtype=np.float64 if x.dtype.kind == "f" else np.int32)
+    np.cumsum(x, axis=-1, out=cs[..., a + 1:a + 1 + n])
+    cs[..., a + 1 + n:] = cs[..., a + n:a + n + 1]  # hi clipped at n
+    return cs[..., a + b + 1:a + b + 1 + n] - cs[..., :n]
+
+
+def _lengths(n: int, window: int) -> np.ndarray:
+    lo, hi = _bounds(n, window)
+    return (hi - lo).astype(np.int32)
+
+
+def _denoise(speed: np.ndarray, window: int, high_speed: float, response: np.ndarray | None) -> np.ndarray:
+    """Guarded centered rolling mean (see Denoising Rules)."""
+    n = speed.shape[-1]
+    valid = ~np.isnan(speed)
+    dense = bool(valid.all())
+    # Centering keeps the running sum small (error ~ √n·σ·ε instead of n·mean·ε)
+    filled = speed if dense else np.where(valid, speed, 0.0)
+    mean = filled.sum(axis=-1, keepdims=True) / np.maximum(valid.sum(axis=-1, keepdims=True), 1)
+    sums = _window_sums(filled - mean if dense else np.where(valid, filled - mean, 0.0), window)
+    counts = _lengths(n, window) if dense else _window_sums(valid, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = np.where(counts > 0, sums / counts + mean, np.nan)
+    high = speed >= high_speed
+    guard = _window_sums(high, window) > 0 if high.any() else np.zeros(speed.shape, dtype=bool)
+    if response is not None:
+        guard |= response
+    return np.where(guard, speed, out)
+
+
+def _response(n: int, onsets: np.ndarray, pre: int, post: int) -> np.ndarray:
+    """Frames within [onset - pre, onset + post] of any onset."""
+    onsets = np.asarray(onsets, dtype=np.int64)
+    d = np.bincount(np.clip(onsets - pre, 0, n), minlength=n + 1)[: n + 1]
+    d = d - np.bincount(np.clip(onsets + post + 1, 0, n), minlength=n + 1)[: n + 1]
+    return np.cumsum(d[:-1]) > 0
+
+
+#%% CELL 04 — SPEED FUNCTION FACTORY
+
+def _create_speed_functions(
+    utils: Mapping,
+    fps: float,
+    window_sec: float,
+    high_speed: float,
+    pre_stim_sec: float,
+    post_stim_sec: float,
+    skip_response: bool,
+    kernel: Callable[[str], Callable],
+) -> dict[str, Callable]:
+    """
+    Create speed denoising kernels bound to BC_UTILS stimulus events and defaults.
+
+    Returns:
+        Dictionary with 3 speed functions.
+    """
+    stimulus_events = utils["stimulus_events"]
+    default_window = max(1, int(round(window_sec * fps)))
+    default_pre = int(round(pre_stim_sec * fps))
+    default_post = int(round(post_stim_sec * fps))
+
+    def response_mask(n: int, onsets: np.ndarray, pre: int | None = None, post: int | None = None) -> np.ndarray:
+        """
+        Frames inside any stimulus response window.
+
+        Args:
+            n: Frame count.
+            onsets: Onset row positions (any channels, any order).
+            pre / post: Frames before / after each onset (default: STARTLE_PRE/POST_STIM_SEC × FPS).
+
+        Returns:
+            bool[n].
+        """
+        return _response(
+            n, onsets,
+            default_pre if pre is None else pre,
+            default_post if post is None else post,
+        )
+
+    def denoise_speed(
+        speed: np.ndarray,
+        response: np.ndarray | None = None,
+        window: int | None = None,
+    ) -> np.ndarray:
+        """
+        Guarded centered rolling mean of Speed (see Denoising Rules).
+
+        Args:
+            speed: float[..., n] Speed (mm/s, NaN allowed).
+            response: bool[n] or bool[..., n] frames to keep raw (None → no response guard).
+            window: Window frames (default: SPEED_DENOISE_AVG_WINDOW_SEC × FPS).
+
+        Returns:
+            float64[..., n] Speed_Denoised.
+
+        Examples:
+            den = denoise_speed(df["Speed"].to_numpy(), response_mask(len(df), onsets))
+        """
+        return kernel("denoise")(
+            np.asarray(speed, dtype=np.float64),
+            default_window if window is None else window,
+            high_speed,
+            response,
+        )
+
+    def speed_denoised(df: pd.DataFrame, window: int | None = None) -> np.ndarray:
+        """
+        Speed_Denoised of one scored table (response windows from its stimulus columns).
+
+        Args:
+            df: Table with Speed and the cleaned PARAM stimulus columns.
+            window: Window frames (default from controller).
+
+        Returns:
+            float64[n].
+
+        Examples:
+            df["Speed_Denoised"] = speed_denoised(df)
+        """
+        response = None
+        if skip_response:
+            events = stimulus_events(df)
+            onsets = np.concatenate([on for on, _ in events.values()]) if events else np.empty(0, dtype=np.int64)
+            response = response_mask(len(df), onsets)
+        return denoise_speed(df["Speed"].to_numpy(), response, window)
+
+    return {
+        "response_mask": response_mask,
+        "denoise_speed": denoise_speed,
+        "speed_denoised": speed_denoised,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    utils: Mapping,
+    fps: float,
+    window_sec: float,
+    high_speed: float,
+    pre_stim_sec: float,
+    post_stim_sec: float,
+    skip_response: bool,
+    kernel: Callable[[str], Callable],
+) -> dict[str, Callable]:
+    """
+    Generate speed denoising functions.
+
+    Args:
+        utils: BC_UTILS bundle (stimulus_events).
+        fps: Frames per second.
+        window_sec: Smoothing window (seconds).
+        high_speed: Jump threshold (mm/s).
+        pre_stim_sec / post_stim_sec: Response window around each onset (seconds).
+        skip_response: Keep raw Speed inside response windows.
+        kernel: Backend kernel lookup (backends.py kernel).
+
+    Returns:
+        Dictionary with 3 speed functions.
+
+    Validation:
+        Asserts 3 functions returned and a positive window.
+    """
+    assert fps > 0 and window_sec > 0, f"Invalid speed window: fps={fps}, window_sec={window_sec}"
+    functions = _create_speed_functions(utils, fps, window_sec, high_speed, pre_stim_sec, post_stim_sec, skip_response, kernel)
+
+    # Validation
+    assert len(functions) == 3, f"Expected 3 speed functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
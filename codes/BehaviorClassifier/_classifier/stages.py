@@ -0,0 +1,360 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+stages.py — Row-Wise Stage Kernels (Features, Layer1, Resistant, Behavior)
+===========================================================================
+
+Feature construction and the per-frame classification stages as array
+kernels over float / code matrices (flies, frames); a single recording
+is a 1-row matrix.
+
+Exports:
+    configure(param: Mapping, fps: float, arena_mm: tuple[float, float], motion_threshold: float, high_speed: float, low_speed: float, noise_tolerance: int, max_gap_sec: float, pre_stim_sec: float, post_stim_sec: float, kernel: Callable) → dict[str, callable]
+
+Stage Functions (6 total):
+    - build_features(x, y, pixel_change) → {Position_X, Position_Y, Speed, Motion}
+    - layer1_codes(speed, motion) → int16[..., n]
+    - remove_micro_bouts(codes, max_length=None, keep=None) → int16[..., n]
+    - fill_gaps(codes, max_length=None, skip=None) → int16[..., n]
+    - resistant_codes(layer2, rows, onsets, pre=None, post=None) → int16[..., n]
+    - behavior_codes(layer2, resistant) → int16[..., n]
+
+Stage Rules:
+    Features   Position = normalized centroid × arena (mm);
+               Speed = |Δposition| × fps (first frame NaN);
+               Motion = PixelChange > motion_threshold (NaN stays NaN)
+    Layer1     Speed ≥ high → Jump; elif Motion == 0 → Freeze;
+               elif Speed ≥ low → Walk; else Stationary; NaN Speed → missing
+    Micro      bouts ≤ noise_tolerance frames → missing (Jump kept)
+    Gaps       missing runs ≤ max_gap frames with the same label on both
+               sides → that label, unless the run touches a `skip` frame
+    Resistant  per onset: [onset - pre, onset + post] inside the row and one
+               Layer2 label throughout (Walk / Stationary / Freeze) →
+               those frames Resistant_<label>; mixed, missing or Jump → missing
+    Behavior   Layer2 label by suffix; Freeze + Resistant_Freeze → Resistant_Freeze
+
+Notes:
+    - Codes follow the BC_UTILS Bouts convention (PARAM domain index, -1 missing)
+    - Runs never cross rows: row starts always begin a new run
+    - Onsets are (row, frame) pairs so every fly keeps its own stimuli
+    - Micro / Gaps / Resistant run the active backend's kernels
+      (backends.py); _micro / _gaps / _resistant here are the NumPy reference
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+
+from .voting import MISSING, _suffix
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for stages.py.
+
+Why Empty?
+    Thresholds, arena size and tolerances come from classifier.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — STAGE KERNELS
+
+def _runs(codes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Runs of a code matrix, row-major, never crossing rows → (run id per frame, starts, lengths)."""
+    flat = codes.reshape(-1)
+    n = codes.shape[-1]
+    new = np.ones(flat.shape, dtype=bool)
+    if flat.size:
+        new[1:] = flat[1:] != flat[:-1]
+        new[::n] = True
+    starts = np.flatnonzero(new)
+    lengths = np.diff(np.append(starts, flat.size))
+    return np.cumsum(new) - 1, starts, lengths
+
+
+def _row_windows(f: int, n: int, rows: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """bool[f, n] marking frames [lo, hi) of each (row, window) pair (±1 difference array)."""
+    rows = np.asarray(rows, dtype=np.int64)
+    lo = np.clip(np.asarray(lo, dtype=np.int64), 0, n)
+    hi = np.clip(np.asarray(hi, dtype=np.int64), 0, n)
+    d = np.bincount(rows * (n + 1) + lo, minlength=f * (n + 1))[: f * (n + 1)]
+    d = d - np.bincount(rows * (n + 1) + hi, minlength=f * (n + 1))[: f * (n + 1)]
+    return np.cumsum(d.reshape(f, n + 1)[:, :-1], axis=1) > 0
+
+
+def _features(x: np.ndarray, y: np.ndarray, pixel_change: np.ndarray, fps: float,
+              arena_mm: tuple[float, float], motion_threshold: float) -> dict[str, np.ndarray]:
+    px = np.asarray(x, dtype=np.float64) * arena_mm[0]
+    py = np.asarray(y, dtype=np.float64) * arena_mm[1]
+    speed = np.full(px.shape, np.nan)
+    speed[..., 1:] = np.hypot(np.diff(px, axis=-1), np.diff(py, axis=-1)) * fps
+    pc = np.asarray(pixel_change, dtype=np.float64)
+    motion = np.where(np.isnan(pc), np.nan, (pc > motion_threshold).astype(np.float64))
+    return {"Position_X": px, "Position_Y": py, "Speed": speed, "Motion": motion}
+
+
+def _layer1(speed: np.ndarray, motion: np.ndarray, high: float, low: float, codes: tuple[int, int, int, int]) -> np.ndarray:
+    jump, walk, stationary, freeze = codes
+    out = np.where(speed >= low, walk, stationary).astype(np.int16)
+    out[motion == 0] = freeze
+    out[speed >= high] = jump
+    out[np.isnan(speed)] = MISSING
+    return out
+
+
+def _micro(codes: np.ndarray, max_length: int, keep: np.ndarray) -> np.ndarray:
+    run, starts, lengths = _runs(codes)
+    c = codes.reshape(-1)[starts]
+    drop = (lengths <= max_length) & (c != MISSING) & ~np.isin(c, keep)
+    out = codes.copy()
+    out.reshape(-1)[drop[run]] = MISSING
+    return out
+
+
+def _gaps(codes: np.ndarray, max_length: int, skip: np.ndarray | None) -> np.ndarray:
+    run, starts, lengths = _runs(codes)
+    k = len(starts)
+    if k < 3:
+        return codes.copy()
+    n = codes.shape[-1]
+    c = codes.reshape(-1)[starts]
+    first = (starts % n) == 0  # run opens a row
+    inner = np.arange(1, k - 1)
+    fill = (
+        (c[inner] == MISSING)
+        & (lengths[inner] <= max_length)
+        & (c[inner - 1] == c[inner + 1])
+        & (c[inner - 1] != MISSING)
+        & ~first[inner]
+        & ~first[inner + 1]
+    )
+    if skip is not None:
+        hits = np.broadcast_to(skip, codes.shape).reshape(-1)
+        cs = np.concatenate([[0], np.cumsum(hits, dtype=np.int64)])
+        fill &= (cs[starts[inner] + lengths[inner]] - cs[starts[inner]]) == 0
+    value = np.full(k, MISSING, dtype=np.int16)
+    value[inner[fill]] = c[inner[fill] - 1]
+    out = codes.copy()
+    flat = out.reshape(-1)
+    sel = value[run] != MISSING
+    flat[sel] = value[run][sel]
+    return out
+
+
+def _resistant(layer2: np.ndarray, rows: np.ndarray, onsets: np.ndarray, pre: int, post: int,
+               lut: np.ndarray) -> np.ndarray:
+    shape = layer2.shape
+    codes2 = layer2.reshape(int(np.prod(shape[:-1])), shape[-1])
+    f, n = codes2.shape
+    out = np.full((f, n), MISSING, dtype=np.int16)
+    rows = np.asarray(rows, dtype=np.int64)
+    lo = np.asarray(onsets, dtype=np.int64) - pre
+    hi = np.asarray(onsets, dtype=np.int64) + post + 1
+    ok = (lo >= 0) & (hi <= n)
+    rows, lo, hi = rows[ok], lo[ok], hi[ok]
+    if len(rows):
+        # changes[r, i] = label changes in row r up to frame i (one label on [lo, hi) ⇔ none inside)
+        changes = np.zeros((f, n), dtype=np.int32)
+        np.cumsum(codes2[:, 1:] != codes2[:, :-1], axis=1, out=changes[:, 1:])
+        label = codes2[rows, lo].astype(np.int64)
+        value = np.where(label >= 0, lut[np.maximum(label, 0)], MISSING)
+        uniform = (changes[rows, hi - 1] == changes[rows, lo]) & (value != MISSING)
+        # overlapping uniform windows share their frames' label → one value per frame
+        for v in np.unique(value[uniform]):
+            sel = uniform & (value == v)
+            out[_row_windows(f, n, rows[sel], lo[sel], hi[sel])] = v
+    return out.reshape(shape)
+
+
+#%% CELL 04 — STAGE FUNCTION FACTORY
+
+def _create_stage_functions(
+    param: Mapping,
+    fps: float,
+    arena_mm: tuple[float, float],
+    motion_threshold: float,
+    high_speed: float,
+    low_speed: float,
+    noise_tolerance: int,
+    max_gap_sec: float,
+    pre_stim_sec: float,
+    post_stim_sec: float,
+    kernel: Callable[[str], Callable],
+) -> dict[str, Callable]:
+    """
+    Create stage kernels bound to PARAM label domains and thresholds.
+
+    Returns:
+        Dictionary with 6 stage functions.
+    """
+    l1 = [_suffix(x) for x in param["Layer1"]["domain"]]
+    l1_codes = tuple(l1.index(s) for s in ("Jump", "Walk", "Stationary", "Freeze"))
+    freeze_code = l1.index("Freeze")
+    resistant_domain = list(param["Resistant"]["domain"])
+    resistant_code = resistant_domain.index("Resistant_Freeze")
+    # Layer2 code → Resistant code of the same label (-1: no Resistant tier, e.g. Jump)
+    resistant_lut = np.array(
+        [resistant_domain.index(f"Resistant_{s}") if f"Resistant_{s}" in resistant_domain else MISSING
+         for s in (_suffix(x) for x in param["Layer2"]["domain"])],
+        dtype=np.int16,
+    )
+    behavior_domain = list(param["Behavior"]["domain"])
+    behavior_lut = np.array([behavior_domain.index(s) for s in l1] + [MISSING], dtype=np.int16)
+    promoted = behavior_domain.index("Resistant_Freeze")
+    default_gap = int(round(max_gap_sec * fps))
+    default_pre = int(round(pre_stim_sec * fps))
+    default_post = int(round(post_stim_sec * fps))
+    default_keep = np.array([l1_codes[0]], dtype=np.int16)
+
+    def build_features(x: np.ndarray, y: np.ndarray, pixel_change: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Position (mm), Speed (mm/s) and Motion from tracked columns.
+
+        Args:
+            x / y: NormalizedCentroidX / NormalizedCentroidY, float[..., n].
+            pixel_change: PixelChange, float[..., n] (NaN = no frame).
+
+        Returns:
+            {"Position_X", "Position_Y", "Speed", "Motion"} → float64[..., n].
+        """
+        return _features(x, y, pixel_change, fps, arena_mm, motion_threshold)
+
+    def layer1_codes(speed: np.ndarray, motion: np.ndarray) -> np.ndarray:
+        """
+        Layer1 codes from Speed (or Speed_Denoised) and Motion.
+
+        Examples:
+            l1 = layer1_codes(feat["Speed"], feat["Motion"])
+        """
+        return _layer1(np.asarray(speed, dtype=np.float64), np.asarray(motion), high_speed, low_speed, l1_codes)
+
+    def remove_micro_bouts(codes: np.ndarray, max_length: int | None = None, keep: Iterable[int] | None = None) -> np.ndarray:
+        """
+        Set bouts of ≤ max_length frames to missing (Layer1_Denoised step 3).
+
+        Args:
+            codes: int16[..., n] Layer1 codes.
+            max_length: Frames (default: NOISE_TOLERANCE).
+            keep: Codes never removed (default: Layer1 Jump).
+        """
+        return kernel("micro")(
+            np.asarray(codes, dtype=np.int16),
+            noise_tolerance if max_length is None else max_length,
+            default_keep if keep is None else np.asarray(list(keep), dtype=np.int16),
+        )
+
+    def fill_gaps(codes: np.ndarray, max_length: int | None = None, skip: np.ndarray | None = None) -> np.ndarray:
+        """
+        Fill short missing runs bounded by the same label (Behavior_Denoised).
+
+        Args:
+            codes: int16[..., n] label codes.
+            max_length: Frames (default: MAX_NAN_BOUT_CLEAN_SEC × FPS).
+            skip: bool[n] or bool[..., n] frames whose gaps stay missing
+                  (stimulus response windows).
+        """
+        return kernel("gaps")(np.asarray(codes, dtype=np.int16), default_gap if max_length is None else max_length, skip)
+
+    def resistant_codes(
+        layer2: np.ndarray,
+        rows: np.ndarray,
+        onsets: np.ndarray,
+        pre: int | None = None,
+        post: int | None = None,
+    ) -> np.ndarray:
+        """
+        Resistant codes: Resistant_<label> on onset windows covered by one Layer2 label.
+
+        Args:
+            layer2: int16[..., n] Layer2 (or Layer2_Denoised) codes.
+            rows / onsets: Onset (row, frame) pairs; rows index the flattened
+                           leading axes (0 for a 1-D input).
+            pre / post: Frames before / after onset (default: STARTLE_PRE/POST_STIM_SEC × FPS).
+
+        Returns:
+            int16[..., n] codes in the Resistant domain (-1 elsewhere).
+        """
+        return kernel("resistant")(
+            np.asarray(layer2, dtype=np.int16), rows, onsets,
+            default_pre if pre is None else pre,
+            default_post if post is None else post,
+            resistant_lut,
+        )
+
+    def behavior_codes(layer2: np.ndarray, resistant: np.ndarray) -> np.ndarray:
+        """
+        Behavior codes from Layer2 codes, Freeze promoted where Resistant_Freeze.
+
+        Examples:
+            beh = behavior_codes(l2, res)
+        """
+        layer2 = np.asarray(layer2, dtype=np.int16)
+        out = behavior_lut[layer2]
+        out[(layer2 == freeze_code) & (np.asarray(resistant) == resistant_code)] = promoted
+        return out
+
+    return {
+        "build_features": build_features,
+        "layer1_codes": layer1_codes,
+        "remove_micro_bouts": remove_micro_bouts,
+        "fill_gaps": fill_gaps,
+        "resistant_codes": resistant_codes,
+        "behavior_codes": behavior_codes,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    param: Mapping,
+    fps: float,
+    arena_mm: tuple[float, float],
+    motion_threshold: float,
+    high_speed: float,
+    low_speed: float,
+    noise_tolerance: int,
+    max_gap_sec: float,
+    pre_stim_sec: float,
+    post_stim_sec: float,
+    kernel: Callable[[str], Callable],
+) -> dict[str, Callable]:
+    """
+    Generate stage functions.
+
+    Args:
+        param: PARAM registry (Layer1 / Resistant / Behavior domains).
+        fps: Frames per second.
+        arena_mm: Arena (width, height) in mm.
+        motion_threshold: PixelChange above this → Motion 1.
+        high_speed / low_speed: Jump and Walk thresholds (mm/s).
+        noise_tolerance: Micro-bout length (frames).
+        max_gap_sec: Longest gap filled in Behavior_Denoised (seconds).
+        pre_stim_sec / post_stim_sec: Resistant coverage window (seconds).
+        kernel: Backend kernel lookup (backends.py kernel).
+
+    Returns:
+        Dictionary with 6 stage functions.
+
+    Validation:
+        Asserts 6 functions returned, ordered thresholds and every Layer1
+        label present in the Behavior domain.
+    """
+    assert 0 <= low_speed < high_speed, f"Invalid speed thresholds: low={low_speed}, high={high_speed}"
+    l1 = {_suffix(x) for x in param["Layer1"]["domain"]}
+    assert l1 <= set(param["Behavior"]["domain"]), f"Behavior domain lacks Layer1 labels: {sorted(l1)}"
+    functions = _create_stage_functions(
+        param, fps, arena_mm, motion_threshold, high_speed, low_speed,
+        noise_tolerance, max_gap_sec, pre_stim_sec, post_stim_sec, kernel,
+    )
+
+    # Validation
+    assert len(functions) == 6, f"Expected 6 stage functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,286 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+voting.py — Sliding-Window Label Voting (Layer2 / Layer2_Denoised)
+===================================================================
+
+Windowed consensus over Layer1 labels with cumulative one-hot counts:
+every window's votes in O(frames × labels), no per-window loop.
+
+Exports:
+    configure(param: Mapping, fps: float, window_sec: float, min_valid_fraction: float, priority: tuple, kernel: Callable) → dict[str, callable]
+
+Voting Functions (4 total):
+    - window_votes(codes, n_labels, window) → (counts int32[L, ..., n], lengths int32[n])
+    - vote_codes(codes, n_labels=None, window=None, jump=None, priority=None, min_valid_fraction=None, spans=None) → int16[..., n]
+    - layer2(layer1, window=None) → Categorical (Layer2 domain)
+    - layer2_denoised(layer1_denoised, window=None) → Categorical (Layer2_Denoised domain)
+
+Voting Rules (per frame, centered window of `window` frames):
+    1. Jump override: any Jump vote in the window → Jump
+    2. Majority of valid votes; ties → first label in `priority`
+       (Jump > Walk > Stationary > Freeze)
+    3. min_valid_fraction (Layer2_Denoised): valid votes must be
+       > fraction × window length, else missing
+    4. No valid votes → missing
+
+Algorithm:
+    codes (-1 = missing) → one-hot bool[L, ..., n] → cumsum along frames
+    (zero row prepended) → counts = cs[hi] - cs[lo] for all windows at once
+    → priority-ordered argmax + override / validity masks
+
+Notes:
+    - Codes are Layer1 domain indices (BC_UTILS Bouts convention, -1 missing);
+      leading axes are independent rows (flies), votes run along the last axis
+    - Window alignment matches pandas rolling(center=True): frames
+      [i - window//2, i + (window-1)//2], truncated at the edges
+    - Window length at the edges is the truncated length; spans=(starts, stops)
+      truncates per row instead (padded fly matrices: padding never counts
+      against the valid fraction)
+    - Layer1 and Layer2 domains share label order (asserted in configure),
+      so consensus codes index the Layer2 domain directly
+    - vote_codes runs the active backend's "vote" kernel (backends.py);
+      _vote here is the NumPy reference
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for voting.py.
+
+Why Empty?
+    Window length, validity fraction and tie order come from classifier.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — VOTING KERNEL
+
+MISSING: int = -1
+
+
+def _bounds(n: int, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Cumsum indices [lo, hi) of every centered window (pandas center=True)."""
+    i = np.arange(n)
+    lo = np.maximum(i - window // 2, 0)
+    hi = np.minimum(i + (window - 1) // 2 + 1, n)
+    return lo, hi
+
+
+def _window_counts(codes: np.ndarray, n_labels: int, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per-label votes int32[L, ..., n] and window lengths int32[n]."""
+    n = codes.shape[-1]
+    onehot = codes[None, ...] == np.arange(n_labels, dtype=codes.dtype).reshape((-1,) + (1,) * codes.ndim)
+    cs = np.zeros(onehot.shape[:-1] + (n + 1,), dtype=np.int32)
+    np.cumsum(onehot, axis=-1, dtype=np.int32, out=cs[..., 1:])
+    lo, hi = _bounds(n, window)
+    return cs[..., hi] - cs[..., lo], (hi - lo).astype(np.int32)
+
+
+def _span_lengths(n: int, window: int, starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Window lengths truncated to each row's [start, stop) frames → int32[..., n]."""
+    i = np.arange(n)
+    lo = np.maximum(i - window // 2, np.asarray(starts)[..., None])
+    hi = np.minimum(i + (window - 1) // 2 + 1, np.asarray(stops)[..., None])
+    return np.maximum(hi - lo, 0).astype(np.int32)
+
+
+def _vote(
+    codes: np.ndarray,
+    n_labels: int,
+    window: int,
+    jump: int | None,
+    priority: np.ndarray,
+    min_valid_fraction: float | None,
+    spans: tuple[np.ndarray, np.ndarray] | None = None,
+) -> np.ndarray:
+    """Consensus code of every window (see Voting Rules)."""
+    counts, lengths = _window_counts(codes, n_labels, window)
+    if spans is not None and min_valid_fraction is not None:
+        lengths = _span_lengths(codes.shape[-1], window, *spans)
+    valid = counts.sum(axis=0)
+    out = priority[np.argmax(counts[priority], axis=0)].astype(np.int16)  # first max in priority order
+    if jump is not None:
+        out[counts[jump] > 0] = jump
+    missing = valid == 0
+    if min_valid_fraction is not None:
+        missing |= valid <= min_valid_fraction * lengths
+    out[missing] = MISSING
+    return out
+
+
+def _suffix(label: str) -> str:
+    return label.split("_", 1)[1] if "_" in label else label
+
+
+#%% CELL 04 — VOTING FUNCTION FACTORY
+
+def _create_voting_functions(
+    param: Mapping,
+    fps: float,
+    window_sec: float,
+    min_valid_fraction: float,
+    priority: tuple,
+    kernel: Callable[[str], Callable],
+) -> dict[str, Callable]:
+    """
+    Create voting kernels bound to PARAM label domains and defaults.
+
+    Returns:
+        Dictionary with 4 voting functions.
+    """
+    default_window = max(1, int(round(window_sec * fps)))
+    domains = {c: list(param[c]["domain"]) for c in ("Layer1", "Layer1_Denoised", "Layer2", "Layer2_Denoised")}
+    suffixes = [_suffix(x) for x in domains["Layer1"]]
+    jump_code = suffixes.index("Jump") if "Jump" in suffixes else None
+    default_priority = np.array(
+        [suffixes.index(s) for s in priority if s in suffixes]
+        + [i for i, s in enumerate(suffixes) if s not in priority],
+        dtype=np.intp,
+    )
+
+    def _codes(values, column: str) -> np.ndarray:
+        if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+            return values
+        return np.asarray(pd.Categorical(values, categories=domains[column]).codes)
+
+    def window_votes(codes: np.ndarray, n_labels: int, window: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Votes per label for every centered window.
+
+        Args:
+            codes: int[..., n] label codes (-1 = missing).
+            n_labels: Number of labels (codes 0..n_labels-1).
+            window: Window length in frames.
+
+        Returns:
+            (counts int32[n_labels, ..., n], lengths int32[n]) — lengths are
+            truncated at the edges.
+        """
+        return _window_counts(np.asarray(codes), n_labels, window)
+
+    def vote_codes(
+        codes: np.ndarray,
+        n_labels: int | None = None,
+        window: int | None = None,
+        jump: int | None = None,
+        priority: Iterable[int] | None = None,
+        min_valid_fraction: float | None = None,
+        spans: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> np.ndarray:
+        """
+        Consensus codes over centered windows (see Voting Rules).
+
+        Args:
+            codes: int[..., n] Layer1 codes (-1 = missing).
+            n_labels: Label count (default: Layer1 domain size).
+            window: Window frames (default: LAYER2_AVG_WINDOW_SEC × FPS).
+            jump: Override code (default: Layer1 Jump).
+            priority: Tie order of codes (default from controller).
+            min_valid_fraction: Validity rule (None → off).
+            spans: Per-row (starts, stops) frame extents for window lengths.
+
+        Returns:
+            int16[..., n] consensus codes.
+
+        Examples:
+            vote_codes(layer1_codes)                            # Layer2
+            vote_codes(den_codes, min_valid_fraction=0.5)       # Layer2_Denoised
+        """
+        return kernel("vote")(
+            np.asarray(codes),
+            len(suffixes) if n_labels is None else n_labels,
+            default_window if window is None else window,
+            jump_code if jump is None else jump,
+            default_priority if priority is None else np.asarray(list(priority), dtype=np.intp),
+            min_valid_fraction,
+            spans,
+        )
+
+    def layer2(layer1, window: int | None = None) -> pd.Categorical:
+        """
+        Layer2: windowed consensus over Layer1 (jump override).
+
+        Args:
+            layer1: Layer1 labels (Series / Categorical / array) or int codes.
+            window: Window frames (default from controller).
+
+        Returns:
+            Categorical over the Layer2 domain (NaN where no valid votes).
+
+        Examples:
+            df["Layer2"] = layer2(df["Layer1"])
+        """
+        codes = vote_codes(_codes(layer1, "Layer1"), window=window)
+        return pd.Categorical.from_codes(codes, categories=domains["Layer2"])
+
+    def layer2_denoised(layer1_denoised, window: int | None = None) -> pd.Categorical:
+        """
+        Layer2_Denoised: consensus over Layer1_Denoised with the half-missing rule.
+
+        Returns:
+            Categorical over the Layer2_Denoised domain (NaN where ≤ min_valid_fraction
+            of the window is valid).
+
+        Examples:
+            df["Layer2_Denoised"] = layer2_denoised(df["Layer1_Denoised"])
+        """
+        codes = vote_codes(_codes(layer1_denoised, "Layer1_Denoised"), window=window, min_valid_fraction=min_valid_fraction)
+        return pd.Categorical.from_codes(codes, categories=domains["Layer2_Denoised"])
+
+    return {
+        "window_votes": window_votes,
+        "vote_codes": vote_codes,
+        "layer2": layer2,
+        "layer2_denoised": layer2_denoised,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    param: Mapping,
+    fps: float,
+    window_sec: float,
+    min_valid_fraction: float,
+    priority: tuple,
+    kernel: Callable[[str], Callable],
+) -> dict[str, Callable]:
+    """
+    Generate voting functions.
+
+    Args:
+        param: PARAM registry (Layer1 / Layer2 domains).
+        fps: Frames per second.
+        window_sec: Voting window (seconds).
+        min_valid_fraction: Layer2_Denoised validity threshold.
+        priority: Tie order as label suffixes ("Jump", "Walk", ...).
+        kernel: Backend kernel lookup (backends.py kernel).
+
+    Returns:
+        Dictionary with 4 voting functions.
+
+    Validation:
+        Asserts 4 functions returned and aligned Layer1 / Layer2 domains.
+    """
+    l1 = [_suffix(x) for x in param["Layer1"]["domain"]]
+    for col in ("Layer1_Denoised", "Layer2", "Layer2_Denoised"):
+        assert [_suffix(x) for x in param[col]["domain"]] == l1, f"{col} domain does not match Layer1: {param[col]['domain']}"
+    assert fps > 0 and window_sec > 0, f"Invalid voting window: fps={fps}, window_sec={window_sec}"
+    functions = _create_voting_functions(param, fps, window_sec, min_valid_fraction, priority, kernel)
+
+    # Validation
+    assert len(functions) == 4, f"Expected 4 voting functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "MISSING"]
@@ -0,0 +1,138 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+_loaders/__init__.py — Loaders Coordinator
+===========================================
+
+Orchestrates loader workers and assembles the BC_LOADERS bundle.
+
+Architecture:
+    4 workers → coordinator → controller → BC_LOADERS export
+
+Workers (4):
+    1. chunked.py: 1 loader function (read_csv_parallel)
+    2. frame_index.py: 4 functions (build_frame_index, load_frame_index,
+       frame_span, read_frames)
+    3. pushdown.py: 2 functions (load_artifact, load_stem)
+    4. compact.py: 3 functions (write_compact, read_compact, compact_scored)
+
+Total Exports: 10 (validated)
+
+Design:
+    - Coordinator receives PATH, BC_UTILS + loader defaults from controller
+    - Calls workers in dependency order
+    - Assembles single immutable bundle
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Mapping
+
+from . import chunked, compact, frame_index, pushdown
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for _loaders coordinator.
+
+Why Empty?
+    Coordinator orchestrates workers (no direct configuration).
+    Defaults come from loaders.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - pure orchestration)
+
+#%% CELL 03 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    utils: Mapping,
+    max_workers: int | None,
+    chunk_bytes: int,
+    min_parallel_bytes: int,
+    frame_column: str,
+    index_stride: int,
+    index_block_bytes: int,
+    index_suffix: str,
+    compact_float_dtype: str,
+    compact_compress: bool,
+) -> MappingProxyType:
+    """
+    Configure and return the immutable BC_LOADERS bundle.
+
+    Args:
+        path: PATH mapping (from Config.path).
+        utils: BC_UTILS bundle (PARAM-derived dtypes).
+        max_workers: Default parser threads (None → os.cpu_count()).
+        chunk_bytes: Target chunk size for parallel parsing.
+        min_parallel_bytes: Spans smaller than this parse on one thread.
+        frame_column: Column indexed by frame sidecars (FrameIndex).
+        index_stride: Rows between stored frame offsets.
+        index_block_bytes: Read size of the index streaming pass.
+        index_suffix: Sidecar suffix appended to the CSV name.
+        compact_float_dtype: Float storage dtype of compact scored files.
+        compact_compress: Compress compact scored files.
+
+    Returns:
+        MappingProxyType with 10 loader exports.
+
+    Orchestration Order (respects dependencies):
+        1. chunked → read_csv_parallel (needs BC_UTILS)
+        2. frame_index → sidecar index + windowed reads (needs PATH temp_path)
+        3. pushdown → column / frame predicates (needs frame_index read_frames)
+        4. compact → compact scored format (needs PATH + BC_UTILS bouts + read_csv_parallel)
+    """
+    chunked_data = chunked.configure(
+        utils=utils,
+        max_workers=max_workers,
+        chunk_bytes=chunk_bytes,
+        min_parallel_bytes=min_parallel_bytes,
+    )
+
+    frame_index_data = frame_index.configure(
+        utils=utils,
+        temp_path=path["temp_path"],
+        frame_column=frame_column,
+        stride=index_stride,
+        block_bytes=index_block_bytes,
+        index_suffix=index_suffix,
+        max_workers=max_workers,
+        chunk_bytes=chunk_bytes,
+        min_parallel_bytes=min_parallel_bytes,
+    )
+
+    pushdown_data = pushdown.configure(
+        path=path,
+        utils=utils,
+        read_frames=frame_index_data["read_frames"],
+    )
+
+    compact_data = compact.configure(
+        path=path,
+        utils=utils,
+        read_csv=chunked_data["read_csv_parallel"],
+        float_dtype=compact_float_dtype,
+        compress=compact_compress,
+        frame_column=frame_column,
+    )
+
+    bundle = {
+        **chunked_data,
+        **frame_index_data,
+        **pushdown_data,
+        **compact_data,
+    }
+
+    # Validation: 1 chunked + 4 frame_index + 2 pushdown + 3 compact = 10
+    expected_count = 10
+    assert len(bundle) == expected_count, (
+        f"BC_LOADERS export count mismatch: expected {expected_count}, got {len(bundle)}. "
+        f"Keys: {sorted(bundle)}"
+    )
+
+    return MappingProxyType(bundle)
+
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,333 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+chunked.py — Parallel Chunked CSV Parsing
+==========================================
+
+Parse one large CSV on several threads straight into preallocated typed
+column buffers.
+
+Exports:
+    configure(utils: Mapping, max_workers: int | None, chunk_bytes: int, min_parallel_bytes: int) → dict[str, callable]
+    read_span(...) → (columns, buffers)   (shared with other loader workers)
+
+Loader Functions (1 total):
+    - read_csv_parallel(file, columns=None, dtypes=None, max_workers=None, chunk_bytes=None, as_frame=True) → DataFrame | dict
+
+Algorithm:
+    1. mmap the file; header → column names, dtypes from PARAM (BC_UTILS)
+    2. Split the data bytes at newline offsets into ~chunk_bytes chunks
+    3. Count rows per chunk (non-blank lines) → row offsets → allocate
+       each output column once (np.empty, final length)
+    4. Threads parse chunks (pandas C parser, GIL released while
+       tokenizing/converting) and write into out[col][row0:row1]
+    5. Integer / bool columns with missing values are promoted to float64
+       (NaN kept) — see Missing Values
+    6. DataFrame built from the buffers with copy=False (no concatenation)
+
+Missing Values:
+    A chunk whose int / bool column holds an empty field or NaN is parsed
+    again with those columns as float64 and kept aside; once all chunks
+    are done, each affected column becomes one float64 buffer (the typed
+    chunks cast, the float chunks copied in). Columns without gaps keep
+    their compact dtype, and the returned dtype map reports "float64" for
+    promoted columns
+
+Notes:
+    - Spans below min_parallel_bytes are parsed on the calling thread
+    - Blank lines are skipped (as the pandas parser does), including a
+      trailing one at the end of the file
+    - Quoted fields containing newlines are not supported (row counts
+      would disagree) → ValueError naming the chunk
+    - Domain strings (category) are parsed as strings, converted once at the end
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import io
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for chunked.py.
+
+Why Empty?
+    Worker count and chunk sizes come from loaders.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — SPAN PARSING
+
+def parse_header(line: bytes) -> list[str]:
+    """Column names from a CSV header line."""
+    text = line.decode("utf-8", "replace").rstrip("\r\n")
+    return [c.strip().strip('"') for c in text.split(",")] if text else []
+
+
+def _bounds(mm: mmap.mmap, lo: int, hi: int, n_chunks: int) -> list[tuple[int, int]]:
+    """Split [lo, hi) into ≤ n_chunks spans ending on newlines."""
+    step = max(1, (hi - lo) // max(1, n_chunks))
+    cuts = [lo]
+    pos = lo + step
+    while pos < hi:
+        nl = mm.find(b"\n", pos, hi)
+        if nl < 0 or nl + 1 >= hi:
+            break
+        cuts.append(nl + 1)
+        pos = nl + 1 + step
+    cuts.append(hi)
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+def _count_rows(mm: mmap.mmap, lo: int, hi: int) -> int:
+    """Non-blank lines in [lo, hi) (a final line without newline counts; '' and '\\r' lines skipped)."""
+    if hi <= lo:
+        return 0
+    buf = np.frombuffer(mm, dtype=np.uint8, count=hi - lo, offset=lo)
+    ends = np.flatnonzero(buf == 10)
+    if len(ends) == 0 or ends[-1] != len(buf) - 1:
+        ends = np.append(ends, len(buf))
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    length = ends - starts
+    last = buf[np.maximum(ends - 1, 0)]
+    blank = (length == 0) | ((length == 1) & (last == 13))
+    return int(len(ends) - np.count_nonzero(blank))
+
+
+def _promotable(dtype: str) -> bool:
+    """Dtypes that cannot hold NaN (parsed again as float64 on gaps)."""
+    return dtype != "category" and np.dtype(dtype).kind in "iub"
+
+
+def read_span(
+    file: Path | str,
+    column_dtypes: Callable[[Iterable[str]], dict[str, str]],
+    columns: Iterable[str] | None = None,
+    dtypes: Mapping[str, str] | None = None,
+    lo: int | None = None,
+    hi: int | None = None,
+    max_workers: int = 1,
+    chunk_bytes: int = 32 << 20,
+    min_parallel_bytes: int = 8 << 20,
+) -> tuple[list[str], dict[str, np.ndarray], dict[str, str]]:
+    """
+    Parse rows in byte range [lo, hi) of a CSV into typed column buffers.
+
+    Args:
+        file: CSV file (first line is the header).
+        column_dtypes: BC_UTILS column_dtypes (PARAM → dtype).
+        columns: Columns to materialize (default: all header columns).
+        dtypes: Per-column dtype overrides.
+        lo / hi: Byte range of whole rows (default: everything after the header).
+        max_workers / chunk_bytes / min_parallel_bytes: Parallelism controls.
+
+    Returns:
+        (columns in header order, name → 1-D array, name → requested dtype)
+
+    Raises:
+        KeyError: Requested column not in the header.
+        ValueError: Unparseable values, or a chunk row count mismatch (quoted newlines).
+    """
+    with open(file, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0:
+            return [], {}, {}
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = mm.find(b"\n")
+            header_end = size if header_end < 0 else header_end + 1
+            names = parse_header(mm[:header_end])
+
+            wanted = names if columns is None else list(columns)
+            unknown = [c for c in wanted if c not in names]
+            if unknown:
+                raise KeyError(f"Columns not in {Path(file).name}: {unknown}")
+            use = [c for c in names if c in set(wanted)]
+            want = {**column_dtypes(use), **(dtypes or {})}
+            want = {c: want[c] for c in use}
+            parse = {c: ("object" if d == "category" else d) for c, d in want.items()}
+
+            lo = header_end if lo is None else max(lo, header_end)
+            hi = size if hi is None else min(hi, size)
+            span = max(0, hi - lo)
+            n_chunks = 1 if span < min_parallel_bytes or max_workers <= 1 else max(
+                max_workers, -(-span // chunk_bytes)
+            )
+            spans = _bounds(mm, lo, hi, n_chunks) if span else []
+
+            counts = [_count_rows(mm, a, b) for a, b in spans]
+            starts = np.concatenate([[0], np.cumsum(counts, dtype=np.int64)])
+            total = int(starts[-1])
+            out = {c: np.empty(total, dtype=np.dtype(parse[c])) for c in use}
+            exact = [c for c in use if _promotable(parse[c])]
+            relaxed = {**parse, **dict.fromkeys(exact, "float64")}
+            gaps: dict[str, dict[int, np.ndarray]] = {}  # column → chunk → float64 values
+            gaps_lock = threading.Lock()
+
+            def parse_chunk(i: int, types: Mapping[str, str]) -> pd.DataFrame:
+                a, b = spans[i]
+                return pd.read_csv(
+                    io.BytesIO(mm[a:b]),
+                    header=None,
+                    names=names,
+                    usecols=use,
+                    dtype=types,
+                    engine="c",
+                )
+
+            def work(i: int) -> None:
+                holes: dict[str, np.ndarray] = {}
+                try:
+                    with np.errstate(invalid="ignore"):  # NaN → int cast warns before it raises
+                        df = parse_chunk(i, parse)
+                except ValueError:
+                    if not exact:
+                        raise
+                    df = parse_chunk(i, relaxed)  # int / bool gaps (a real error raises again)
+                    for c in exact:
+                        v = df[c].to_numpy()
+                        if np.isnan(v).any():
+                            holes[c] = v
+                            continue
+                        typed = v.astype(parse[c])
+                        if not np.array_equal(typed, v):
+                            raise ValueError(f"{Path(file).name}: column {c!r} in chunk {i} does not fit {parse[c]}")
+                        df[c] = typed
+                if len(df) != counts[i]:
+                    a, b = spans[i]
+                    raise ValueError(
+                        f"{Path(file).name}: chunk {i} bytes [{a}, {b}) parsed {len(df)} rows, "
+                        f"expected {counts[i]} (quoted newlines?)"
+                    )
+                r0, r1 = int(starts[i]), int(starts[i + 1])
+                for c in use:
+                    if c not in holes:
+                        out[c][r0:r1] = df[c].to_numpy()
+                if holes:
+                    with gaps_lock:
+                        for c, v in holes.items():
+                            gaps.setdefault(c, {})[i] = v
+
+            if len(spans) <= 1:
+                for i in range(len(spans)):
+                    work(i)
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    list(pool.map(work, range(len(spans))))
+    for c, chunks in gaps.items():
+        col = out[c].astype(np.float64)
+        for i, v in chunks.items():
+            col[int(starts[i]):int(starts[i + 1])] = v
+        out[c] = col
+        want[c] = "float64"
+    return use, out, want
+
+
+def to_frame(use: list[str], out: dict[str, np.ndarray], want: Mapping[str, str]) -> pd.DataFrame:
+    """DataFrame over the buffers (copy=False); category columns converted once."""
+    df = pd.DataFrame({c: out[c] for c in use}, copy=False)
+    for c in use:
+        if want[c] == "category":
+            df[c] = pd.Categorical(out[c])
+    return df
+
+
+#%% CELL 04 — LOADER FUNCTION FACTORY
+
+def _create_chunked_functions(
+    utils: Mapping,
+    max_workers: int | None,
+    chunk_bytes: int,
+    min_parallel_bytes: int,
+) -> dict[str, Callable]:
+    """
+    Create the parallel reader bound to BC_UTILS dtypes and controller defaults.
+
+    Returns:
+        Dictionary with 1 loader function.
+    """
+    column_dtypes = utils["column_dtypes"]
+    default_workers, default_chunk = max_workers, chunk_bytes
+
+    def read_csv_parallel(
+        file: Path | str,
+        columns: Iterable[str] | None = None,
+        dtypes: Mapping[str, str] | None = None,
+        max_workers: int | None = None,
+        chunk_bytes: int | None = None,
+        as_frame: bool = True,
+    ) -> pd.DataFrame | dict[str, np.ndarray]:
+        """
+        Parse a large CSV on several threads.
+
+        Args:
+            file: CSV path (e.g., PATH['tracked_path'](stem)).
+            columns: Columns to load (default: all).
+            dtypes: dtype overrides (default: PARAM via column_dtypes).
+            max_workers: Threads (None → controller default / os.cpu_count()).
+            chunk_bytes: Target chunk size in bytes.
+            as_frame: DataFrame (True) or dict of NumPy arrays (False).
+
+        Returns:
+            DataFrame (columns in file order) or name → array.
+
+        Examples:
+            df = BC_LOADERS["read_csv_parallel"](PATH["tracked_path"](stem))
+        """
+        workers = max_workers or default_workers or os.cpu_count() or 1
+        use, out, want = read_span(
+            file, column_dtypes, columns=columns, dtypes=dtypes,
+            max_workers=workers,
+            chunk_bytes=chunk_bytes or default_chunk,
+            min_parallel_bytes=min_parallel_bytes,
+        )
+        return to_frame(use, out, want) if as_frame else out
+
+    return {
+        "read_csv_parallel": read_csv_parallel,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    utils: Mapping,
+    max_workers: int | None,
+    chunk_bytes: int,
+    min_parallel_bytes: int,
+) -> dict[str, Callable]:
+    """
+    Generate chunked loader functions.
+
+    Args:
+        utils: BC_UTILS bundle (column_dtypes).
+        max_workers: Default threads (None → os.cpu_count()).
+        chunk_bytes: Default chunk size.
+        min_parallel_bytes: Spans smaller than this parse on one thread.
+
+    Returns:
+        Dictionary with 1 loader function.
+
+    Validation:
+        Asserts 1 function returned and a positive chunk size.
+    """
+    assert chunk_bytes > 0, f"chunk_bytes must be positive, got {chunk_bytes}"
+    functions = _create_chunked_functions(utils, max_workers, chunk_bytes, min_parallel_bytes)
+
+    # Validation
+    assert len(functions) == 1, f"Expected 1 chunked loader function, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "read_span", "to_frame", "parse_header"]
@@ -0,0 +1,334 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+compact.py — Compact Scored Output (float32 + RLE Labels)
+==========================================================
+
+Optional binary twin of *_scored.csv (PATH SUFFIX_SCORED_COMPACT,
+'_scored.npz'), much smaller and much faster to reload.
+
+Exports:
+    configure(path: Mapping, utils: Mapping, read_csv: Callable, float_dtype: str, compress: bool) → dict[str, callable]
+
+Compact Functions (3 total):
+    - write_compact(df, file) → Path
+    - read_compact(file, columns=None, frames=None, as_frame=True) → DataFrame | dict
+    - compact_scored(stem, flagged=False, path=None) → Path
+
+Column Encoding (dtype from PARAM via BC_UTILS column_dtypes):
+    category / object                 → RLE bouts (starts, lengths, int16 codes);
+                                        PARAM domain = categories (stable codes),
+                                        labels outside it appended as extra
+                                        categories (recorded in "unknown")
+    int8 / bool                       → RLE bouts of the values; a column made
+                                        float by NaN keeps NaN as code -1
+                                        ("missing"); non-integral values, values
+                                        beyond int16 or a -1 value → float_dtype array
+    int64                             → (start, step) if an arithmetic range
+                                        (FrameIndex), else int64 array
+    float64                           → float_dtype array (float32)
+
+File Layout (np.savez[_compressed]):
+    __meta__            JSON (uint8): version, rows, per-column kind/dtype/categories
+    v/<col>             value arrays
+    s/<col> l/<col> c/<col>   bout starts / lengths / codes
+
+Notes:
+    - Only requested columns are read from the archive (members load lazily)
+    - frames=(start, stop) slices bouts before decoding (no full expansion)
+    - float32 keeps ~7 significant digits (kinematics in mm, mm/s)
+    - Nothing is mapped to missing silently: only NaN reads back as NaN
+    - More categories than int16 codes can address → ValueError
+    - Written via PATH temp_path + os.replace (atomic)
+    - compact_scored parses the CSV with read_csv_parallel (PARAM dtypes:
+      labels arrive as categories, no mixed-type inference)
+    - Measured on synthetic scored tables: ~13–18.5x smaller than the
+      CSV, short of the 20–100x hoped for; float32 kinematics dominate
+      the archive (labels compress to a few bouts)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for compact.py.
+
+Why Empty?
+    Float precision and compression come from loaders.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — ENCODING
+
+_VERSION: int = 2
+
+_MISSING: int = -1                                   # bout code of NaN
+_MAX_CODES: int = int(np.iinfo(np.int16).max) + 1    # categories addressable by int16 codes
+
+
+def _value_codes(v: np.ndarray) -> tuple[np.ndarray, bool] | None:
+    """
+    int16 codes of an int8 / bool column → (codes, has NaN).
+
+    Returns None when the values need the float fallback (non-integral,
+    beyond int16, or -1 present: -1 is the bout missing code).
+    """
+    if v.dtype.kind in "iub":
+        info = np.iinfo(np.int16)
+        ok = not len(v) or (int(v.min()) >= info.min and int(v.max()) <= info.max and not (v == _MISSING).any())
+        return (v.astype(np.int16), False) if ok else None
+    v = np.asarray(v, dtype=np.float64)
+    gaps = np.isnan(v)
+    whole = v[~gaps]
+    if len(whole) and (
+        not np.array_equal(whole, np.round(whole))
+        or whole.min() < np.iinfo(np.int16).min
+        or whole.max() > np.iinfo(np.int16).max
+        or (whole == _MISSING).any()
+    ):
+        return None
+    return np.where(gaps, _MISSING, v).astype(np.int16), bool(gaps.any())
+
+
+def _rows_for(meta: dict, z, frames: tuple[int | None, int | None] | None, frame_column: str):
+    """Row selector (slice or bool mask) for a FrameIndex window."""
+    n = meta["rows"]
+    if frames is None:
+        return slice(0, n)
+    start, stop = frames
+    spec = meta["columns"].get(frame_column)
+    if spec is None:
+        raise KeyError(f"frames= needs a {frame_column!r} column in the compact file")
+    if spec["kind"] == "range" and spec["step"] > 0:
+        f0, step = spec["start"], spec["step"]
+        r0 = 0 if start is None else int(np.clip(-(-(start - f0) // step), 0, n))
+        r1 = n if stop is None else int(np.clip(-(-(stop - f0) // step), 0, n))
+        return slice(r0, max(r0, r1))
+    f = z[f"v/{frame_column}"]
+    keep = np.ones(n, dtype=bool)
+    if start is not None:
+        keep &= f >= start
+    if stop is not None:
+        keep &= f < stop
+    return keep
+
+
+def _decode_bouts(starts: np.ndarray, lengths: np.ndarray, codes: np.ndarray, rows) -> np.ndarray:
+    """Per-row codes for a row slice (bouts clipped first) or bool mask."""
+    if isinstance(rows, slice):
+        r0, r1 = rows.start, rows.stop
+        ends = starts + lengths
+        i0 = int(np.searchsorted(ends, r0, side="right"))
+        i1 = int(np.searchsorted(starts, r1, side="left"))
+        s = np.clip(starts[i0:i1], r0, r1)
+        e = np.clip(ends[i0:i1], r0, r1)
+        return np.repeat(codes[i0:i1], e - s)
+    return np.repeat(codes, lengths)[rows]
+
+
+#%% CELL 04 — COMPACT FUNCTION FACTORY
+
+def _create_compact_functions(
+    path: Mapping,
+    utils: Mapping,
+    read_csv: Callable,
+    float_dtype: str,
+    compress: bool,
+    frame_column: str,
+) -> dict[str, Callable]:
+    """
+    Create compact writer/reader bound to PATH, BC_UTILS and defaults.
+
+    Returns:
+        Dictionary with 3 compact functions.
+    """
+    default_path = path
+    column_dtypes = utils["column_dtypes"]
+    encode_bouts = utils["encode_bouts"]
+    save = np.savez_compressed if compress else np.savez
+
+    def write_compact(df: pd.DataFrame, file: Path | str) -> Path:
+        """
+        Write a scored DataFrame in the compact format (see header).
+
+        Args:
+            df: Scored table (any PARAM / derived columns).
+            file: Destination (e.g., PATH['scored_compact_path'](stem)).
+
+        Returns:
+            Destination Path.
+
+        Raises:
+            ValueError: A label column has more categories than int16 codes address.
+        """
+        file = Path(file)
+        dtypes = column_dtypes(df.columns)
+        arrays: dict[str, np.ndarray] = {}
+        specs: dict[str, dict] = {}
+        for col in df.columns:
+            dt = dtypes[col]
+            values = df[col]
+            if dt in ("category", "object"):
+                raw = values if dt == "category" else values.to_numpy()
+                b = encode_bouts(raw, column=col, unknown="append")
+                unknown: list = []
+                if b.categories is not None:
+                    domain = encode_bouts(raw[:0], column=col).categories   # () without a PARAM domain
+                    unknown = list(b.categories[len(domain):]) if domain else []
+                    if len(b.categories) > _MAX_CODES:
+                        raise ValueError(f"{col}: {len(b.categories)} categories exceed int16 codes ({_MAX_CODES})")
+                arrays[f"s/{col}"], arrays[f"l/{col}"], arrays[f"c/{col}"] = b.starts, b.lengths, b.codes
+                cats = None if b.categories is None else [str(c) for c in b.categories]
+                specs[col] = {"kind": "bouts", "dtype": dt, "categories": cats, "unknown": [str(c) for c in unknown]}
+            elif dt in ("int8", "bool") and (coded := _value_codes(values.to_numpy())) is not None:
+                codes, gaps = coded
+                b = encode_bouts(codes, missing=_MISSING if gaps else None)
+                arrays[f"s/{col}"], arrays[f"l/{col}"], arrays[f"c/{col}"] = b.starts, b.lengths, b.codes
+                specs[col] = {"kind": "bouts", "dtype": dt, "categories": None, "missing": _MISSING if gaps else None}
+            elif dt == "int64":
+                v = values.to_numpy(dtype=np.int64)
+                step = int(v[1] - v[0]) if len(v) > 1 else 1
+                if len(v) and np.array_equal(v, v[0] + step * np.arange(len(v), dtype=np.int64)):
+                    specs[col] = {"kind": "range", "dtype": dt, "start": int(v[0]), "step": step}
+                else:
+                    arrays[f"v/{col}"] = v
+                    specs[col] = {"kind": "array", "dtype": dt}
+            else:
+                arrays[f"v/{col}"] = values.to_numpy(dtype=float_dtype)
+                specs[col] = {"kind": "array", "dtype": float_dtype}
+        meta = {"version": _VERSION, "rows": len(df), "order": list(df.columns), "columns": specs}
+        arrays["__meta__"] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+
+        file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path["temp_path"](file)
+        with open(tmp, "wb") as fh:
+            save(fh, **arrays)
+        os.replace(tmp, file)
+        return file
+
+    def read_compact(
+        file: Path | str,
+        columns: Iterable[str] | None = None,
+        frames: tuple[int | None, int | None] | None = None,
+        as_frame: bool = True,
+    ) -> pd.DataFrame | dict[str, np.ndarray]:
+        """
+        Load a compact scored file (columns and frame window pushed down).
+
+        Args:
+            file: Compact file path.
+            columns: Columns to decode (default: all, file order).
+            frames: (start, stop) FrameIndex window.
+            as_frame: DataFrame (True) or dict of arrays (False).
+
+        Returns:
+            Labels as Categorical (codes when as_frame=False), binary ints
+            as int8 (float64 with NaN when the column had gaps), floats as
+            stored (float32).
+
+        Examples:
+            read_compact(PATH["scored_compact_path"](stem), columns=["Speed", "Behavior"], frames=(0, 1800))
+        """
+        with np.load(file) as z:
+            meta = json.loads(z["__meta__"].tobytes())
+            order = meta["order"]
+            use = order if columns is None else list(columns)
+            unknown = [c for c in use if c not in meta["columns"]]
+            if unknown:
+                raise KeyError(f"Columns not in {Path(file).name}: {unknown}")
+            rows = _rows_for(meta, z, frames, frame_column)
+
+            out: dict[str, object] = {}
+            for col in use:
+                spec = meta["columns"][col]
+                if spec["kind"] == "range":
+                    idx = np.arange(meta["rows"], dtype=np.int64)[rows]
+                    out[col] = spec["start"] + spec["step"] * idx
+                elif spec["kind"] == "array":
+                    out[col] = z[f"v/{col}"][rows]
+                else:
+                    codes = _decode_bouts(z[f"s/{col}"], z[f"l/{col}"], z[f"c/{col}"], rows)
+                    cats = spec["categories"]
+                    if cats is not None and as_frame:
+                        out[col] = pd.Categorical.from_codes(codes, categories=cats)
+                    elif spec.get("missing") is not None:
+                        out[col] = np.where(codes == spec["missing"], np.nan, codes.astype(np.float64))
+                    elif spec["dtype"] in ("int8", "bool"):
+                        out[col] = codes.astype(spec["dtype"])
+                    else:
+                        out[col] = codes
+        return pd.DataFrame(out, copy=False) if as_frame else out
+
+    def compact_scored(stem: str, flagged: bool = False, path: Mapping | None = None) -> Path:
+        """
+        Write the compact twin of a stem's scored CSV (next to it).
+
+        Args:
+            stem: Base stem.
+            flagged: Use Flag/Scored/ instead of Scored/.
+            path: Optional PATH override.
+
+        Returns:
+            Compact file Path.
+        """
+        p = default_path if path is None else path
+        src = p["flag_scored_path" if flagged else "scored_path"](stem)
+        dst = p["flag_scored_compact_path" if flagged else "scored_compact_path"](stem)
+        df = read_csv(src)
+        return write_compact(df, dst)
+
+    return {
+        "write_compact": write_compact,
+        "read_compact": read_compact,
+        "compact_scored": compact_scored,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    utils: Mapping,
+    read_csv: Callable,
+    float_dtype: str,
+    compress: bool,
+    frame_column: str,
+) -> dict[str, Callable]:
+    """
+    Generate compact format functions.
+
+    Args:
+        path: PATH mapping (compact path builders, temp_path).
+        utils: BC_UTILS bundle (column_dtypes, encode_bouts).
+        read_csv: CSV reader of compact_scored (chunked read_csv_parallel).
+        float_dtype: Storage dtype of float columns.
+        compress: zlib-compress the archive members.
+        frame_column: Column used for frame windows (FrameIndex).
+
+    Returns:
+        Dictionary with 3 compact functions.
+
+    Validation:
+        Asserts 3 functions returned and the PATH compact builders exist.
+    """
+    assert "scored_compact_path" in path, "PATH lacks scored_compact_path (SUFFIX_SCORED_COMPACT)"
+    functions = _create_compact_functions(path, utils, read_csv, float_dtype, compress, frame_column)
+
+    # Validation
+    assert len(functions) == 3, f"Expected 3 compact functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,360 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+frame_index.py — Byte-Offset Frame Index
+=========================================
+
+Sidecar index FrameIndex → byte offset for tracked / sleap / scored /
+pose CSVs, so frame windows can be read without parsing whole files.
+
+Exports:
+    configure(utils: Mapping, temp_path: Callable, frame_column: str, stride: int, block_bytes: int, index_suffix: str, max_workers: int | None, chunk_bytes: int, min_parallel_bytes: int) → dict[str, callable]
+
+Frame Index Functions (4 total):
+    - build_frame_index(file, stride=None) → FrameOffsets
+    - load_frame_index(file, build=True) → FrameOffsets | None
+    - frame_span(file, start=None, stop=None) → (lo, hi)
+    - read_frames(file, start=None, stop=None, columns=None, dtypes=None, as_frame=True) → DataFrame | dict
+
+Sidecar (next to the CSV, hidden from discovery):
+    <folder>/.<name>.csv<index_suffix>   e.g. .BASE_fly1_tracked.csv.fidx.npz
+    frames  int64[k]   FrameIndex of every `stride`-th row
+    offsets int64[k+1] byte offset of those rows (+ file size)
+    meta    int64[6]   size, mtime_ns, rows, stride, sorted, header_bytes
+
+Lookup ([start, stop) frames, sorted files):
+    lo = offset of the last sampled row with frame < start (so rows
+         repeating the start frame before a sample are kept)
+    hi = offset of the first sampled row with frame ≥ stop (else EOF)
+    → parse only [lo, hi), then trim rows outside the window exactly
+
+Notes:
+    - Built with one streaming pass (block reads, NumPy newline scan,
+      FrameIndex column parsed per block); blank lines are skipped, as
+      the parser skips them
+    - Stale sidecars (size / mtime changed) are rebuilt on load
+    - Sidecars are written via PATH temp_path + os.replace (atomic); a
+      folder that cannot be written (read-only / Drive root) keeps the
+      index in memory for the process instead (OSError never surfaces)
+    - Unsorted FrameIndex → span is the whole file (still exact after trim)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import io
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .chunked import parse_header, read_span, to_frame
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for frame_index.py.
+
+Why Empty?
+    Stride, block size and sidecar suffix come from loaders.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — FRAME OFFSETS
+
+class FrameOffsets:
+    """
+    Loaded frame index of one CSV.
+
+    Usage:
+        fidx = BC_LOADERS["load_frame_index"](PATH["tracked_path"](stem))
+        lo, hi = fidx.span(1000, 2000)     # bytes covering frames [1000, 2000)
+    """
+
+    __slots__ = ("file", "frames", "offsets", "size", "mtime_ns", "rows", "stride", "sorted", "header_bytes")
+
+    def __init__(self, file: Path, frames: np.ndarray, offsets: np.ndarray, meta: np.ndarray) -> None:
+        self.file = file
+        self.frames = frames
+        self.offsets = offsets
+        self.size, self.mtime_ns, self.rows, self.stride, srt, self.header_bytes = (int(v) for v in meta)
+        self.sorted = bool(srt)
+
+    def __repr__(self) -> str:
+        return f"FrameOffsets({self.file.name}, rows={self.rows}, stride={self.stride}, sorted={self.sorted})"
+
+    def current(self) -> bool:
+        """Sidecar matches the CSV on disk (size and mtime)."""
+        try:
+            st = self.file.stat()
+        except FileNotFoundError:
+            return False
+        return st.st_size == self.size and st.st_mtime_ns == self.mtime_ns
+
+    def span(self, start: int | None = None, stop: int | None = None) -> tuple[int, int]:
+        """Byte range [lo, hi) containing every row with start ≤ frame < stop."""
+        lo, hi = self.header_bytes, self.size
+        if not self.sorted or not len(self.frames):
+            return lo, hi
+        if start is not None:
+            i = int(np.searchsorted(self.frames, start, side="left")) - 1
+            lo = int(self.offsets[max(i, 0)])
+        if stop is not None:
+            j = int(np.searchsorted(self.frames, stop, side="left"))
+            hi = int(self.offsets[j])
+        return lo, max(lo, hi)
+
+
+def _sidecar(file: Path, suffix: str) -> Path:
+    return file.with_name(f".{file.name}{suffix}")
+
+
+def _scan(file: Path, column: str, stride: int, block_bytes: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """One streaming pass → (sampled frames, sampled offsets + size, meta)."""
+    st = file.stat()
+    frames_s: list[np.ndarray] = []
+    offs_s: list[np.ndarray] = []
+    rows = 0
+    ordered = True
+    last = None
+
+    with open(file, "rb") as fh:
+        header = fh.readline()
+        names = parse_header(header)
+        if column not in names:
+            raise ValueError(f"{file.name}: no {column!r} column to index (header: {names})")
+        k = names.index(column)
+        base = len(header)
+        header_bytes = base
+        carry = b""
+
+        def take(body: bytes, at: int) -> None:
+            nonlocal rows, ordered, last
+            raw = np.frombuffer(body, dtype=np.uint8)
+            nl = np.flatnonzero(raw == 10)
+            starts = np.concatenate([[0], nl + 1])
+            ends = np.append(nl, len(body))
+            width = ends - starts
+            blank = (width == 0) | ((width == 1) & (raw[np.maximum(ends - 1, 0)] == 13))
+            starts = starts[(starts < len(body)) & ~blank]
+            vals = pd.read_csv(
+                io.BytesIO(body), header=None, usecols=[k], dtype="int64", engine="c"
+            ).iloc[:, 0].to_numpy()
+            if len(vals) != len(starts):
+                raise ValueError(
+                    f"{file.name}: {len(vals)} values for {len(starts)} lines near byte {at} "
+                    f"(quoted newlines?)"
+                )
+            if len(vals):
+                if ordered and ((last is not None and vals[0] < last) or np.any(np.diff(vals) < 0)):
+                    ordered = False
+                last = vals[-1]
+            pick = (np.arange(rows, rows + len(vals)) % stride) == 0
+            frames_s.append(vals[pick])
+            offs_s.append(starts[pick].astype(np.int64) + at)
+            rows += len(vals)
+
+        while True:
+            block = fh.read(block_bytes)
+            if not block:
+                break
+            buf = carry + block
+            cut = buf.rfind(b"\n") + 1
+            if cut == 0:
+                carry = buf
+                continue
+            take(buf[:cut], base)
+            base += cut
+            carry = buf[cut:]
+        if carry.strip():
+            take(carry, base)
+
+    frames = np.concatenate(frames_s) if frames_s else np.empty(0, dtype=np.int64)
+    offsets = np.concatenate(offs_s + [np.array([st.st_size], dtype=np.int64)])
+    meta = np.array([st.st_size, st.st_mtime_ns, rows, stride, int(ordered), header_bytes], dtype=np.int64)
+    return frames, offsets, meta
+
+
+#%% CELL 04 — FRAME INDEX FUNCTION FACTORY
+
+def _create_frame_index_functions(
+    utils: Mapping,
+    temp_path: Callable[[Path | str], Path],
+    frame_column: str,
+    stride: int,
+    block_bytes: int,
+    index_suffix: str,
+    max_workers: int | None,
+    chunk_bytes: int,
+    min_parallel_bytes: int,
+) -> dict[str, Callable]:
+    """
+    Create frame index builders and windowed readers.
+
+    Returns:
+        Dictionary with 4 frame index functions.
+    """
+    column_dtypes = utils["column_dtypes"]
+    default_stride = stride
+    in_memory: dict[Path, FrameOffsets] = {}  # indexes whose sidecar could not be written
+
+    def build_frame_index(file: Path | str, stride: int | None = None) -> FrameOffsets:
+        """
+        Build (or rebuild) the sidecar index of one CSV with one streaming pass.
+
+        Args:
+            file: CSV with a FrameIndex column.
+            stride: Keep every n-th row offset (default from controller).
+
+        Returns:
+            FrameOffsets.
+
+        Raises:
+            ValueError: No FrameIndex column, or lines that do not parse 1:1.
+        """
+        file = Path(file)
+        frames, offsets, meta = _scan(file, frame_column, stride or default_stride, block_bytes)
+        fidx = FrameOffsets(file, frames, offsets, meta)
+        side = _sidecar(file, index_suffix)
+        tmp = temp_path(side)
+        try:
+            with open(tmp, "wb") as fh:
+                np.savez(fh, frames=frames, offsets=offsets, meta=meta)
+            os.replace(tmp, side)
+        except OSError:  # read-only folder → keep the index in memory
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+            in_memory[file] = fidx
+        else:
+            in_memory.pop(file, None)
+        return fidx
+
+    def load_frame_index(file: Path | str, build: bool = True) -> FrameOffsets | None:
+        """
+        Load the sidecar index; missing or stale → rebuild (or None if build=False).
+
+        Examples:
+            fidx = load_frame_index(PATH["scored_path"]("BASE_fly1"))
+        """
+        file = Path(file)
+        held = in_memory.get(file)
+        if held is not None and held.current():
+            return held
+        side = _sidecar(file, index_suffix)
+        try:
+            with np.load(side) as z:
+                fidx = FrameOffsets(file, z["frames"], z["offsets"], z["meta"])
+            if fidx.current():
+                return fidx
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            pass
+        return build_frame_index(file) if build else None
+
+    def frame_span(file: Path | str, start: int | None = None, stop: int | None = None) -> tuple[int, int]:
+        """Byte range [lo, hi) covering frames [start, stop) (index built on demand)."""
+        return load_frame_index(file).span(start, stop)
+
+    def read_frames(
+        file: Path | str,
+        start: int | None = None,
+        stop: int | None = None,
+        columns: Iterable[str] | None = None,
+        dtypes: Mapping[str, str] | None = None,
+        as_frame: bool = True,
+    ) -> pd.DataFrame | dict[str, np.ndarray]:
+        """
+        Read only the rows with start ≤ FrameIndex < stop.
+
+        Args:
+            file: CSV path.
+            start / stop: Frame window (None → open end; both None → whole
+                          file, no index needed).
+            columns: Columns to load (FrameIndex is also parsed when windowed).
+            dtypes: dtype overrides.
+            as_frame: DataFrame (True) or dict of NumPy arrays (False).
+
+        Examples:
+            df = read_frames(PATH["tracked_path"](stem), 5400, 7200)
+        """
+        windowed = start is not None or stop is not None
+        lo, hi = frame_span(file, start, stop) if windowed else (None, None)
+        cols = None if columns is None else list(columns)
+        if cols is not None and windowed:
+            cols = list(dict.fromkeys([*cols, frame_column]))
+        use, out, want = read_span(
+            file, column_dtypes, columns=cols, dtypes=dtypes, lo=lo, hi=hi,
+            max_workers=max_workers or os.cpu_count() or 1,
+            chunk_bytes=chunk_bytes, min_parallel_bytes=min_parallel_bytes,
+        )
+        if windowed and use:
+            f = out[frame_column]
+            keep = np.ones(len(f), dtype=bool)
+            if start is not None:
+                keep &= f >= start
+            if stop is not None:
+                keep &= f < stop
+            if not keep.all():
+                out = {c: a[keep] for c, a in out.items()}
+        if columns is not None:
+            keep_cols = set(columns)
+            use = [c for c in use if c in keep_cols]
+            out = {c: out[c] for c in use}
+        return to_frame(use, out, want) if as_frame else out
+
+    return {
+        "build_frame_index": build_frame_index,
+        "load_frame_index": load_frame_index,
+        "frame_span": frame_span,
+        "read_frames": read_frames,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    utils: Mapping,
+    temp_path: Callable[[Path | str], Path],
+    frame_column: str,
+    stride: int,
+    block_bytes: int,
+    index_suffix: str,
+    max_workers: int | None,
+    chunk_bytes: int,
+    min_parallel_bytes: int,
+) -> dict[str, Callable]:
+    """
+    Generate frame index functions.
+
+    Args:
+        utils: BC_UTILS bundle (column_dtypes).
+        temp_path: PATH['temp_path'] (atomic sidecar writes).
+        frame_column: Indexed column (PARAM 'FrameIndex').
+        stride: Rows between stored offsets.
+        block_bytes: Read size of the streaming pass.
+        index_suffix: Sidecar suffix appended to the CSV name.
+        max_workers / chunk_bytes / min_parallel_bytes: Parallel parse settings.
+
+    Returns:
+        Dictionary with 4 frame index functions.
+
+    Validation:
+        Asserts 4 functions returned and positive stride/block size.
+    """
+    assert stride > 0 and block_bytes > 0, f"Invalid index settings: stride={stride}, block={block_bytes}"
+    functions = _create_frame_index_functions(
+        utils, temp_path, frame_column, stride, block_bytes, index_suffix,
+        max_workers, chunk_bytes, min_parallel_bytes,
+    )
+
+    # Validation
+    assert len(functions) == 4, f"Expected 4 frame index functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "FrameOffsets"]
@@ -0,0 +1,212 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+pushdown.py — Column & Frame-Range Pushdown Loaders
+====================================================
+
+Load only the columns and FrameIndex window an analysis needs; nothing
+outside them is parsed or materialized.
+
+Exports:
+    configure(path: Mapping, utils: Mapping, read_frames: Callable) → dict[str, callable]
+
+Pushdown Functions (2 total):
+    - load_artifact(file, columns=None, tag=None, role=None, type=None, frames=None, dtypes=None, as_frame=True) → DataFrame | dict
+    - load_stem(stem, kind="scored", columns=None, tag=None, role=None, type=None, frames=None, dtypes=None, as_frame=True, path=None) → DataFrame | dict
+
+Column Predicate (resolved against the file header, file order kept):
+    columns                explicit list
+    tag / role / type      PARAM filters (BC_UTILS select_columns)
+    combined               intersection of everything given
+    nothing given          all header columns
+
+Frame Predicate:
+    frames=(start, stop)   rows with start ≤ FrameIndex < stop (None = open end)
+                           → sidecar frame index → byte span → parse span only
+
+Notes:
+    - Column pushdown uses read_csv usecols (unselected fields are
+      tokenized but never converted or stored)
+    - Requested columns absent from the header → KeyError; PARAM filters
+      simply select what the header has
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .chunked import parse_header
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for pushdown.py.
+
+Why Empty?
+    Artifact kinds mirror PATH builders; parse settings live in the other workers.
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - pure composition of PATH / BC_UTILS / frame reads)
+
+#%% CELL 03 — ARTIFACT KINDS
+
+# Artifact kind → PATH path builder
+_KIND_PATHS: dict[str, str] = {
+    "tracked": "tracked_path",
+    "sleap": "sleap_path",
+    "scored": "scored_path",
+    "pose": "pose_path",
+    "flag_scored": "flag_scored_path",
+    "flag_pose": "flag_pose_path",
+}
+
+
+def _read_header(file: Path | str) -> list[str]:
+    with open(file, "rb") as fh:
+        return parse_header(fh.readline())
+
+
+#%% CELL 04 — PUSHDOWN FUNCTION FACTORY
+
+def _create_pushdown_functions(
+    path: Mapping,
+    utils: Mapping,
+    read_frames: Callable,
+) -> dict[str, Callable]:
+    """
+    Create pushdown loaders bound to PATH, BC_UTILS and the frame reader.
+
+    Returns:
+        Dictionary with 2 pushdown functions.
+    """
+    default_path = path
+    select_columns = utils["select_columns"]
+
+    def _resolve(
+        header: list[str],
+        columns: Iterable[str] | None,
+        tag: str | None,
+        role: str | None,
+        type: str | None,
+    ) -> list[str] | None:
+        """Header columns matching the predicate (None → all)."""
+        keep = None
+        if columns is not None:
+            columns = list(columns)
+            unknown = [c for c in columns if c not in header]
+            if unknown:
+                raise KeyError(f"Columns not in header: {unknown}")
+            keep = set(columns)
+        if tag is not None or role is not None or type is not None:
+            picked = set(select_columns(tag=tag, role=role, type=type, columns=header))
+            keep = picked if keep is None else keep & picked
+        return None if keep is None else [c for c in header if c in keep]
+
+    def load_artifact(
+        file: Path | str,
+        columns: Iterable[str] | None = None,
+        tag: str | None = None,
+        role: str | None = None,
+        type: str | None = None,
+        frames: tuple[int | None, int | None] | None = None,
+        dtypes: Mapping[str, str] | None = None,
+        as_frame: bool = True,
+    ) -> pd.DataFrame | dict[str, np.ndarray]:
+        """
+        Load a CSV artifact with column and frame-range pushdown.
+
+        Args:
+            file: CSV path.
+            columns: Explicit column subset.
+            tag / role / type: PARAM column filters (see header).
+            frames: (start, stop) FrameIndex window.
+            dtypes: dtype overrides (default: PARAM via BC_UTILS).
+            as_frame: DataFrame (True) or dict of NumPy arrays (False).
+
+        Returns:
+            Selected columns (file order) for rows in the window.
+
+        Examples:
+            load_artifact(PATH["scored_path"](stem), role="binary", frames=(5400, 7200))
+            load_artifact(PATH["tracked_path"](stem), tag="stimuli")
+        """
+        use = _resolve(_read_header(file), columns, tag, role, type)
+        start, stop = frames if frames is not None else (None, None)
+        return read_frames(file, start, stop, columns=use, dtypes=dtypes, as_frame=as_frame)
+
+    def load_stem(
+        stem: str,
+        kind: str = "scored",
+        columns: Iterable[str] | None = None,
+        tag: str | None = None,
+        role: str | None = None,
+        type: str | None = None,
+        frames: tuple[int | None, int | None] | None = None,
+        dtypes: Mapping[str, str] | None = None,
+        as_frame: bool = True,
+        path: Mapping | None = None,
+    ) -> pd.DataFrame | dict[str, np.ndarray]:
+        """
+        load_artifact() for a stem's artifact located via PATH.
+
+        Args:
+            stem: Base stem (e.g., 'BASE_fly1').
+            kind: 'tracked' | 'sleap' | 'scored' | 'pose' | 'flag_scored' | 'flag_pose'.
+            path: Optional PATH override.
+            (other args as load_artifact)
+
+        Examples:
+            load_stem("BASE_fly1", columns=["FrameIndex", "Layer1"], frames=(0, 1800))
+        """
+        if kind not in _KIND_PATHS:
+            raise ValueError(f"Unknown artifact kind {kind!r}. Available: {sorted(_KIND_PATHS)}")
+        p = default_path if path is None else path
+        file = p[_KIND_PATHS[kind]](stem)
+        return load_artifact(
+            file, columns=columns, tag=tag, role=role, type=type,
+            frames=frames, dtypes=dtypes, as_frame=as_frame,
+        )
+
+    return {
+        "load_artifact": load_artifact,
+        "load_stem": load_stem,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    utils: Mapping,
+    read_frames: Callable,
+) -> dict[str, Callable]:
+    """
+    Generate pushdown functions.
+
+    Args:
+        path: PATH mapping (from Config.path).
+        utils: BC_UTILS bundle (select_columns).
+        read_frames: frame_index read_frames (windowed span reader).
+
+    Returns:
+        Dictionary with 2 pushdown functions.
+
+    Validation:
+        Asserts 2 functions returned and every artifact kind has a PATH builder.
+    """
+    missing = [k for k, key in _KIND_PATHS.items() if key not in path]
+    assert not missing, f"PATH lacks builders for artifact kinds: {missing}"
+    functions = _create_pushdown_functions(path, utils, read_frames)
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 pushdown functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
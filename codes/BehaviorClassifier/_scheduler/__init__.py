@@ -0,0 +1,159 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+_scheduler/__init__.py — Scheduler Coordinator
+===============================================
+
+Orchestrates scheduler workers and assembles the BC_SCHEDULER bundle.
+
+Architecture:
+    6 workers → coordinator → controller → BC_SCHEDULER export
+
+Workers (6):
+    1. dag.py: 2 DAG functions (build_dag, stem_paths)
+    2. journal.py: 1 journal function (open_journal)
+    3. executor.py: 2 executor functions (run_dag, run_batch)
+    4. leases.py: 2 lease functions (open_leases, lease_status)
+    5. planner.py: 1 planner function (plan_run)
+    6. governor.py: 3 governor functions (estimate_rows, estimate_task_bytes, open_governor)
+
+Total Exports: 11 (validated)
+
+Design:
+    - Coordinator receives PATH, BC_UTILS + execution defaults from controller
+    - Calls workers in dependency order
+    - Assembles single immutable bundle
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Mapping
+
+from . import dag
+from . import journal
+from . import executor
+from . import leases
+from . import planner
+from . import governor
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for _scheduler coordinator.
+
+Why Empty?
+    Coordinator orchestrates workers (no direct configuration).
+    Defaults come from scheduler.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - pure orchestration)
+
+#%% CELL 03 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    max_workers: int | None,
+    max_retries: int,
+    journal_name: str,
+    record_digests: bool,
+    report_outcomes: bool,
+    lease_dir: str,
+    lease_ttl: float,
+    lease_heartbeat: float,
+    utils: Mapping,
+    storage: Mapping,
+    plan_costs: Mapping[str, float],
+    plan_require_sleap: bool,
+    memory_budget: int,
+    governor_sample_bytes: int,
+) -> MappingProxyType:
+    """
+    Configure and return the immutable BC_SCHEDULER bundle.
+
+    Args:
+        path: PATH mapping (from Config.path).
+        max_workers: Default pool size (None → os.cpu_count()).
+        max_retries: Default retry budget per task.
+        journal_name: Journal filename under pBehaviorClassification.
+        record_digests: run_batch records source digests of finished stems.
+        report_outcomes: run_batch writes flag / error tasks to REPORT_FLAG / REPORT_ERROR.
+        lease_dir: Lease folder under pBehaviorClassification.
+        lease_ttl: Seconds without heartbeat before a lease is stale.
+        lease_heartbeat: Seconds between lease heartbeats.
+        utils: BC_UTILS bundle (PARAM-derived sizing).
+        storage: BC_STORAGE bundle (report shards + merge).
+        plan_costs: Planner calibration (µs/frame, memory overhead).
+        plan_require_sleap: Planner treats missing sleap as an error.
+        memory_budget: Governor memory budget (bytes).
+        governor_sample_bytes: Bytes sampled per file for row estimates (governor + planner).
+
+    Returns:
+        MappingProxyType with 11 scheduler exports.
+
+    Orchestration Order (respects dependencies):
+        1. dag → build_dag, stem_paths (needs PATH)
+        2. journal → open_journal (needs PATH)
+        3. executor → run_dag, run_batch (needs dag + journal + BC_STORAGE reports)
+        4. leases → open_leases, lease_status (needs PATH)
+        5. planner → plan_run (needs PATH + BC_UTILS + governor row sampling)
+        6. governor → estimate_rows, estimate_task_bytes, open_governor (needs PATH + BC_UTILS)
+    """
+    dag_data = dag.configure(path=path)
+    journal_data = journal.configure(path=path, journal_name=journal_name)
+    executor_data = executor.configure(
+        path=path,
+        max_workers=max_workers,
+        max_retries=max_retries,
+        dag=dag_data,
+        journal=journal_data,
+        record_digests=record_digests,
+        storage=storage,
+        report_outcomes=report_outcomes,
+    )
+
+    leases_data = leases.configure(
+        path=path,
+        lease_dir=lease_dir,
+        ttl=lease_ttl,
+        heartbeat=lease_heartbeat,
+    )
+
+    planner_data = planner.configure(
+        path=path,
+        utils=utils,
+        costs=plan_costs,
+        require_sleap=plan_require_sleap,
+        max_workers=max_workers,
+        sample_bytes=governor_sample_bytes,
+    )
+
+    governor_data = governor.configure(
+        path=path,
+        utils=utils,
+        budget_bytes=memory_budget,
+        sample_bytes=governor_sample_bytes,
+        memory_overhead=plan_costs["memory_overhead"],
+    )
+
+    bundle = {
+        **dag_data,
+        **journal_data,
+        **executor_data,
+        **leases_data,
+        **planner_data,
+        **governor_data,
+    }
+
+    # Validation: 2 dag + 1 journal + 2 executor + 2 leases + 1 planner + 3 governor = 11
+    expected_count = 11
+    assert len(bundle) == expected_count, (
+        f"BC_SCHEDULER export count mismatch: expected {expected_count}, got {len(bundle)}. "
+        f"Keys: {sorted(bundle)}"
+    )
+
+    return MappingProxyType(bundle)
+
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["configure"]
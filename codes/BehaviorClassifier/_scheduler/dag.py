@@ -0,0 +1,195 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+dag.py — Per-Stem Task DAG
+===========================
+
+Derive the task graph of each stem from PATH artifact relationships.
+
+Exports:
+    configure(path: Mapping) → dict[str, callable]
+
+DAG Functions (2 total):
+    - build_dag(stems: Iterable[str] | None = None, path: Mapping | None = None) → dict[str, Task]
+    - stem_paths(stem: str, path: Mapping | None = None) → dict[str, Path]
+
+Per-Stem Graph:
+    preflight ──ok/flag──→ score   (tracked [+ sleap] → scored | Flag/scored)
+              └─ok/flag──→ pose    (tracked + sleap → pose | Flag/pose; only if sleap exists)
+    {preflight, score, pose} ──any error──→ error  (inputs → Error/Tracked, Error/Pose)
+
+Notes:
+    - Task keys are 'STEM:stage' (unique across the experiment)
+    - Stems default to g_tracked(); sleap presence from one presence_matrix() scan
+    - Pure graph construction (no task execution)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Callable, Iterable, Mapping, NamedTuple
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for dag.py.
+
+Why Empty?
+    Graph shape follows PATH artifact relationships (fixed by design).
+    PATH passed via configure() from coordinator.
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - PATH-derived graph)
+
+#%% CELL 03 — TASK TYPE
+
+# Stage names in topological order
+STAGES: tuple[str, ...] = ("preflight", "score", "pose", "error")
+
+# Stage outcomes
+OK, FLAG, ERROR, FAILED, SKIPPED = "ok", "flag", "error", "failed", "skipped"
+
+
+class Task(NamedTuple):
+    """
+    One node of the DAG.
+
+    Fields:
+        stem: Base stem ('BASE_flyN').
+        stage: One of STAGES.
+        deps: Stage names (same stem) that must resolve first.
+        when: "ok" → run only if every dep ended ok/flag;
+              "error" → run only if any dep ended error/failed.
+    """
+    stem: str
+    stage: str
+    deps: tuple[str, ...]
+    when: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.stem}:{self.stage}"
+
+    def dep_keys(self) -> tuple[str, ...]:
+        return tuple(f"{self.stem}:{d}" for d in self.deps)
+
+
+def stem_tasks(stem: str, has_sleap: bool) -> list[Task]:
+    """
+    Build the task list for one stem.
+
+    Args:
+        stem: Base stem.
+        has_sleap: Whether the sleap input exists (pose task only if True).
+
+    Returns:
+        Tasks in topological order.
+    """
+    tasks = [
+        Task(stem, "preflight", (), OK),
+        Task(stem, "score", ("preflight",), OK),
+    ]
+    if has_sleap:
+        tasks.append(Task(stem, "pose", ("preflight",), OK))
+    tasks.append(Task(stem, "error", tuple(t.stage for t in tasks), ERROR))
+    return tasks
+
+
+#%% CELL 04 — DAG FUNCTION FACTORY
+
+def _create_dag_functions(path: Mapping) -> dict[str, Callable]:
+    """
+    Create DAG builders bound to a default PATH.
+
+    Args:
+        path: PATH mapping (from Config.path.configure).
+
+    Returns:
+        Dictionary with 2 DAG functions.
+    """
+    default_path = path
+
+    def stem_paths(stem: str, path: Mapping | None = None) -> dict[str, Path]:
+        """
+        Concrete input/output Paths for a stem (picklable, for stage functions).
+
+        Args:
+            stem: Base stem.
+            path: Optional PATH override (e.g., configure(root=...)).
+
+        Returns:
+            Dict with tracked, sleap, scored, pose, flag_scored, flag_pose,
+            error_tracked_copy, error_pose_copy, report_error, report_flag.
+        """
+        p = default_path if path is None else path
+        sib = p["siblings"](stem)
+        return {
+            "tracked": sib["tracked"],
+            "sleap": sib["sleap"],
+            "scored": sib["scored"],
+            "pose": sib["pose"],
+            "flag_scored": sib["flag_scored"],
+            "flag_pose": sib["flag_pose"],
+            "error_tracked_copy": p["error_tracked_copy_path"](sib["tracked"].name),
+            "error_pose_copy": p["error_pose_copy_path"](sib["sleap"].name),
+            "report_error": p["report_error_path"](),
+            "report_flag": p["report_flag_path"](),
+        }
+
+    def build_dag(stems: Iterable[str] | None = None, path: Mapping | None = None) -> dict[str, Task]:
+        """
+        Build the experiment DAG (one subgraph per stem).
+
+        Args:
+            stems: Stems to schedule (default: every g_tracked() stem).
+            path: Optional PATH override.
+
+        Returns:
+            Ordered dict task key → Task (topological within each stem).
+        """
+        p = default_path if path is None else path
+        stem_of = p["stem_without_suffix"]
+        if stems is None:
+            stems = [stem_of(fp.name) for fp in p["g_tracked"]()]
+        presence = p["presence_matrix"]()
+        sleap = presence.column("sleap")
+
+        dag: dict[str, Task] = {}
+        for stem in stems:
+            row = presence.stem_index.get(stem)
+            has_sleap = row is not None and bool(sleap[row])
+            for task in stem_tasks(stem, has_sleap):
+                dag[task.key] = task
+        return dag
+
+    return {
+        "build_dag": build_dag,
+        "stem_paths": stem_paths,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(path: Mapping) -> dict[str, Callable]:
+    """
+    Generate DAG functions bound to PATH.
+
+    Args:
+        path: PATH mapping (from Config.path).
+
+    Returns:
+        Dictionary with 2 DAG functions.
+
+    Validation:
+        Asserts 2 functions returned.
+    """
+    functions = _create_dag_functions(path)
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 DAG functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "Task", "STAGES", "stem_tasks"]
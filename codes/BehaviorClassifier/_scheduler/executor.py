@@ -0,0 +1,619 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+executor.py — Bounded Process-Pool DAG Runner
+==============================================
+
+Run ready DAG tasks on a bounded process pool with retries, cancellation,
+and a resumable journal.
+
+Exports:
+    configure(path: Mapping, max_workers: int | None, max_retries: int, dag: dict, journal: dict, record_digests: bool, storage: Mapping, report_outcomes: bool) → dict[str, callable]
+
+Executor Functions (2 total):
+    - run_dag(dag, stages, paths_for, ...) → dict
+    - run_batch(stages, stems=None, path=None, leases=None, ...) → dict
+
+Stage Contract:
+    fn(stem: str, paths: dict[str, Path]) → "ok" | "flag" | "error" | None
+    - Must be a module-level function (pickled to worker processes)
+    - None means "ok"; raising counts as a failed attempt (retried)
+    - Missing stage in `stages` → task settles "skipped" without running
+      (so do its "ok"-dependents: pass every stage up to the ones wanted)
+
+Result Shape:
+    {"outcomes": {task_key: outcome}, "counts": {outcome: n},
+     "cancelled": bool, "remaining": [task_key, ...],
+     "unclaimed": [stem, ...]}
+
+Resume:
+    - Only ok / flag outcomes recorded against the same input stamp
+      (size, mtime_ns of the stem's tracked / sleap files) are skipped;
+      error, failed and skipped tasks, and tasks whose inputs changed, run
+    - A task resumes only when all its deps resumed (a re-run upstream
+      task re-decides its dependents, e.g. the Error branch)
+    - run_dag resumes whenever a journal is given (resume=True)
+    - run_batch resumes only from an explicit journal (Journal / file);
+      the default journal is reset and rewritten unless resume=True
+
+Shared Roots (run_batch(leases=...)):
+    - Each stem is claimed when its first task is about to be submitted
+      (not up front), so machines started later still find work
+    - A stem held by another owner, or already finished (scored / Flag
+      scored output no older than its inputs), is left out: its tasks are
+      not run and it is listed in "unclaimed"
+    - The lease is released as soon as every task of the stem has settled
+    - The default journal becomes one file per owner
+      ('.scheduler_journal.<owner>.jsonl'), so owners never reset each
+      other's journal
+
+Reports (run_batch):
+    - Every task settling flag → REPORT_FLAG row; error / failed →
+      REPORT_ERROR row (Stage = task stage, Reason = outcome, Detail =
+      the failure's exception)
+    - Rows go to this run's own shard (BC_STORAGE open_report_shard; worker
+      id = lease owner, else host-pid), written by the parent process as
+      tasks settle, and are merged into the canonical reports when
+      run_batch ends (merge_reports; safe with other owners still writing)
+    - reports=False skips both
+
+Source Digests (run_batch):
+    - Stems whose tasks all ended ok / flag, with inputs unchanged since
+      the run started, get their input digests recorded
+      (PATH['record_digests']) so stale_outputs(method="hash") works
+    - record_digests=False skips it (no input hashing after the run)
+
+Notes:
+    - In-flight tasks never exceed max_workers (bounded queue)
+    - max_workers=0 runs tasks inline (debugging, notebooks)
+    - A crashed worker (BrokenProcessPool) fails the attempt and the pool
+      is rebuilt, so one OOM-killed task does not sink the batch
+    - Cancellation: set `cancel` (threading.Event) or Ctrl-C; queued tasks
+      are dropped, running tasks finish and are journaled
+    - Admission: submit_hook(task) is asked before each pool submission
+      (False defers; ignored while nothing is in flight) and done_hook(task)
+      is told when each pooled attempt completes (memory governor)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import os
+import pickle
+from collections import Counter, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from threading import Event
+from typing import Callable, Iterable, Mapping
+
+from .dag import ERROR, FAILED, FLAG, OK, SKIPPED, Task
+from .journal import Journal
+from .leases import LeaseManager
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for executor.py.
+
+Why Empty?
+    Worker count, retry budget and journal name come from the controller.
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — TASK INVOCATION
+
+# Poll interval for cancellation checks while waiting on futures (seconds)
+_POLL_SEC = 0.2
+
+_VALID_OUTCOMES = (OK, FLAG, ERROR)
+
+# paths_for() keys whose files are a task's inputs (journal stamps)
+_INPUT_KEYS: tuple[str, ...] = ("tracked", "sleap")
+
+# paths_for() keys of the score output (canonical, Flag); leased stems with a fresh one are done
+_OUTPUT_KEYS: tuple[str, ...] = ("scored", "flag_scored")
+
+
+def _input_stamp(paths: Mapping[str, Path]) -> list:
+    """[size, mtime_ns] per input file (None when missing), JSON-ready."""
+    out = []
+    for key in _INPUT_KEYS:
+        if key not in paths:
+            continue
+        try:
+            st = os.stat(paths[key])
+        except OSError:
+            out.append(None)
+        else:
+            out.append([st.st_size, st.st_mtime_ns])
+    return out
+
+
+def _finished(paths: Mapping[str, Path]) -> bool:
+    """True if a score output exists and is no older than any existing input."""
+    def mtime(key: str) -> int | None:
+        try:
+            return os.stat(paths[key]).st_mtime_ns
+        except (KeyError, OSError):
+            return None
+    outputs = [t for t in map(mtime, _OUTPUT_KEYS) if t is not None]
+    inputs = [t for t in map(mtime, _INPUT_KEYS) if t is not None]
+    return bool(outputs) and max(outputs) >= max(inputs, default=0)
+
+
+def _invoke(fn: Callable, stem: str, paths: dict[str, Path]) -> str:
+    """Run one stage (executes in the worker process)."""
+    outcome = fn(stem, paths)
+    if outcome is None:
+        return OK
+    if outcome not in _VALID_OUTCOMES:
+        raise ValueError(f"Stage returned {outcome!r}; expected one of {_VALID_OUTCOMES} or None")
+    return outcome
+
+
+def _decide(task: Task, outcomes: dict[str, str]) -> str | None:
+    """
+    Decide whether a task runs once its deps are resolved.
+
+    Returns:
+        None (deps unresolved), "run", or SKIPPED (branch not taken).
+    """
+    dep_out = []
+    for d in task.dep_keys():
+        if d not in outcomes:
+            return None
+        dep_out.append(outcomes[d])
+    if task.when == OK:
+        return "run" if all(o in (OK, FLAG) for o in dep_out) else SKIPPED
+    return "run" if any(o in (ERROR, FAILED) for o in dep_out) else SKIPPED
+
+
+def run_dag(
+    dag: Mapping[str, Task],
+    stages: Mapping[str, Callable],
+    paths_for: Callable[[str], dict[str, Path]],
+    max_workers: int | None = None,
+    max_retries: int = 2,
+    journal: Journal | None = None,
+    resume: bool = True,
+    cancel: Event | None = None,
+    submit_hook: Callable[[Task], bool] | None = None,
+    done_hook: Callable[[Task], None] | None = None,
+    claim: Callable[[str], bool] | None = None,
+    release: Callable[[str], None] | None = None,
+    report: Callable[[Task, str, str | None], None] | None = None,
+) -> dict:
+    """
+    Execute a task DAG.
+
+    Args:
+        dag: Task key → Task (from build_dag).
+        stages: Stage name → stage function (see Stage Contract).
+        paths_for: Stem → paths dict passed to stage functions.
+        max_workers: Pool size (None → os.cpu_count(); 0 → inline).
+        max_retries: Extra attempts after a failed attempt.
+        journal: Optional Journal for resumable runs.
+        resume: Skip tasks already finished in `journal` (see Resume).
+        cancel: Optional Event; when set, stop submitting and drain.
+        submit_hook: Optional admission check; returning False defers the
+                     task until another one completes (see memory governors).
+                     Always admitted when nothing is in flight.
+        done_hook: Optional callback after each pooled attempt completes
+                   (success, failure or crash), paired with submit_hook.
+        claim: Optional stem check made once, right before the stem's first
+               task is submitted; False leaves the whole stem out ("unclaimed").
+        release: Optional callback once every task of a claimed stem settled
+                 (also for claimed stems left unfinished by a cancellation).
+        report: Optional callback (task, outcome, error) for each task that
+                settles flag, error or failed.
+
+    Returns:
+        Result dict (see Result Shape).
+
+    Raises:
+        TypeError: A stage function cannot be pickled for worker processes.
+    """
+    workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+    if workers > 0:
+        for name, fn in stages.items():
+            try:
+                pickle.dumps(fn)
+            except Exception as exc:
+                raise TypeError(
+                    f"Stage {name!r} is not picklable (use a module-level function): {exc}"
+                ) from exc
+
+    paths_cache: dict[str, dict[str, Path]] = {}
+    stamps: dict[str, list] = {}
+
+    def paths(stem: str) -> dict[str, Path]:
+        if stem not in paths_cache:
+            paths_cache[stem] = paths_for(stem)
+        return paths_cache[stem]
+
+    def stamp(stem: str) -> list:
+        if stem not in stamps:
+            stamps[stem] = _input_stamp(paths(stem))
+        return stamps[stem]
+
+    outcomes: dict[str, str] = {}
+    if journal is not None and resume:
+        finished = journal.load({k: stamp(t.stem) for k, t in dag.items()})
+        for key, task in dag.items():  # topological: a task resumes only with all its deps
+            if key in finished and all(d in outcomes for d in task.dep_keys()):
+                outcomes[key] = finished[key]
+
+    dependents: dict[str, list[str]] = defaultdict(list)
+    for task in dag.values():
+        for d in task.dep_keys():
+            dependents[d].append(task.key)
+
+    ready: deque[str] = deque()
+    queued: set[str] = set()
+    attempts: Counter[str] = Counter()
+    open_tasks = Counter(t.stem for k, t in dag.items() if k not in outcomes)
+    claimed: set[str] = set()
+    unclaimed: set[str] = set()
+
+    def admit(key: str) -> bool:
+        """Claim the task's stem on first submission (False → stem left out)."""
+        stem = dag[key].stem
+        if claim is None or stem in claimed:
+            return True
+        if stem not in unclaimed and claim(stem):
+            claimed.add(stem)
+            return True
+        unclaimed.add(stem)
+        queued.discard(key)
+        return False
+
+    def settle(key: str, outcome: str, error: str | None = None) -> None:
+        outcomes[key] = outcome
+        if journal is not None:
+            journal.record(key, "done", outcome=outcome, attempt=attempts[key], error=error,
+                           stamp=stamp(dag[key].stem))
+        if report is not None and outcome in (FLAG, ERROR, FAILED):
+            report(dag[key], outcome, error)
+        stem = dag[key].stem
+        open_tasks[stem] -= 1
+        if stem in claimed and open_tasks[stem] == 0:
+            claimed.discard(stem)
+            if release is not None:
+                release(stem)
+        for child in dependents[key]:
+            consider(child)
+
+    def consider(key: str) -> None:
+        if key in outcomes or key in queued:
+            return
+        task = dag[key]
+        decision = _decide(task, outcomes)
+        if decision is None:
+            return
+        if decision == SKIPPED:
+            settle(key, SKIPPED)
+        elif stages.get(task.stage) is None:
+            settle(key, SKIPPED)
+        else:
+            queued.add(key)
+            ready.append(key)
+
+    def finish(key: str, fut_or_exc) -> None:
+        """Settle a completed attempt or requeue it for retry."""
+        attempts[key] += 1
+        try:
+            outcome = fut_or_exc() if callable(fut_or_exc) else fut_or_exc.result()
+        except Exception as exc:
+            if attempts[key] <= max_retries:
+                if journal is not None:
+                    journal.record(key, "retry", attempt=attempts[key], error=repr(exc))
+                ready.appendleft(key)
+            else:
+                queued.discard(key)
+                settle(key, FAILED, error=repr(exc))
+        else:
+            queued.discard(key)
+            settle(key, outcome)
+
+    def complete(key: str, fut: Future) -> None:
+        """Pooled attempt finished: notify done_hook, then settle/retry."""
+        if done_hook is not None:
+            done_hook(dag[key])
+        finish(key, fut)
+
+    for key in dag:
+        if key not in outcomes:
+            consider(key)
+
+    cancelled = False
+    try:
+        if workers == 0:
+            # --- Inline execution ---
+            while ready:
+                if cancel is not None and cancel.is_set():
+                    cancelled = True
+                    break
+                key = ready.popleft()
+                if not admit(key):
+                    continue
+                task = dag[key]
+                fn = stages[task.stage]
+                finish(key, lambda: _invoke(fn, task.stem, paths(task.stem)))
+        else:
+            # --- Bounded process pool ---
+            pool = ProcessPoolExecutor(max_workers=workers)
+            in_flight: dict[Future, str] = {}
+            try:
+                while ready or in_flight:
+                    if cancel is not None and cancel.is_set():
+                        cancelled = True
+                        break
+                    deferred: list[str] = []
+                    while ready and len(in_flight) < workers:
+                        key = ready.popleft()
+                        task = dag[key]
+                        if not admit(key):
+                            continue
+                        if submit_hook is not None and not submit_hook(task) and in_flight:
+                            deferred.append(key)
+                            continue
+                        fut = pool.submit(_invoke, stages[task.stage], task.stem, paths(task.stem))
+                        in_flight[fut] = key
+                    ready.extendleft(reversed(deferred))
+                    if not in_flight:
+                        continue
+                    done, _ = wait(in_flight, timeout=_POLL_SEC, return_when=FIRST_COMPLETED)
+                    broken = False
+                    for fut in done:
+                        key = in_flight.pop(fut)
+                        broken |= isinstance(fut.exception(), BrokenProcessPool)
+                        complete(key, fut)
+                    if broken:
+                        # Remaining in-flight futures are doomed too; fail the attempts and rebuild
+                        for fut, key in list(in_flight.items()):
+                            complete(key, fut)
+                        in_flight.clear()
+                        pool.shutdown(wait=True, cancel_futures=True)
+                        pool = ProcessPoolExecutor(max_workers=workers)
+            except KeyboardInterrupt:
+                cancelled = True
+                raise
+            finally:
+                if in_flight:
+                    for fut in in_flight:
+                        fut.cancel()
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    for fut, key in in_flight.items():
+                        if fut.done() and not fut.cancelled():
+                            complete(key, fut)
+                        elif done_hook is not None:
+                            done_hook(dag[key])
+                else:
+                    pool.shutdown(wait=True)
+    finally:
+        if journal is not None:
+            journal.close()
+        if release is not None:
+            for stem in sorted(claimed):
+                release(stem)
+
+    remaining = [k for k in dag if k not in outcomes and dag[k].stem not in unclaimed]
+    return {
+        "outcomes": outcomes,
+        "counts": dict(Counter(outcomes.values())),
+        "cancelled": cancelled,
+        "remaining": remaining,
+        "unclaimed": sorted(unclaimed),
+    }
+
+
+#%% CELL 04 — EXECUTOR FUNCTION FACTORY
+
+def _create_executor_functions(
+    path: Mapping,
+    max_workers: int | None,
+    max_retries: int,
+    dag: dict,
+    journal: dict,
+    record_digests: bool,
+    storage: Mapping,
+    report_outcomes: bool,
+) -> dict[str, Callable]:
+    """
+    Create run_dag/run_batch bound to controller defaults.
+
+    Args:
+        path: Default PATH mapping.
+        max_workers: Default pool size.
+        max_retries: Default retry budget.
+        dag: Dictionary with build_dag, stem_paths (from dag.py).
+        journal: Dictionary with open_journal (from journal.py).
+        record_digests: Default for recording source digests after run_batch.
+        storage: BC_STORAGE bundle (open_report_shard, merge_reports).
+        report_outcomes: Default for writing flag / error reports in run_batch.
+
+    Returns:
+        Dictionary with 2 executor functions.
+    """
+    build_dag = dag["build_dag"]
+    stem_paths = dag["stem_paths"]
+    open_journal = journal["open_journal"]
+    default_path, default_workers, default_retries = path, max_workers, max_retries
+    default_record = record_digests
+    default_reports = report_outcomes
+    open_report_shard = storage["open_report_shard"]
+    merge_reports = storage["merge_reports"]
+
+    def _run_dag(dag, stages, paths_for, max_workers=None, max_retries=None, **kwargs) -> dict:
+        """run_dag with controller defaults for workers/retries (see run_dag)."""
+        return run_dag(
+            dag, stages, paths_for,
+            max_workers=default_workers if max_workers is None else max_workers,
+            max_retries=default_retries if max_retries is None else max_retries,
+            **kwargs,
+        )
+    _run_dag.__doc__ = run_dag.__doc__
+
+    def run_batch(
+        stages: Mapping[str, Callable],
+        stems: Iterable[str] | None = None,
+        path: Mapping | None = None,
+        max_workers: int | None = None,
+        max_retries: int | None = None,
+        journal: Journal | Path | str | bool = True,
+        resume: bool | None = None,
+        cancel: Event | None = None,
+        submit_hook: Callable[[Task], bool] | None = None,
+        done_hook: Callable[[Task], None] | None = None,
+        record_digests: bool | None = None,
+        leases: LeaseManager | None = None,
+        reports: bool | None = None,
+    ) -> dict:
+        """
+        Build the experiment DAG and run it (replaces the serial g_tracked() loop).
+
+        Args:
+            stages: Stage name → module-level stage function.
+            stems: Stems to process (default: every g_tracked() stem).
+            path: Optional PATH override (e.g., configure(root=...)).
+            max_workers: Pool size (None → controller default; 0 → inline).
+            max_retries: Retry budget (None → controller default).
+            journal: True → default journal under pBehaviorClassification;
+                     False → no journal; or an explicit Journal / file path.
+            resume: Skip tasks already finished in the journal (see Resume).
+                    None → True for an explicit journal, False for the
+                    default one (which is then reset for this run).
+            cancel: Optional threading.Event for cooperative cancellation.
+            submit_hook: Optional admission check (see run_dag).
+            done_hook: Optional completion callback (see run_dag).
+            record_digests: Record source digests of finished stems
+                            (see Source Digests; None → controller default).
+            leases: Optional LeaseManager (open_leases) for a root shared by
+                    several machines / processes (see Shared Roots).
+            reports: Write flag / error / failed tasks to the reports (see
+                     Reports; None → controller default).
+
+        Returns:
+            Result dict (see run_dag).
+
+        Examples:
+            with BC_SCHEDULER["open_governor"]() as gov:
+                run_batch(stages, **gov.hooks())
+
+            with BC_SCHEDULER["open_leases"]() as leases:   # on every machine
+                run_batch(stages, leases=leases)
+        """
+        p = path
+        graph = build_dag(stems, path=p)
+        if resume is None:
+            resume = journal not in (True, False, None)
+        if journal is True:
+            j = open_journal(path=p)
+            if leases is not None:
+                j = Journal(j.file.with_name(f"{j.file.stem}.{leases.owner}{j.file.suffix}"))
+            if not resume:
+                j.reset()
+        elif journal is False or journal is None:
+            j = None
+        elif isinstance(journal, Journal):
+            j = journal
+        else:
+            j = open_journal(file=journal)
+        record = default_record if record_digests is None else record_digests
+        stems_run = list(dict.fromkeys(t.stem for t in graph.values()))
+        before = {s: _input_stamp(stem_paths(s, path=p)) for s in stems_run} if record else {}
+
+        def claim(stem: str) -> bool:
+            if not leases.claim(stem):
+                return False
+            if _finished(stem_paths(stem, path=p)):  # done by another owner meanwhile
+                leases.release(stem)
+                return False
+            return True
+
+        shards: dict = {}
+
+        def report(task: Task, outcome: str, error: str | None) -> None:
+            kind = "flag" if outcome == FLAG else "error"
+            if kind not in shards:
+                shards[kind] = open_report_shard(kind, worker=None if leases is None else leases.owner, path=p)
+            shards[kind].add(task.stem, stage=task.stage, reason=outcome, detail=error or "")
+
+        try:
+            result = _run_dag(
+                graph, stages, lambda stem: stem_paths(stem, path=p),
+                max_workers=max_workers, max_retries=max_retries,
+                journal=j, resume=resume, cancel=cancel,
+                submit_hook=submit_hook, done_hook=done_hook,
+                claim=None if leases is None else claim,
+                release=None if leases is None else leases.release,
+                report=report if (default_reports if reports is None else reports) else None,
+            )
+        finally:
+            for shard in shards.values():
+                shard.close()
+        if shards:
+            merge_reports(sorted(shards), path=p)
+        if record:
+            built: dict[str, bool] = dict.fromkeys(stems_run, True)
+            for key, task in graph.items():
+                outcome = result["outcomes"].get(key)
+                if task.stage == "error":
+                    built[task.stem] &= outcome == SKIPPED
+                else:
+                    built[task.stem] &= outcome in (OK, FLAG)
+            done = [s for s in stems_run if built[s] and _input_stamp(stem_paths(s, path=p)) == before[s]]
+            (default_path if p is None else p)["record_digests"](done)
+        return result
+
+    return {
+        "run_dag": _run_dag,
+        "run_batch": run_batch,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    max_workers: int | None,
+    max_retries: int,
+    dag: dict,
+    journal: dict,
+    record_digests: bool,
+    storage: Mapping,
+    report_outcomes: bool,
+) -> dict[str, Callable]:
+    """
+    Generate executor functions.
+
+    Args:
+        path: PATH mapping (from Config.path).
+        max_workers: Default pool size (None → os.cpu_count()).
+        max_retries: Default retry budget.
+        dag: DAG functions (from dag.py).
+        journal: Journal functions (from journal.py).
+        record_digests: Default for recording source digests after run_batch.
+        storage: BC_STORAGE bundle (report shards + merge).
+        report_outcomes: Default for writing flag / error reports in run_batch.
+
+    Returns:
+        Dictionary with 2 executor functions.
+
+    Validation:
+        Asserts 2 functions returned and a non-negative retry budget.
+    """
+    assert max_retries >= 0, f"max_retries must be >= 0, got {max_retries}"
+    functions = _create_executor_functions(
+        path, max_workers, max_retries, dag, journal, record_digests, storage, report_outcomes,
+    )
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 executor functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "run_dag"]
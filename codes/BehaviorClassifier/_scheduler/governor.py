@@ -0,0 +1,269 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+governor.py — Row Estimator & Memory-Budget Governor
+=====================================================
+
+Admit tasks into the process pool only while the projected resident
+memory of everything in flight stays under a budget.
+
+Exports:
+    configure(path: Mapping, utils: Mapping, budget_bytes: int, sample_bytes: int, memory_overhead: float) → dict[str, callable]
+
+Governor Functions (3 total):
+    - estimate_rows(file: Path | str) → dict
+    - estimate_task_bytes(task: Task, path: Mapping | None = None) → int
+    - open_governor(budget_bytes: int | None = None, path: Mapping | None = None) → MemoryGovernor
+
+Row Estimate (one read of the first `sample_bytes`):
+    header   → columns (widths from PARAM via BC_UTILS row_bytes)
+    rows     → (size - header) / mean width of the complete sampled rows
+               (exact when the whole file fits in the sample)
+
+Task Estimate:
+    preflight, score  rows(tracked) × row_bytes(tracked header ∪ scored columns) × overhead
+    pose              rows(sleap)   × row_bytes(sleap header ∪ pose columns)     × overhead
+    error             0 (inputs are streamed / linked, not loaded)
+
+Admission:
+    admit(task)   → True if in-flight bytes + estimate ≤ budget, or nothing
+                    is in flight (an oversized task still runs, alone)
+    release(task) → subtract its estimate when the attempt completes
+    run_batch(stages, **governor.hooks())
+
+Notes:
+    - Estimates are cached per (file, size, mtime)
+    - Default budget: fraction of physical RAM (scheduler.py CELL 02)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import threading
+from pathlib import Path
+from typing import Callable, Mapping
+
+from .dag import Task
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for governor.py.
+
+Why Empty?
+    Budget, sample size and overhead come from scheduler.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — ROW ESTIMATION
+
+def _sample_rows(file: Path, sample_bytes: int) -> dict:
+    """Estimate rows of a CSV from its size and first `sample_bytes`."""
+    try:
+        size = file.stat().st_size
+    except FileNotFoundError:
+        return {"rows": 0, "columns": [], "row_width": 0.0, "exact": True}
+    with open(file, "rb") as fh:
+        sample = fh.read(sample_bytes)
+    header, sep, body = sample.partition(b"\n")
+    columns = [c.strip().strip('"') for c in header.decode("utf-8", "replace").rstrip("\r").split(",")] if header else []
+    if not sep:
+        return {"rows": 0, "columns": columns, "row_width": 0.0, "exact": True}
+
+    exact = len(sample) >= size
+    complete = body if exact else body[: body.rfind(b"\n") + 1]
+    n = complete.count(b"\n") + (1 if exact and body and not body.endswith(b"\n") else 0)
+    if exact:
+        return {"rows": n, "columns": columns, "row_width": (len(body) / n) if n else 0.0, "exact": True}
+    if n == 0:  # one row longer than the sample
+        return {"rows": 1, "columns": columns, "row_width": float(size - len(header) - 1), "exact": False}
+    width = len(complete) / n
+    rows = int(round((size - len(header) - 1) / width))
+    return {"rows": rows, "columns": columns, "row_width": width, "exact": False}
+
+
+#%% CELL 04 — MEMORY GOVERNOR
+
+class MemoryGovernor:
+    """
+    Memory-budget admission control for run_dag / run_batch.
+
+    Usage:
+        with BC_SCHEDULER["open_governor"](budget_bytes=8 * 2**30) as gov:
+            BC_SCHEDULER["run_batch"](stages, **gov.hooks())
+            gov.usage()     # {"budget", "in_flight", "used", "peak", "deferrals"}
+    """
+
+    def __init__(self, budget_bytes: int, estimate: Callable[[Task], int]) -> None:
+        self.budget_bytes = int(budget_bytes)
+        self._estimate = estimate
+        self._lock = threading.Lock()
+        self._inflight: dict[str, int] = {}
+        self._used = 0
+        self.peak = 0
+        self.deferrals = 0
+
+    def __enter__(self) -> "MemoryGovernor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def admit(self, task: Task) -> bool:
+        """Reserve the task's estimate if it fits (see header)."""
+        need = self._estimate(task)
+        with self._lock:
+            if self._inflight and self._used + need > self.budget_bytes:
+                self.deferrals += 1
+                return False
+            self._inflight[task.key] = self._inflight.get(task.key, 0) + need
+            self._used += need
+            self.peak = max(self.peak, self._used)
+            return True
+
+    def release(self, task: Task) -> None:
+        """Return the task's reservation (unknown tasks ignored)."""
+        with self._lock:
+            self._used -= self._inflight.pop(task.key, 0)
+
+    def hooks(self) -> dict[str, Callable]:
+        """run_dag / run_batch keyword arguments."""
+        return {"submit_hook": self.admit, "done_hook": self.release}
+
+    def usage(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "budget": self.budget_bytes,
+                "in_flight": len(self._inflight),
+                "used": self._used,
+                "peak": self.peak,
+                "deferrals": self.deferrals,
+            }
+
+
+#%% CELL 05 — GOVERNOR FUNCTION FACTORY
+
+def _create_governor_functions(
+    path: Mapping,
+    utils: Mapping,
+    budget_bytes: int,
+    sample_bytes: int,
+    memory_overhead: float,
+) -> dict[str, Callable]:
+    """
+    Create estimator + governor functions bound to PATH and BC_UTILS.
+
+    Returns:
+        Dictionary with 3 governor functions.
+    """
+    default_path = path
+    default_budget = budget_bytes
+    row_bytes = utils["row_bytes"]
+    scored_cols = utils["select_columns"](tag="scored")
+    pose_cols = utils["select_columns"](tag="pose")
+    cache: dict[tuple, dict] = {}
+    lock = threading.Lock()
+
+    def estimate_rows(file: Path | str) -> dict:
+        """
+        Estimate a CSV's data rows from its size and a sampled head.
+
+        Returns:
+            {"rows": int, "columns": [header...], "row_width": float, "exact": bool}
+
+        Examples:
+            estimate_rows(PATH["tracked_path"]("BASE_fly1"))["rows"]
+        """
+        file = Path(file)
+        try:
+            st = file.stat()
+            key = (str(file), st.st_size, st.st_mtime_ns)
+        except FileNotFoundError:
+            return _sample_rows(file, sample_bytes)
+        with lock:
+            hit = cache.get(key)
+        if hit is None:
+            hit = _sample_rows(file, sample_bytes)
+            with lock:
+                cache[key] = hit
+        return hit
+
+    def _bytes(file: Path, extra: list[str]) -> int:
+        est = estimate_rows(file)
+        cols = list(dict.fromkeys(est["columns"] + extra))
+        return int(est["rows"] * row_bytes(cols) * memory_overhead)
+
+    def estimate_task_bytes(task: Task, path: Mapping | None = None) -> int:
+        """
+        Projected resident bytes of one task (see header for the rules).
+
+        Args:
+            task: DAG task.
+            path: Optional PATH override.
+        """
+        p = default_path if path is None else path
+        if task.stage in ("preflight", "score"):
+            return _bytes(p["tracked_path"](task.stem), scored_cols)
+        if task.stage == "pose":
+            return _bytes(p["sleap_path"](task.stem), pose_cols)
+        return 0
+
+    def open_governor(budget_bytes: int | None = None, path: Mapping | None = None) -> MemoryGovernor:
+        """
+        Create a memory governor for one run.
+
+        Args:
+            budget_bytes: Memory budget (default from controller).
+            path: Optional PATH override (used for task estimates).
+
+        Returns:
+            MemoryGovernor (pass gov.hooks() to run_batch / run_dag).
+        """
+        budget = default_budget if budget_bytes is None else budget_bytes
+        return MemoryGovernor(budget, lambda task: estimate_task_bytes(task, path=path))
+
+    return {
+        "estimate_rows": estimate_rows,
+        "estimate_task_bytes": estimate_task_bytes,
+        "open_governor": open_governor,
+    }
+
+
+#%% CELL 06 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    utils: Mapping,
+    budget_bytes: int,
+    sample_bytes: int,
+    memory_overhead: float,
+) -> dict[str, Callable]:
+    """
+    Generate governor functions.
+
+    Args:
+        path: PATH mapping (from Config.path).
+        utils: BC_UTILS bundle (select_columns, row_bytes).
+        budget_bytes: Default memory budget.
+        sample_bytes: Bytes read from each file head for row estimates.
+        memory_overhead: Working copies per loaded row.
+
+    Returns:
+        Dictionary with 3 governor functions.
+
+    Validation:
+        Asserts 3 functions returned and positive budget/sample size.
+    """
+    assert budget_bytes > 0 and sample_bytes > 0, (
+        f"Governor limits must be positive: budget={budget_bytes}, sample={sample_bytes}"
+    )
+    functions = _create_governor_functions(path, utils, budget_bytes, sample_bytes, memory_overhead)
+
+    # Validation
+    assert len(functions) == 3, f"Expected 3 governor functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 07 — EXPORTS
+
+__all__ = ["configure", "MemoryGovernor"]
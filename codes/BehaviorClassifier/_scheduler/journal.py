@@ -0,0 +1,211 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+journal.py — Resumable Run Journal
+===================================
+
+Append-only JSONL record of task events (one line per event).
+
+Exports:
+    configure(path: Mapping, journal_name: str) → dict[str, callable]
+
+Journal Functions (1 total):
+    - open_journal(file: Path | str | None = None, path: Mapping | None = None) → Journal
+
+Record Shape:
+    {"task": "BASE_fly1:score", "event": "done", "outcome": "ok",
+     "attempt": 1, "t": 1729350000.0, "error": null,
+     "stamp": [[12345678, 1729349000000000000], null]}
+
+Events:
+    - done: terminal, outcome recorded (ok/flag/error/failed/skipped)
+    - retry: attempt failed, will be resubmitted (error message recorded)
+
+Notes:
+    - Lines are flushed per event; fsync on close
+    - A torn last line (crash mid-write) is ignored on load
+    - Resume = load(stamps) → finished task keys are not resubmitted
+    - Only successful outcomes (ok / flag) count as finished: error,
+      failed and skipped tasks run again on resume
+    - stamp = (size, mtime_ns) of the task's inputs when it ran; a task
+      whose inputs changed since (or that has no stamp) is not finished
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Mapping
+
+from .dag import FLAG, OK
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for journal.py.
+
+Why Empty?
+    Journal filename comes from the controller (JOURNAL_NAME).
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - name passed via configure())
+
+#%% CELL 03 — JOURNAL
+
+# Outcomes a resumed run does not repeat
+RESUMABLE: tuple[str, ...] = (OK, FLAG)
+
+
+class Journal:
+    """
+    Append-only task journal.
+
+    Usage:
+        with Journal(file) as j:
+            finished = j.load(stamps)
+            j.record("BASE_fly1:score", "done", outcome="ok", attempt=1, stamp=stamps["BASE_fly1:score"])
+    """
+
+    def __init__(self, file: Path | str) -> None:
+        self.file = Path(file)
+        self._fh = None
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def load(self, stamps: Mapping[str, object] | None = None) -> dict[str, str]:
+        """
+        Read finished tasks from a previous run.
+
+        Args:
+            stamps: Task key → current input stamp. When given, a record
+                    only counts if it carries the same stamp (inputs unchanged).
+
+        Returns:
+            Task key → last terminal outcome, successful ones only
+            (later records win; see RESUMABLE).
+        """
+        last: dict[str, dict] = {}
+        if not self.file.exists():
+            return {}
+        with open(self.file, "r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn write from a crashed run
+                if rec.get("event") == "done":
+                    last[rec["task"]] = rec
+        return {
+            task: rec.get("outcome")
+            for task, rec in last.items()
+            if rec.get("outcome") in RESUMABLE
+            and (stamps is None or (task in stamps and rec.get("stamp") == stamps[task]))
+        }
+
+    def record(
+        self,
+        task: str,
+        event: str,
+        outcome: str | None = None,
+        attempt: int = 0,
+        error: str | None = None,
+        stamp: object = None,
+    ) -> None:
+        """Append one event line and flush (stamp: JSON-ready input stamp)."""
+        if self._fh is None:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.file, "a", encoding="utf-8")
+        rec = {
+            "task": task,
+            "event": event,
+            "outcome": outcome,
+            "attempt": attempt,
+            "t": time.time(),
+            "error": error,
+            "stamp": stamp,
+        }
+        self._fh.write(json.dumps(rec) + "\n")
+        self._fh.flush()
+
+    def close(self) -> None:
+        """Flush to disk (fsync) and close."""
+        if self._fh is not None:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+            self._fh.close()
+            self._fh = None
+
+    def reset(self) -> None:
+        """Delete the journal (fresh run)."""
+        self.close()
+        self.file.unlink(missing_ok=True)
+
+
+#%% CELL 04 — JOURNAL FUNCTION FACTORY
+
+def _create_journal_functions(path: Mapping, journal_name: str) -> dict[str, Callable]:
+    """
+    Create journal opener bound to the default journal location.
+
+    Args:
+        path: PATH mapping (journal lives under pBehaviorClassification).
+        journal_name: Journal filename.
+
+    Returns:
+        Dictionary with 1 journal function.
+    """
+    default_path = path
+
+    def open_journal(file: Path | str | None = None, path: Mapping | None = None) -> Journal:
+        """
+        Open the run journal.
+
+        Args:
+            file: Explicit journal file (overrides default location).
+            path: Optional PATH override (journal under its pBehaviorClassification).
+
+        Returns:
+            Journal (not yet opened for writing; use as context manager).
+        """
+        if file is not None:
+            return Journal(file)
+        p = default_path if path is None else path
+        return Journal(p["pBehaviorClassification"] / journal_name)
+
+    return {
+        "open_journal": open_journal,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(path: Mapping, journal_name: str) -> dict[str, Callable]:
+    """
+    Generate journal functions.
+
+    Args:
+        path: PATH mapping (from Config.path).
+        journal_name: Journal filename (from controller).
+
+    Returns:
+        Dictionary with 1 journal function.
+
+    Validation:
+        Asserts 1 function returned.
+    """
+    functions = _create_journal_functions(path, journal_name)
+
+    # Validation
+    assert len(functions) == 1, f"Expected 1 journal function, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "Journal", "RESUMABLE"]
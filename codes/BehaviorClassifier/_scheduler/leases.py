@@ -0,0 +1,354 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+leases.py — File-Lease Work Claiming
+=====================================
+
+Split stems between machines sharing one experiment root: a stem is
+processed only by the holder of its lease file.
+
+Exports:
+    configure(path: Mapping, lease_dir: str, ttl: float, heartbeat: float) → dict[str, callable]
+
+Lease Functions (2 total):
+    - open_leases(owner: str | None = None, ttl: float | None = None, heartbeat: float | None = None, path: Mapping | None = None) → LeaseManager
+    - lease_status(path: Mapping | None = None, ttl: float | None = None) → list[dict]
+
+Protocol:
+    claim     os.open(<stem>.lease, O_CREAT | O_EXCL) → exactly one winner
+    heartbeat os.utime(<stem>.lease) every `heartbeat` seconds (mtime = liveness)
+    stale     mtime older than `ttl` → holder presumed dead
+    takeover  O_EXCL <stem>.takeover lock → re-check staleness → unlink stale
+              lease → release lock → claim as usual
+    release   owner check → unlink
+
+Layout:
+    BehaviorClassification/.leases/BASE_fly1.lease     {"owner", "host", "pid", "t"}
+
+Notes:
+    - run_batch(leases=...) claims per stem at submission (see executor.py)
+    - Works on local disks and NFS; ttl must exceed clock skew between hosts
+    - FUSE mounts (Drive) may not honour O_EXCL across machines
+    - One heartbeat thread per LeaseManager covers all held leases
+    - A lease whose file vanished or changed owner is reported as lost
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for leases.py.
+
+Why Empty?
+    Lease folder, TTL and heartbeat interval come from scheduler.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — LEASE FILES
+
+def _read_owner(file: Path) -> str | None:
+    try:
+        return json.loads(file.read_text(encoding="utf-8")).get("owner")
+    except (OSError, ValueError):
+        return None
+
+
+def _age(file: Path) -> float | None:
+    """Seconds since last heartbeat (None if the file is gone)."""
+    try:
+        return time.time() - file.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _create_excl(file: Path, payload: dict) -> bool:
+    """Atomically create `file` with payload; False if it already exists."""
+    try:
+        fd = os.open(file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        os.write(fd, json.dumps(payload).encode("utf-8"))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return True
+
+
+class LeaseManager:
+    """
+    Claims and heartbeats leases for one owner (process).
+
+    Usage:
+        with BC_SCHEDULER["open_leases"]() as leases:
+            for stem in leases.iter_claims(PATH["g_tracked_missing_scored"]()):
+                process(stem)
+                leases.release(stem)
+    """
+
+    def __init__(self, folder: Path, owner: str, ttl: float, heartbeat: float) -> None:
+        self.folder = Path(folder)
+        self.owner = owner
+        self.ttl = float(ttl)
+        self.heartbeat = float(heartbeat)
+        self.lost: set[str] = set()
+        self._held: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "LeaseManager":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _file(self, stem: str) -> Path:
+        return self.folder / f"{stem}.lease"
+
+    def _payload(self) -> dict:
+        return {"owner": self.owner, "host": socket.gethostname(), "pid": os.getpid(), "t": time.time()}
+
+    # --- Claiming ---
+    def _take_over(self, stem: str) -> None:
+        """Remove the lease of `stem` if stale (serialised by a takeover lock)."""
+        lock = self.folder / f"{stem}.takeover"
+        if not _create_excl(lock, self._payload()):
+            age = _age(lock)
+            if age is not None and age > self.ttl:  # taker died mid-takeover
+                lock.unlink(missing_ok=True)
+            return
+        try:
+            age = _age(self._file(stem))
+            if age is not None and age > self.ttl:
+                self._file(stem).unlink(missing_ok=True)
+        finally:
+            lock.unlink(missing_ok=True)
+
+    def claim(self, stem: str) -> bool:
+        """
+        Try to claim `stem` (takes over a stale lease).
+
+        Returns:
+            True if this owner now holds the lease.
+        """
+        self.folder.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            if stem in self._held:
+                return True
+        file = self._file(stem)
+        if not _create_excl(file, self._payload()):
+            age = _age(file)
+            if age is None or age <= self.ttl:
+                return False
+            self._take_over(stem)
+            if not _create_excl(file, self._payload()):
+                return False
+        with self._lock:
+            self._held.add(stem)
+        self._ensure_heartbeat()
+        return True
+
+    def iter_claims(
+        self,
+        stems: Iterable[str],
+        done: Callable[[str], bool] | None = None,
+    ) -> Iterator[str]:
+        """
+        Lazily claim stems not held by anyone else.
+
+        Args:
+            stems: Candidate stems (e.g., g_tracked_missing_scored()).
+            done: Optional re-check after claiming (e.g., output now exists);
+                  done stems are released and skipped.
+
+        Yields:
+            Stems this owner holds (caller releases when finished).
+        """
+        for stem in stems:
+            if not self.claim(stem):
+                continue
+            if done is not None and done(stem):
+                self.release(stem)
+                continue
+            yield stem
+
+    # --- Heartbeat & release ---
+    def _ensure_heartbeat(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._beat, name="bc-lease", daemon=True)
+            self._thread.start()
+
+    def _beat(self) -> None:
+        while not self._stop.wait(self.heartbeat):
+            self.renew()
+
+    def renew(self) -> set[str]:
+        """
+        Heartbeat all held leases now.
+
+        Returns:
+            Stems lost since the last call (file gone or owned by someone else).
+        """
+        with self._lock:
+            held = sorted(self._held)
+        lost = set()
+        for stem in held:
+            file = self._file(stem)
+            if _read_owner(file) != self.owner:
+                lost.add(stem)
+                continue
+            try:
+                os.utime(file)
+            except FileNotFoundError:
+                lost.add(stem)
+        with self._lock:
+            self._held -= lost
+            self.lost |= lost
+        return lost
+
+    def holds(self, stem: str) -> bool:
+        """True if `stem` is held and its file still names this owner."""
+        with self._lock:
+            if stem not in self._held:
+                return False
+        return _read_owner(self._file(stem)) == self.owner
+
+    def release(self, stem: str) -> None:
+        """Release one lease (only removes the file if still ours)."""
+        with self._lock:
+            self._held.discard(stem)
+        file = self._file(stem)
+        if _read_owner(file) == self.owner:
+            file.unlink(missing_ok=True)
+
+    def held(self) -> list[str]:
+        with self._lock:
+            return sorted(self._held)
+
+    def close(self) -> None:
+        """Stop heartbeats and release every held lease."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for stem in self.held():
+            self.release(stem)
+
+
+#%% CELL 04 — LEASE FUNCTION FACTORY
+
+def _create_lease_functions(
+    path: Mapping,
+    lease_dir: str,
+    ttl: float,
+    heartbeat: float,
+) -> dict[str, Callable]:
+    """
+    Create lease functions bound to PATH and controller defaults.
+
+    Returns:
+        Dictionary with 2 lease functions.
+    """
+    default_path = path
+    default_ttl, default_heartbeat = ttl, heartbeat
+
+    def _folder(p: Mapping) -> Path:
+        return p["pBehaviorClassification"] / lease_dir
+
+    def open_leases(
+        owner: str | None = None,
+        ttl: float | None = None,
+        heartbeat: float | None = None,
+        path: Mapping | None = None,
+    ) -> LeaseManager:
+        """
+        Open a lease manager for this process.
+
+        Args:
+            owner: Owner id (default '<hostname>-<pid>-<random>').
+            ttl: Seconds without heartbeat before a lease is stale.
+            heartbeat: Seconds between heartbeats (must be < ttl).
+            path: Optional PATH override (e.g., configure(root=...)).
+
+        Returns:
+            LeaseManager (use as context manager).
+
+        Raises:
+            ValueError: heartbeat >= ttl.
+        """
+        p = default_path if path is None else path
+        t = default_ttl if ttl is None else ttl
+        h = default_heartbeat if heartbeat is None else heartbeat
+        if h >= t:
+            raise ValueError(f"heartbeat ({h}s) must be shorter than ttl ({t}s)")
+        owner = owner or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        return LeaseManager(_folder(p), owner, t, h)
+
+    def lease_status(path: Mapping | None = None, ttl: float | None = None) -> list[dict]:
+        """
+        List current leases.
+
+        Returns:
+            [{"stem", "owner", "age", "stale"}] sorted by stem.
+        """
+        p = default_path if path is None else path
+        t = default_ttl if ttl is None else ttl
+        folder = _folder(p)
+        if not folder.is_dir():
+            return []
+        out = []
+        for file in sorted(folder.glob("*.lease")):
+            age = _age(file)
+            if age is None:
+                continue
+            out.append({"stem": file.stem, "owner": _read_owner(file), "age": age, "stale": age > t})
+        return out
+
+    return {
+        "open_leases": open_leases,
+        "lease_status": lease_status,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(path: Mapping, lease_dir: str, ttl: float, heartbeat: float) -> dict[str, Callable]:
+    """
+    Generate lease functions.
+
+    Args:
+        path: PATH mapping (leases live under pBehaviorClassification).
+        lease_dir: Lease folder name.
+        ttl: Default lease TTL (seconds).
+        heartbeat: Default heartbeat interval (seconds).
+
+    Returns:
+        Dictionary with 2 lease functions.
+
+    Validation:
+        Asserts 2 functions returned and heartbeat < ttl.
+    """
+    assert 0 < heartbeat < ttl, f"Expected 0 < heartbeat < ttl, got heartbeat={heartbeat}, ttl={ttl}"
+    functions = _create_lease_functions(path, lease_dir, ttl, heartbeat)
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 lease functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "LeaseManager"]
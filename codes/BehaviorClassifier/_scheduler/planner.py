@@ -0,0 +1,279 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+planner.py — Dry-Run Processing Planner
+========================================
+
+Full run plan with cost estimates from PATH discovery and file sizes,
+calibrated by sampling the head of one file per kind.
+
+Exports:
+    configure(path: Mapping, utils: Mapping, costs: Mapping, require_sleap: bool, max_workers: int | None, sample_bytes: int) → dict[str, callable]
+
+Planner Functions (1 total):
+    - plan_run(stems=None, path=None, method="mtime", digests=None, require_sleap=None, max_workers=None) → dict
+
+Plan Shape:
+    {
+      "score":      [stems with no scored output yet],
+      "stale":      [stems whose outputs are older than inputs (re-run)],
+      "error":      [stems that will fail pre-flight (require_sleap + no sleap)],
+      "no_pose":    [stems to score without pose (no sleap)],
+      "up_to_date": [stems with current Scored/ or Flag/Scored/ output],
+      "stems":      {stem: {"action", "tracked_bytes", "sleap_bytes", "frames",
+                            "sleap_frames", "cpu_sec", "peak_bytes"}},
+      "totals":     {"stems", "frames", "cpu_sec", "peak_bytes",
+                     "peak_bytes_parallel", "workers"},
+      "row_width":  {"tracked", "sleap"} (bytes per CSV row used for frames),
+    }
+
+Estimates:
+    frames      (bytes - header) / row width; the row width is measured on
+                the first `sample_bytes` of the largest file of the kind
+                (governor row sampling), falling back to
+                csv_row_width(columns) when no file has a complete row
+    cpu_sec     frames × score µs/frame (+ sleap frames × pose µs/frame)
+    peak_bytes  frames × row_bytes(tracked ∪ scored columns) × overhead
+                (+ sleap frames × row_bytes(sleap ∪ pose columns) × overhead)
+    parallel    sum of the `workers` largest per-stem peaks
+
+Notes:
+    - One presence scan + one scandir of Tracked/ and Sleap/ (sizes) + one
+      head read per kind
+    - The PARAM width alone (csv_row_width) is a worst-case guess: on the
+      synthetic recordings it undercounts frames by about a third (floats
+      written shorter than its 18 characters); the sampled width is
+      within a few percent
+    - Costs are per-frame calibration constants (scheduler.py CELL 02)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import heapq
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+from .governor import _sample_rows
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for planner.py.
+
+Why Empty?
+    Cost calibration and the sleap policy come from scheduler.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - costs passed via configure())
+
+#%% CELL 03 — SIZE SCAN
+
+def _sizes(folder: Path, suffix: str) -> dict[str, int]:
+    """Stem → file size for `*suffix` in folder (one scandir)."""
+    cut = len(suffix)
+    try:
+        with os.scandir(folder) as it:
+            return {
+                e.name[:-cut]: e.stat().st_size
+                for e in it
+                if e.name.endswith(suffix) and not e.name.startswith(".")
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _frames(size: int, header: int, width: float) -> int:
+    return max(0, int(round((size - header) / width)))
+
+
+def _calibrate(sizes: Mapping[str, int], file_for: Callable[[str], Path], sample_bytes: int,
+               header: int, width: float) -> tuple[int, float]:
+    """(header bytes, row width) measured on the largest file; the PARAM guess when it has no full row."""
+    if not sizes:
+        return header, width
+    file = file_for(max(sizes, key=sizes.get))
+    est = _sample_rows(file, sample_bytes)
+    if est["row_width"] <= 0:
+        return header, width
+    with open(file, "rb") as fh:
+        measured = len(fh.readline(sample_bytes))
+    return measured, est["row_width"]
+
+
+#%% CELL 04 — PLANNER FUNCTION FACTORY
+
+def _create_planner_functions(
+    path: Mapping,
+    utils: Mapping,
+    costs: Mapping[str, float],
+    require_sleap: bool,
+    max_workers: int | None,
+    sample_bytes: int,
+) -> dict[str, Callable]:
+    """
+    Create the planner bound to PATH, BC_UTILS sizing and cost defaults.
+
+    Returns:
+        Dictionary with 1 planner function.
+    """
+    default_path = path
+    default_require_sleap = require_sleap
+    default_workers = max_workers
+
+    select = utils["select_columns"]
+    tracked_cols = select(tag="tracked")
+    sleap_cols = select(tag="sleap")
+    score_cols = list(dict.fromkeys(tracked_cols + select(tag="scored")))
+    pose_cols = list(dict.fromkeys(sleap_cols + select(tag="pose")))
+
+    tracked_width = utils["csv_row_width"](tracked_cols)
+    sleap_width = utils["csv_row_width"](sleap_cols)
+    tracked_header = len(",".join(tracked_cols)) + 1
+    sleap_header = len(",".join(sleap_cols)) + 1
+    score_row = utils["row_bytes"](score_cols) * costs["memory_overhead"]
+    pose_row = utils["row_bytes"](pose_cols) * costs["memory_overhead"]
+    score_sec = costs["score_us_per_frame"] * 1e-6
+    pose_sec = costs["pose_us_per_frame"] * 1e-6
+
+    def plan_run(
+        stems: Iterable[str] | None = None,
+        path: Mapping | None = None,
+        method: str = "mtime",
+        digests: Mapping | None = None,
+        require_sleap: bool | None = None,
+        max_workers: int | None = None,
+    ) -> dict:
+        """
+        Build a dry-run plan (see header for the shape).
+
+        Args:
+            stems: Stems to plan (default: every stem with a tracked file).
+            path: Optional PATH override.
+            method / digests: Staleness check (see PATH['stale_outputs']; "hash"
+                              reads the digests run_batch records).
+            require_sleap: Missing sleap → "error" instead of "no_pose".
+            max_workers: Workers for peak_bytes_parallel (None → os.cpu_count()).
+
+        Returns:
+            Plan dict.
+
+        Examples:
+            plan = BC_SCHEDULER["plan_run"]()
+            plan["totals"]["cpu_sec"] / 3600           # CPU hours
+            plan["totals"]["peak_bytes_parallel"] / 2**30   # GiB for the pool
+        """
+        p = default_path if path is None else path
+        need_sleap = default_require_sleap if require_sleap is None else require_sleap
+        workers = max_workers or default_workers or os.cpu_count() or 1
+
+        presence = p["presence_matrix"]()
+        tracked = presence.column("tracked")
+        sleap = presence.column("sleap")
+        done = presence.column("scored") | presence.column("flag_scored")
+        if stems is None:
+            stems = [s for s, t in zip(presence.stems, tracked) if t]
+        stale = set(p["stale_stems"](method=method, digests=digests))
+        t_sizes = _sizes(p["pTracked"], p["SUFFIX_TRACKED"])
+        s_sizes = _sizes(p["pSleap"], p["SUFFIX_SLEAP"])
+        t_header, t_width = _calibrate(t_sizes, p["tracked_path"], sample_bytes, tracked_header, tracked_width)
+        s_header, s_width = _calibrate(s_sizes, p["sleap_path"], sample_bytes, sleap_header, sleap_width)
+
+        plan: dict = {"score": [], "stale": [], "error": [], "no_pose": [], "up_to_date": [], "stems": {}}
+        peaks: list[float] = []
+        total_frames = 0
+        total_cpu = 0.0
+        for stem in sorted(stems):
+            row = presence.stem_index.get(stem)
+            if row is None or not tracked[row]:
+                continue
+            has_sleap = bool(sleap[row])
+            t_bytes = t_sizes.get(stem, 0)
+            s_bytes = s_sizes.get(stem, 0) if has_sleap else 0
+            frames = _frames(t_bytes, t_header, t_width)
+            s_frames = _frames(s_bytes, s_header, s_width) if has_sleap else 0
+
+            if not has_sleap and need_sleap:
+                action = "error"
+            elif stem in stale:
+                action = "stale"
+            elif done[row]:
+                action = "up_to_date"
+            else:
+                action = "score"
+            plan[action].append(stem)
+            if not has_sleap and action != "error":
+                plan["no_pose"].append(stem)
+
+            runs = action in ("score", "stale")
+            cpu = (frames * score_sec + s_frames * pose_sec) if runs else 0.0
+            peak = (frames * score_row + s_frames * pose_row) if runs else 0.0
+            plan["stems"][stem] = {
+                "action": action,
+                "tracked_bytes": t_bytes,
+                "sleap_bytes": s_bytes,
+                "frames": frames,
+                "sleap_frames": s_frames,
+                "cpu_sec": cpu,
+                "peak_bytes": int(peak),
+            }
+            if runs:
+                total_frames += frames
+                total_cpu += cpu
+                peaks.append(peak)
+
+        plan["totals"] = {
+            "stems": len(plan["score"]) + len(plan["stale"]),
+            "frames": total_frames,
+            "cpu_sec": total_cpu,
+            "peak_bytes": int(max(peaks, default=0)),
+            "peak_bytes_parallel": int(sum(heapq.nlargest(workers, peaks))),
+            "workers": workers,
+        }
+        plan["row_width"] = {"tracked": t_width, "sleap": s_width}
+        return plan
+
+    return {
+        "plan_run": plan_run,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    utils: Mapping,
+    costs: Mapping[str, float],
+    require_sleap: bool,
+    max_workers: int | None,
+    sample_bytes: int,
+) -> dict[str, Callable]:
+    """
+    Generate planner functions.
+
+    Args:
+        path: PATH mapping (from Config.path).
+        utils: BC_UTILS bundle (select_columns, csv_row_width, row_bytes).
+        costs: score_us_per_frame, pose_us_per_frame, memory_overhead.
+        require_sleap: Default sleap policy.
+        max_workers: Default pool size for parallel peak estimates.
+        sample_bytes: Head bytes read to measure the row width of each kind.
+
+    Returns:
+        Dictionary with 1 planner function.
+
+    Validation:
+        Asserts 1 function returned and all cost keys present.
+    """
+    required = {"score_us_per_frame", "pose_us_per_frame", "memory_overhead"}
+    assert required <= set(costs), f"Missing plan costs: {sorted(required - set(costs))}"
+    functions = _create_planner_functions(path, utils, costs, require_sleap, max_workers, sample_bytes)
+
+    # Validation
+    assert len(functions) == 1, f"Expected 1 planner function, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
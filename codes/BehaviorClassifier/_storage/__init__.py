@@ -0,0 +1,150 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+_storage/__init__.py — Storage Coordinator
+===========================================
+
+Orchestrates storage workers and assembles the BC_STORAGE bundle.
+
+Architecture:
+    5 workers → coordinator → controller → BC_STORAGE export
+
+Workers (5):
+    1. staging.py: 2 staging functions (is_slow_mount, open_staging)
+    2. publish.py: 2 publish functions (publish_batch, open_publisher)
+    3. recovery.py: 2 recovery functions (scan_temp_files, recover_temp_files)
+    4. copies.py: 2 copy functions (copy_error_file, copy_error_inputs)
+    5. reports.py: 3 report functions (open_report_shard, merge_reports, read_report)
+
+Total Exports: 11 (validated)
+
+Design:
+    - Coordinator receives PATH + storage defaults from controller
+    - Calls workers in dependency order
+    - Assembles single immutable bundle
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+from . import staging
+from . import publish
+from . import recovery
+from . import copies
+from . import reports
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for _storage coordinator.
+
+Why Empty?
+    Coordinator orchestrates workers (no direct configuration).
+    Defaults come from storage.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - pure orchestration)
+
+#%% CELL 03 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    staging_dir: Path,
+    staging_budget_bytes: int,
+    staging_workers: int,
+    writeback_batch: int,
+    slow_fs_types: tuple[str, ...],
+    publish_batch_size: int,
+    publish_max_delay: float,
+    publish_durability: str,
+    recovery_min_age: float,
+    recovery_workers: int,
+    copy_modes: tuple[str, ...],
+    copy_verify: bool,
+    copy_log_name: str | None,
+    report_shard_dir: str,
+) -> MappingProxyType:
+    """
+    Configure and return the immutable BC_STORAGE bundle.
+
+    Args:
+        path: PATH mapping (from Config.path).
+        staging_dir: Default local cache directory.
+        staging_budget_bytes: Byte budget for cached inputs.
+        staging_workers: Concurrent copy threads.
+        writeback_batch: Pending outputs that trigger a write-back flush.
+        slow_fs_types: fstype prefixes treated as slow mounts.
+        publish_batch_size: Items per publish commit.
+        publish_max_delay: Seconds a publish batch waits to fill.
+        publish_durability: "batch" | "file" | "none".
+        recovery_min_age: Seconds before a temp file counts as orphaned.
+        recovery_workers: Recovery thread count.
+        copy_modes: Error copy strategy chain.
+        copy_verify: Verify Error copies before publishing.
+        copy_log_name: Error copy log under pError (None → no log).
+        report_shard_dir: Shard folder name next to each report.
+
+    Returns:
+        MappingProxyType with 11 storage exports.
+
+    Orchestration Order (respects dependencies):
+        1. staging → is_slow_mount, open_staging (needs PATH)
+        2. publish → publish_batch, open_publisher (needs PATH)
+        3. recovery → scan_temp_files, recover_temp_files (needs PATH)
+        4. copies → copy_error_file, copy_error_inputs (needs PATH)
+        5. reports → open_report_shard, merge_reports, read_report (needs PATH)
+    """
+    staging_data = staging.configure(
+        path=path,
+        cache_dir=staging_dir,
+        budget_bytes=staging_budget_bytes,
+        max_workers=staging_workers,
+        batch_size=writeback_batch,
+        slow_fs_types=slow_fs_types,
+    )
+
+    publish_data = publish.configure(
+        path=path,
+        batch_size=publish_batch_size,
+        max_delay=publish_max_delay,
+        durability=publish_durability,
+    )
+
+    recovery_data = recovery.configure(
+        path=path,
+        min_age=recovery_min_age,
+        max_workers=recovery_workers,
+    )
+
+    copies_data = copies.configure(
+        path=path,
+        modes=copy_modes,
+        verify=copy_verify,
+        log_name=copy_log_name,
+    )
+
+    reports_data = reports.configure(path=path, shard_dir=report_shard_dir)
+
+    bundle = {
+        **staging_data,
+        **publish_data,
+        **recovery_data,
+        **copies_data,
+        **reports_data,
+    }
+
+    # Validation: 2 staging + 2 publish + 2 recovery + 2 copies + 3 reports = 11
+    expected_count = 11
+    assert len(bundle) == expected_count, (
+        f"BC_STORAGE export count mismatch: expected {expected_count}, got {len(bundle)}. "
+        f"Keys: {sorted(bundle)}"
+    )
+
+    return MappingProxyType(bundle)
+
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["configure"]
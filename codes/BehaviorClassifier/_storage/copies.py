@@ -0,0 +1,278 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+copies.py — Error Copy Strategies
+==================================
+
+Place failed inputs into Error/Tracked and Error/Pose without doubling
+disk I/O where the filesystem allows it.
+
+Exports:
+    configure(path: Mapping, modes: tuple[str, ...], verify: bool, log_name: str | None) → dict[str, callable]
+
+Copy Functions (2 total):
+    - copy_error_file(source: Path | str, dest: Path | str, modes=None, verify=None) → dict
+    - copy_error_inputs(stem: str, path: Mapping | None = None, modes=None, verify=None) → list[dict]
+
+Strategy Chain (first that succeeds wins):
+    1. hardlink   os.link (same filesystem; zero bytes copied)
+    2. reflink    FICLONE ioctl (Linux btrfs/XFS/…; copy-on-write)
+    3. copy       streamed copy with blake2b hashing on the fly
+
+Record Shape:
+    {"source": Path, "dest": Path, "mode": "hardlink", "bytes": 123,
+     "digest": "…" | None, "verified": True}
+
+Notes:
+    - Every mode publishes through temp_path + os.replace (atomic)
+    - verify: hardlink → same inode; reflink/copy → blake2b digests match
+    - Records are appended to pError/<log_name> (JSONL) when log_name is set
+    - Hardlinked copies share the inode: inputs are treated as immutable
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Mapping
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for copies.py.
+
+Why Empty?
+    Mode order, verification and log name come from storage.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — STRATEGIES
+
+COPY_MODES: tuple[str, ...] = ("hardlink", "reflink", "copy")
+
+# linux/fs.h: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+_CHUNK = 1 << 20  # 1 MiB
+
+
+def _digest(file: Path) -> str:
+    """Streamed blake2b of a file."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(file, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _hardlink(source: Path, tmp: Path) -> str | None:
+    os.link(source, tmp)
+    return None
+
+
+def _reflink(source: Path, tmp: Path) -> str | None:
+    import fcntl  # POSIX only; ImportError → next strategy
+
+    with open(source, "rb") as src, open(tmp, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    return None
+
+
+def _stream(source: Path, tmp: Path) -> str | None:
+    h = hashlib.blake2b(digest_size=20)
+    with open(source, "rb") as src, open(tmp, "wb") as dst:
+        for chunk in iter(lambda: src.read(_CHUNK), b""):
+            h.update(chunk)
+            dst.write(chunk)
+        dst.flush()
+        os.fsync(dst.fileno())
+    return h.hexdigest()
+
+
+_STRATEGIES: dict[str, Callable[[Path, Path], str | None]] = {
+    "hardlink": _hardlink,
+    "reflink": _reflink,
+    "copy": _stream,
+}
+
+
+def _place(
+    source: Path,
+    dest: Path,
+    modes: tuple[str, ...],
+    verify: bool,
+    temp_path: Callable[[Path], Path],
+) -> dict:
+    """Run the strategy chain for one file (see header)."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = temp_path(dest)
+    errors: list[str] = []
+    for mode in modes:
+        tmp.unlink(missing_ok=True)
+        try:
+            src_digest = _STRATEGIES[mode](source, tmp)
+        except (OSError, ImportError) as exc:
+            errors.append(f"{mode}: {exc}")
+            continue
+
+        digest, verified = src_digest, None
+        if verify:
+            if mode == "hardlink":
+                verified = os.path.samefile(source, tmp)
+            else:
+                digest = src_digest or _digest(source)
+                verified = _digest(tmp) == digest
+            if not verified:
+                errors.append(f"{mode}: hash mismatch")
+                continue
+
+        os.replace(tmp, dest)
+        return {
+            "source": source,
+            "dest": dest,
+            "mode": mode,
+            "bytes": dest.stat().st_size,
+            "digest": digest,
+            "verified": verified,
+        }
+
+    tmp.unlink(missing_ok=True)
+    raise OSError(f"Could not copy {source} → {dest}: " + "; ".join(errors))
+
+
+#%% CELL 04 — COPY FUNCTION FACTORY
+
+def _create_copy_functions(
+    path: Mapping,
+    modes: tuple[str, ...],
+    verify: bool,
+    log_name: str | None,
+) -> dict[str, Callable]:
+    """
+    Create Error copy functions bound to PATH and controller defaults.
+
+    Returns:
+        Dictionary with 2 copy functions.
+    """
+    default_path = path
+    default_modes, default_verify = modes, verify
+
+    def _log(p: Mapping, rec: dict) -> None:
+        if log_name is None:
+            return
+        log = p["pError"] / log_name
+        log.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({**rec, "source": str(rec["source"]), "dest": str(rec["dest"]), "t": time.time()})
+        with open(log, "a", encoding="utf-8") as fh:  # one short O_APPEND write per record
+            fh.write(line + "\n")
+
+    def _run(p: Mapping, source, dest, modes, verify) -> dict:
+        chain = default_modes if modes is None else tuple(modes)
+        unknown = set(chain) - set(COPY_MODES)
+        if unknown:
+            raise ValueError(f"Unknown copy modes {sorted(unknown)} (expected {COPY_MODES})")
+        rec = _place(
+            Path(source),
+            Path(dest),
+            chain,
+            default_verify if verify is None else verify,
+            p["temp_path"],
+        )
+        _log(p, rec)
+        return rec
+
+    def copy_error_file(
+        source: Path | str,
+        dest: Path | str,
+        modes: tuple[str, ...] | None = None,
+        verify: bool | None = None,
+    ) -> dict:
+        """
+        Copy one file using the cheapest working strategy.
+
+        Args:
+            source: Original input file.
+            dest: Destination (e.g., PATH['error_tracked_copy_path'](source.name)).
+            modes: Strategy chain (subset/order of COPY_MODES).
+            verify: Check inode/hash before publishing.
+
+        Returns:
+            Copy record (see header).
+
+        Raises:
+            OSError: Every strategy failed (reasons joined in the message).
+        """
+        return _run(default_path, source, dest, modes, verify)
+
+    def copy_error_inputs(
+        stem: str,
+        path: Mapping | None = None,
+        modes: tuple[str, ...] | None = None,
+        verify: bool | None = None,
+    ) -> list[dict]:
+        """
+        Copy a stem's tracked and sleap inputs into Error/Tracked and Error/Pose.
+
+        Args:
+            stem: Base stem ('BASE_flyN').
+            path: Optional PATH override.
+            modes / verify: See copy_error_file().
+
+        Returns:
+            Copy records for the inputs that exist (tracked first).
+        """
+        p = default_path if path is None else path
+        pairs = (
+            (p["tracked_path"](stem), p["error_tracked_copy_path"]),
+            (p["sleap_path"](stem), p["error_pose_copy_path"]),
+        )
+        return [
+            _run(p, src, dest_of(src.name), modes, verify)
+            for src, dest_of in pairs
+            if src.exists()
+        ]
+
+    return {
+        "copy_error_file": copy_error_file,
+        "copy_error_inputs": copy_error_inputs,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    modes: tuple[str, ...],
+    verify: bool,
+    log_name: str | None,
+) -> dict[str, Callable]:
+    """
+    Generate Error copy functions.
+
+    Args:
+        path: PATH mapping (Error folders + temp naming).
+        modes: Default strategy chain.
+        verify: Default verification switch.
+        log_name: JSONL log filename under pError (None → no log).
+
+    Returns:
+        Dictionary with 2 copy functions.
+
+    Validation:
+        Asserts 2 functions returned and known modes.
+    """
+    assert set(modes) <= set(COPY_MODES), f"Unknown copy modes {modes} (expected subset of {COPY_MODES})"
+    functions = _create_copy_functions(path, tuple(modes), verify, log_name)
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 copy functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "COPY_MODES"]
@@ -0,0 +1,455 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+publish.py — Batched Atomic Publish Engine
+===========================================
+
+Publish many small outputs with the write → fsync → rename guarantees,
+paying the sync cost once per batch instead of once per file.
+
+Exports:
+    configure(path: Mapping, batch_size: int, max_delay: float, durability: str) → dict[str, callable]
+
+Publish Functions (2 total):
+    - publish_batch(items: Iterable[tuple[Path, Content]], durability: str | None = None) → dict[Path, Exception | None]
+    - open_publisher(batch_size: int | None = None, max_delay: float | None = None, durability: str | None = None) → Publisher
+
+Content:
+    bytes | str | Callable[[Path], None]  (callable writes the given temp path,
+    e.g. lambda p: df.to_csv(p, index=False))
+
+Batch Commit (durability="batch"):
+    1. Write every item to temp_path(final)          ('a/b.~tmp.csv')
+    2. Commit manifest per folder (temp → size)      ('a/.~commit-<id>.json')
+    3. One syncfs per filesystem of the folders      (temps + manifests durable)
+    4. os.replace(temp, final) for every item        (atomic per file)
+    5. One fsync per distinct parent directory       (renames durable)
+    6. Manifests removed
+
+Commit Manifests:
+    The writer's record that a temp is complete. recovery.py finishes only
+    temps listed in a manifest with the same size; any other temp is a
+    torn write and is deleted. Manifests are durable before the first
+    rename ("file": fsynced with their folder; "none": best effort).
+
+Durability Modes:
+    - "batch": steps above (default; one sync per filesystem for the whole
+      batch; without syncfs (non-Linux) every temp and manifest is
+      fdatasynced after all are written, then their folders fsynced)
+    - "file": fsync each temp file right after writing it
+    - "none": no fsync (scratch outputs)
+
+Notes:
+    - A crash leaves either the old final or the new final, never a torn one;
+      leftover '.~tmp' files are handled by recovery.py
+    - A failing item never blocks the rest of its batch
+    - One final path twice in a batch: the last item wins, earlier ones are
+      superseded (never written; Publisher futures resolve to None)
+    - Publisher runs commits on one background writer thread; a future
+      cancelled before its batch commits is not written
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import ctypes
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Iterable, Mapping, Union
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for publish.py.
+
+Why Empty?
+    Batch size, delay and durability come from storage.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — BATCH COMMIT
+
+Content = Union[bytes, str, Callable[[Path], None]]
+
+DURABILITY_MODES: tuple[str, ...] = ("batch", "file", "none")
+
+# Commit manifests: '<folder>/.~commit-<hex>.json' → {"temps": {name: size}}
+MANIFEST_PREFIX: str = ".~commit-"
+MANIFEST_SUFFIX: str = ".json"
+
+# syncfs(2): flush one filesystem only (Linux; None elsewhere)
+try:
+    _SYNCFS = ctypes.CDLL(None, use_errno=True).syncfs
+except (OSError, TypeError, AttributeError):
+    _SYNCFS = None
+
+
+def is_manifest(name: str) -> bool:
+    """True for a commit-manifest filename."""
+    return name.startswith(MANIFEST_PREFIX) and name.endswith(MANIFEST_SUFFIX)
+
+
+def read_manifest(file: Path) -> dict[str, int]:
+    """Temp name → committed size ({} when unreadable / torn)."""
+    try:
+        temps = json.loads(Path(file).read_text(encoding="utf-8")).get("temps", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+    return {str(k): int(v) for k, v in temps.items()} if isinstance(temps, dict) else {}
+
+
+def _write_manifest(folder: Path, temps: dict[str, int], fsync: bool) -> Path:
+    """Record completed temps of one folder (see Commit Manifests)."""
+    file = folder / f"{MANIFEST_PREFIX}{uuid.uuid4().hex}{MANIFEST_SUFFIX}"
+    with open(file, "w", encoding="utf-8") as fh:
+        json.dump({"pid": os.getpid(), "temps": temps}, fh)
+        if fsync:
+            fh.flush()
+            os.fsync(fh.fileno())
+    if fsync:
+        _fsync_path(folder)
+    return file
+
+
+def _fsync_path(path: Path) -> None:
+    """fsync a file or directory by path (directories unsupported on Windows)."""
+    if os.name == "nt" and path.is_dir():
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _sync_files(files: list[Path]) -> None:
+    """Make written files (and their folder entries) durable: one syncfs per filesystem."""
+    by_dev: dict[int, Path] = {}
+    for f in files:
+        by_dev.setdefault(f.parent.stat().st_dev, f.parent)
+    if _SYNCFS is not None:
+        for folder in by_dev.values():
+            fd = os.open(folder, os.O_RDONLY)
+            try:
+                if _SYNCFS(fd) != 0:
+                    err = ctypes.get_errno()
+                    raise OSError(err, os.strerror(err), str(folder))
+            finally:
+                os.close(fd)
+        return
+    datasync = getattr(os, "fdatasync", os.fsync)
+    for f in files:
+        fd = os.open(f, os.O_RDONLY)
+        try:
+            datasync(fd)
+        finally:
+            os.close(fd)
+    for folder in sorted({f.parent for f in files}):
+        _fsync_path(folder)
+
+
+def _write_temp(tmp: Path, content: Content, fsync: bool) -> None:
+    """Write content to the temp path (optionally fsync the file)."""
+    tmp.parent.mkdir(parents=True, exist_ok=True)
+    if callable(content):
+        content(tmp)
+        if fsync:
+            _fsync_path(tmp)
+        return
+    mode = "wb" if isinstance(content, (bytes, bytearray, memoryview)) else "w"
+    with open(tmp, mode, **({} if mode == "wb" else {"encoding": "utf-8"})) as fh:
+        fh.write(content)
+        if fsync:
+            fh.flush()
+            os.fsync(fh.fileno())
+
+
+def _commit(
+    items: list[tuple[Path, Content]],
+    temp_path: Callable[[Path], Path],
+    durability: str,
+) -> dict[Path, Exception | None]:
+    """
+    Commit one batch (see header for the steps).
+
+    Returns:
+        final → None on success, or the exception that stopped that item
+        (duplicate finals: the last item's result).
+    """
+    if durability not in DURABILITY_MODES:
+        raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {durability!r}")
+    latest: dict[Path, Content] = {}
+    for final, content in items:
+        final = Path(final)
+        latest.pop(final, None)  # re-insert: last item wins, keeps its position
+        latest[final] = content
+
+    result: dict[Path, Exception | None] = {}
+    written: list[tuple[Path, Path]] = []
+    for final, content in latest.items():
+        tmp = temp_path(final)
+        try:
+            _write_temp(tmp, content, fsync=(durability == "file"))
+            written.append((tmp, final))
+        except Exception as exc:
+            tmp.unlink(missing_ok=True)
+            result[final] = exc
+
+    by_dir: dict[Path, list[tuple[Path, Path]]] = {}
+    for tmp, final in written:
+        by_dir.setdefault(tmp.parent, []).append((tmp, final))
+    manifests: list[Path] = []
+    for folder, pairs in by_dir.items():
+        try:
+            manifests.append(_write_manifest(folder, {t.name: t.stat().st_size for t, _ in pairs}, durability == "file"))
+        except Exception as exc:  # unrecorded temps must not be published
+            for tmp, final in pairs:
+                tmp.unlink(missing_ok=True)
+                result[final] = exc
+            written = [w for w in written if w not in pairs]
+
+    if written and durability == "batch":
+        _sync_files([t for t, _ in written] + manifests)
+
+    dirs: set[Path] = set()
+    for tmp, final in written:
+        try:
+            os.replace(tmp, final)
+            dirs.add(final.parent)
+            result[final] = None
+        except Exception as exc:
+            tmp.unlink(missing_ok=True)
+            result[final] = exc
+
+    if durability != "none":
+        for d in sorted(dirs):
+            _fsync_path(d)
+    for m in manifests:
+        m.unlink(missing_ok=True)
+    return result
+
+
+#%% CELL 04 — BACKGROUND PUBLISHER
+
+class Publisher:
+    """
+    Background writer: queue outputs, commit them in batches.
+
+    Usage:
+        with BC_STORAGE["open_publisher"]() as pub:
+            pub.submit(PATH["scored_path"](stem), lambda p: df.to_csv(p, index=False))
+            pub.submit(PATH["flag_scored_path"](stem), csv_text)
+        # leaving the block commits everything still queued
+
+    Notes:
+        - submit() returns a Future → final Path (or the item's exception);
+          None when a later submit of the same path in the same batch
+          superseded it
+        - A batch commits at batch_size items or max_delay seconds after
+          its first item, whichever comes first
+        - future.cancel() before its batch commits → the item is not written
+        - submit() / flush() after close() → RuntimeError
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        temp_path: Callable[[Path], Path],
+        batch_size: int,
+        max_delay: float,
+        durability: str,
+    ) -> None:
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {durability!r}")
+        self._temp_path = temp_path
+        self.batch_size = int(batch_size)
+        self.max_delay = float(max_delay)
+        self.durability = durability
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="bc-publish", daemon=True)
+        self._closed = False
+        self._thread.start()
+
+    def __enter__(self) -> "Publisher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def submit(self, final: Path | str, content: Content) -> Future:
+        """Queue one output for publishing."""
+        if self._closed:
+            raise RuntimeError("Publisher is closed")
+        fut: Future = Future()
+        self._queue.put((Path(final), content, fut))
+        return fut
+
+    def flush(self) -> None:
+        """Block until everything submitted so far is committed."""
+        if self._closed:
+            raise RuntimeError("Publisher is closed")
+        barrier: Future = Future()
+        self._queue.put(barrier)
+        barrier.result()
+
+    def close(self) -> None:
+        """Commit remaining items and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            batch, barriers = [], []
+            deadline = time.monotonic() + self.max_delay
+            item = first
+            while True:
+                if item is self._STOP:
+                    stop = True
+                    break
+                if isinstance(item, Future):
+                    barriers.append(item)
+                    break  # flush() → commit now
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            self._commit(batch)
+            for b in barriers:
+                b.set_result(None)
+
+    def _commit(self, batch: list) -> None:
+        batch = [item for item in batch if item[2].set_running_or_notify_cancel()]  # cancelled → skipped
+        if not batch:
+            return
+        try:
+            result = _commit([(f, c) for f, c, _ in batch], self._temp_path, self.durability)
+        except Exception as exc:  # sync/dir fsync failure → whole batch failed
+            for _, _, fut in batch:
+                fut.set_exception(exc)
+            return
+        last = {final: i for i, (final, _, _) in enumerate(batch)}
+        for i, (final, _, fut) in enumerate(batch):
+            err = result.get(final)
+            if last[final] != i:
+                fut.set_result(None)  # superseded
+            elif err is None:
+                fut.set_result(final)
+            else:
+                fut.set_exception(err)
+
+
+#%% CELL 05 — PUBLISH FUNCTION FACTORY
+
+def _create_publish_functions(
+    path: Mapping,
+    batch_size: int,
+    max_delay: float,
+    durability: str,
+) -> dict[str, Callable]:
+    """
+    Create publish functions bound to PATH temp naming and controller defaults.
+
+    Returns:
+        Dictionary with 2 publish functions.
+    """
+    temp_path = path["temp_path"]
+    defaults = (batch_size, max_delay, durability)
+
+    def publish_batch(
+        items: Iterable[tuple[Path | str, Content]],
+        durability: str | None = None,
+    ) -> dict[Path, Exception | None]:
+        """
+        Publish outputs synchronously as one batch.
+
+        Args:
+            items: (final path, content) pairs.
+            durability: "batch" | "file" | "none" (default from controller).
+
+        Returns:
+            final → None (published) or the exception for that item.
+
+        Examples:
+            errs = publish_batch([(PATH["scored_path"](s), csv) for s, csv in done])
+            failed = [p for p, e in errs.items() if e is not None]
+        """
+        return _commit(list(items), temp_path, defaults[2] if durability is None else durability)
+
+    def open_publisher(
+        batch_size: int | None = None,
+        max_delay: float | None = None,
+        durability: str | None = None,
+    ) -> Publisher:
+        """
+        Start a background publisher.
+
+        Args:
+            batch_size: Items per commit (default from controller).
+            max_delay: Seconds to wait for a batch to fill.
+            durability: "batch" | "file" | "none".
+
+        Returns:
+            Publisher (use as context manager).
+        """
+        b, d, m = (
+            default if v is None else v
+            for default, v in zip(defaults, (batch_size, max_delay, durability))
+        )
+        return Publisher(temp_path=temp_path, batch_size=b, max_delay=d, durability=m)
+
+    return {
+        "publish_batch": publish_batch,
+        "open_publisher": open_publisher,
+    }
+
+
+#%% CELL 06 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    batch_size: int,
+    max_delay: float,
+    durability: str,
+) -> dict[str, Callable]:
+    """
+    Generate publish functions.
+
+    Args:
+        path: PATH mapping (temp_path naming).
+        batch_size: Default items per commit.
+        max_delay: Default seconds to wait for a batch to fill.
+        durability: Default durability mode.
+
+    Returns:
+        Dictionary with 2 publish functions.
+
+    Validation:
+        Asserts 2 functions returned and a known durability mode.
+    """
+    assert durability in DURABILITY_MODES, f"Unknown durability {durability!r} (expected {DURABILITY_MODES})"
+    assert batch_size > 0, f"batch_size must be positive, got {batch_size}"
+    functions = _create_publish_functions(path, batch_size, max_delay, durability)
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 publish functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 07 — EXPORTS
+
+__all__ = ["configure", "Publisher", "DURABILITY_MODES", "MANIFEST_PREFIX", "is_manifest", "read_manifest"]
@@ -0,0 +1,290 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+recovery.py — Orphaned Temp-File Recovery
+==========================================
+
+Find '.~tmp' files left by crashed writers and either finish their
+publish or delete them.
+
+Exports:
+    configure(path: Mapping, min_age: float, max_workers: int) → dict[str, callable]
+
+Recovery Functions (2 total):
+    - scan_temp_files(folders: Iterable[str] | None = None, min_age: float | None = None, path: Mapping | None = None) → list[dict]
+    - recover_temp_files(dry_run: bool = False, folders=None, min_age=None, max_workers=None, path=None) → dict
+
+Classification (one record per temp file):
+    skip      modified less than min_age seconds ago (writer may be alive)
+    delete    not recorded in a commit manifest (torn / unfinished write),
+              size differs from the manifest, or superseded (final is newer)
+    complete  recorded in a commit manifest with the same size, final
+              missing or older → rename into place
+
+Record Shape:
+    {"temp": Path, "final": Path, "action": "complete", "reason": "verified csv"}
+
+Commit Manifests:
+    Written by publish.py once a batch's temps are complete (and durable
+    before any rename). Content checks cannot tell a file cut at a row
+    boundary from a finished one, so only the writer's record completes a
+    temp. Manifests older than min_age whose temps are all gone are removed.
+
+Notes:
+    - Temps of writers that publish without manifests (staging write-back,
+      Error copies, report merges) are deleted, never completed: their
+      outputs are simply produced again
+    - One os.scandir per output folder (no recursive globbing)
+    - Classification and actions run on a thread pool (I/O-bound)
+    - Completed renames are followed by one fsync per touched folder
+    - dry_run=True reports the plan without touching files
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+from .publish import is_manifest, read_manifest
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for recovery.py.
+
+Why Empty?
+    Minimum age and concurrency come from storage.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — CLASSIFICATION
+
+# Folders written by the pipeline (publish targets)
+OUTPUT_FOLDERS: tuple[str, ...] = (
+    "pBehaviorClassification",
+    "pScored",
+    "pPose",
+    "pErrorTracked",
+    "pErrorPose",
+    "pFlagScored",
+    "pFlagPose",
+)
+
+def _classify(temp: Path, final: Path, now: float, min_age: float, committed: int | None) -> dict:
+    """Classify one temp file (see header); committed = manifest size or None."""
+    rec = {"temp": temp, "final": final, "action": "delete", "reason": ""}
+    try:
+        st = temp.stat()
+    except FileNotFoundError:
+        rec.update(action="skip", reason="vanished")
+        return rec
+    if now - st.st_mtime < min_age:
+        rec.update(action="skip", reason="recent (writer may be active)")
+        return rec
+    if committed is None:
+        rec["reason"] = "not in a commit manifest (unfinished write)"
+        return rec
+    if st.st_size != committed:
+        rec["reason"] = f"size {st.st_size} differs from committed {committed}"
+        return rec
+    try:
+        fst = final.stat()
+        if fst.st_mtime_ns >= st.st_mtime_ns:
+            rec["reason"] = "superseded by final"
+            return rec
+    except FileNotFoundError:
+        pass
+    rec.update(action="complete", reason="recorded in commit manifest")
+    return rec
+
+
+def _apply(rec: dict) -> None:
+    """Carry out one record's action."""
+    if rec["action"] == "complete":
+        os.replace(rec["temp"], rec["final"])
+    elif rec["action"] == "delete":
+        rec["temp"].unlink(missing_ok=True)
+
+
+def _fsync_dir(folder: Path) -> None:
+    if os.name == "nt":
+        return
+    fd = os.open(folder, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+#%% CELL 04 — RECOVERY FUNCTION FACTORY
+
+def _create_recovery_functions(
+    path: Mapping,
+    min_age: float,
+    max_workers: int,
+) -> dict[str, Callable]:
+    """
+    Create recovery functions bound to PATH and controller defaults.
+
+    Returns:
+        Dictionary with 2 recovery functions.
+    """
+    default_path = path
+    default_min_age = min_age
+    default_workers = max_workers
+
+    def _scan(folders: Iterable[str] | None, p: Mapping) -> tuple[list[Path], list[Path]]:
+        """(temps, manifests) of the output folders (one scandir each)."""
+        is_temp = p["is_temp_path"]
+        temps: list[Path] = []
+        manifests: list[Path] = []
+        for key in dict.fromkeys(OUTPUT_FOLDERS if folders is None else folders):
+            try:
+                with os.scandir(p[key]) as it:
+                    for e in it:
+                        if e.is_file() and is_temp(e.name):
+                            temps.append(Path(e.path))
+                        elif e.is_file() and is_manifest(e.name):
+                            manifests.append(Path(e.path))
+            except FileNotFoundError:
+                continue
+        return temps, manifests
+
+    def scan_temp_files(
+        folders: Iterable[str] | None = None,
+        min_age: float | None = None,
+        path: Mapping | None = None,
+        max_workers: int | None = None,
+    ) -> list[dict]:
+        """
+        Find and classify leftover temp files.
+
+        Args:
+            folders: PATH folder keys to scan (default OUTPUT_FOLDERS).
+            min_age: Seconds since last write before a temp is considered orphaned.
+            path: Optional PATH override.
+            max_workers: Classification threads.
+
+        Returns:
+            Records sorted by temp path (see header for shape).
+        """
+        p = default_path if path is None else path
+        final_of = p["final_from_temp"]
+        age = default_min_age if min_age is None else min_age
+        temps, manifests = _scan(folders, p)
+        committed: dict[Path, int] = {}
+        for m in manifests:
+            committed.update({m.parent / name: size for name, size in read_manifest(m).items()})
+
+        now = time.time()
+        workers = default_workers if max_workers is None else max_workers
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            records = list(pool.map(lambda t: _classify(t, final_of(t), now, age, committed.get(t)), sorted(temps)))
+        return records
+
+    def recover_temp_files(
+        dry_run: bool = False,
+        folders: Iterable[str] | None = None,
+        min_age: float | None = None,
+        max_workers: int | None = None,
+        path: Mapping | None = None,
+    ) -> dict:
+        """
+        Finish or delete orphaned temp files.
+
+        Args:
+            dry_run: Only report what would happen.
+            folders / min_age / max_workers / path: See scan_temp_files().
+
+        Returns:
+            {"completed": [final...], "deleted": [temp...], "skipped": [temp...],
+             "manifests": [removed manifest...], "errors": {temp: message},
+             "records": [...], "dry_run": bool}
+
+        Examples:
+            plan = BC_STORAGE["recover_temp_files"](dry_run=True)
+            for r in plan["records"]:
+                print(r["action"], r["temp"].name, r["reason"])
+        """
+        records = scan_temp_files(folders=folders, min_age=min_age, path=path, max_workers=max_workers)
+        result = {"completed": [], "deleted": [], "skipped": [], "manifests": [], "errors": {}, "records": records, "dry_run": dry_run}
+
+        todo = [r for r in records if r["action"] != "skip"]
+        result["skipped"] = [r["temp"] for r in records if r["action"] == "skip"]
+        if dry_run:
+            result["completed"] = [r["final"] for r in todo if r["action"] == "complete"]
+            result["deleted"] = [r["temp"] for r in todo if r["action"] == "delete"]
+            return result
+
+        def run(rec: dict) -> str | None:
+            try:
+                _apply(rec)
+                return None
+            except OSError as exc:
+                return f"{type(exc).__name__}: {exc}"
+
+        workers = default_workers if max_workers is None else max_workers
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            errors = list(pool.map(run, todo))
+
+        touched: set[Path] = set()
+        for rec, err in zip(todo, errors):
+            if err is not None:
+                result["errors"][rec["temp"]] = err
+            elif rec["action"] == "complete":
+                result["completed"].append(rec["final"])
+                touched.add(rec["final"].parent)
+            else:
+                result["deleted"].append(rec["temp"])
+        for folder in sorted(touched):
+            _fsync_dir(folder)
+
+        p = default_path if path is None else path
+        age = default_min_age if min_age is None else min_age
+        now = time.time()
+        for m in _scan(folders, p)[1]:
+            try:
+                if now - m.stat().st_mtime >= age and not any((m.parent / t).exists() for t in read_manifest(m)):
+                    m.unlink()
+                    result["manifests"].append(m)
+            except OSError:
+                continue
+        return result
+
+    return {
+        "scan_temp_files": scan_temp_files,
+        "recover_temp_files": recover_temp_files,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(path: Mapping, min_age: float, max_workers: int) -> dict[str, Callable]:
+    """
+    Generate recovery functions.
+
+    Args:
+        path: PATH mapping (folders + temp naming).
+        min_age: Default seconds before a temp counts as orphaned.
+        max_workers: Default thread count.
+
+    Returns:
+        Dictionary with 2 recovery functions.
+
+    Validation:
+        Asserts 2 functions returned.
+    """
+    functions = _create_recovery_functions(path, min_age, max_workers)
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 recovery functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "OUTPUT_FOLDERS"]
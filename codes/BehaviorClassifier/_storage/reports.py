@@ -0,0 +1,486 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+reports.py — Sharded REPORT_ERROR / REPORT_FLAG
+================================================
+
+Lock-free report writing for parallel workers: one shard file per worker,
+merged into the canonical report at the end of a run.
+
+Exports:
+    configure(path: Mapping, shard_dir: str) → dict[str, callable]
+
+Report Functions (3 total):
+    - open_report_shard(kind: str, worker: str | None = None, path: Mapping | None = None) → ReportShard
+    - merge_reports(kinds: Iterable[str] = ("error", "flag"), keep_shards: bool = False, path: Mapping | None = None) → dict[str, int]
+    - read_report(kind: str, stem: str | None = None, base: str | None = None, path: Mapping | None = None) → list[dict]
+
+Report Columns (REPORT_COLUMNS):
+    Base, Fly, Stem, Stage, Reason, Detail
+
+Layout:
+    Error/REPORT_ERROR.csv                      canonical (sorted by Base, Fly, Stem)
+    Error/.REPORT_ERROR.idx.json                Base → [start, end) byte range
+    Error/.shards/REPORT_ERROR.<worker>.csv     per-worker shards (until merge)
+    Error/.shards/REPORT_ERROR.<worker>.csv.merging   shard claimed by a merge
+    Error/.REPORT_ERROR.csv.lock                merge lock (O_EXCL)
+    Error/REPORT_ERROR.rejected.csv             malformed rows set aside by merges
+
+Notes:
+    - Shards are append-only and private to one worker (no shared lock)
+    - Merge = claim each shard (os.replace to '*.merging'), then canonical
+      rows + claimed shards → dedupe → sort → atomic replace (temp_path +
+      os.replace), then only the claimed files are removed; re-running is safe
+    - Handoff: writers append under flock and re-check the shard name
+      first; a merge flocks each claimed shard before reading it, so no row
+      lands in a claimed shard after it was read — the writer reopens a
+      fresh shard and the row waits for the next merge (without flock, a
+      claimed file that grew after the read is kept for the next merge)
+    - Merges of one report are serialised by an O_EXCL lock file, so several
+      machines finishing run_batch together never drop each other's rows
+    - Merges never drop rows: a canonical report or shard whose header is
+      not REPORT_COLUMNS is refused (ValueError, nothing rewritten), and
+      rows of the wrong width (e.g. a torn last row of a crashed worker)
+      are appended to the .rejected file before the report is replaced
+    - read_report seeks straight to one Base via the index; a missing or
+      stale index falls back to a streaming scan
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import csv
+import io
+import json
+import os
+import socket
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping
+
+try:
+    import fcntl  # POSIX advisory locks (shard writer ↔ merge handoff)
+except ImportError:  # Windows: merges keep shards that grew after the read instead
+    fcntl = None
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for reports.py.
+
+Why Empty?
+    Shard folder name comes from storage.py CELL 02 via configure().
+    Report columns are fixed by design (REPORT_COLUMNS).
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - layout passed via configure())
+
+#%% CELL 03 — REPORT SHARDS
+
+REPORT_COLUMNS: tuple[str, ...] = ("Base", "Fly", "Stem", "Stage", "Reason", "Detail")
+
+REPORT_KINDS: tuple[str, ...] = ("error", "flag")
+
+# Suffix of a shard claimed by a running merge
+MERGING_SUFFIX: str = ".merging"
+
+
+class ReportShard:
+    """
+    Per-worker report shard (append-only CSV).
+
+    Usage:
+        with BC_STORAGE["open_report_shard"]("error") as shard:
+            shard.add("BASE_fly1", stage="preflight", reason="missing columns", detail="Speed")
+    """
+
+    def __init__(self, file: Path, parse_base_fly: Callable[[str], tuple[str, int | None]]) -> None:
+        self.file = Path(file)
+        self._parse = parse_base_fly
+        self._fh = None
+        self._writer = None
+
+    def __enter__(self) -> "ReportShard":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _claimed(self) -> bool:
+        """True if a merge moved the open shard aside (the name is gone or another file)."""
+        try:
+            return os.stat(self.file).st_ino != os.fstat(self._fh.fileno()).st_ino
+        except FileNotFoundError:
+            return True
+
+    def add(self, stem: str, stage: str, reason: str, detail: str = "") -> None:
+        """Append one report row (flushed immediately; reopens a shard claimed by a merge)."""
+        base, fly = self._parse(stem)
+        while True:
+            if self._fh is None:
+                self.file.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = open(self.file, "a", encoding="utf-8", newline="")
+                self._writer = csv.writer(self._fh, lineterminator="\n")
+            with _locked(self._fh):
+                if not self._claimed():
+                    if self._fh.tell() == 0:
+                        self._writer.writerow(REPORT_COLUMNS)
+                    self._writer.writerow((base, "" if fly is None else fly, stem, stage, reason, detail))
+                    self._fh.flush()
+                    return
+            self.close()
+
+    def close(self) -> None:
+        """Close the shard (fsync)."""
+        if self._fh is not None:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+            self._fh.close()
+            self._fh = self._writer = None
+
+
+#%% CELL 04 — MERGE & INDEX HELPERS
+
+# Merge lock: a holder silent this long is presumed dead (seconds); poll interval while waiting
+_LOCK_STALE_SEC = 60.0
+_LOCK_POLL_SEC = 0.05
+
+
+@contextmanager
+def _locked(fh) -> Iterator[None]:
+    """Exclusive flock on an open file for the block (no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _read_rows(file: Path) -> tuple[list[tuple[str, ...]], list[list[str]]]:
+    """
+    Data rows of a report/shard file → (rows, malformed rows).
+
+    Notes:
+        Read under flock: a writer mid-row finishes first (see Handoff).
+
+    Raises:
+        ValueError: Header differs from REPORT_COLUMNS (foreign file layout).
+    """
+    if not file.exists():
+        return [], []
+    with open(file, "r", encoding="utf-8", newline="") as fh, _locked(fh):
+        rows = [r for r in csv.reader(fh) if r]
+    if rows and tuple(rows[0]) != REPORT_COLUMNS:
+        raise ValueError(
+            f"{file}: header {rows[0]} is not {list(REPORT_COLUMNS)}; refusing to merge "
+            f"(move the file aside or convert it first)"
+        )
+    good = [tuple(r) for r in rows[1:] if len(r) == len(REPORT_COLUMNS)]
+    bad = [r for r in rows[1:] if len(r) != len(REPORT_COLUMNS)]
+    return good, bad
+
+
+def _rejected_path(report: Path) -> Path:
+    return report.with_name(f"{report.stem}.rejected{report.suffix}")
+
+
+def _keep_rejected(report: Path, bad: list[list[str]]) -> None:
+    """Append malformed rows to the report's .rejected file (fsynced)."""
+    file = _rejected_path(report)
+    with open(file, "a", encoding="utf-8", newline="") as fh:
+        csv.writer(fh, lineterminator="\n").writerows(bad)
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+@contextmanager
+def _exclusive(lock: Path) -> Iterator[None]:
+    """Hold `lock` (O_CREAT | O_EXCL file) for the block; waits for other holders."""
+    while True:
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            break
+        except FileExistsError:
+            try:
+                age = time.time() - lock.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if age > _LOCK_STALE_SEC:
+                lock.unlink(missing_ok=True)
+            else:
+                time.sleep(_LOCK_POLL_SEC)
+    try:
+        yield
+    finally:
+        lock.unlink(missing_ok=True)
+
+
+def _claim(shards: list[Path]) -> list[Path]:
+    """Move shards aside for one merge (os.replace → '*.merging'); shards already gone are skipped."""
+    claimed = []
+    for shard in shards:
+        if shard.name.endswith(MERGING_SUFFIX):  # left by an interrupted merge
+            claimed.append(shard)
+            continue
+        target = shard.with_name(shard.name + MERGING_SUFFIX)
+        try:
+            os.replace(shard, target)
+        except FileNotFoundError:
+            continue
+        claimed.append(target)
+    return claimed
+
+
+def _sort_key(row: tuple[str, ...]) -> tuple:
+    base, fly, stem = row[0], row[1], row[2]
+    return (base, int(fly) if fly.lstrip("-").isdigit() else -1, stem, *row[3:])
+
+
+def _index_path(report: Path) -> Path:
+    return report.with_name(f".{report.stem}.idx.json")
+
+
+def _write_report(report: Path, rows: list[tuple[str, ...]], temp_path: Callable[[Path], Path]) -> None:
+    """Write sorted rows + Base byte-range index (both atomic)."""
+    buf = io.StringIO()
+    w = csv.writer(buf, lineterminator="\n")
+    w.writerow(REPORT_COLUMNS)
+    data = bytearray(buf.getvalue().encode("utf-8"))
+
+    ranges: dict[str, list[int]] = {}
+    for row in rows:
+        buf.seek(0)
+        buf.truncate()
+        w.writerow(row)
+        line = buf.getvalue().encode("utf-8")
+        r = ranges.setdefault(row[0], [len(data), len(data)])
+        data += line
+        r[1] = len(data)
+
+    report.parent.mkdir(parents=True, exist_ok=True)
+    tmp = temp_path(report)
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, report)
+
+    st = report.stat()
+    idx = _index_path(report)
+    tmp = temp_path(idx)
+    tmp.write_text(json.dumps({"size": st.st_size, "mtime_ns": st.st_mtime_ns, "bases": ranges}), encoding="utf-8")
+    os.replace(tmp, idx)
+
+
+def _load_index(report: Path) -> dict | None:
+    """Index if present and matching the report's size/mtime, else None."""
+    try:
+        idx = json.loads(_index_path(report).read_text(encoding="utf-8"))
+        st = report.stat()
+    except (OSError, ValueError):
+        return None
+    if idx.get("size") != st.st_size or idx.get("mtime_ns") != st.st_mtime_ns:
+        return None
+    return idx
+
+
+#%% CELL 05 — REPORT FUNCTION FACTORY
+
+def _create_report_functions(path: Mapping, shard_dir: str) -> dict[str, Callable]:
+    """
+    Create report functions bound to PATH and the shard folder name.
+
+    Returns:
+        Dictionary with 3 report functions.
+    """
+    default_path = path
+
+    def _report(p: Mapping, kind: str) -> Path:
+        if kind not in REPORT_KINDS:
+            raise ValueError(f"Unknown report kind {kind!r} (expected {REPORT_KINDS})")
+        return p["report_error_path"]() if kind == "error" else p["report_flag_path"]()
+
+    def _shards(report: Path) -> list[Path]:
+        """Shards of a report, including ones claimed by an interrupted merge."""
+        folder = report.parent / shard_dir
+        if not folder.is_dir():
+            return []
+        pattern = f"{report.stem}.*{report.suffix}"
+        return sorted([*folder.glob(pattern), *folder.glob(pattern + MERGING_SUFFIX)])
+
+    def open_report_shard(kind: str, worker: str | None = None, path: Mapping | None = None) -> ReportShard:
+        """
+        Open this worker's shard of a report.
+
+        Args:
+            kind: "error" or "flag".
+            worker: Shard id (default '<hostname>-<pid>'; unique per process).
+            path: Optional PATH override.
+
+        Returns:
+            ReportShard (use as context manager).
+        """
+        p = default_path if path is None else path
+        report = _report(p, kind)
+        worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+        file = report.parent / shard_dir / f"{report.stem}.{worker}{report.suffix}"
+        return ReportShard(file, p["parse_base_fly"])
+
+    def merge_reports(
+        kinds: Iterable[str] = REPORT_KINDS,
+        keep_shards: bool = False,
+        path: Mapping | None = None,
+    ) -> dict[str, int]:
+        """
+        Merge shards into the canonical reports (sorted, deduplicated).
+
+        Args:
+            kinds: Reports to merge.
+            keep_shards: Leave shard files in place after merging.
+            path: Optional PATH override.
+
+        Returns:
+            kind → row count of the merged report, plus "<kind>_rejected"
+            → malformed rows set aside (only when there were any).
+
+        Raises:
+            ValueError: The report or a shard has a foreign header (nothing
+                        is rewritten or removed).
+
+        Notes:
+            - Safe while workers still write (see header: claimed shards)
+            - run_batch merges its own shards when it ends
+            - Reports with no rows and no shards are left untouched
+        """
+        p = default_path if path is None else path
+        counts: dict[str, int] = {}
+        for kind in kinds:
+            report = _report(p, kind)
+            if not _shards(report) and not report.exists():
+                counts[kind] = 0
+                continue
+            report.parent.mkdir(parents=True, exist_ok=True)
+            with _exclusive(report.with_name(f".{report.name}.lock")):
+                shards = _shards(report)
+                if not keep_shards:
+                    shards = _claim(shards)
+                rows, bad = _read_rows(report)
+                rows = set(rows)
+                sizes: dict[Path, int] = {}
+                for shard in shards:
+                    try:
+                        sizes[shard] = shard.stat().st_size
+                    except FileNotFoundError:
+                        continue
+                    good, torn = _read_rows(shard)
+                    rows.update(good)
+                    bad.extend(torn)
+                ordered = sorted(rows, key=_sort_key)
+                if bad:
+                    _keep_rejected(report, bad)
+                _write_report(report, ordered, p["temp_path"])
+                if not keep_shards:
+                    for shard, size in sizes.items():
+                        try:
+                            grew = shard.stat().st_size > size  # a late row landed after the read
+                        except FileNotFoundError:
+                            continue
+                        if not grew:
+                            shard.unlink(missing_ok=True)
+            counts[kind] = len(ordered)
+            if bad:
+                counts[f"{kind}_rejected"] = len(bad)
+        return counts
+
+    def read_report(
+        kind: str,
+        stem: str | None = None,
+        base: str | None = None,
+        path: Mapping | None = None,
+    ) -> list[dict]:
+        """
+        Read report rows, optionally only for one stem or Base.
+
+        Args:
+            kind: "error" or "flag".
+            stem: Only rows of this stem (implies its Base).
+            base: Only rows of this Base.
+            path: Optional PATH override.
+
+        Returns:
+            Rows as dicts keyed by REPORT_COLUMNS (merged report only).
+
+        Examples:
+            read_report("error", base="20240101_Exp")
+            read_report("flag", stem="20240101_Exp_fly3")
+        """
+        p = default_path if path is None else path
+        report = _report(p, kind)
+        if stem is not None:
+            base = p["parse_base_fly"](stem)[0]
+        if not report.exists():
+            return []
+
+        idx = _load_index(report) if base is not None else None
+        if idx is not None:
+            span = idx["bases"].get(base)
+            if span is None:
+                return []
+            with open(report, "rb") as fh:
+                fh.seek(span[0])
+                text = fh.read(span[1] - span[0]).decode("utf-8")
+            rows = csv.reader(io.StringIO(text, newline=""))
+        else:
+            fh = open(report, "r", encoding="utf-8", newline="")
+            rows = csv.reader(fh)
+            next(rows, None)
+
+        try:
+            out = [
+                dict(zip(REPORT_COLUMNS, r))
+                for r in rows
+                if len(r) == len(REPORT_COLUMNS)
+                and (base is None or r[0] == base)
+                and (stem is None or r[2] == stem)
+            ]
+        finally:
+            if idx is None:
+                fh.close()
+        return out
+
+    return {
+        "open_report_shard": open_report_shard,
+        "merge_reports": merge_reports,
+        "read_report": read_report,
+    }
+
+
+#%% CELL 06 — CONFIGURE
+
+def configure(path: Mapping, shard_dir: str) -> dict[str, Callable]:
+    """
+    Generate report functions.
+
+    Args:
+        path: PATH mapping (report paths, parse_base_fly, temp naming).
+        shard_dir: Shard folder name next to each report.
+
+    Returns:
+        Dictionary with 3 report functions.
+
+    Validation:
+        Asserts 3 functions returned.
+    """
+    functions = _create_report_functions(path, shard_dir)
+
+    # Validation
+    assert len(functions) == 3, f"Expected 3 report functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 07 — EXPORTS
+
+__all__ = ["configure", "ReportShard", "REPORT_COLUMNS", "REPORT_KINDS"]
@@ -0,0 +1,565 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+staging.py — Local Staging Cache for Slow Experiment Roots
+===========================================================
+
+Opt-in local-disk cache in front of Drive/FUSE/network experiment roots.
+
+Exports:
+    configure(path: Mapping, cache_dir: Path, budget_bytes: int, max_workers: int, batch_size: int, slow_fs_types: tuple) → dict[str, callable]
+
+Staging Functions (2 total):
+    - is_slow_mount(target: Path | str) → bool
+    - open_staging(enabled: bool | None = None, path: Mapping | None = None, ...) → StagingCache
+
+StagingCache:
+    Inputs (read path):
+        - prefetch(sources) → copy ahead with bounded concurrency
+        - prefetch_stems(stems) → tracked + sleap + arena image of each stem
+        - local(source) → cached local Path, pinned (copies on miss, blocking)
+        - release(source) → unpin a path returned by local()
+        - reading(source) → context manager: local() on enter, release() on exit
+    Outputs (write path):
+        - output(final) → context manager yielding a local Path to write
+          instead of `final`; committed for write-back on a clean exit
+        - flush() → publish committed outputs to their final paths in one batch
+    Housekeeping:
+        - usage() → {"bytes", "entries", "budget", "pending_outputs"}
+        - close() → flush + stop copy threads
+
+Notes:
+    - Disabled cache is a pass-through (local(p) is p, output(p) yields p)
+    - Cache mirrors the experiment layout under one folder per experiment
+      root (<cache_dir>/<root name>-<hash of root>), so two roots with the
+      same relative paths never share entries
+    - Entries revalidate on size + mtime (copies carry the source mtime);
+      changed sources are re-copied
+    - Opening a cache adopts the inputs already on disk from earlier
+      sessions (LRU by access time) and evicts down to the budget
+    - Processes sharing a root share its inputs; partial copies and staged
+      outputs are named per process, so they never collide
+    - LRU eviction keeps cached inputs under the byte budget but never
+      removes a pinned entry: pins are counted per local() call and held
+      from before the copy starts until release(), so a path a reader holds
+      is never unlinked under it (pinned entries may exceed the budget)
+    - Only committed outputs are written back: a block that raises, or a
+      writer still inside its block, is never published. Each output()
+      gets its own local file, so concurrent writers never share one
+    - Write-back publishes via temp_path + os.replace (atomic per file)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import hashlib
+import os
+import shutil
+import itertools
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for staging.py.
+
+Why Empty?
+    Cache location, budget, concurrency and batch size come from
+    storage.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — MOUNT DETECTION
+
+# Colab mounts Google Drive here (FUSE)
+_COLAB_DRIVE = Path("/content/drive")
+
+
+def _mount_fstype(target: Path) -> str | None:
+    """
+    Filesystem type of the mount holding `target` (Linux /proc/mounts).
+
+    Returns:
+        fstype string, or None if unavailable (non-Linux, no match).
+    """
+    try:
+        with open("/proc/mounts", "r", encoding="utf-8") as fh:
+            mounts = [line.split()[1:3] for line in fh if line.strip()]
+    except OSError:
+        return None
+    best, fstype = "", None
+    s = str(target)
+    for mnt, fs in mounts:
+        mnt = mnt.replace("\\040", " ")
+        if (s == mnt or s.startswith(mnt.rstrip("/") + "/")) and len(mnt) > len(best):
+            best, fstype = mnt, fs
+    return fstype
+
+
+def _is_slow_mount(target: Path | str, slow_fs_types: tuple[str, ...]) -> bool:
+    """True if `target` is on the Colab Drive mount or a slow filesystem type."""
+    p = Path(target).resolve()
+    if p == _COLAB_DRIVE or _COLAB_DRIVE in p.parents:
+        return True
+    fstype = _mount_fstype(p)
+    return fstype is not None and fstype.startswith(slow_fs_types)
+
+
+#%% CELL 04 — STAGING CACHE
+
+# In-progress input copies: '<folder>/.~part-<pid>-<n>-<name>' (never adopted)
+_PARTIAL_PREFIX: str = ".~part-"
+
+
+def _root_key(root: Path) -> str:
+    """Cache subfolder of one experiment root ('<name>-<12 hex of its resolved path>')."""
+    resolved = str(Path(root).resolve())
+    return f"{Path(resolved).name or 'root'}-{hashlib.blake2b(resolved.encode('utf-8'), digest_size=6).hexdigest()}"
+
+
+class StagingCache:
+    """
+    Local staging cache for one experiment root.
+
+    Args:
+        remote_root: Experiment root on the slow mount (pExperimentalFolder).
+        cache_root: Local directory for staged copies (this root's own folder).
+        budget_bytes: Max bytes of cached inputs (LRU eviction above it).
+        max_workers: Concurrent copy threads.
+        batch_size: Committed outputs that trigger an automatic flush().
+        temp_path: PATH temp-name builder (for atomic write-back).
+        stem_sources: stem → input Paths to stage (for prefetch_stems).
+        enabled: False → pass-through (no copies, no threads).
+    """
+
+    def __init__(
+        self,
+        remote_root: Path,
+        cache_root: Path,
+        budget_bytes: int,
+        max_workers: int,
+        batch_size: int,
+        temp_path: Callable[[Path], Path],
+        stem_sources: Callable[[str], Iterable[Path]] | None = None,
+        enabled: bool = True,
+    ) -> None:
+        self.remote_root = Path(remote_root)
+        self.cache_root = Path(cache_root)
+        self.budget_bytes = int(budget_bytes)
+        self.batch_size = int(batch_size)
+        self.enabled = bool(enabled)
+        self._temp_path = temp_path
+        self._stem_sources = stem_sources
+        self._lock = threading.RLock()
+        self._lru: OrderedDict[Path, tuple[int, int, int]] = OrderedDict()  # local → (size, mtime_ns of source, bytes)
+        self._bytes = 0
+        self._inflight: dict[Path, Future] = {}
+        self._pins: Counter[Path] = Counter()  # local → readers holding it
+        self._pending: dict[Path, Path] = {}  # final → committed local
+        self._serial = itertools.count()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bc-stage") if enabled else None
+        if enabled:
+            self._adopt()
+
+    def __enter__(self) -> "StagingCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- Layout ---
+    def _local_for(self, source: Path, area: str) -> Path:
+        """Mirror `source` under cache_root/area (outside-root paths keep their absolute layout)."""
+        source = Path(source)
+        try:
+            rel = source.relative_to(self.remote_root)
+        except ValueError:
+            rel = Path(*source.resolve().parts[1:])
+        return self.cache_root / area / rel
+
+    # --- Inputs ---
+    def _adopt(self) -> None:
+        """Add inputs cached by earlier sessions to the LRU (oldest access first), then evict to budget."""
+        found = []
+        for folder, _, names in os.walk(self.cache_root / "in"):
+            for name in names:
+                if name.startswith(_PARTIAL_PREFIX):
+                    continue
+                local = Path(folder) / name
+                try:
+                    st = local.stat()
+                except FileNotFoundError:
+                    continue
+                found.append((st.st_atime_ns, local, st))
+        with self._lock:
+            for _, local, st in sorted(found, key=lambda t: t[0]):
+                if local not in self._lru:
+                    self._lru[local] = (st.st_size, st.st_mtime_ns, st.st_size)
+                    self._bytes += st.st_size
+            self._evict()
+
+    def _copy_in(self, source: Path, local: Path) -> Path:
+        """Copy one source into the cache (worker thread)."""
+        st = source.stat()
+        with self._lock:
+            entry = self._lru.get(local)
+            if entry is not None and entry[:2] == (st.st_size, st.st_mtime_ns) and local.exists():
+                self._lru.move_to_end(local)
+                return local
+        local.parent.mkdir(parents=True, exist_ok=True)
+        tmp = local.with_name(f"{_PARTIAL_PREFIX}{os.getpid()}-{next(self._serial)}-{local.name}")
+        try:
+            shutil.copyfile(source, tmp)
+            os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))  # revalidation key survives restarts
+            os.replace(tmp, local)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        with self._lock:
+            old = self._lru.pop(local, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._lru[local] = (st.st_size, st.st_mtime_ns, st.st_size)
+            self._bytes += st.st_size
+            self._evict(keep=local)
+        return local
+
+    def _evict(self, keep: Path | None = None) -> None:
+        """Drop least-recently-used unpinned inputs (never `keep`) until under budget (lock held)."""
+        for local in [k for k in self._lru if not self._pins[k] and k != keep]:
+            if self._bytes <= self.budget_bytes:
+                break
+            _, _, nbytes = self._lru.pop(local)
+            try:
+                local.unlink()
+            except FileNotFoundError:
+                pass
+            self._bytes -= nbytes
+
+    def _submit(self, source: Path) -> Future | None:
+        source = Path(source)
+        local = self._local_for(source, "in")
+        with self._lock:
+            fut = self._inflight.get(local)
+            if fut is not None and not fut.done():
+                return fut
+            fut = self._pool.submit(self._copy_in, source, local)
+            self._inflight[local] = fut
+        fut.add_done_callback(lambda f, k=local: self._forget(k, f))
+        return fut
+
+    def _forget(self, local: Path, fut: Future) -> None:
+        with self._lock:
+            if self._inflight.get(local) is fut:
+                del self._inflight[local]
+
+    def prefetch(self, sources: Iterable[Path | str], wait_all: bool = False) -> list[Future]:
+        """
+        Start copying `sources` into the cache (missing sources skipped).
+
+        Args:
+            sources: Remote paths to stage.
+            wait_all: Block until all copies finish.
+
+        Returns:
+            Futures resolving to local Paths (empty when disabled).
+        """
+        if not self.enabled:
+            return []
+        futures = [f for f in (self._submit(s) for s in sources if Path(s).exists()) if f]
+        if wait_all:
+            wait(futures)
+        return futures
+
+    def prefetch_stems(self, stems: Iterable[str], wait_all: bool = False) -> list[Future]:
+        """Prefetch the inputs of each stem (tracked, sleap, arena image)."""
+        if self._stem_sources is None:
+            return []
+        return self.prefetch((src for s in stems for src in self._stem_sources(s)), wait_all=wait_all)
+
+    def local(self, source: Path | str) -> Path:
+        """
+        Local path for reading `source` (copies on miss; blocks until ready).
+
+        The entry is pinned (never evicted) until release(source); prefer
+        reading(source), which releases on exit.
+
+        Returns:
+            Cached Path, or `source` itself when disabled.
+        """
+        source = Path(source)
+        if not self.enabled:
+            return source
+        local = self._local_for(source, "in")
+        with self._lock:
+            self._pins[local] += 1
+        try:
+            return self._submit(source).result()
+        except BaseException:
+            self.release(source)
+            raise
+
+    def release(self, source: Path | str) -> None:
+        """Unpin one local(source) call; the entry becomes evictable again."""
+        if not self.enabled:
+            return
+        local = self._local_for(Path(source), "in")
+        with self._lock:
+            if self._pins[local] <= 1:
+                self._pins.pop(local, None)
+                self._evict()
+            else:
+                self._pins[local] -= 1
+
+    @contextmanager
+    def reading(self, source: Path | str) -> Iterator[Path]:
+        """
+        Pinned local path for the duration of a with-block.
+
+        Examples:
+            with stage.reading(PATH["tracked_path"](stem)) as p:
+                df = pd.read_csv(p)
+        """
+        local = self.local(source)
+        try:
+            yield local
+        finally:
+            self.release(source)
+
+    # --- Outputs ---
+    @contextmanager
+    def output(self, final: Path | str) -> Iterator[Path]:
+        """
+        Local path to write an output destined for `final`.
+
+        Notes:
+            - Committed for the next flush() when the block exits cleanly;
+              auto-flushes above batch_size committed outputs
+            - A block that raises discards its local file (nothing published)
+            - A later commit for the same `final` replaces an unflushed one
+            - Disabled cache yields `final` (write directly)
+
+        Raises:
+            FileNotFoundError: The block exited without writing the file.
+
+        Examples:
+            with stage.output(PATH["scored_path"](stem)) as p:
+                df.to_csv(p, index=False)
+        """
+        final = Path(final)
+        if not self.enabled:
+            yield final
+            return
+        base = self._local_for(final, "out")
+        local = base.with_name(f"{os.getpid()}-{next(self._serial)}-{base.name}")
+        local.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            yield local
+        except BaseException:
+            local.unlink(missing_ok=True)
+            raise
+        if not local.exists():
+            raise FileNotFoundError(f"Staged output for {final} was not written: {local}")
+        with self._lock:
+            old = self._pending.pop(final, None)
+            self._pending[final] = local
+            due = len(self._pending) > self.batch_size
+        if old is not None:
+            old.unlink(missing_ok=True)
+        if due:
+            self.flush()
+
+    def _copy_out(self, local: Path, final: Path) -> Path:
+        """Publish one staged output atomically (temp copy + replace)."""
+        final.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._temp_path(final)
+        shutil.copyfile(local, tmp)
+        os.replace(tmp, final)
+        local.unlink()
+        return final
+
+    def flush(self) -> list[Path]:
+        """
+        Write back all committed outputs (one concurrent batch).
+
+        Returns:
+            Final paths published.
+
+        Raises:
+            Exception: First write-back failure (failed items stay pending).
+        """
+        if not self.enabled:
+            return []
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        futures = {self._pool.submit(self._copy_out, l, f): (f, l) for f, l in batch.items()}
+        done: list[Path] = []
+        error: BaseException | None = None
+        for fut, (f, l) in futures.items():
+            try:
+                done.append(fut.result())
+            except BaseException as exc:  # keep for retry, surface first error
+                with self._lock:
+                    kept = self._pending.setdefault(f, l)
+                if kept is not l:  # superseded by a newer commit meanwhile
+                    l.unlink(missing_ok=True)
+                error = error or exc
+        if error is not None:
+            raise error
+        return sorted(done)
+
+    # --- Housekeeping ---
+    def usage(self) -> dict[str, int]:
+        """Current cache usage."""
+        with self._lock:
+            return {
+                "bytes": self._bytes,
+                "entries": len(self._lru),
+                "budget": self.budget_bytes,
+                "pending_outputs": len(self._pending),
+            }
+
+    def close(self) -> None:
+        """Flush pending outputs and stop copy threads."""
+        if self._pool is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            self.enabled = False
+
+
+#%% CELL 05 — STAGING FUNCTION FACTORY
+
+def _create_staging_functions(
+    path: Mapping,
+    cache_dir: Path,
+    budget_bytes: int,
+    max_workers: int,
+    batch_size: int,
+    slow_fs_types: tuple[str, ...],
+) -> dict[str, Callable]:
+    """
+    Create staging functions bound to controller defaults.
+
+    Returns:
+        Dictionary with 2 staging functions.
+    """
+    default_path = path
+    default_cache_dir = cache_dir
+    defaults = (budget_bytes, max_workers, batch_size)
+
+    def is_slow_mount(target: Path | str) -> bool:
+        """
+        Whether `target` sits on Colab Drive or a slow (FUSE/network) mount.
+
+        Args:
+            target: Any path (typically detect_experiment_root()).
+
+        Returns:
+            True for /content/drive/... or fstype in the slow list.
+        """
+        return _is_slow_mount(target, slow_fs_types)
+
+    def open_staging(
+        enabled: bool | None = None,
+        path: Mapping | None = None,
+        cache_dir: Path | str | None = None,
+        budget_bytes: int | None = None,
+        max_workers: int | None = None,
+        batch_size: int | None = None,
+    ) -> StagingCache:
+        """
+        Open a staging cache for the experiment root.
+
+        Args:
+            enabled: True/False to force; None → enable only on slow mounts.
+            path: Optional PATH override (e.g., configure(root=...)).
+            cache_dir: Local cache directory (default from controller); the
+                       cache uses its <root name>-<hash> subfolder.
+            budget_bytes / max_workers / batch_size: Overrides of defaults.
+
+        Returns:
+            StagingCache (pass-through when disabled).
+
+        Examples:
+            with BC_STORAGE["open_staging"]() as stage:
+                stage.prefetch_stems(stems)
+                with stage.reading(PATH["tracked_path"](stem)) as p:
+                    df = pd.read_csv(p)
+                with stage.output(PATH["scored_path"](stem)) as p:
+                    df.to_csv(p, index=False)
+        """
+        p = default_path if path is None else path
+        root = p["pExperimentalFolder"]
+        builders = (p["tracked_path"], p["sleap_path"], p["arenaimg_path"])
+        if enabled is None:
+            enabled = is_slow_mount(root)
+        b, w, n = (
+            d if v is None else v
+            for d, v in zip(defaults, (budget_bytes, max_workers, batch_size))
+        )
+        return StagingCache(
+            remote_root=root,
+            cache_root=Path(cache_dir or default_cache_dir) / _root_key(root),
+            budget_bytes=b,
+            max_workers=w,
+            batch_size=n,
+            temp_path=p["temp_path"],
+            stem_sources=lambda stem: [build(stem) for build in builders],
+            enabled=enabled,
+        )
+
+    return {
+        "is_slow_mount": is_slow_mount,
+        "open_staging": open_staging,
+    }
+
+
+#%% CELL 06 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    cache_dir: Path,
+    budget_bytes: int,
+    max_workers: int,
+    batch_size: int,
+    slow_fs_types: tuple[str, ...],
+) -> dict[str, Callable]:
+    """
+    Generate staging functions.
+
+    Args:
+        path: PATH mapping (from Config.path).
+        cache_dir: Default local cache directory.
+        budget_bytes: Default byte budget for cached inputs.
+        max_workers: Default concurrent copy threads.
+        batch_size: Default committed-output count that triggers a flush.
+        slow_fs_types: fstype prefixes treated as slow mounts.
+
+    Returns:
+        Dictionary with 2 staging functions.
+
+    Validation:
+        Asserts 2 functions returned and positive limits.
+    """
+    assert budget_bytes > 0 and max_workers > 0 and batch_size > 0, (
+        f"Staging limits must be positive: budget={budget_bytes}, workers={max_workers}, batch={batch_size}"
+    )
+    functions = _create_staging_functions(path, cache_dir, budget_bytes, max_workers, batch_size, slow_fs_types)
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 staging functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 07 — EXPORTS
+
+__all__ = ["configure", "StagingCache"]
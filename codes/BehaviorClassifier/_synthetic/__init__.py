@@ -0,0 +1,172 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+_synthetic/__init__.py — Synthetic Data Coordinator
+====================================================
+
+Orchestrates synthetic data workers and assembles the BC_SYNTHETIC bundle.
+
+Architecture:
+    5 workers → coordinator → controller → BC_SYNTHETIC export
+
+Workers (5):
+    1. schedule.py: 2 schedule functions (stimulus_trains, gpio_word)
+    2. behavior.py: 2 behavior functions (behavior_labels, trajectory)
+    3. tables.py: 6 table functions (base_table, tracked_table,
+       sleap_table, stream_recording, recording, spec_violations)
+    4. faults.py: 1 fault function (inject_faults)
+    5. tree.py: 1 tree function (write_experiment)
+
+Total Exports: 12 (validated)
+
+Design:
+    - Coordinator receives PARAM, PATH, BC_UTILS + generator defaults from controller
+    - Calls workers in dependency order
+    - Assembles single immutable bundle
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Mapping
+
+from . import behavior, faults, schedule, tables, tree
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for _synthetic coordinator.
+
+Why Empty?
+    Coordinator orchestrates workers (no direct configuration).
+    Schedules, bout statistics and layout come from synthetic.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - pure orchestration)
+
+#%% CELL 03 — CONFIGURE
+
+def configure(
+    param: Mapping,
+    path: Mapping,
+    utils: Mapping,
+    fps: float,
+    arena_mm: tuple[float, float],
+    stimulus_schedule: Mapping[str, tuple[float, float, float]],
+    bout_mean_sec: Mapping[str, float],
+    bout_weights: Mapping[str, float],
+    speed_range: Mapping[str, tuple[float, float]],
+    responses: Mapping[str, tuple[float, float, float]],
+    turn_sd: float,
+    pixels_per_mm_s: float,
+    frame_id_start_max: int,
+    body_length_mm: float,
+    body_offsets: Mapping[str, tuple[float, float]],
+    position_noise_mm: float,
+    confidence_beta: tuple[float, float],
+    protected_columns: tuple[str, ...],
+    recording_sec: float,
+    base_prefix: str,
+    float_format: str | None,
+) -> MappingProxyType:
+    """
+    Configure and return the immutable BC_SYNTHETIC bundle.
+
+    Args:
+        param: PARAM registry (from Config.param).
+        path: PATH bundle (default experiment root for write_experiment).
+        utils: BC_UTILS bundle (column selection, dtypes).
+        fps: Frames per second.
+        arena_mm: Arena (width, height) in mm.
+        stimulus_schedule: channel → (first_onset_sec, period_sec, on_sec).
+        bout_mean_sec / bout_weights: Bout statistics per label.
+        speed_range: Label → (min, max) speed (mm/s).
+        responses: Label → (probability, pre_sec, post_sec) per onset.
+        turn_sd: Heading random-walk step (rad / frame).
+        pixels_per_mm_s: PixelChange per mm/s of speed.
+        frame_id_start_max: First BASE FrameID drawn below this.
+        body_length_mm / body_offsets: Sleap keypoint layout.
+        position_noise_mm: Keypoint noise (SD, mm).
+        confidence_beta: Beta(a, b) of sleap confidences.
+        protected_columns: Timebase columns faults never corrupt.
+        recording_sec: Default recording length (seconds).
+        base_prefix: BASE name prefix.
+        float_format: CSV float format of written tables.
+
+    Returns:
+        MappingProxyType with 12 synthetic data exports.
+
+    Orchestration Order (respects dependencies):
+        1. schedule → stimulus trains (needs PARAM stimuli)
+        2. behavior → truth codes + trajectories (needs PARAM Layer1)
+        3. tables → PARAM-typed tables (needs BC_UTILS + schedule + behavior)
+        4. faults → fault injection (needs PARAM domains)
+        5. tree → experiment tree (needs PATH + tables + faults)
+    """
+    schedule_data = schedule.configure(
+        param=param,
+        fps=fps,
+        schedule=stimulus_schedule,
+    )
+
+    behavior_data = behavior.configure(
+        param=param,
+        fps=fps,
+        arena_mm=arena_mm,
+        bout_mean_sec=bout_mean_sec,
+        bout_weights=bout_weights,
+        speed_range=speed_range,
+        responses=responses,
+        turn_sd=turn_sd,
+        pixels_per_mm_s=pixels_per_mm_s,
+    )
+
+    tables_data = tables.configure(
+        param=param,
+        utils=utils,
+        schedule=schedule_data,
+        behavior=behavior_data,
+        fps=fps,
+        arena_mm=arena_mm,
+        frame_id_start_max=frame_id_start_max,
+        body_length_mm=body_length_mm,
+        body_offsets=body_offsets,
+        position_noise_mm=position_noise_mm,
+        confidence_beta=confidence_beta,
+    )
+
+    faults_data = faults.configure(
+        param=param,
+        protected=protected_columns,
+    )
+
+    tree_data = tree.configure(
+        path=path,
+        tables=tables_data,
+        faults=faults_data,
+        fps=fps,
+        recording_sec=recording_sec,
+        base_prefix=base_prefix,
+        float_format=float_format,
+    )
+
+    bundle = {
+        **schedule_data,
+        **behavior_data,
+        **tables_data,
+        **faults_data,
+        **tree_data,
+    }
+
+    # Validation: 2 schedule + 2 behavior + 6 tables + 1 faults + 1 tree = 12
+    expected_count = 12
+    assert len(bundle) == expected_count, (
+        f"BC_SYNTHETIC export count mismatch: expected {expected_count}, got {len(bundle)}. "
+        f"Keys: {sorted(bundle)}"
+    )
+
+    return MappingProxyType(bundle)
+
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,254 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+behavior.py — Synthetic Behavior Bouts & Trajectories
+=====================================================
+
+Ground-truth behavior sequences (Layer1 codes) from bout statistics,
+stimulus responses on top, and a centroid trajectory / pixel-change
+trace that the classifier maps back to the same labels.
+
+Exports:
+    configure(param: Mapping, fps: float, arena_mm: tuple[float, float], bout_mean_sec: Mapping[str, float], bout_weights: Mapping[str, float], speed_range: Mapping[str, tuple[float, float]], responses: Mapping[str, tuple[float, float, float]], turn_sd: float, pixels_per_mm_s: float) → dict[str, callable]
+
+Behavior Functions (2 total):
+    - behavior_labels(n, onsets=None, seed=None, bout_mean_sec=None, bout_weights=None, responses=None) → int16[n]
+    - trajectory(codes, seed=None, speed_range=None) → {NormalizedCentroidX, NormalizedCentroidY, PixelChange, Speed, Heading}
+
+Generation Rules:
+    Bouts      label ~ bout_weights, length ~ 1 + Exponential(bout_mean_sec)
+               (consecutive bouts may draw the same label; lengths add)
+    Responses  per onset, at most one: label with probability p over
+               [onset - pre_sec, onset + post_sec] (label → (p, pre, post))
+    Speed      Uniform(speed_range[label]) mm/s per frame
+    Heading    random walk (turn_sd rad / frame)
+    Position   integrated in mm, reflected at the arena walls, / arena → [0, 1]
+    Pixels     0 when Speed is 0, else 1 + Poisson(pixels_per_mm_s × Speed)
+
+Notes:
+    - Codes follow the BC_UTILS Bouts convention (Layer1 domain index);
+      labels are addressed by suffix (Jump, Walk, Stationary, Freeze)
+    - Default speed ranges sit clear of the classifier thresholds, so
+      Layer1 of the generated table reproduces the truth except at
+      wall reflections and the first frame (Speed NaN)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Mapping
+
+import numpy as np
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for behavior.py.
+
+Why Empty?
+    Bout statistics, speeds and responses come from synthetic.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — GENERATION KERNELS
+
+def _suffix(label: str) -> str:
+    return label.split("_", 1)[1] if "_" in label else label
+
+
+def _bouts(n: int, means: np.ndarray, weights: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """int16[n] codes from i.i.d. bouts (drawn in blocks until n frames)."""
+    expected = float(weights @ means) + 1.0
+    parts, total = [], 0
+    while total < n:
+        k = int((n - total) / expected * 1.1) + 16
+        labels = rng.choice(len(weights), size=k, p=weights)
+        lengths = 1 + np.round(rng.exponential(means[labels])).astype(np.int64)
+        parts.append(np.repeat(labels.astype(np.int16), lengths))
+        total += int(lengths.sum())
+    return np.concatenate(parts)[:n]
+
+
+def _respond(codes: np.ndarray, onsets: np.ndarray, table: list[tuple[int, float, int, int]],
+             rng: np.random.Generator) -> None:
+    """Overwrite response windows in place (one response per onset at most)."""
+    if not len(onsets) or not table:
+        return
+    n = len(codes)
+    draw = rng.random(len(onsets))
+    edge = 0.0
+    for code, p, pre, post in table:
+        hit = onsets[(draw >= edge) & (draw < edge + p)]
+        edge += p
+        for onset in hit:
+            codes[max(onset - pre, 0):min(onset + post + 1, n)] = code
+
+
+def _fold(x: np.ndarray, width: float) -> np.ndarray:
+    """Reflect positions into [0, width] (triangle wave)."""
+    x = np.mod(x, 2 * width)
+    return np.where(x > width, 2 * width - x, x)
+
+
+#%% CELL 04 — BEHAVIOR FUNCTION FACTORY
+
+def _create_behavior_functions(
+    param: Mapping,
+    fps: float,
+    arena_mm: tuple[float, float],
+    bout_mean_sec: Mapping[str, float],
+    bout_weights: Mapping[str, float],
+    speed_range: Mapping[str, tuple[float, float]],
+    responses: Mapping[str, tuple[float, float, float]],
+    turn_sd: float,
+    pixels_per_mm_s: float,
+) -> dict[str, Callable]:
+    """
+    Create bout / trajectory generators bound to the Layer1 domain.
+
+    Returns:
+        Dictionary with 2 behavior functions.
+    """
+    labels = [_suffix(x) for x in param["Layer1"]["domain"]]
+    width, height = float(arena_mm[0]), float(arena_mm[1])
+
+    def _per_label(values: Mapping[str, float]) -> np.ndarray:
+        return np.array([float(values.get(s, 0.0)) for s in labels], dtype=np.float64)
+
+    def _responses(values: Mapping[str, tuple[float, float, float]]) -> list[tuple[int, float, int, int]]:
+        return [(labels.index(s), p, int(round(pre * fps)), int(round(post * fps))) for s, (p, pre, post) in values.items()]
+
+    default_means = _per_label(bout_mean_sec) * fps
+    default_weights = _per_label(bout_weights)
+    default_responses = _responses(responses)
+    default_ranges = np.array([speed_range[s] for s in labels], dtype=np.float64)
+
+    def behavior_labels(
+        n: int,
+        onsets: np.ndarray | None = None,
+        seed: int | np.random.Generator | None = None,
+        bout_mean_sec: Mapping[str, float] | None = None,
+        bout_weights: Mapping[str, float] | None = None,
+        responses: Mapping[str, tuple[float, float, float]] | None = None,
+    ) -> np.ndarray:
+        """
+        Ground-truth behavior codes (see Generation Rules).
+
+        Args:
+            n: Frame count.
+            onsets: Stimulus onset frames (any channel); None → no responses.
+            seed: Seed or Generator.
+            bout_mean_sec / bout_weights / responses: Overrides keyed by label
+                suffix (default: BOUT_MEAN_SEC / BOUT_WEIGHTS / RESPONSES).
+
+        Returns:
+            int16[n] Layer1 codes.
+
+        Examples:
+            truth = behavior_labels(36_000, onsets, seed=1, responses={"Freeze": (1.0, 1.5, 2.5)})
+        """
+        rng = np.random.default_rng(seed)
+        means = default_means if bout_mean_sec is None else _per_label(bout_mean_sec) * fps
+        weights = default_weights if bout_weights is None else _per_label(bout_weights)
+        codes = _bouts(n, means, weights / weights.sum(), rng) if n else np.empty(0, dtype=np.int16)
+        if onsets is not None:
+            table = default_responses if responses is None else _responses(responses)
+            _respond(codes, np.sort(np.asarray(onsets, dtype=np.int64)), table, rng)
+        return codes
+
+    def trajectory(
+        codes: np.ndarray,
+        seed: int | np.random.Generator | None = None,
+        speed_range: Mapping[str, tuple[float, float]] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Centroid track and pixel change that reproduce `codes` under Layer1.
+
+        Args:
+            codes: int16[n] Layer1 codes (from behavior_labels).
+            seed: Seed or Generator.
+            speed_range: label suffix → (min, max) mm/s (default: SPEED_RANGE_MM_S).
+
+        Returns:
+            NormalizedCentroidX / NormalizedCentroidY (float64, [0, 1]),
+            PixelChange (int64), Speed (mm/s truth) and Heading (rad).
+
+        Examples:
+            track = trajectory(truth, seed=1)
+        """
+        rng = np.random.default_rng(seed)
+        codes = np.asarray(codes, dtype=np.int64)
+        ranges = default_ranges if speed_range is None else np.array([speed_range[s] for s in labels], dtype=np.float64)
+        lo, hi = ranges[codes, 0], ranges[codes, 1]
+        speed = lo + (hi - lo) * rng.random(len(codes))
+        heading = np.cumsum(rng.normal(0.0, turn_sd, size=len(codes)))
+        step = speed / fps
+        x = _fold(rng.uniform(0, width) + np.cumsum(step * np.cos(heading)), width)
+        y = _fold(rng.uniform(0, height) + np.cumsum(step * np.sin(heading)), height)
+        pixels = np.where(speed > 0, 1 + rng.poisson(pixels_per_mm_s * speed), 0).astype(np.int64)
+        return {
+            "NormalizedCentroidX": x / width,
+            "NormalizedCentroidY": y / height,
+            "PixelChange": pixels,
+            "Speed": speed,
+            "Heading": np.mod(heading, 2 * np.pi),
+        }
+
+    return {
+        "behavior_labels": behavior_labels,
+        "trajectory": trajectory,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    param: Mapping,
+    fps: float,
+    arena_mm: tuple[float, float],
+    bout_mean_sec: Mapping[str, float],
+    bout_weights: Mapping[str, float],
+    speed_range: Mapping[str, tuple[float, float]],
+    responses: Mapping[str, tuple[float, float, float]],
+    turn_sd: float,
+    pixels_per_mm_s: float,
+) -> dict[str, Callable]:
+    """
+    Generate behavior functions.
+
+    Args:
+        param: PARAM registry (Layer1 domain).
+        fps: Frames per second.
+        arena_mm: Arena (width, height) in mm.
+        bout_mean_sec: Label → mean bout length (seconds).
+        bout_weights: Label → bout draw weight.
+        speed_range: Label → (min, max) speed (mm/s).
+        responses: Label → (probability, pre_sec, post_sec) per stimulus onset.
+        turn_sd: Heading random-walk step (rad / frame).
+        pixels_per_mm_s: PixelChange per mm/s of speed.
+
+    Returns:
+        Dictionary with 2 behavior functions.
+
+    Validation:
+        Asserts 2 functions returned, every Layer1 label with a speed range,
+        known labels in the statistics and response probabilities ≤ 1.
+    """
+    labels = {_suffix(x) for x in param["Layer1"]["domain"]}
+    assert labels <= set(speed_range), f"speed_range lacks Layer1 labels: {sorted(labels - set(speed_range))}"
+    for name, table in (("bout_mean_sec", bout_mean_sec), ("bout_weights", bout_weights), ("responses", responses)):
+        assert set(table) <= labels, f"{name} has unknown labels: {sorted(set(table) - labels)}"
+    assert sum(bout_weights.values()) > 0, f"bout_weights must not all be 0: {dict(bout_weights)}"
+    assert sum(p for p, _, _ in responses.values()) <= 1.0, f"Response probabilities exceed 1: {dict(responses)}"
+    functions = _create_behavior_functions(
+        param, fps, arena_mm, bout_mean_sec, bout_weights, speed_range, responses, turn_sd, pixels_per_mm_s,
+    )
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 behavior functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,168 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+faults.py — Fault Injection for Synthetic Tables
+================================================
+
+Corrupts a generated table the ways real recordings break, so loaders,
+QC and the classifier can be stress-tested on known defects.
+
+Exports:
+    configure(param: Mapping, protected: tuple[str, ...]) → dict[str, callable]
+
+Fault Functions (1 total):
+    - inject_faults(df, seed=None, nan_runs=0, nan_run_frames=60, out_of_range=0.0, stim_glitches=0, drop_frames=0.0, drop_columns=()) → DataFrame
+
+Faults (applied in this order, each optional):
+    nan_runs        runs of NaN (1..nan_run_frames frames) in random
+                    unprotected columns (int columns become float, as in CSV)
+    out_of_range    this fraction of rows per domain column gets a value
+                    outside the ParamSpec domain ([lo, hi] → beyond an
+                    edge; list → max + 1 or 'Unknown')
+    stim_glitches   single-frame flips in 'stimuli' channels (the spikes
+                    and dropouts BC_UTILS clean_stimuli removes)
+    drop_frames     this fraction of rows deleted (FrameIndex gaps)
+    drop_columns    columns removed
+
+Notes:
+    - Protected columns (timebase: FrameIndex, FrameID, Timestamp) only
+      lose rows, never values
+    - Columns without a domain get no out-of-range values
+    - Returns a new table; the input is not modified
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for faults.py.
+
+Why Empty?
+    Protected columns come from synthetic.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - protected columns passed via configure())
+
+#%% CELL 03 — FAULT KERNELS
+
+def _bad_values(spec: Mapping, k: int, rng: np.random.Generator):
+    """k values outside the spec's domain (None when unbounded)."""
+    dom = spec.get("domain")
+    if dom is None:
+        return None
+    if spec.get("type") == "float" and len(dom) == 2:
+        lo, hi = float(dom[0]), float(dom[1])
+        span = (hi - lo) or 1.0
+        over = rng.uniform(0.01, 1.0, size=k) * span
+        return np.where(rng.random(k) < 0.5, lo - over, hi + over)
+    if spec.get("type") == "string":
+        return np.full(k, "Unknown", dtype=object)
+    return np.full(k, max(dom) + 1)
+
+
+#%% CELL 04 — FAULT FUNCTION FACTORY
+
+def _create_fault_functions(param: Mapping, protected: tuple[str, ...]) -> dict[str, Callable]:
+    """
+    Create the fault injector bound to PARAM domains.
+
+    Returns:
+        Dictionary with 1 fault function.
+    """
+    stimuli = {name for name, spec in param.items() if "stimuli" in spec.get("tags", [])}
+
+    def inject_faults(
+        df: pd.DataFrame,
+        seed: int | np.random.Generator | None = None,
+        nan_runs: int = 0,
+        nan_run_frames: int = 60,
+        out_of_range: float = 0.0,
+        stim_glitches: int = 0,
+        drop_frames: float = 0.0,
+        drop_columns: Iterable[str] = (),
+    ) -> pd.DataFrame:
+        """
+        Copy of df with the requested faults (see Faults).
+
+        Args:
+            df: Generated table (tracked / sleap / BASE).
+            seed: Seed or Generator.
+            nan_runs / nan_run_frames: NaN run count / longest run (frames).
+            out_of_range: Fraction of rows per domain column made illegal.
+            stim_glitches: Single-frame flips per stimulus channel.
+            drop_frames: Fraction of rows deleted.
+            drop_columns: Columns removed.
+
+        Returns:
+            Faulty DataFrame (index reset).
+
+        Examples:
+            bad = inject_faults(tracked, seed=3, nan_runs=5, drop_columns=["PixelChange"])
+        """
+        rng = np.random.default_rng(seed)
+        out = df.copy()
+        n = len(out)
+        free = [c for c in out.columns if c not in protected]
+        if nan_runs and n and free:
+            out[free] = out[free].astype({c: np.float64 for c in free if out[c].dtype.kind in "iub"})
+            for _ in range(nan_runs):
+                c = free[rng.integers(len(free))]
+                start = int(rng.integers(n))
+                out.iloc[start:start + int(rng.integers(1, nan_run_frames + 1)), out.columns.get_loc(c)] = np.nan
+        if out_of_range > 0 and n:
+            k = max(1, int(round(out_of_range * n)))
+            for c in free:
+                bad = _bad_values(param.get(c, {}), k, rng)
+                if bad is not None:
+                    if bad.dtype.kind == "O" or out[c].dtype.kind not in "iuf":
+                        out[c] = out[c].astype(object)
+                    out.iloc[rng.choice(n, size=min(k, n), replace=False), out.columns.get_loc(c)] = bad[:n]
+        if stim_glitches and n:
+            for c in sorted(stimuli & set(free)):
+                rows = rng.choice(n, size=min(stim_glitches, n), replace=False)
+                col = out[c].to_numpy(copy=True)
+                col[rows] = 1 - col[rows]
+                out[c] = col
+        if drop_frames > 0 and n:
+            out = out.iloc[np.sort(rng.choice(n, size=n - int(round(drop_frames * n)), replace=False))]
+        drop = [c for c in drop_columns if c in out.columns]
+        return out.drop(columns=drop).reset_index(drop=True)
+
+    return {
+        "inject_faults": inject_faults,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(param: Mapping, protected: tuple[str, ...]) -> dict[str, Callable]:
+    """
+    Generate fault functions.
+
+    Args:
+        param: PARAM registry (domains, stimulus channels).
+        protected: Columns whose values are never corrupted.
+
+    Returns:
+        Dictionary with 1 fault function.
+
+    Validation:
+        Asserts 1 function returned and protected columns known to PARAM.
+    """
+    assert set(protected) <= set(param), f"Protected columns not in PARAM: {sorted(set(protected) - set(param))}"
+    functions = _create_fault_functions(param, protected)
+
+    # Validation
+    assert len(functions) == 1, f"Expected 1 fault function, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
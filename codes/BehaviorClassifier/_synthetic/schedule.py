@@ -0,0 +1,170 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+schedule.py — Synthetic Stimulus Schedules (PARAM 'stimuli' channels)
+=====================================================================
+
+Periodic ON/OFF trains for every PARAM stimulus channel and the BASE
+GPIO word that encodes them.
+
+Exports:
+    configure(param: Mapping, fps: float, schedule: Mapping[str, tuple[float, float, float]]) → dict[str, callable]
+
+Schedule Functions (2 total):
+    - stimulus_trains(n, schedule=None, jitter_sec=0.0, seed=None) → {channel: int8[n]}
+    - gpio_word(trains) → int64[n]
+
+Schedule Format:
+    channel → (first_onset_sec, period_sec, on_sec); period ≤ 0 → single
+    pulse; channels missing from the schedule stay 0
+
+Notes:
+    - Channels and their order come from PARAM (tag 'stimuli'); GPIO bit k
+      is the k-th channel
+    - Trains are binary (PARAM domain [0, 1]) and already clean: ON runs
+      are ≥ 1 frame and never merge (jitter is clipped to half a period)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Mapping
+
+import numpy as np
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for schedule.py.
+
+Why Empty?
+    Default schedule and FPS come from synthetic.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — TRAIN KERNEL
+
+def _train(n: int, fps: float, first: float, period: float, on: float, jitter: float,
+           rng: np.random.Generator) -> np.ndarray:
+    """int8[n] ON/OFF train from one schedule entry (±1 difference array)."""
+    if period > 0:
+        onsets = np.arange(first, n / fps, period)
+        jitter = min(jitter, period / 2)
+    else:
+        onsets = np.array([first], dtype=np.float64)
+    if jitter > 0 and len(onsets):
+        onsets = onsets + rng.uniform(-jitter, jitter, size=len(onsets))
+    start = np.clip(np.round(onsets * fps).astype(np.int64), 0, n)
+    stop = np.clip(start + max(1, int(round(on * fps))), 0, n)
+    d = np.zeros(n + 1, dtype=np.int32)
+    np.add.at(d, start, 1)
+    np.add.at(d, stop, -1)
+    return (np.cumsum(d[:-1]) > 0).astype(np.int8)
+
+
+#%% CELL 04 — SCHEDULE FUNCTION FACTORY
+
+def _create_schedule_functions(
+    param: Mapping,
+    fps: float,
+    schedule: Mapping[str, tuple[float, float, float]],
+) -> dict[str, Callable]:
+    """
+    Create stimulus schedule generators bound to PARAM channels.
+
+    Returns:
+        Dictionary with 2 schedule functions.
+    """
+    channels = [name for name, spec in param.items() if "stimuli" in spec.get("tags", [])]
+    default_schedule = dict(schedule)
+
+    def stimulus_trains(
+        n: int,
+        schedule: Mapping[str, tuple[float, float, float]] | None = None,
+        jitter_sec: float = 0.0,
+        seed: int | np.random.Generator | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        ON/OFF train for every PARAM stimulus channel.
+
+        Args:
+            n: Frame count.
+            schedule: channel → (first_onset_sec, period_sec, on_sec)
+                      (default: STIMULUS_SCHEDULE).
+            jitter_sec: Uniform onset jitter (± seconds).
+            seed: Seed or Generator.
+
+        Returns:
+            channel → int8[n] (all PARAM stimulus channels, PARAM order).
+
+        Raises:
+            KeyError: Schedule names a channel PARAM does not tag 'stimuli'.
+
+        Examples:
+            trains = stimulus_trains(36_000, {"VisualStim": (10.0, 30.0, 0.5)})
+        """
+        plan = default_schedule if schedule is None else dict(schedule)
+        unknown = sorted(set(plan) - set(channels))
+        if unknown:
+            raise KeyError(f"Not PARAM stimulus channels: {unknown}. Available: {channels}")
+        rng = np.random.default_rng(seed)
+        return {
+            ch: _train(n, fps, *plan[ch], jitter_sec, rng) if ch in plan else np.zeros(n, dtype=np.int8)
+            for ch in channels
+        }
+
+    def gpio_word(trains: Mapping[str, np.ndarray]) -> np.ndarray:
+        """
+        BASE GPIO state: bit k set while the k-th stimulus channel is ON.
+
+        Examples:
+            base["GPIO"] = gpio_word(trains)
+        """
+        n = len(next(iter(trains.values()))) if trains else 0
+        word = np.zeros(n, dtype=np.int64)
+        for bit, ch in enumerate(channels):
+            if ch in trains:
+                word |= np.asarray(trains[ch], dtype=np.int64) << bit
+        return word
+
+    return {
+        "stimulus_trains": stimulus_trains,
+        "gpio_word": gpio_word,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    param: Mapping,
+    fps: float,
+    schedule: Mapping[str, tuple[float, float, float]],
+) -> dict[str, Callable]:
+    """
+    Generate stimulus schedule functions.
+
+    Args:
+        param: PARAM registry (channels tagged 'stimuli').
+        fps: Frames per second.
+        schedule: Default channel → (first_onset_sec, period_sec, on_sec).
+
+    Returns:
+        Dictionary with 2 schedule functions.
+
+    Validation:
+        Asserts 2 functions returned, a positive FPS and a schedule over
+        PARAM stimulus channels only.
+    """
+    assert fps > 0, f"Invalid fps: {fps}"
+    channels = {name for name, spec in param.items() if "stimuli" in spec.get("tags", [])}
+    assert set(schedule) <= channels, f"Schedule channels not in PARAM stimuli: {sorted(set(schedule) - channels)}"
+    functions = _create_schedule_functions(param, fps, schedule)
+
+    # Validation
+    assert len(functions) == 2, f"Expected 2 schedule functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
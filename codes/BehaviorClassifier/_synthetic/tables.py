@@ -0,0 +1,369 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+tables.py — Synthetic BASE / tracked / sleap Tables (PARAM-typed)
+=================================================================
+
+Assembles input tables whose columns, order and dtypes come from PARAM
+tags, plus a checker that reports every ParamSpec violation of a table.
+
+Exports:
+    configure(param: Mapping, utils: Mapping, schedule: Mapping, behavior: Mapping, fps: float, arena_mm: tuple[float, float], frame_id_start_max: int, body_length_mm: float, body_offsets: Mapping[str, tuple[float, float]], position_noise_mm: float, confidence_beta: tuple[float, float]) → dict[str, callable]
+
+Table Functions (6 total):
+    - base_table(trains, start_frame=0, start_ns=0) → DataFrame (tag BASE)
+    - tracked_table(frame_index, trains, track) → DataFrame (tag tracked)
+    - sleap_table(frame_index, track, seed=None) → DataFrame (tag sleap)
+    - stream_recording(n_frames, n_flies=1, seed=None, schedule=None, sleap=True) → (base, iterator of flies)
+    - recording(n_frames, n_flies=1, seed=None, schedule=None, sleap=True) → {base, tracked, sleap, truth}
+    - spec_violations(df, tag=None) → {column: [issue, ...]}
+
+Column Rules (from each ParamSpec):
+    type       int → integer dtype, float → float64 (BC_UTILS column_dtypes)
+    domain     [lo, hi] → values clipped into range; list → members only
+    unit       frames → FrameIndex / FrameID; ns → Timestamp at FPS;
+               fraction → normalized by arena_mm
+    tags       column set and order = BC_UTILS select_columns(tag=...)
+
+Recording Layout:
+    one BASE (FrameID from a random start < frame_id_start_max) shared by
+    n_flies tracked / sleap tables on the same FrameIndex and stimuli;
+    every fly has its own behavior truth and trajectory
+
+Sleap Keypoints:
+    '<Part>.Position.X/Y' = centroid + body_offsets[Part] (body lengths
+    forward / left of the heading) + noise; '<Part>.Confidence' ~
+    Beta(confidence_beta); parts without an offset sit on the centroid
+
+Issues (spec_violations):
+    missing, nan, type (non-integer in an int column / non-numeric),
+    out_of_range (outside [lo, hi] or not a domain member)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Iterator, Mapping
+
+import numpy as np
+import pandas as pd
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for tables.py.
+
+Why Empty?
+    Geometry, keypoint layout and confidence model come from synthetic.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — SPEC HELPERS
+
+def _range(spec: Mapping) -> tuple[float, float] | None:
+    """[lo, hi] of a numeric range domain (None for lists / unbounded)."""
+    dom = spec.get("domain")
+    if spec.get("type") == "float" and dom is not None and len(dom) == 2:
+        return float(dom[0]), float(dom[1])
+    return None
+
+
+def _members(spec: Mapping) -> list | None:
+    """Legal values of a membership domain (binary / categorical / string)."""
+    dom = spec.get("domain")
+    return None if dom is None or _range(spec) is not None else list(dom)
+
+
+def _issues(col: pd.Series, spec: Mapping) -> list[str]:
+    """ParamSpec violations of one column (see Issues)."""
+    out = []
+    values = col.to_numpy()
+    kind = spec.get("type")
+    nan = col.isna().to_numpy()
+    if nan.any():
+        out.append("nan")
+    if kind in ("int", "float"):
+        if not pd.api.types.is_numeric_dtype(col.dtype):
+            return out + ["type"]
+        ok = values[~nan].astype(np.float64)
+        if kind == "int" and (ok != np.round(ok)).any():
+            out.append("type")
+    else:
+        ok = values[~nan]
+    rng, members = _range(spec), _members(spec)
+    if rng is not None and ((ok < rng[0]) | (ok > rng[1])).any():
+        out.append("out_of_range")
+    elif members is not None and not pd.Series(ok).isin(members).all():
+        out.append("out_of_range")
+    return out
+
+
+#%% CELL 04 — TABLE FUNCTION FACTORY
+
+def _create_table_functions(
+    param: Mapping,
+    utils: Mapping,
+    schedule: Mapping,
+    behavior: Mapping,
+    fps: float,
+    arena_mm: tuple[float, float],
+    frame_id_start_max: int,
+    body_length_mm: float,
+    body_offsets: Mapping[str, tuple[float, float]],
+    position_noise_mm: float,
+    confidence_beta: tuple[float, float],
+) -> dict[str, Callable]:
+    """
+    Create table builders bound to PARAM tags, BC_UTILS dtypes and the
+    schedule / behavior generators.
+
+    Returns:
+        Dictionary with 6 table functions.
+    """
+    select_columns = utils["select_columns"]
+    column_dtypes = utils["column_dtypes"]
+    stimulus_trains = schedule["stimulus_trains"]
+    gpio_word = schedule["gpio_word"]
+    behavior_labels = behavior["behavior_labels"]
+    trajectory = behavior["trajectory"]
+    columns = {tag: select_columns(tag=tag) for tag in ("BASE", "tracked", "sleap")}
+    width, height = float(arena_mm[0]), float(arena_mm[1])
+
+    def _typed(data: Mapping[str, np.ndarray], tag: str) -> pd.DataFrame:
+        """DataFrame in PARAM column order, clipped to range domains, PARAM dtypes."""
+        cols = columns[tag]
+        dtypes = column_dtypes(cols)
+        out = {}
+        for c in cols:
+            x = np.array(data[c], dtype=dtypes[c], copy=None)  # no copy when already typed
+            rng = _range(param[c])
+            out[c] = np.clip(x, *rng, out=x if x is not data[c] else None) if rng is not None else x
+        return pd.DataFrame(out, columns=cols, copy=False)  # one block per column, no consolidation copy
+
+    def base_table(trains: Mapping[str, np.ndarray], start_frame: int = 0, start_ns: int = 0) -> pd.DataFrame:
+        """
+        BASE table: GPIO word of the stimulus trains, FrameID and Timestamp.
+
+        Args:
+            trains: channel → int8[n] (stimulus_trains).
+            start_frame: First FrameID.
+            start_ns: First Timestamp (acquisition clock, ns).
+
+        Examples:
+            base = base_table(trains, start_frame=81_233)
+        """
+        gpio = gpio_word(trains)
+        k = np.arange(len(gpio), dtype=np.int64)
+        return _typed({
+            "GPIO": gpio,
+            "FrameID": start_frame + k,
+            "Timestamp": start_ns + np.round(k * (1e9 / fps)).astype(np.int64),
+        }, "BASE")
+
+    def tracked_table(frame_index: np.ndarray, trains: Mapping[str, np.ndarray], track: Mapping[str, np.ndarray]) -> pd.DataFrame:
+        """
+        tracked table of one fly.
+
+        Args:
+            frame_index: Shared timebase (BASE FrameID values).
+            trains: channel → int8[n].
+            track: trajectory() output.
+        """
+        return _typed({"FrameIndex": frame_index, **trains, **track}, "tracked")
+
+    def sleap_table(
+        frame_index: np.ndarray,
+        track: Mapping[str, np.ndarray],
+        seed: int | np.random.Generator | None = None,
+    ) -> pd.DataFrame:
+        """
+        sleap table of one fly (see Sleap Keypoints).
+
+        Args:
+            frame_index: Shared timebase.
+            track: trajectory() output (centroid + Heading).
+            seed: Seed or Generator.
+        """
+        rng = np.random.default_rng(seed)
+        n = len(frame_index)
+        cx = np.asarray(track["NormalizedCentroidX"]) * width
+        cy = np.asarray(track["NormalizedCentroidY"]) * height
+        cos, sin = np.cos(track["Heading"]), np.sin(track["Heading"])
+        data: dict[str, np.ndarray] = {"FrameIndex": frame_index}
+        for c in columns["sleap"]:
+            part, _, field = c.partition(".")
+            if field == "Confidence":
+                data[c] = rng.beta(*confidence_beta, size=n)
+            elif field in ("Position.X", "Position.Y"):
+                fwd, left = body_offsets.get(part, (0.0, 0.0))
+                fwd, left = fwd * body_length_mm, left * body_length_mm
+                if field == "Position.X":
+                    data[c] = (cx + fwd * cos - left * sin + rng.normal(0, position_noise_mm, n)) / width
+                else:
+                    data[c] = (cy + fwd * sin + left * cos + rng.normal(0, position_noise_mm, n)) / height
+        return _typed(data, "sleap")
+
+    def stream_recording(
+        n_frames: int,
+        n_flies: int = 1,
+        seed: int | np.random.Generator | None = None,
+        schedule: Mapping[str, tuple[float, float, float]] | None = None,
+        sleap: bool = True,
+    ) -> tuple[pd.DataFrame, Iterator[dict]]:
+        """
+        One BASE recording, flies generated one at a time (see Recording Layout).
+
+        Args:
+            n_frames: Frames per table.
+            n_flies: Flies sharing the BASE.
+            seed: Seed or Generator (same seed → same tables).
+            schedule: Stimulus schedule (default: STIMULUS_SCHEDULE).
+            sleap: Also build sleap tables.
+
+        Returns:
+            (BASE DataFrame, iterator of {"tracked": DataFrame, "sleap":
+            DataFrame | None, "truth": int16[n] Layer1 codes} per fly).
+
+        Notes:
+            Only one fly is in memory at a time (write_experiment at scale);
+            flies must be consumed in order.
+
+        Examples:
+            base, flies = stream_recording(10_000_000, n_flies=3, seed=7)
+            for fly in flies:
+                fly["tracked"].to_csv(...)
+        """
+        rng = np.random.default_rng(seed)
+        trains = stimulus_trains(n_frames, schedule, seed=rng)
+        base = base_table(
+            trains,
+            start_frame=int(rng.integers(0, frame_id_start_max)) if frame_id_start_max > 0 else 0,
+            start_ns=int(rng.integers(0, 10**12)),
+        )
+        frame_index = base["FrameID"].to_numpy()
+        onsets = np.flatnonzero(np.any([np.diff(t, prepend=0) > 0 for t in trains.values()], axis=0)) if trains else None
+
+        def flies() -> Iterator[dict]:
+            for _ in range(n_flies):
+                truth = behavior_labels(n_frames, onsets, seed=rng)
+                track = trajectory(truth, seed=rng)
+                yield {
+                    "tracked": tracked_table(frame_index, trains, track),
+                    "sleap": sleap_table(frame_index, track, seed=rng) if sleap else None,
+                    "truth": truth,
+                }
+
+        return base, flies()
+
+    def recording(
+        n_frames: int,
+        n_flies: int = 1,
+        seed: int | np.random.Generator | None = None,
+        schedule: Mapping[str, tuple[float, float, float]] | None = None,
+        sleap: bool = True,
+    ) -> dict:
+        """
+        One BASE recording with all flies in memory (stream_recording, collected).
+
+        Returns:
+            {"base": DataFrame, "tracked": [DataFrame], "sleap": [DataFrame],
+             "truth": [int16[n] Layer1 codes]} (sleap empty when sleap=False).
+
+        Examples:
+            rec = recording(36_000, n_flies=3, seed=7)
+            scored = BC_CLASSIFIER["score_flies"](rec["tracked"])
+        """
+        base, flies = stream_recording(n_frames, n_flies, seed, schedule, sleap)
+        out: dict = {"base": base, "tracked": [], "sleap": [], "truth": []}
+        for fly in flies:
+            out["tracked"].append(fly["tracked"])
+            out["truth"].append(fly["truth"])
+            if sleap:
+                out["sleap"].append(fly["sleap"])
+        return out
+
+    def spec_violations(df: pd.DataFrame, tag: str | None = None) -> dict[str, list[str]]:
+        """
+        ParamSpec violations of a table (see Issues).
+
+        Args:
+            df: Table to check (PARAM columns; others ignored).
+            tag: Expected column set (adds 'missing'); None → present columns only.
+
+        Returns:
+            column → issues (columns without issues omitted).
+
+        Examples:
+            assert not spec_violations(rec["tracked"][0], tag="tracked")
+        """
+        expected = select_columns(tag=tag) if tag else []
+        out = {c: ["missing"] for c in expected if c not in df.columns}
+        for c in df.columns:
+            if c in param:
+                issues = _issues(df[c], param[c])
+                if issues:
+                    out[c] = issues
+        return out
+
+    return {
+        "base_table": base_table,
+        "tracked_table": tracked_table,
+        "sleap_table": sleap_table,
+        "stream_recording": stream_recording,
+        "recording": recording,
+        "spec_violations": spec_violations,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    param: Mapping,
+    utils: Mapping,
+    schedule: Mapping,
+    behavior: Mapping,
+    fps: float,
+    arena_mm: tuple[float, float],
+    frame_id_start_max: int,
+    body_length_mm: float,
+    body_offsets: Mapping[str, tuple[float, float]],
+    position_noise_mm: float,
+    confidence_beta: tuple[float, float],
+) -> dict[str, Callable]:
+    """
+    Generate table functions.
+
+    Args:
+        param: PARAM registry (column specs).
+        utils: BC_UTILS bundle (select_columns, column_dtypes).
+        schedule: Schedule functions (stimulus_trains, gpio_word).
+        behavior: Behavior functions (behavior_labels, trajectory).
+        fps: Frames per second (Timestamp spacing).
+        arena_mm: Arena (width, height) in mm.
+        frame_id_start_max: First FrameID drawn below this (0 → start at 0).
+        body_length_mm: Body length scaling body_offsets.
+        body_offsets: Sleap part → (forward, left) in body lengths.
+        position_noise_mm: Keypoint noise (SD, mm).
+        confidence_beta: Beta(a, b) of keypoint / view confidences.
+
+    Returns:
+        Dictionary with 6 table functions.
+
+    Validation:
+        Asserts 5 functions returned and body_offsets naming sleap parts.
+    """
+    parts = {c.split(".", 1)[0] for c in utils["select_columns"](tag="sleap") if "." in c}
+    assert set(body_offsets) <= parts, f"body_offsets names unknown sleap parts: {sorted(set(body_offsets) - parts)}"
+    functions = _create_table_functions(
+        param, utils, schedule, behavior, fps, arena_mm, frame_id_start_max,
+        body_length_mm, body_offsets, position_noise_mm, confidence_beta,
+    )
+
+    # Validation
+    assert len(functions) == 6, f"Expected 6 table functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
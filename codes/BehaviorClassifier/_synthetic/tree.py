@@ -0,0 +1,194 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+tree.py — Synthetic Experiment Tree (PATH layout)
+=================================================
+
+Writes generated recordings into an experiment root exactly where the
+pipeline looks for them, so discovery, loaders, the scheduler and the
+classifier run on synthetic data unchanged.
+
+Exports:
+    configure(path: Mapping, tables: Mapping, faults: Mapping, fps: float, recording_sec: float, base_prefix: str, float_format: str | None) → dict[str, callable]
+
+Tree Functions (1 total):
+    - write_experiment(path=None, n_bases=1, n_flies=3, n_frames=None, seed=None, sleap=True, schedule=None, faults=None, fault_fraction=1.0) → {stem: int16[n] truth}
+
+Layout (PATH folders):
+    pRawData / <BASE>.csv                   BASE table (one per recording)
+    tracked_path(<BASE>_fly<N>)             pTracked / *_tracked.csv
+    sleap_path(<BASE>_fly<N>)               pSleap / *_sleap.csv (sleap=True)
+
+Faults:
+    faults = {"base" | "tracked" | "sleap": inject_faults kwargs}; each
+    fly (and each BASE) is faulted with probability fault_fraction
+
+Notes:
+    - BASE names are <base_prefix><NNN> (NNN from 001); stems parse with
+      PATH parse_base_fly
+    - filename_policy has no BASE suffix: RawData/<BASE>.csv is this
+      generator's convention
+    - Recording i uses child i of SeedSequence(seed): the same seed writes
+      the same tree, and recordings are independent of n_bases
+    - Faults draw from their own stream: clean data and truth do not
+      depend on `faults` / `fault_fraction`
+    - Flies are generated and written one at a time (memory ~ one fly)
+    - Floats are written with float_format (9 significant digits by
+      default: ~35% smaller / faster sleap CSVs than full repr)
+    - Existing files are overwritten
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Mapping
+
+import numpy as np
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for tree.py.
+
+Why Empty?
+    Default PATH, recording length and BASE prefix come from synthetic.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - defaults passed via configure())
+
+#%% CELL 03 — FAULT KINDS
+
+_FAULT_KINDS: tuple[str, ...] = ("base", "tracked", "sleap")
+
+#%% CELL 04 — TREE FUNCTION FACTORY
+
+def _create_tree_functions(
+    path: Mapping,
+    tables: Mapping,
+    faults: Mapping,
+    fps: float,
+    recording_sec: float,
+    base_prefix: str,
+    float_format: str | None,
+) -> dict[str, Callable]:
+    """
+    Create the experiment writer bound to the default PATH and generators.
+
+    Returns:
+        Dictionary with 1 tree function.
+    """
+    stream_recording = tables["stream_recording"]
+    inject_faults = faults["inject_faults"]
+    default_path = path
+    default_frames = int(round(recording_sec * fps))
+
+    def write_experiment(
+        path: Mapping | None = None,
+        n_bases: int = 1,
+        n_flies: int = 3,
+        n_frames: int | None = None,
+        seed: int | None = None,
+        sleap: bool = True,
+        schedule: Mapping[str, tuple[float, float, float]] | None = None,
+        faults: Mapping[str, Mapping] | None = None,
+        fault_fraction: float = 1.0,
+    ) -> dict[str, np.ndarray]:
+        """
+        Generate and write a full experiment tree (see Layout).
+
+        Args:
+            path: PATH bundle of the target root (default: configured PATH),
+                  e.g. Config.path.configure(root=Path("/scratch/SynthExp")).
+            n_bases: Recordings.
+            n_flies: Flies per recording.
+            n_frames: Frames per recording (default: RECORDING_SEC × FPS).
+            seed: Root seed.
+            sleap: Also write *_sleap.csv.
+            schedule: Stimulus schedule (default: STIMULUS_SCHEDULE).
+            faults: Per-kind inject_faults kwargs (see Faults).
+            fault_fraction: Share of flies / BASEs that get the faults.
+
+        Returns:
+            stem → int16[n_frames] ground-truth Layer1 codes.
+
+        Raises:
+            KeyError: Unknown fault kind.
+
+        Examples:
+            PATH_SYN = Config.path.configure(root=Path("/scratch/SynthExp"))
+            truth = write_experiment(PATH_SYN, n_bases=4, n_flies=3, n_frames=216_000, seed=1,
+                                     faults={"tracked": {"nan_runs": 10}}, fault_fraction=0.25)
+        """
+        P = default_path if path is None else path
+        plan = dict(faults or {})
+        unknown = sorted(set(plan) - set(_FAULT_KINDS))
+        if unknown:
+            raise KeyError(f"Unknown fault kinds: {unknown}. Available: {list(_FAULT_KINDS)}")
+        n = default_frames if n_frames is None else n_frames
+        for key in ("pRawData", "pTracked", "pSleap"):
+            P[key].mkdir(parents=True, exist_ok=True)
+
+        truth: dict[str, np.ndarray] = {}
+        for i, child in enumerate(np.random.SeedSequence(seed).spawn(n_bases), start=1):
+            data_seed, fault_seed = child.spawn(2)
+            rng = np.random.default_rng(fault_seed)
+            base = f"{base_prefix}{i:03d}"
+            base_df, flies = stream_recording(n, n_flies, seed=np.random.default_rng(data_seed), schedule=schedule, sleap=sleap)
+
+            def _maybe(kind: str, df):
+                hit = kind in plan and rng.random() < fault_fraction
+                return inject_faults(df, seed=rng, **plan[kind]) if hit else df
+
+            _maybe("base", base_df).to_csv(P["pRawData"] / f"{base}.csv", index=False)
+            for k, fly in enumerate(flies, start=1):
+                stem = f"{base}_fly{k}"
+                _maybe("tracked", fly["tracked"]).to_csv(P["tracked_path"](stem), index=False, float_format=float_format)
+                if sleap:
+                    _maybe("sleap", fly["sleap"]).to_csv(P["sleap_path"](stem), index=False, float_format=float_format)
+                truth[stem] = fly["truth"]
+        return truth
+
+    return {
+        "write_experiment": write_experiment,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    tables: Mapping,
+    faults: Mapping,
+    fps: float,
+    recording_sec: float,
+    base_prefix: str,
+    float_format: str | None,
+) -> dict[str, Callable]:
+    """
+    Generate tree functions.
+
+    Args:
+        path: Default PATH bundle (folders + tracked_path / sleap_path).
+        tables: Table functions (stream_recording).
+        faults: Fault functions (inject_faults).
+        fps: Frames per second.
+        recording_sec: Default recording length (seconds).
+        base_prefix: BASE name prefix.
+        float_format: CSV float format (None → full repr).
+
+    Returns:
+        Dictionary with 1 tree function.
+
+    Validation:
+        Asserts 1 function returned and a BASE prefix without '_fly'.
+    """
+    assert "_fly" not in base_prefix, f"BASE prefix must not contain '_fly': {base_prefix!r}"
+    functions = _create_tree_functions(path, tables, faults, fps, recording_sec, base_prefix, float_format)
+
+    # Validation
+    assert len(functions) == 1, f"Expected 1 tree function, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
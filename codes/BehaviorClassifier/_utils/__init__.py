@@ -0,0 +1,109 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+_utils/__init__.py — Utilities Coordinator
+===========================================
+
+Orchestrates utility workers and assembles the BC_UTILS bundle.
+
+Architecture:
+    3 workers → coordinator → controller → BC_UTILS export
+
+Workers (3):
+    1. dtypes.py: 5 dtype functions (select_columns, column_dtypes,
+       column_widths, row_bytes, csv_row_width)
+    2. bouts.py: 6 bout functions (encode_bouts, decode_bouts, filter_bouts,
+       merge_bouts, drop_micro_bouts, bridge_gaps)
+    3. stimuli.py: 3 stimulus functions (stimulus_events, clean_stimuli,
+       stem_stimulus_events)
+
+Total Exports: 14 (validated)
+
+Design:
+    - Coordinator receives PARAM, PATH + defaults from controller
+    - Calls workers in dependency order
+    - Assembles single immutable bundle
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Mapping
+
+from . import bouts, dtypes, stimuli
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for _utils coordinator.
+
+Why Empty?
+    Coordinator orchestrates workers (no direct configuration).
+    Defaults come from utils.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - pure orchestration)
+
+#%% CELL 03 — CONFIGURE
+
+def configure(
+    param: Mapping,
+    text_widths: Mapping[str, float],
+    string_bytes: int,
+    path: Mapping,
+    stim_max_gap: int,
+    stim_min_on: int,
+) -> MappingProxyType:
+    """
+    Configure and return the immutable BC_UTILS bundle.
+
+    Args:
+        param: PARAM registry (from Config.param).
+        text_widths: Average CSV characters per value by PARAM type.
+        string_bytes: In-memory bytes per object-string value.
+        path: PATH mapping (from Config.path).
+        stim_max_gap: Stimulus zero gaps ≤ this many frames are filled.
+        stim_min_on: Stimulus ON runs shorter than this are removed.
+
+    Returns:
+        MappingProxyType with 14 utility exports.
+
+    Orchestration Order (respects dependencies):
+        1. dtypes → select_columns, column_dtypes, column_widths,
+           row_bytes, csv_row_width (needs PARAM)
+        2. bouts → RLE label bouts (needs PARAM domains)
+        3. stimuli → stimulus cleaning + onsets (needs PARAM tags + PATH)
+    """
+    dtypes_data = dtypes.configure(
+        param=param,
+        text_widths=text_widths,
+        string_bytes=string_bytes,
+    )
+
+    bouts_data = bouts.configure(param=param)
+
+    stimuli_data = stimuli.configure(
+        path=path,
+        param=param,
+        max_gap=stim_max_gap,
+        min_on=stim_min_on,
+    )
+
+    bundle = {
+        **dtypes_data,
+        **bouts_data,
+        **stimuli_data,
+    }
+
+    # Validation: 5 dtypes + 6 bouts + 3 stimuli = 14
+    expected_count = 14
+    assert len(bundle) == expected_count, (
+        f"BC_UTILS export count mismatch: expected {expected_count}, got {len(bundle)}. "
+        f"Keys: {sorted(bundle)}"
+    )
+
+    return MappingProxyType(bundle)
+
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,358 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+bouts.py — Run-Length-Encoded Label Bouts
+==========================================
+
+Per-frame categorical labels (Layer1, Layer2, Resistant, Behavior and
+their _Denoised variants) as runs: starts, lengths and integer codes.
+
+Exports:
+    configure(param: Mapping) → dict[str, callable]
+
+Bout Functions (6 total):
+    - encode_bouts(values, column=None, categories=None, unknown="raise", missing=None) → Bouts
+    - decode_bouts(bouts, codes=False) → Categorical | ndarray
+    - filter_bouts(bouts, min_length=None, max_length=None, labels=None) → Bouts
+    - merge_bouts(bouts, gap=0) → Bouts
+    - drop_micro_bouts(bouts, max_length, keep=()) → Bouts
+    - bridge_gaps(bouts, max_length) → Bouts
+
+Bouts Layout:
+    starts     int64[k]   first frame of each bout
+    lengths    int64[k]   frames per bout
+    codes      int16[k]   index into categories (-1 = missing / NaN)
+    categories tuple | None   label per code (PARAM domain order)
+    n_frames   int        decoded length (frames outside bouts → missing)
+
+Notes:
+    - Encode / decode are vectorized (one diff + flatnonzero / one repeat)
+    - Columns with a PARAM string domain use that domain as categories,
+      so codes are stable across files
+    - Nothing becomes missing silently: labels outside the categories raise
+      (or unknown="missing" / "append"); raw integer values must fit int16
+      and may not be -1 unless they are the declared `missing` value
+    - filter_bouts may leave gaps; merge / drop / bridge return bouts that
+      tile [0, n_frames) when their input did
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for bouts.py.
+
+Why Empty?
+    Categories come from PARAM domains; lengths are call arguments.
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - PARAM passed via configure())
+
+#%% CELL 03 — BOUTS TYPE
+
+MISSING: int = -1
+
+
+class Bouts:
+    """
+    Run-length-encoded label column.
+
+    Usage:
+        b = BC_UTILS["encode_bouts"](df["Layer1"], column="Layer1")
+        b.starts, b.lengths, b.codes, b.labels()
+        BC_UTILS["decode_bouts"](b)          # back to per-frame Categorical
+    """
+
+    __slots__ = ("starts", "lengths", "codes", "categories", "n_frames")
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        lengths: np.ndarray,
+        codes: np.ndarray,
+        categories: tuple | None,
+        n_frames: int,
+    ) -> None:
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        codes = np.asarray(codes)
+        if codes.dtype != np.int16 and len(codes):
+            info = np.iinfo(np.int16)
+            if int(codes.min()) < info.min or int(codes.max()) > info.max:
+                raise ValueError(f"Bout codes outside int16 [{info.min}, {info.max}]: {int(codes.min())}..{int(codes.max())}")
+        self.codes = codes.astype(np.int16, copy=False)
+        self.categories = None if categories is None else tuple(categories)
+        self.n_frames = int(n_frames)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return f"Bouts(bouts={len(self)}, frames={self.n_frames}, categories={self.categories})"
+
+    @property
+    def ends(self) -> np.ndarray:
+        """Exclusive end frame of each bout."""
+        return self.starts + self.lengths
+
+    def labels(self) -> np.ndarray:
+        """Label of each bout (object array, NaN for missing)."""
+        if self.categories is None:
+            return self.codes.copy()
+        lut = np.array([*self.categories, np.nan], dtype=object)
+        return lut[self.codes]  # -1 → last entry (NaN)
+
+    def code_of(self, label) -> int:
+        """Code of one label (categories index, or the value itself)."""
+        if self.categories is None:
+            return int(label)
+        try:
+            return self.categories.index(label)
+        except ValueError:
+            raise KeyError(f"Label {label!r} not in categories {self.categories}") from None
+
+    def _take(self, mask: np.ndarray) -> "Bouts":
+        return Bouts(self.starts[mask], self.lengths[mask], self.codes[mask], self.categories, self.n_frames)
+
+
+def _rle(codes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(starts, lengths, codes) of runs of equal values."""
+    n = len(codes)
+    if n == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.int16)
+    starts = np.concatenate([[0], np.flatnonzero(codes[1:] != codes[:-1]) + 1])
+    lengths = np.diff(np.append(starts, n))
+    return starts, lengths, codes[starts]
+
+
+def _integer_codes(arr: np.ndarray, missing: int | None) -> np.ndarray:
+    """int16 codes of raw integer values (`missing` → MISSING); ValueError if they do not fit."""
+    gaps = arr == missing if missing is not None else None
+    v = arr if gaps is None else arr[~gaps]
+    if len(v):
+        info = np.iinfo(np.int16)
+        lo, hi = int(v.min()), int(v.max())
+        if lo < info.min or hi > info.max:
+            raise ValueError(f"Integer labels outside int16 [{info.min}, {info.max}]: {lo}..{hi}")
+        if lo <= MISSING <= hi and (v == MISSING).any():
+            raise ValueError(f"Integer label {MISSING} is the missing code (declare it with missing={MISSING})")
+    codes = arr.astype(np.int16)
+    if gaps is not None:
+        codes[gaps] = MISSING
+    return codes
+
+
+def _merge(b: Bouts, gap: int) -> Bouts:
+    """Coalesce consecutive equal-code bouts separated by ≤ gap frames."""
+    if len(b) < 2:
+        return b
+    ends = b.ends
+    same = (b.codes[1:] == b.codes[:-1]) & (b.starts[1:] - ends[:-1] <= gap)
+    first = np.flatnonzero(np.concatenate([[True], ~same]))
+    starts = b.starts[first]
+    new_ends = np.maximum.reduceat(ends, first)
+    return Bouts(starts, new_ends - starts, b.codes[first], b.categories, b.n_frames)
+
+
+#%% CELL 04 — BOUT FUNCTION FACTORY
+
+def _create_bout_functions(param: Mapping) -> dict[str, Callable]:
+    """
+    Create bout helpers bound to PARAM domains.
+
+    Returns:
+        Dictionary with 6 bout functions.
+    """
+
+    def _domain(column: str | None) -> tuple | None:
+        spec = param.get(column) if column else None
+        if spec and spec.get("type") == "string" and spec.get("domain"):
+            return tuple(spec["domain"])
+        return None
+
+    def encode_bouts(
+        values,
+        column: str | None = None,
+        categories: Iterable | None = None,
+        unknown: str = "raise",
+        missing: int | None = None,
+    ) -> Bouts:
+        """
+        Encode a per-frame label column as bouts.
+
+        Args:
+            values: Labels (Series / Categorical / array); NaN → missing.
+            column: PARAM column name (its domain becomes the categories).
+            categories: Explicit categories (overrides the PARAM domain).
+            unknown: Labels outside the categories: 'raise', 'missing' (→ -1)
+                     or 'append' (extra categories after the domain, sorted).
+            missing: Raw integer value that marks missing frames (→ -1).
+
+        Returns:
+            Bouts tiling [0, len(values)).
+
+        Raises:
+            ValueError: Labels outside the categories (unknown='raise'), or raw
+                        integers outside int16 / equal to -1 but not `missing`.
+
+        Examples:
+            encode_bouts(df["Layer2_Denoised"], column="Layer2_Denoised")
+            encode_bouts(df["Motion"].to_numpy())     # integer codes as-is
+            encode_bouts(raw, column="Layer1", unknown="append")
+        """
+        assert unknown in ("raise", "missing", "append"), f"unknown must be 'raise', 'missing' or 'append', got {unknown!r}"
+        cats = tuple(categories) if categories is not None else _domain(column)
+        if cats is not None:
+            codes = pd.Categorical(values, categories=list(cats)).codes
+            gaps = codes == MISSING
+            if unknown != "missing" and gaps.any():
+                raw = np.asarray(values, dtype=object)
+                stray = gaps & pd.notna(raw)
+                if stray.any():
+                    extra = sorted(pd.unique(raw[stray]), key=str)
+                    if unknown == "raise":
+                        raise ValueError(f"{column or 'values'}: labels outside categories {cats}: {extra}")
+                    cats = (*cats, *extra)
+                    codes = pd.Categorical(values, categories=list(cats)).codes
+        else:
+            arr = np.asarray(values)
+            if arr.dtype.kind in "iub":
+                codes = _integer_codes(arr, missing)
+            else:
+                cat = pd.Categorical(arr)
+                cats, codes = tuple(cat.categories), cat.codes
+        codes = np.asarray(codes)
+        starts, lengths, run_codes = _rle(codes)
+        return Bouts(starts, lengths, run_codes, cats, len(codes))
+
+    def decode_bouts(bouts: Bouts, codes: bool = False) -> pd.Categorical | np.ndarray:
+        """
+        Expand bouts back to one value per frame.
+
+        Args:
+            bouts: Bouts to decode (gaps → missing).
+            codes: Return the integer code array instead of labels.
+
+        Returns:
+            Categorical over bouts.categories, or int16 codes.
+        """
+        b = bouts
+        if len(b) and b.starts[0] == 0 and int(b.lengths.sum()) == b.n_frames and np.all(b.starts[1:] == b.ends[:-1]):
+            out = np.repeat(b.codes, b.lengths)
+        else:
+            out = np.full(b.n_frames, MISSING, dtype=np.int16)
+            total = int(b.lengths.sum())
+            if total:
+                shift = b.starts - np.concatenate([[0], np.cumsum(b.lengths)[:-1]])
+                out[np.arange(total) + np.repeat(shift, b.lengths)] = np.repeat(b.codes, b.lengths)
+        if codes or b.categories is None:
+            return out
+        return pd.Categorical.from_codes(out, categories=list(b.categories))
+
+    def filter_bouts(
+        bouts: Bouts,
+        min_length: int | None = None,
+        max_length: int | None = None,
+        labels: Iterable | None = None,
+    ) -> Bouts:
+        """
+        Bouts whose length is in [min_length, max_length] and label in labels.
+
+        Examples:
+            freezes = filter_bouts(b, min_length=30, labels=["Layer2_Freeze"])
+            freezes.starts, freezes.lengths
+        """
+        mask = np.ones(len(bouts), dtype=bool)
+        if min_length is not None:
+            mask &= bouts.lengths >= min_length
+        if max_length is not None:
+            mask &= bouts.lengths <= max_length
+        if labels is not None:
+            mask &= np.isin(bouts.codes, [bouts.code_of(x) for x in labels])
+        return bouts._take(mask)
+
+    def merge_bouts(bouts: Bouts, gap: int = 0) -> Bouts:
+        """
+        Coalesce consecutive bouts with the same code.
+
+        Args:
+            bouts: Bouts (sorted by start).
+            gap: Merge across gaps of up to `gap` frames (0 → touching only).
+        """
+        return _merge(bouts, gap)
+
+    def drop_micro_bouts(bouts: Bouts, max_length: int, keep: Iterable = ()) -> Bouts:
+        """
+        Mark bouts of ≤ max_length frames as missing, except labels in keep.
+
+        Examples:
+            drop_micro_bouts(b, NOISE_TOLERANCE, keep=["Layer1_Jump"])
+        """
+        keep_codes = [bouts.code_of(x) for x in keep]
+        drop = (bouts.lengths <= max_length) & (bouts.codes != MISSING) & ~np.isin(bouts.codes, keep_codes)
+        codes = np.where(drop, MISSING, bouts.codes)
+        return _merge(Bouts(bouts.starts, bouts.lengths, codes, bouts.categories, bouts.n_frames), 0)
+
+    def bridge_gaps(bouts: Bouts, max_length: int) -> Bouts:
+        """
+        Fill missing bouts of ≤ max_length frames whose two neighbours share a label.
+
+        Examples:
+            bridge_gaps(b, int(MAX_NAN_BOUT_CLEAN_SEC * fps))
+        """
+        c = bouts.codes
+        if len(c) < 3:
+            return bouts
+        inner = np.arange(1, len(c) - 1)
+        fill = (
+            (c[inner] == MISSING)
+            & (bouts.lengths[inner] <= max_length)
+            & (c[inner - 1] == c[inner + 1])
+            & (c[inner - 1] != MISSING)
+        )
+        codes = c.copy()
+        codes[inner[fill]] = c[inner[fill] - 1]
+        return _merge(Bouts(bouts.starts, bouts.lengths, codes, bouts.categories, bouts.n_frames), 0)
+
+    return {
+        "encode_bouts": encode_bouts,
+        "decode_bouts": decode_bouts,
+        "filter_bouts": filter_bouts,
+        "merge_bouts": merge_bouts,
+        "drop_micro_bouts": drop_micro_bouts,
+        "bridge_gaps": bridge_gaps,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(param: Mapping) -> dict[str, Callable]:
+    """
+    Generate bout functions.
+
+    Args:
+        param: PARAM registry (label domains).
+
+    Returns:
+        Dictionary with 6 bout functions.
+
+    Validation:
+        Asserts 6 functions returned.
+    """
+    functions = _create_bout_functions(param)
+
+    # Validation
+    assert len(functions) == 6, f"Expected 6 bout functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "Bouts", "MISSING"]
@@ -0,0 +1,205 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+dtypes.py — PARAM-Derived Column Types & Widths
+================================================
+
+Map PARAM column metadata (type, role, domain, tags) to NumPy/pandas
+dtypes, in-memory widths and average CSV text widths.
+
+Exports:
+    configure(param: Mapping, text_widths: Mapping[str, float], string_bytes: int) → dict[str, callable]
+
+Dtype Functions (5 total):
+    - select_columns(tag=None, role=None, type=None, columns=None) → list[str]
+    - column_dtypes(columns: Iterable[str], compact: bool = True) → dict[str, str]
+    - column_widths(columns: Iterable[str], compact: bool = True) → dict[str, int]
+    - row_bytes(columns: Iterable[str], compact: bool = True) → int
+    - csv_row_width(columns: Iterable[str]) → float
+
+Type Mapping (compact=True / compact=False):
+    int + binary          → int8      / int64
+    int (other)           → int64     / int64
+    float                 → float64   / float64
+    bool                  → bool      / bool
+    string + domain       → category  / object
+    string (no domain)    → object    / object
+
+Notes:
+    - Columns not registered in PARAM (e.g., Speed_Denoised) are treated
+      as float (the pipeline's derived numeric columns)
+    - Widths are bytes per value in memory (category → 1-byte codes)
+    - CSV text width = average characters per value + 1 delimiter
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for dtypes.py.
+
+Why Empty?
+    Text widths and string sizes come from utils.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - widths passed via configure())
+
+#%% CELL 03 — TYPE RULES
+
+# Fallback spec for columns missing from PARAM
+_DERIVED_SPEC: dict = {"type": "float", "role": "continuous", "domain": None, "tags": []}
+
+
+def _dtype_of(spec: Mapping, compact: bool) -> str:
+    """pandas dtype string for one PARAM spec."""
+    kind, role = spec.get("type"), spec.get("role")
+    if kind == "int":
+        return "int8" if compact and role == "binary" else "int64"
+    if kind == "float":
+        return "float64"
+    if kind == "bool":
+        return "bool"
+    if kind == "string" and compact and spec.get("domain"):
+        return "category"
+    return "object"
+
+
+def _width_of(dtype: str, string_bytes: int) -> int:
+    """In-memory bytes per value of a dtype string."""
+    if dtype == "category":
+        return 1  # int8 codes (≤ 127 categories)
+    if dtype == "object":
+        return string_bytes
+    return np.dtype(dtype).itemsize
+
+
+def _text_width_of(spec: Mapping, text_widths: Mapping[str, float]) -> float:
+    """Average CSV characters per value (delimiter excluded)."""
+    if spec.get("role") == "binary":
+        return 1.0
+    domain = spec.get("domain")
+    if spec.get("type") == "string" and domain:
+        return sum(len(str(v)) for v in domain) / len(domain)
+    return float(text_widths[spec.get("type", "float")])
+
+
+#%% CELL 04 — DTYPE FUNCTION FACTORY
+
+def _create_dtype_functions(
+    param: Mapping,
+    text_widths: Mapping[str, float],
+    string_bytes: int,
+) -> dict[str, Callable]:
+    """
+    Create dtype helpers bound to the PARAM registry.
+
+    Returns:
+        Dictionary with 5 dtype functions.
+    """
+
+    def _spec(name: str) -> Mapping:
+        return param.get(name, _DERIVED_SPEC)
+
+    def select_columns(
+        tag: str | None = None,
+        role: str | None = None,
+        type: str | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> list[str]:
+        """
+        PARAM columns matching all given filters (PARAM order).
+
+        Args:
+            tag: Provenance tag ('tracked', 'scored', 'sleap', 'pose', 'BASE', 'stimuli').
+            role: 'binary' | 'categorical' | 'continuous'.
+            type: 'int' | 'float' | 'string' | 'bool'.
+            columns: Restrict to these names (e.g., a CSV header).
+
+        Examples:
+            select_columns(tag="tracked")
+            select_columns(tag="stimuli", columns=header)
+        """
+        allowed = None if columns is None else set(columns)
+        return [
+            name for name, spec in param.items()
+            if (tag is None or tag in spec.get("tags", ()))
+            and (role is None or spec.get("role") == role)
+            and (type is None or spec.get("type") == type)
+            and (allowed is None or name in allowed)
+        ]
+
+    def column_dtypes(columns: Iterable[str], compact: bool = True) -> dict[str, str]:
+        """
+        pandas dtypes for columns (read_csv(dtype=...) ready).
+
+        Args:
+            columns: Column names.
+            compact: int8 for binary ints, category for domain strings.
+        """
+        return {c: _dtype_of(_spec(c), compact) for c in columns}
+
+    def column_widths(columns: Iterable[str], compact: bool = True) -> dict[str, int]:
+        """In-memory bytes per value of each column."""
+        return {c: _width_of(d, string_bytes) for c, d in column_dtypes(columns, compact).items()}
+
+    def row_bytes(columns: Iterable[str], compact: bool = True) -> int:
+        """In-memory bytes per row for a set of columns."""
+        return sum(column_widths(columns, compact).values())
+
+    def csv_row_width(columns: Iterable[str]) -> float:
+        """
+        Average CSV bytes per data row (values + delimiters + newline).
+
+        Examples:
+            frames ≈ (file_size - header_size) / csv_row_width(select_columns(tag="tracked"))
+        """
+        cols = list(columns)
+        return sum(_text_width_of(_spec(c), text_widths) + 1.0 for c in cols) if cols else 1.0
+
+    return {
+        "select_columns": select_columns,
+        "column_dtypes": column_dtypes,
+        "column_widths": column_widths,
+        "row_bytes": row_bytes,
+        "csv_row_width": csv_row_width,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    param: Mapping,
+    text_widths: Mapping[str, float],
+    string_bytes: int,
+) -> dict[str, Callable]:
+    """
+    Generate dtype functions.
+
+    Args:
+        param: PARAM registry (from Config.param).
+        text_widths: Average CSV characters per value by PARAM type.
+        string_bytes: In-memory bytes per object-string value.
+
+    Returns:
+        Dictionary with 5 dtype functions.
+
+    Validation:
+        Asserts 5 functions returned and a width for every PARAM type.
+    """
+    missing = {spec.get("type") for spec in param.values()} - set(text_widths)
+    assert not missing, f"text_widths missing PARAM types: {sorted(missing)}"
+    functions = _create_dtype_functions(param, text_widths, string_bytes)
+
+    # Validation
+    assert len(functions) == 5, f"Expected 5 dtype functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
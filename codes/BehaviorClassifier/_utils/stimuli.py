@@ -0,0 +1,238 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+stimuli.py — Stimulus Cleaning & Onset Engine
+==============================================
+
+Clean every PARAM 'stimuli' channel (VisualStim, Stim0, Stim1) and
+extract onsets/offsets in one run-length pass over all channels.
+
+Exports:
+    configure(path: Mapping, param: Mapping, max_gap: int, min_on: int) → dict[str, callable]
+
+Stimulus Functions (3 total):
+    - stimulus_events(channels, max_gap=None, min_on=None) → {name: (onsets, offsets)}
+    - clean_stimuli(channels, max_gap=None, min_on=None) → {name: int8[n]}
+    - stem_stimulus_events(stem, path=None, refresh=False) → {name: (onsets, offsets)}
+
+Cleaning Rules (frames, per channel):
+    1. Zero gaps of ≤ max_gap frames between two ON runs are filled
+    2. ON runs shorter than min_on frames (after filling) are removed
+
+Algorithm:
+    channels stacked → bool[c, n] → padded diff → all ON runs of all
+    channels as (channel, onset, offset) from two np.nonzero calls →
+    gap bridging and length filtering as array masks (no per-channel loop)
+
+Notes:
+    - Onsets / offsets are row positions (offset exclusive); map to
+      frames with df["FrameIndex"].to_numpy()[onsets]
+    - Any non-zero value counts as ON; NaN (a missing sample, e.g. a gap
+      in the tracked CSV) counts as OFF, so a dropout inside an ON run is
+      a zero gap that Cleaning Rule 1 can bridge
+    - stem_stimulus_events reads only the stimulus columns of the tracked
+      CSV (as float32, so empty fields load as NaN) and caches results per
+      stem (invalidated on size / mtime change)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import threading
+from pathlib import Path
+from typing import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for stimuli.py.
+
+Why Empty?
+    Gap and minimum-length thresholds come from utils.py CELL 02 via configure().
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - thresholds passed via configure())
+
+#%% CELL 03 — RUN ENGINE
+
+def _on_runs(x: np.ndarray, max_gap: int, min_on: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """All cleaned ON runs of bool[c, n] → (channel, onset, offset)."""
+    c = x.shape[0]
+    pad = np.zeros((c, 1), dtype=np.int8)
+    d = np.diff(np.concatenate([pad, x.astype(np.int8), pad], axis=1), axis=1)
+    ch, on = np.nonzero(d == 1)
+    _, off = np.nonzero(d == -1)  # row-major → aligned with (ch, on)
+
+    # 1. Bridge short zero gaps between ON runs of the same channel
+    if len(on) > 1:
+        bridge = (ch[1:] == ch[:-1]) & (on[1:] - off[:-1] <= max_gap)
+        first = np.concatenate([[True], ~bridge])
+        ch, on, off = ch[first], on[first], off[np.concatenate([~bridge, [True]])]
+
+    # 2. Drop spurious short ON runs
+    keep = (off - on) >= min_on
+    return ch[keep], on[keep], off[keep]
+
+
+def _stack(channels: Mapping[str, np.ndarray] | pd.DataFrame, names: list[str]) -> np.ndarray:
+    """bool[c, n] ON mask (non-zero → ON, NaN → OFF)."""
+    if not names:
+        return np.zeros((0, 0), dtype=bool)
+    return np.stack([np.nan_to_num(np.asarray(channels[name])) != 0 for name in names])
+
+
+#%% CELL 04 — STIMULUS FUNCTION FACTORY
+
+def _create_stimulus_functions(
+    path: Mapping,
+    param: Mapping,
+    max_gap: int,
+    min_on: int,
+) -> dict[str, Callable]:
+    """
+    Create stimulus helpers bound to PATH and the PARAM 'stimuli' tag.
+
+    Returns:
+        Dictionary with 3 stimulus functions.
+    """
+    default_path = path
+    default_gap, default_min = max_gap, min_on
+    stim_cols = [name for name, spec in param.items() if "stimuli" in spec.get("tags", ())]
+    cache: dict[str, tuple[tuple, dict]] = {}
+    lock = threading.Lock()
+
+    def _names(channels) -> list[str]:
+        return [c for c in stim_cols if c in channels]
+
+    def stimulus_events(
+        channels: Mapping[str, np.ndarray] | pd.DataFrame,
+        max_gap: int | None = None,
+        min_on: int | None = None,
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """
+        Clean all stimulus channels and return ON runs.
+
+        Args:
+            channels: DataFrame or mapping with any of the PARAM stimulus columns.
+            max_gap: Fill zero gaps of ≤ max_gap frames (default from controller).
+            min_on: Minimum ON length in frames (default from controller).
+
+        Returns:
+            name → (onsets int64[k], offsets int64[k]) row positions.
+
+        Examples:
+            ev = stimulus_events(df)
+            onsets, offsets = ev["VisualStim"]
+        """
+        names = _names(channels)
+        ch, on, off = _on_runs(
+            _stack(channels, names),
+            default_gap if max_gap is None else max_gap,
+            default_min if min_on is None else min_on,
+        )
+        cuts = np.searchsorted(ch, np.arange(len(names) + 1))
+        return {
+            name: (on[cuts[i]:cuts[i + 1]].astype(np.int64), off[cuts[i]:cuts[i + 1]].astype(np.int64))
+            for i, name in enumerate(names)
+        }
+
+    def clean_stimuli(
+        channels: Mapping[str, np.ndarray] | pd.DataFrame,
+        max_gap: int | None = None,
+        min_on: int | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Cleaned 0/1 stimulus columns (same rules as stimulus_events).
+
+        Returns:
+            name → int8[n].
+        """
+        names = _names(channels)
+        n = len(np.asarray(channels[names[0]])) if names else 0
+        out = {}
+        for name, (on, off) in stimulus_events(channels, max_gap, min_on).items():
+            d = np.zeros(n + 1, dtype=np.int8)
+            d[on] = 1  # runs are maximal → onsets and offsets never coincide
+            d[off] = -1
+            out[name] = np.cumsum(d[:-1], dtype=np.int8)
+        return out
+
+    def stem_stimulus_events(
+        stem: str,
+        path: Mapping | None = None,
+        refresh: bool = False,
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """
+        Stimulus events of a stem's tracked CSV (cached per stem).
+
+        Args:
+            stem: Base stem.
+            path: Optional PATH override.
+            refresh: Ignore the cache.
+
+        Returns:
+            name → (onsets, offsets) row positions in the tracked CSV.
+
+        Examples:
+            onsets, _ = stem_stimulus_events("BASE_fly1")["VisualStim"]
+        """
+        p = default_path if path is None else path
+        file = Path(p["tracked_path"](stem))
+        st = file.stat()
+        key = (str(file), st.st_size, st.st_mtime_ns, default_gap, default_min)
+        with lock:
+            hit = cache.get(stem)
+        if hit is not None and hit[0] == key and not refresh:
+            return hit[1]
+        with open(file, "rb") as fh:
+            header = fh.readline().decode("utf-8", "replace").rstrip("\r\n").split(",")
+        cols = [c for c in stim_cols if c in header]
+        df = pd.read_csv(file, usecols=cols, dtype={c: "float32" for c in cols}, engine="c")
+        events = stimulus_events(df)
+        with lock:
+            cache[stem] = (key, events)
+        return events
+
+    return {
+        "stimulus_events": stimulus_events,
+        "clean_stimuli": clean_stimuli,
+        "stem_stimulus_events": stem_stimulus_events,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(
+    path: Mapping,
+    param: Mapping,
+    max_gap: int,
+    min_on: int,
+) -> dict[str, Callable]:
+    """
+    Generate stimulus functions.
+
+    Args:
+        path: PATH mapping (tracked_path).
+        param: PARAM registry ('stimuli' tag).
+        max_gap: Default zero-gap fill length (frames).
+        min_on: Default minimum ON length (frames).
+
+    Returns:
+        Dictionary with 3 stimulus functions.
+
+    Validation:
+        Asserts 3 functions returned and non-negative thresholds.
+    """
+    assert max_gap >= 0 and min_on >= 0, f"Invalid stimulus thresholds: max_gap={max_gap}, min_on={min_on}"
+    functions = _create_stimulus_functions(path, param, max_gap, min_on)
+
+    # Validation
+    assert len(functions) == 3, f"Expected 3 stimulus functions, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
@@ -0,0 +1,154 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+benchmark.py — Pipeline Benchmark Controller
+=============================================
+
+End-to-end stage benchmarks on generated inputs, with a regression gate
+against a baseline recorded on the same setup.
+
+Overview:
+    - Every pipeline stage (load, stimulus clean, features, Layer1,
+      denoise, Layer2, Resistant, Behavior, full classify, pose, QC, publish)
+      timed on its own inputs at several recording sizes
+    - Throughput (frames/s, best of interleaved samples) and peak traced
+      memory (MB) per stage × size
+    - Results stored as JSON; the gate fails when a stage stays slower or
+      larger than the baseline beyond TOLERANCE after GATE_RETRIES
+      re-measurements
+    - The gate refuses a baseline recorded on another setup (BASELINE_MATCH
+      keys of meta); reference baselines are committed per setup in
+      BASELINE_DIR, and BASELINE_FILE overrides them on one machine
+    - Extra stages plug in with register_stage
+    - Fault round trip: a generated experiment with every generator fault
+      is loaded and scored end to end (check_faults)
+    - Shared-root check: several processes split one root through leases,
+      each stem scored exactly once (check_leases)
+
+Architecture:
+    benchmark.py (controller) → _benchmark/ (coordinator) → 6 workers
+
+Public API:
+    BC_BENCHMARK dictionary (immutable MappingProxyType)
+
+Usage:
+    from BehaviorClassifier import BC_BENCHMARK
+
+    BC_BENCHMARK["check_regressions"]()                  # gate vs this setup's baseline
+    results = BC_BENCHMARK["run_benchmarks"](sizes=[36_000], stages=["layer2"])
+    print(BC_BENCHMARK["format_report"](BC_BENCHMARK["compare_results"](results)))
+    BC_BENCHMARK["save_baseline"](BC_BENCHMARK["run_benchmarks"]())   # override on this machine
+    BC_BENCHMARK["save_baseline"](results, reference=True)             # committed reference of this setup
+    BC_BENCHMARK["check_faults"]()                       # faulted data loads and scores
+    BC_BENCHMARK["check_leases"]()                       # owners split a shared root
+
+    python -m BehaviorClassifier.benchmark              # fault + lease checks + gate + report (exit 1 on failure)
+    python -m BehaviorClassifier.benchmark --update     # record this machine's override
+    python -m BehaviorClassifier.benchmark --reference  # record this setup's committed reference
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import importlib
+import sys
+import tempfile
+from pathlib import Path
+from types import MappingProxyType
+
+from Config.path import configure as configure_path
+from BehaviorClassifier import BC_CLASSIFIER, BC_LOADERS, BC_SCHEDULER, BC_STORAGE, BC_SYNTHETIC, BC_UTILS
+
+#%% CELL 02 — USER CONSTANTS
+"""
+Benchmark sizes, timing and gate defaults.
+"""
+BENCH_SIZES: tuple[int, ...] = (36_000, 216_000, 1_080_000)   # 10 min, 1 h, 5 h at 60 fps
+BENCH_SEED: int = 0                         # generated inputs (same seed → same data)
+BENCH_REPEAT: int = 5                       # interleaved timing rounds (best sample kept)
+MIN_SAMPLE_SEC: float = 0.2                 # short stages loop until a sample lasts this long
+
+TOLERANCE: float = 0.05                     # fail beyond 5% slower / larger than baseline
+MEMORY_SLACK_MB: float = 0.5                # absolute peak allowance on top of TOLERANCE
+GATE_RETRIES: int = 2                       # re-measure regressed stage × size before failing
+
+BASELINE_DIR: Path = Path(__file__).resolve().parent / "_benchmark" / "baselines"   # committed, one per setup
+BASELINE_FILE: Path = Path.home() / ".cache" / "bc_benchmark" / "baseline.json"   # optional per-machine override
+# meta facts the run must share with the baseline (else the gate refuses it)
+BASELINE_MATCH: tuple[str, ...] = ("machine", "cpu_count", "kernel_backend", "python", "numpy", "pandas")
+WORK_DIR: Path = Path(tempfile.gettempdir()) / "bc_benchmark"   # load / publish scratch files
+PUBLISH_DURABILITY: str = "none"            # time the write path, not the disk's fsync
+
+# Fault round trip: every inject_faults fault, per table kind
+_ALL_FAULTS: dict = {"nan_runs": 20, "nan_run_frames": 60, "out_of_range": 0.001, "stim_glitches": 3, "drop_frames": 0.01}
+FAULT_CHECK: dict[str, dict] = {
+    "base": _ALL_FAULTS,
+    "tracked": _ALL_FAULTS,
+    "sleap": {**_ALL_FAULTS, "drop_columns": ("Head.Confidence",)},   # tracked columns are all required
+}
+FAULT_CHECK_FRAMES: int = 36_000            # frames per fly
+FAULT_CHECK_FLIES: int = 2
+FAULT_CHECK_DIR: Path = WORK_DIR / "faults"   # experiment root (rewritten each check)
+
+# Shared-root lease check: owner processes on one root
+LEASE_CHECK_PROCS: int = 3
+LEASE_CHECK_FLIES: int = 24                 # stems (tiny files; score stage sleeps)
+LEASE_CHECK_DIR: Path = WORK_DIR / "leases"   # experiment root (rewritten each check)
+
+#%% CELL 03 — DELEGATION TO SUBPACKAGE
+
+_benchmark = importlib.import_module("._benchmark", package="BehaviorClassifier")
+
+BC_BENCHMARK: MappingProxyType = _benchmark.configure(
+    synthetic=BC_SYNTHETIC,
+    utils=BC_UTILS,
+    loaders=BC_LOADERS,
+    classifier=BC_CLASSIFIER,
+    storage=BC_STORAGE,
+    scheduler=BC_SCHEDULER,
+    sizes=BENCH_SIZES,
+    seed=BENCH_SEED,
+    retries=GATE_RETRIES,
+    repeat=BENCH_REPEAT,
+    min_sample_sec=MIN_SAMPLE_SEC,
+    tolerance=TOLERANCE,
+    memory_slack_mb=MEMORY_SLACK_MB,
+    baseline_file=BASELINE_FILE,
+    baseline_dir=BASELINE_DIR,
+    match_keys=BASELINE_MATCH,
+    work_dir=WORK_DIR,
+    publish_durability=PUBLISH_DURABILITY,
+    path_for=lambda root: configure_path(root=root),
+    fault_check=FAULT_CHECK,
+    fault_frames=FAULT_CHECK_FRAMES,
+    fault_flies=FAULT_CHECK_FLIES,
+    fault_dir=FAULT_CHECK_DIR,
+    lease_procs=LEASE_CHECK_PROCS,
+    lease_flies=LEASE_CHECK_FLIES,
+    lease_dir=LEASE_CHECK_DIR,
+)
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["BC_BENCHMARK"]
+
+#%% CELL 05 — COMMAND LINE
+"""
+When run directly: run the fault round trip and lease check, then measure, gate and print the
+comparison (exit status 1 on a failure or regression), or record the baseline
+(--update: this machine's override, --reference: the committed reference).
+"""
+if __name__ == "__main__":
+    try:
+        BC_BENCHMARK["check_faults"]()
+        BC_BENCHMARK["check_leases"]()
+    except RuntimeError as exc:
+        sys.exit(str(exc))
+    _progress = lambda stage, n, m: print(f"{stage:<16}{n:>10}  {m['fps']:>14,.0f} frames/s  {m['peak_mb']:>9.1f} MB", flush=True)
+    _results = BC_BENCHMARK["run_benchmarks"](progress=_progress)
+    if "--update" in sys.argv[1:] or "--reference" in sys.argv[1:]:
+        print(f"Baseline written: {BC_BENCHMARK['save_baseline'](_results, reference='--reference' in sys.argv[1:])}")
+    else:
+        try:
+            print(BC_BENCHMARK["format_report"](BC_BENCHMARK["check_regressions"](_results)))
+        except (FileNotFoundError, RuntimeError) as exc:
+            sys.exit(str(exc))
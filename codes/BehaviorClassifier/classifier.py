@@ -0,0 +1,115 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+classifier.py — Classifier Controller
+======================================
+
+Behavior classification kernels for the scored pipeline.
+
+Overview:
+    - Feature construction (Position mm, Speed mm/s, Motion) and
+      Layer1 / Resistant / Behavior stages as row-wise array kernels
+    - Speed_Denoised: guarded centered rolling mean from cumulative sums
+      (jump and stimulus-response guards as precomputed masks)
+    - Layer2 / Layer2_Denoised windowed voting on integer label codes
+      (cumulative one-hot counts, O(frames × labels))
+    - Multi-fly batch: flies of one BASE stacked into (flies, frames)
+      matrices on the shared FrameIndex, every stage run once
+    - Pose table from sleap (view selection, orientation, mm positions)
+    - Table QC: ok / flag / error against the PARAM column set and domains
+    - Hot kernels behind a backend registry: NumPy reference, Numba JIT
+      when installed (runtime switch + parity check)
+
+Architecture:
+    classifier.py (controller) → _classifier/ (coordinator) → 7 workers
+
+Public API:
+    BC_CLASSIFIER dictionary (immutable MappingProxyType)
+
+Usage:
+    from BehaviorClassifier import BC_CLASSIFIER
+
+    scored = BC_CLASSIFIER["score_flies"]([tracked_fly1, tracked_fly2, tracked_fly3])
+    df["Speed_Denoised"] = BC_CLASSIFIER["speed_denoised"](df)
+    df["Layer2"] = BC_CLASSIFIER["layer2"](df["Layer1"])
+    df["Layer2_Denoised"] = BC_CLASSIFIER["layer2_denoised"](df["Layer1_Denoised"])
+    pose = BC_CLASSIFIER["pose_table"](sleap)
+    BC_CLASSIFIER["qc_table"](scored, tag="scored")["outcome"]   # "ok" | "flag" | "error"
+
+    BC_CLASSIFIER["use_backend"]("numpy")        # runtime switch (this process)
+    BC_CLASSIFIER["check_backends"]()            # {backend: {kernel: bit-identical}}
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import importlib
+from types import MappingProxyType
+
+from Config import PARAM
+from BehaviorClassifier import BC_UTILS
+
+#%% CELL 02 — USER CONSTANTS
+"""
+Classifier timebase, thresholds and windows.
+"""
+FPS: float = 60.0                           # camera frame rate (frames/s)
+FRAME_COLUMN: str = "FrameIndex"            # shared timebase (aligned to BASE.FrameID)
+
+# Feature construction
+ARENA_MM: tuple[float, float] = (30.0, 30.0)  # arena (width, height); Position = normalized × arena
+MOTION_PIXEL_THRESHOLD: float = 0.0         # PixelChange above this → Motion = 1
+
+# Speed thresholds (mm/s)
+HIGH_SPEED: float = 75.0                    # Jump threshold
+LOW_SPEED: float = 4.0                      # Walk / Stationary boundary
+
+# Layer1_Denoised / Behavior_Denoised
+NOISE_TOLERANCE: int = 3                    # micro-bouts ≤ 3 frames removed (Jump kept)
+MAX_NAN_BOUT_CLEAN_SEC: float = 1.0         # fill NaN gaps ≤ 1 s bounded by the same label
+
+# Speed_Denoised
+SPEED_DENOISE_AVG_WINDOW_SEC: float = 0.5   # centered smoothing window
+SKIP_RESPONSE_WINDOW: bool = True           # keep raw Speed around stimulus onsets
+STARTLE_PRE_STIM_SEC: float = 1.0           # response window before onset
+STARTLE_POST_STIM_SEC: float = 1.0          # response window after onset
+
+# Layer2 voting
+LAYER2_AVG_WINDOW_SEC: float = 0.1          # centered voting window
+LAYER2_MIN_VALID_FRACTION: float = 0.5      # Layer2_Denoised: valid votes must exceed this share
+VOTE_PRIORITY: tuple = ("Jump", "Walk", "Stationary", "Freeze")  # tie order (label suffixes)
+
+# Kernel backend
+KERNEL_BACKEND: str = "auto"                # "auto" (numba if installed) | "numpy" | "numba"
+
+# Table QC
+QC_MAX_NAN_FRACTION: float = 0.2            # NaN share per column above this → flag
+
+#%% CELL 03 — DELEGATION TO SUBPACKAGE
+
+_classifier = importlib.import_module("._classifier", package="BehaviorClassifier")
+
+BC_CLASSIFIER: MappingProxyType = _classifier.configure(
+    param=PARAM,
+    utils=BC_UTILS,
+    fps=FPS,
+    frame_column=FRAME_COLUMN,
+    arena_mm=ARENA_MM,
+    motion_threshold=MOTION_PIXEL_THRESHOLD,
+    high_speed=HIGH_SPEED,
+    low_speed=LOW_SPEED,
+    noise_tolerance=NOISE_TOLERANCE,
+    max_gap_sec=MAX_NAN_BOUT_CLEAN_SEC,
+    speed_window_sec=SPEED_DENOISE_AVG_WINDOW_SEC,
+    layer2_window_sec=LAYER2_AVG_WINDOW_SEC,
+    layer2_min_valid_fraction=LAYER2_MIN_VALID_FRACTION,
+    vote_priority=VOTE_PRIORITY,
+    pre_stim_sec=STARTLE_PRE_STIM_SEC,
+    post_stim_sec=STARTLE_POST_STIM_SEC,
+    skip_response_window=SKIP_RESPONSE_WINDOW,
+    kernel_backend=KERNEL_BACKEND,
+    qc_max_nan_fraction=QC_MAX_NAN_FRACTION,
+)
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["BC_CLASSIFIER"]
@@ -0,0 +1,75 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+loaders.py — Artifact Loaders Controller
+=========================================
+
+Fast readers for tracked / sleap / scored / pose CSV artifacts.
+
+Overview:
+    - Parallel chunked parsing of one large CSV into PARAM-typed buffers
+      (newline-aligned chunks, threads, no concatenation copies)
+    - Sidecar FrameIndex → byte offset index for frame-window reads
+    - Column (list / PARAM tag / role / type) and frame-range pushdown
+    - Compact scored twin (*_scored.npz: float32 + RLE label bouts)
+
+Architecture:
+    loaders.py (controller) → _loaders/ (coordinator) → 4 workers
+
+Public API:
+    BC_LOADERS dictionary (immutable MappingProxyType)
+
+Usage:
+    from BehaviorClassifier import BC_LOADERS
+
+    df = BC_LOADERS["read_csv_parallel"](PATH["tracked_path"](stem))
+    win = BC_LOADERS["read_frames"](PATH["scored_path"](stem), 5400, 7200)
+    bin = BC_LOADERS["load_stem"](stem, "scored", role="binary", frames=(5400, 7200))
+    BC_LOADERS["compact_scored"](stem)   # writes PATH["scored_compact_path"](stem)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import importlib
+from types import MappingProxyType
+
+from Config import PATH
+from BehaviorClassifier import BC_UTILS
+
+#%% CELL 02 — USER CONSTANTS
+"""
+Loader defaults (override per call via loader arguments).
+"""
+LOADER_WORKERS: int | None = None           # None → os.cpu_count()
+CHUNK_BYTES: int = 32 * 1024**2             # target bytes per parsed chunk
+MIN_PARALLEL_BYTES: int = 8 * 1024**2       # smaller spans parse on one thread
+
+FRAME_COLUMN: str = "FrameIndex"            # shared PARAM column (tracked/sleap/pose/scored)
+INDEX_STRIDE: int = 256                     # rows between stored byte offsets
+INDEX_BLOCK_BYTES: int = 8 * 1024**2        # read size of the index pass
+INDEX_SUFFIX: str = ".fidx.npz"             # sidecar: .<name>.csv.fidx.npz
+
+COMPACT_FLOAT_DTYPE: str = "float32"        # float storage in *_scored.npz
+COMPACT_COMPRESS: bool = True               # zlib members (smaller, still fast to load)
+
+#%% CELL 03 — DELEGATION TO SUBPACKAGE
+
+_loaders = importlib.import_module("._loaders", package="BehaviorClassifier")
+
+BC_LOADERS: MappingProxyType = _loaders.configure(
+    path=PATH,
+    utils=BC_UTILS,
+    max_workers=LOADER_WORKERS,
+    chunk_bytes=CHUNK_BYTES,
+    min_parallel_bytes=MIN_PARALLEL_BYTES,
+    frame_column=FRAME_COLUMN,
+    index_stride=INDEX_STRIDE,
+    index_block_bytes=INDEX_BLOCK_BYTES,
+    index_suffix=INDEX_SUFFIX,
+    compact_float_dtype=COMPACT_FLOAT_DTYPE,
+    compact_compress=COMPACT_COMPRESS,
+)
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["BC_LOADERS"]
@@ -0,0 +1,126 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+scheduler.py — Batch Scheduler Controller
+==========================================
+
+Turn PATH artifact relationships into per-stem task DAGs and run them
+on a bounded process pool.
+
+Overview:
+    - Per-stem DAG: preflight → score / pose, with the Error branch
+      (error copies) triggered by any failing stage
+    - Flag outcomes keep the DAG on the success path (outputs → Flag/)
+    - Bounded ProcessPoolExecutor (in-flight tasks ≤ workers)
+    - Retries per task, cooperative cancellation
+    - Resumable append-only JSONL journal (ok / flag outcomes keyed on
+      input size + mtime; failed tasks always rerun)
+    - Source digests of finished stems recorded after each batch
+      (PATH['stale_outputs'](method="hash"))
+    - Flag / error / failed tasks written to per-run report shards and
+      merged into REPORT_FLAG / REPORT_ERROR when the batch ends
+    - File leases (O_CREAT|O_EXCL + heartbeat) to split stems between
+      machines sharing one experiment root
+    - Dry-run planner: actions + CPU/memory estimates from file sizes
+    - Memory governor: admit tasks while projected RSS stays under budget
+
+Architecture:
+    scheduler.py (controller) → _scheduler/ (coordinator) → 6 workers
+
+Public API:
+    BC_SCHEDULER dictionary (immutable MappingProxyType)
+
+Usage:
+    from BehaviorClassifier import BC_SCHEDULER
+
+    # Stage functions must be module-level (picklable):
+    #     fn(stem: str, paths: dict[str, Path]) -> "ok" | "flag" | "error" | None
+    results = BC_SCHEDULER["run_batch"]({
+        "preflight": my_preflight,
+        "score": my_score,
+        "pose": my_pose,
+        "error": my_error_copies,
+    })
+
+    # Admit by memory instead of a fixed worker count
+    with BC_SCHEDULER["open_governor"]() as gov:
+        BC_SCHEDULER["run_batch"](stages, **gov.hooks())
+
+    # Size the session before running
+    plan = BC_SCHEDULER["plan_run"]()
+    plan["score"], plan["stale"], plan["totals"]["cpu_sec"]
+
+    # Multi-machine: every machine runs the same call on the shared root;
+    # stems are claimed one at a time as they are submitted, released when
+    # settled, and each owner keeps its own journal
+    with BC_SCHEDULER["open_leases"]() as leases:
+        BC_SCHEDULER["run_batch"](stages, leases=leases)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import importlib
+import os
+from types import MappingProxyType
+
+from Config import PATH
+from BehaviorClassifier import BC_STORAGE, BC_UTILS
+
+#%% CELL 02 — USER CONSTANTS
+"""
+Execution defaults (override per call via run_batch/run_dag/open_leases/plan_run/open_governor arguments).
+"""
+MAX_WORKERS: int | None = None          # None → os.cpu_count()
+MAX_RETRIES: int = 2                    # extra attempts after the first failure
+JOURNAL_NAME: str = ".scheduler_journal.jsonl"   # under pBehaviorClassification
+RECORD_DIGESTS: bool = True             # hash inputs of finished stems (hash staleness)
+REPORT_OUTCOMES: bool = True            # flag / error / failed tasks → REPORT_FLAG / REPORT_ERROR
+
+LEASE_DIR: str = ".leases"              # under pBehaviorClassification
+LEASE_TTL_SEC: float = 120.0            # no heartbeat for this long → stale
+LEASE_HEARTBEAT_SEC: float = 30.0       # must be < LEASE_TTL_SEC
+
+# Planner calibration (measure on a representative stem, then update)
+PLAN_COSTS: dict[str, float] = {
+    "score_us_per_frame": 4.0,          # CPU µs per tracked frame (score stage)
+    "pose_us_per_frame": 6.0,           # CPU µs per sleap frame (pose stage)
+    "memory_overhead": 3.0,             # working copies per loaded row
+}
+PLAN_REQUIRE_SLEAP: bool = False        # True → missing sleap planned as Error
+
+MEMORY_BUDGET_FRACTION: float = 0.75    # governor budget = fraction of physical RAM
+GOVERNOR_SAMPLE_BYTES: int = 64 * 1024  # head bytes read per file for row estimates (planner: one file per kind)
+
+#%% CELL 03 — DELEGATION TO SUBPACKAGE
+
+def _physical_memory() -> int:
+    """Physical RAM in bytes (4 GiB if the platform does not report it)."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return 4 * 1024**3
+
+
+_scheduler = importlib.import_module("._scheduler", package="BehaviorClassifier")
+
+BC_SCHEDULER: MappingProxyType = _scheduler.configure(
+    path=PATH,
+    max_workers=MAX_WORKERS,
+    max_retries=MAX_RETRIES,
+    journal_name=JOURNAL_NAME,
+    record_digests=RECORD_DIGESTS,
+    report_outcomes=REPORT_OUTCOMES,
+    lease_dir=LEASE_DIR,
+    lease_ttl=LEASE_TTL_SEC,
+    lease_heartbeat=LEASE_HEARTBEAT_SEC,
+    utils=BC_UTILS,
+    storage=BC_STORAGE,
+    plan_costs=PLAN_COSTS,
+    plan_require_sleap=PLAN_REQUIRE_SLEAP,
+    memory_budget=int(_physical_memory() * MEMORY_BUDGET_FRACTION),
+    governor_sample_bytes=GOVERNOR_SAMPLE_BYTES,
+)
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["BC_SCHEDULER"]
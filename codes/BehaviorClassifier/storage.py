@@ -0,0 +1,109 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+storage.py — Storage Controller
+================================
+
+Storage-side helpers for experiment roots on slow mounts
+(Google Drive under Colab, FUSE, network shares).
+
+Overview:
+    - Opt-in local staging cache (auto-enabled on slow mounts)
+    - Bounded-concurrency prefetch of tracked / sleap / arena images
+    - LRU eviction under a byte budget
+    - Batched atomic write-back of outputs (temp_path + os.replace)
+    - Batched atomic publish engine: background writer, one sync per batch,
+      one fsync per output folder
+    - Crash recovery: sweep orphaned '.~tmp' files (finish the ones a commit
+      manifest records, delete the rest)
+    - Error copies via hardlink → reflink → streamed copy (hash-verified)
+    - Sharded REPORT_ERROR / REPORT_FLAG writers, sorted merge, indexed reads
+
+Architecture:
+    storage.py (controller) → _storage/ (coordinator) → 5 workers
+
+Public API:
+    BC_STORAGE dictionary (immutable MappingProxyType)
+
+Usage:
+    from BehaviorClassifier import BC_STORAGE
+
+    with BC_STORAGE["open_staging"]() as stage:      # None → auto-detect
+        stage.prefetch_stems(stems)
+        with stage.reading(PATH["tracked_path"](stem)) as p:   # pinned while read
+            df = pd.read_csv(p)
+        with stage.output(PATH["scored_path"](stem)) as p:     # committed on exit
+            df.to_csv(p, index=False)
+    # leaving the block flushes committed outputs
+
+    with BC_STORAGE["open_publisher"]() as pub:
+        pub.submit(PATH["scored_path"](stem), lambda p: df.to_csv(p, index=False))
+
+    BC_STORAGE["recover_temp_files"](dry_run=True)   # after a crashed run
+
+    records = BC_STORAGE["copy_error_inputs"](stem)  # [{"mode": "hardlink", ...}]
+
+    with BC_STORAGE["open_report_shard"]("error") as shard:   # in each worker
+        shard.add(stem, stage="preflight", reason="missing columns")
+    BC_STORAGE["merge_reports"]()                              # end of run (run_batch does this itself)
+    BC_STORAGE["read_report"]("error", base="20240101_Exp")
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import importlib
+import tempfile
+from pathlib import Path
+from types import MappingProxyType
+
+from Config import PATH
+
+#%% CELL 02 — USER CONSTANTS
+"""
+Staging and publish defaults (override per call via open_staging /
+open_publisher / publish_batch / recover_temp_files / copy_error_* / report arguments).
+"""
+STAGING_DIR: Path = Path(tempfile.gettempdir()) / "bc_staging"   # local SSD (one subfolder per root)
+STAGING_BUDGET_BYTES: int = 20 * 1024**3    # cached inputs (LRU above this)
+STAGING_WORKERS: int = 8                    # concurrent copies (I/O-bound)
+WRITEBACK_BATCH: int = 64                   # pending outputs per auto-flush
+SLOW_FS_TYPES: tuple[str, ...] = ("fuse", "nfs", "cifs", "smb", "9p", "sshfs", "davfs")
+
+PUBLISH_BATCH_SIZE: int = 256               # outputs per commit
+PUBLISH_MAX_DELAY: float = 0.5              # seconds a batch waits to fill
+PUBLISH_DURABILITY: str = "batch"           # "batch" | "file" | "none"
+
+RECOVERY_MIN_AGE_SEC: float = 300.0         # younger temps may be live writes
+RECOVERY_WORKERS: int = 8
+
+ERROR_COPY_MODES: tuple[str, ...] = ("hardlink", "reflink", "copy")   # tried in order
+ERROR_COPY_VERIFY: bool = True              # inode / blake2b check before publish
+ERROR_COPY_LOG: str | None = ".error_copies.jsonl"   # under pError (None → off)
+
+REPORT_SHARD_DIR: str = ".shards"           # next to REPORT_ERROR / REPORT_FLAG
+
+#%% CELL 03 — DELEGATION TO SUBPACKAGE
+
+_storage = importlib.import_module("._storage", package="BehaviorClassifier")
+
+BC_STORAGE: MappingProxyType = _storage.configure(
+    path=PATH,
+    staging_dir=STAGING_DIR,
+    staging_budget_bytes=STAGING_BUDGET_BYTES,
+    staging_workers=STAGING_WORKERS,
+    writeback_batch=WRITEBACK_BATCH,
+    slow_fs_types=SLOW_FS_TYPES,
+    publish_batch_size=PUBLISH_BATCH_SIZE,
+    publish_max_delay=PUBLISH_MAX_DELAY,
+    publish_durability=PUBLISH_DURABILITY,
+    recovery_min_age=RECOVERY_MIN_AGE_SEC,
+    recovery_workers=RECOVERY_WORKERS,
+    copy_modes=ERROR_COPY_MODES,
+    copy_verify=ERROR_COPY_VERIFY,
+    copy_log_name=ERROR_COPY_LOG,
+    report_shard_dir=REPORT_SHARD_DIR,
+)
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["BC_STORAGE"]
@@ -0,0 +1,129 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+synthetic.py — Synthetic Data Controller
+=========================================
+
+Generated BASE / tracked / sleap inputs of any length and fly count,
+driven by the PARAM column specs, for benchmarks and stress tests.
+
+Overview:
+    - Stimulus trains for every PARAM 'stimuli' channel from a schedule,
+      encoded into the BASE GPIO word
+    - Ground-truth behavior bouts (Jump / Walk / Stationary / Freeze) with
+      stimulus responses, and a trajectory / pixel trace that the
+      classifier maps back to them
+    - Tables typed, ordered and range-clipped from PARAM; spec_violations()
+      reports any column breaking its ParamSpec
+    - Fault injection: NaN runs, out-of-range values, stimulus glitches,
+      dropped frames, missing columns
+    - Full experiment trees written through PATH folders
+
+Architecture:
+    synthetic.py (controller) → _synthetic/ (coordinator) → 5 workers
+
+Public API:
+    BC_SYNTHETIC dictionary (immutable MappingProxyType)
+
+Usage:
+    from BehaviorClassifier import BC_SYNTHETIC
+
+    rec = BC_SYNTHETIC["recording"](216_000, n_flies=3, seed=1)
+    BC_SYNTHETIC["spec_violations"](rec["tracked"][0], tag="tracked")   # → {}
+
+    from Config.path import configure
+    truth = BC_SYNTHETIC["write_experiment"](configure(root=Path("/scratch/SynthExp")),
+                                             n_bases=10, n_flies=3, seed=1,
+                                             faults={"tracked": {"nan_runs": 5}}, fault_fraction=0.2)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import importlib
+from types import MappingProxyType
+
+from Config import PARAM, PATH
+from BehaviorClassifier import BC_UTILS
+from BehaviorClassifier.classifier import ARENA_MM, FPS   # generated data matches what is scored
+
+#%% CELL 02 — USER CONSTANTS
+"""
+Generator defaults (recording length, stimuli, behavior statistics;
+FPS and ARENA_MM come from classifier.py).
+"""
+RECORDING_SEC: float = 600.0                # default recording length (write_experiment)
+BASE_PREFIX: str = "Synthetic"              # BASE names Synthetic001, Synthetic002, ...
+FRAME_ID_START_MAX: int = 1_000_000         # BASE FrameID starts at a random value below this
+CSV_FLOAT_FORMAT: str | None = "%.9g"       # written floats (None → full repr; slower, larger)
+
+# Stimuli: channel → (first onset s, period s, ON s); period ≤ 0 → single pulse
+STIMULUS_SCHEDULE: dict[str, tuple[float, float, float]] = {
+    "VisualStim": (30.0, 60.0, 0.5),
+    "Stim0": (45.0, 120.0, 1.0),
+    "Stim1": (105.0, 120.0, 1.0),
+}
+
+# Behavior bouts (by label suffix)
+BOUT_MEAN_SEC: dict[str, float] = {"Jump": 0.05, "Walk": 1.5, "Stationary": 2.0, "Freeze": 4.0}
+BOUT_WEIGHTS: dict[str, float] = {"Jump": 0.05, "Walk": 0.40, "Stationary": 0.30, "Freeze": 0.25}
+RESPONSES: dict[str, tuple[float, float, float]] = {   # per onset: (probability, pre s, post s)
+    "Jump": (0.3, 0.0, 0.1),
+    "Freeze": (0.4, 1.5, 2.5),                  # covers the Resistant window (±1 s)
+}
+
+# Kinematics (ranges clear of classifier HIGH_SPEED 75 / LOW_SPEED 4 mm/s)
+SPEED_RANGE_MM_S: dict[str, tuple[float, float]] = {
+    "Jump": (90.0, 150.0),
+    "Walk": (8.0, 40.0),
+    "Stationary": (0.5, 2.5),
+    "Freeze": (0.0, 0.0),
+}
+HEADING_TURN_SD: float = 0.2                # heading random walk (rad / frame)
+PIXELS_PER_MM_S: float = 2.0                # PixelChange ~ 1 + Poisson(2 × speed); Freeze → 0
+
+# Sleap keypoints: part → (forward, left) in body lengths from the centroid
+BODY_LENGTH_MM: float = 2.5
+BODY_OFFSETS: dict[str, tuple[float, float]] = {
+    "Head": (0.5, 0.0),
+    "Thorax": (0.0, 0.0),
+    "Abdomen": (-0.5, 0.0),
+    "LeftWing": (-0.3, 0.25),
+    "RightWing": (-0.3, -0.25),
+}
+POSITION_NOISE_MM: float = 0.05             # keypoint noise (SD)
+CONFIDENCE_BETA: tuple[float, float] = (8.0, 2.0)  # confidences ~ Beta(8, 2) (mean 0.8)
+
+# Faults never corrupt the timebase (rows may still be dropped)
+PROTECTED_COLUMNS: tuple[str, ...] = ("FrameIndex", "FrameID", "Timestamp")
+
+#%% CELL 03 — DELEGATION TO SUBPACKAGE
+
+_synthetic = importlib.import_module("._synthetic", package="BehaviorClassifier")
+
+BC_SYNTHETIC: MappingProxyType = _synthetic.configure(
+    param=PARAM,
+    path=PATH,
+    utils=BC_UTILS,
+    fps=FPS,
+    arena_mm=ARENA_MM,
+    stimulus_schedule=STIMULUS_SCHEDULE,
+    bout_mean_sec=BOUT_MEAN_SEC,
+    bout_weights=BOUT_WEIGHTS,
+    speed_range=SPEED_RANGE_MM_S,
+    responses=RESPONSES,
+    turn_sd=HEADING_TURN_SD,
+    pixels_per_mm_s=PIXELS_PER_MM_S,
+    frame_id_start_max=FRAME_ID_START_MAX,
+    body_length_mm=BODY_LENGTH_MM,
+    body_offsets=BODY_OFFSETS,
+    position_noise_mm=POSITION_NOISE_MM,
+    confidence_beta=CONFIDENCE_BETA,
+    protected_columns=PROTECTED_COLUMNS,
+    recording_sec=RECORDING_SEC,
+    base_prefix=BASE_PREFIX,
+    float_format=CSV_FLOAT_FORMAT,
+)
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["BC_SYNTHETIC"]
@@ -0,0 +1,74 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+utils.py — Utilities Controller
+================================
+
+Shared helpers for the BehaviorClassifier bundles.
+
+Overview:
+    - PARAM-derived column selection (by tag / role / type)
+    - PARAM type → pandas dtype, in-memory widths, CSV text widths
+      (sizing estimates without reading CSV content)
+    - Run-length-encoded label bouts (encode / decode / filter / merge,
+      micro-bout removal, gap bridging)
+    - Stimulus cleaning + onset/offset extraction for all 'stimuli'
+      channels in one vectorized pass (cached per stem)
+
+Architecture:
+    utils.py (controller) → _utils/ (coordinator) → 3 workers
+
+Public API:
+    BC_UTILS dictionary (immutable MappingProxyType)
+
+Usage:
+    from BehaviorClassifier import BC_UTILS
+
+    cols = BC_UTILS["select_columns"](tag="tracked")
+    df = pd.read_csv(fp, usecols=cols, dtype=BC_UTILS["column_dtypes"](cols))
+    BC_UTILS["row_bytes"](cols)          # bytes per row in memory
+    BC_UTILS["csv_row_width"](cols)      # bytes per row on disk (average)
+    bouts = BC_UTILS["encode_bouts"](df["Layer1"], column="Layer1")
+    onsets, offsets = BC_UTILS["stimulus_events"](df)["VisualStim"]
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import importlib
+from types import MappingProxyType
+
+from Config import PARAM, PATH
+
+#%% CELL 02 — USER CONSTANTS
+"""
+Sizing defaults (average CSV characters per value, by PARAM type).
+Binary and domain-string columns are derived from PARAM directly.
+"""
+TEXT_WIDTHS: dict[str, float] = {
+    "int": 6.0,         # frame indices / pixel counts
+    "float": 18.0,      # pandas float repr (up to 17 significant digits)
+    "string": 10.0,     # free-text strings without a domain
+    "bool": 5.0,        # 'True' / 'False'
+}
+STRING_BYTES: int = 64  # object string: pointer + small str object
+
+# Stimulus cleaning (frames)
+STIM_MAX_GAP: int = 3   # fill OFF gaps of ≤ 3 frames inside a stimulus
+STIM_MIN_ON: int = 3    # drop ON runs shorter than 3 frames (spurious)
+
+#%% CELL 03 — DELEGATION TO SUBPACKAGE
+
+_utils = importlib.import_module("._utils", package="BehaviorClassifier")
+
+BC_UTILS: MappingProxyType = _utils.configure(
+    param=PARAM,
+    text_widths=TEXT_WIDTHS,
+    string_bytes=STRING_BYTES,
+    path=PATH,
+    stim_max_gap=STIM_MAX_GAP,
+    stim_min_on=STIM_MIN_ON,
+)
+
+#%% CELL 04 — EXPORTS
+
+__all__ = ["BC_UTILS"]
@@ -6,35 +6,43 @@ _path/__init__.py — PATH Coordinator
 Orchestrates all path workers and assembles the final PATH dictionary.
 
 Architecture:
-    8 workers → coordinator → controller → PATH export
+    10 workers → coordinator → controller → PATH export
     
-Workers (8):
+Workers (10):
     1. roots.py: Environment detection + root resolution
     2. folders.py: 26 folder paths (13 unique, rest derived)
-    3. filename_policy.py: 9 suffix constants
-    4. name_builders.py: 10 name functions
-    5. path_builders.py: 13 path functions
-    6. discovery.py: 14 discovery functions
+    3. filename_policy.py: 12 suffix/dependency constants
+    4. name_builders.py: 11 name functions
+    5. path_builders.py: 15 path functions
+    6. discovery.py: 15 discovery functions
     7. transforms.py: 7 transform utilities
     8. report.py: 4 diagnostic functions
+    9. index.py: 2 inventory functions (presence matrix, BASE/fly index)
+    10. staleness.py: 4 staleness functions
     
-Total Exports: 87 (validated)
+Total Exports: 99 (validated)
     - 4 environment detection functions
     - 24 folder paths (1 root + 23 subfolders)
-    - 10 suffix/report constants
-    - 10 name builders
-    - 13 path builders
-    - 14 discovery functions
+    - 12 suffix/report/dependency constants
+    - 11 name builders
+    - 15 path builders
+    - 15 discovery functions
     - 7 transforms
     - 4 diagnostics
+    - 2 index
+    - 4 staleness
     - 1 backward compat alias (filename)
-    = 87 unique exports
+    = 99 unique exports
     
 Design:
     - Coordinator receives optional root override
     - Calls workers in dependency order
     - Assembles single immutable PATH dictionary
-    - Validates export count (67 expected)
+    - Validates export count (99 expected)
+
+Multi-Root:
+    federation.py builds one PATH per root via configure() and merges their
+    presence matrices (federate(); not part of the per-root PATH).
 """
 
 #%% CELL 01 — IMPORTS
@@ -53,6 +61,9 @@ from . import path_builders
 from . import discovery
 from . import transforms
 from . import report
+from . import index
+from . import staleness
+from . import federation
 
 #%% CELL 02 — USER CONSTANTS
 """
@@ -75,22 +86,24 @@ def _assemble_path(root: Optional[Path] = None) -> dict:
         root: Optional experiment root override. If None, auto-detect.
         
     Returns:
-        Dictionary with 87 path-related exports.
+        Dictionary with 99 path-related exports.
         
     Orchestration Order (respects dependencies):
         1. roots → 4 environment functions
         2. folders → 24 folder paths (needs root)
-        3. filename_policy → 10 suffix constants
-        4. name_builders → 10 name functions (needs policy)
-        5. path_builders → 13 path functions (needs folders + names)
-        6. discovery → 14 discovery functions (needs folders + policy + names + paths)
+        3. filename_policy → 12 suffix/dependency constants
+        4. name_builders → 11 name functions (needs policy)
+        5. path_builders → 15 path functions (needs folders + names)
+        6. discovery → 15 discovery functions (needs folders + policy + names + paths)
         7. transforms → 7 utilities (needs policy + names + folders)
         8. report → 4 diagnostics (needs folders + policy)
+        9. index → 2 inventory functions (needs folders + policy + transforms)
+        10. staleness → 4 staleness functions (needs folders + policy)
         
     Notes:
         - Each worker returns dict via configure()
         - Coordinator merges all dicts (no key conflicts)
-        - Final dict contains 86 raw entries + 1 alias → 87 unique exports
+        - Final dict contains 98 raw entries + 1 alias → 99 unique exports
     """
     # --- Phase 1: Root detection ---
     roots_data = roots.configure()
@@ -129,6 +142,16 @@ def _assemble_path(root: Optional[Path] = None) -> dict:
     # --- Phase 8: Diagnostic functions ---
     report_data = report.configure(folders=folders_data, policy=policy_data)
     
+    # --- Phase 9: Presence matrix + BASE/fly index ---
+    index_data = index.configure(
+        folders=folders_data,
+        policy=policy_data,
+        transforms=transforms_data,
+    )
+    
+    # --- Phase 10: Staleness detection ---
+    staleness_data = staleness.configure(folders=folders_data, policy=policy_data)
+    
     # --- Assemble final PATH dictionary ---
     path_dict = {}
     
@@ -141,16 +164,16 @@ def _assemble_path(root: Optional[Path] = None) -> dict:
     # Add folder paths (26)
     path_dict.update(folders_data)
     
-    # Add suffix policy (10: 7 suffixes + 2 reports + KNOWN_SUFFIXES tuple)
+    # Add suffix policy (12: 8 suffixes + 2 reports + KNOWN_SUFFIXES + ARTIFACT_DEPENDENCIES)
     path_dict.update(policy_data)
     
-    # Add name builders (10)
+    # Add name builders (11)
     path_dict.update(names_data)
     
-    # Add path builders (13)
+    # Add path builders (15)
     path_dict.update(paths_data)
     
-    # Add discovery functions (14)
+    # Add discovery functions (15)
     path_dict.update(discovery_data)
     
     # Add transform utilities (7)
@@ -159,6 +182,12 @@ def _assemble_path(root: Optional[Path] = None) -> dict:
     # Add diagnostic functions (4)
     path_dict.update(report_data)
     
+    # Add presence matrix + BASE/fly index (2)
+    path_dict.update(index_data)
+    
+    # Add staleness detection (4)
+    path_dict.update(staleness_data)
+    
     # Add backward compatibility alias
     path_dict["filename"] = names_data["stem_without_suffix"]  # Legacy alias
     
@@ -178,21 +207,23 @@ def configure(root: Optional[Path] = None) -> MappingProxyType:
                   - Jupyter/Local: {cwd}/Experiments
                   
     Returns:
-        MappingProxyType with 87 path-related exports (immutable).
+        MappingProxyType with 99 path-related exports (immutable).
         
     Export Categories:
         - Environment detection: 4 functions
         - Folders: 24 paths
-        - Suffix policy: 10 constants
-        - Name builders: 10 functions
-        - Path builders: 13 functions
-        - Discovery: 14 functions
+        - Suffix policy: 12 constants
+        - Name builders: 11 functions
+        - Path builders: 15 functions
+        - Discovery: 15 functions
         - Transforms: 7 functions
         - Diagnostics: 4 functions
+        - Index: 2 functions
+        - Staleness: 4 functions
         - Backward compat: 1 alias (filename)
         
     Validation:
-        Asserts 87 exports present (all workers + backward compat).
+        Asserts 99 exports present (all workers + backward compat).
         
     Notes:
         - Immutable (MappingProxyType prevents modification)
@@ -212,10 +243,11 @@ def configure(root: Optional[Path] = None) -> MappingProxyType:
     """
     path_dict = _assemble_path(root=root)
     
-    # Validation: Expect 87 total exports
-    # 4 env + 24 folders + 10 policy + 10 names + 13 paths + 14 discovery + 7 transforms + 4 diagnostics + 1 alias
-    # = 4 + 24 + 10 + 10 + 13 + 14 + 7 + 4 + 1 = 87
-    expected_count = 87
+    # Validation: Expect 99 total exports
+    # 4 env + 24 folders + 12 policy + 11 names + 15 paths + 15 discovery + 7 transforms + 4 diagnostics
+    # + 2 index + 4 staleness + 1 alias
+    # = 4 + 24 + 12 + 11 + 15 + 15 + 7 + 4 + 2 + 4 + 1 = 99
+    expected_count = 99
     actual_count = len(path_dict)
     
     assert actual_count == expected_count, (
@@ -227,6 +259,11 @@ def configure(root: Optional[Path] = None) -> MappingProxyType:
     return MappingProxyType(path_dict)
 
 
-#%% CELL 05 — EXPORTS
+#%% CELL 05 — FEDERATION
+
+# Multi-root discovery (one PATH per root, built with configure above)
+federate = federation.configure(build_path=lambda root: configure(root=root))["federate"]
+
+#%% CELL 06 — EXPORTS
 
-__all__ = ["configure"]
+__all__ = ["configure", "federate"]
@@ -8,12 +8,13 @@ Glob-based discovery for canonical artifacts (sorted, deterministic).
 Exports:
     configure(folders: dict, policy: dict, names: dict) → dict[str, callable]
     
-Discovery Functions (13 total):
-    Basic Discovery (7):
+Discovery Functions (15 total):
+    Basic Discovery (8):
         - g_tracked() → list[Path]
         - g_sleap() → list[Path]
         - g_scored() → list[Path]
         - g_pose() → list[Path]
+        - g_scored_compact() → list[Path]
         - g_arenaimg() → list[Path]
         - g_flyvideo() → list[Path]
         - g_cropvideo() → list[Path]
@@ -67,7 +68,7 @@ def _create_discovery_functions(folders: dict, policy: dict, names: dict, paths:
         paths: Dictionary with sleap_path, scored_path, etc. (from path_builders.py).
         
     Returns:
-        Dictionary with 14 discovery functions.
+        Dictionary with 15 discovery functions.
         
     Notes:
         - Uses closures to capture folder paths and suffixes
@@ -95,6 +96,7 @@ def _create_discovery_functions(folders: dict, policy: dict, names: dict, paths:
     SUFFIX_ARENAIMG = policy["SUFFIX_ARENAIMG"]
     SUFFIX_FLYVIDEO = policy["SUFFIX_FLYVIDEO"]
     SUFFIX_CROPVIDEO = policy["SUFFIX_CROPVIDEO"]
+    SUFFIX_SCORED_COMPACT = policy["SUFFIX_SCORED_COMPACT"]
     
     # Extract name utilities
     stem_without_suffix = names["stem_without_suffix"]
@@ -122,6 +124,10 @@ def _create_discovery_functions(folders: dict, policy: dict, names: dict, paths:
         """Discover all pose files in pPose/."""
         return sorted(pPose.glob(f"*{SUFFIX_POSE}"))
     
+    def g_scored_compact() -> list[Path]:
+        """Discover compact scored files in pScored/."""
+        return sorted(pScored.glob(f"*{SUFFIX_SCORED_COMPACT}"))
+    
     def g_arenaimg() -> list[Path]:
         """Discover all arena images in pArenaImage/."""
         return sorted(pArenaImage.glob(f"*{SUFFIX_ARENAIMG}"))
@@ -192,6 +198,7 @@ def _create_discovery_functions(folders: dict, policy: dict, names: dict, paths:
             Dictionary with sibling path keys:
                 - base (str): Base stem
                 - tracked, sleap, scored, pose, arenaimg, flyvideo, cropvideo (Path)
+                - scored_compact, flag_scored_compact (Path)
                 - flag_scored, flag_pose (Path)
                 - error_tracked_copy, error_pose_copy (Callable)
                 
@@ -212,6 +219,8 @@ def _create_discovery_functions(folders: dict, policy: dict, names: dict, paths:
         cropvideo_path_fn = paths["cropvideo_path"]
         flag_scored_path_fn = paths["flag_scored_path"]
         flag_pose_path_fn = paths["flag_pose_path"]
+        scored_compact_path_fn = paths["scored_compact_path"]
+        flag_scored_compact_path_fn = paths["flag_scored_compact_path"]
         error_tracked_copy_path_fn = paths["error_tracked_copy_path"]
         error_pose_copy_path_fn = paths["error_pose_copy_path"]
         
@@ -224,8 +233,10 @@ def _create_discovery_functions(folders: dict, policy: dict, names: dict, paths:
             "arenaimg": arenaimg_path_fn(base),
             "flyvideo": flyvideo_path_fn(base),
             "cropvideo": cropvideo_path_fn(base),
+            "scored_compact": scored_compact_path_fn(base),
             "flag_scored": flag_scored_path_fn(base),
             "flag_pose": flag_pose_path_fn(base),
+            "flag_scored_compact": flag_scored_compact_path_fn(base),
             "error_tracked_copy": (lambda orig=name: error_tracked_copy_path_fn(orig)),
             "error_pose_copy": (lambda orig=name: error_pose_copy_path_fn(orig)),
         }
@@ -235,6 +246,7 @@ def _create_discovery_functions(folders: dict, policy: dict, names: dict, paths:
         "g_sleap": g_sleap,
         "g_scored": g_scored,
         "g_pose": g_pose,
+        "g_scored_compact": g_scored_compact,
         "g_arenaimg": g_arenaimg,
         "g_flyvideo": g_flyvideo,
         "g_cropvideo": g_cropvideo,
@@ -261,10 +273,10 @@ def configure(folders: dict, policy: dict, names: dict, paths: dict) -> dict[str
         paths: Dictionary with path builders (from path_builders.py).
         
     Returns:
-        Dictionary with 14 discovery functions.
+        Dictionary with 15 discovery functions.
         
     Validation:
-        Asserts 14 functions returned.
+        Asserts 15 functions returned.
         
     Notes:
         - Called by coordinator with all dependencies
@@ -274,7 +286,7 @@ def configure(folders: dict, policy: dict, names: dict, paths: dict) -> dict[str
     discovery = _create_discovery_functions(folders, policy, names, paths)
     
     # Validation
-    assert len(discovery) == 14, f"Expected 14 discovery functions, got {len(discovery)}"
+    assert len(discovery) == 15, f"Expected 15 discovery functions, got {len(discovery)}"
     
     return discovery
 
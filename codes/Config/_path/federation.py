@@ -0,0 +1,314 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+federation.py — Multi-Root Federated Discovery
+===============================================
+
+One merged, deduplicated artifact index across many experiment roots.
+
+Exports:
+    configure(build_path: Callable[[Path | None], Mapping]) → dict[str, callable]
+
+Federation Functions (1 total):
+    - federate(roots: Iterable[Path | str], max_workers: int | None = None) → FederatedIndex
+
+FederatedIndex Layout (sorted by stem):
+    - roots: tuple[Path, ...] → resolved roots in priority order (duplicates dropped)
+    - paths: tuple[Mapping, ...] → PATH of each root (configure(root=...))
+    - stems: tuple[str, ...] → union of stems over all roots
+    - columns: tuple[str, ...] → same 13 columns as presence_matrix()
+    - matrix: bool[n_stems, 13] → artifact present in any root
+    - owner: int16[n_stems, 13] → root supplying each artifact (-1 absent)
+    - membership: bool[n_stems, n_roots] → stem seen in root
+
+Federated Discovery (same names as PATH):
+    FED["g_tracked"]() ... FED["g_error_pose_copies"]()
+    FED["g_tracked_missing_sleap"](), FED["g_tracked_missing_scored"]()
+
+Notes:
+    - Roots are scanned concurrently (one presence_matrix() per root)
+    - Deduplication: an artifact found in several roots is taken from the
+      first root listed; duplicates() reports every stem seen in > 1 root
+    - Missing-output queries compare artifacts across roots
+      (tracked in root A + scored in root B → not missing)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+import numpy as np
+
+from .index import _KINDS, _QC_KINDS
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for federation.py.
+
+Why Empty?
+    Roots are call arguments; columns mirror presence_matrix() (fixed by design).
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - roots passed per call)
+
+#%% CELL 03 — FEDERATED INDEX
+
+# Column label → (folder key, suffix key), presence_matrix() order
+_COLUMNS: dict[str, tuple[str, str]] = {
+    label: (folder_key, suffix_key) for label, folder_key, suffix_key in _KINDS + _QC_KINDS
+}
+
+# Discovery name → column label
+_GLOBS: dict[str, str] = {
+    "g_tracked": "tracked",
+    "g_sleap": "sleap",
+    "g_scored": "scored",
+    "g_pose": "pose",
+    "g_arenaimg": "arenaimg",
+    "g_flyvideo": "flyvideo",
+    "g_cropvideo": "cropvideo",
+    "g_scored_compact": "scored_compact",
+    "g_flag_scored": "flag_scored",
+    "g_flag_pose": "flag_pose",
+    "g_error_tracked_copies": "error_tracked_copy",
+    "g_error_pose_copies": "error_pose_copy",
+}
+
+# Filtered discovery name → (column present, column missing)
+_MISSING: dict[str, tuple[str, str]] = {
+    "g_tracked_missing_sleap": ("tracked", "sleap"),
+    "g_tracked_missing_scored": ("tracked", "scored"),
+}
+
+
+class FederatedIndex:
+    """
+    Immutable artifact index merged over several experiment roots.
+
+    Usage:
+        FED = federate([root_a, root_b, ...])
+        FED["g_tracked"]()                  # tracked Paths over all roots
+        FED["g_tracked_missing_scored"]()    # work left anywhere
+        FED.root_of("BASE_fly1")             # where the stem came from
+    """
+
+    __slots__ = ("roots", "paths", "stems", "columns", "matrix", "owner", "membership", "stem_index")
+
+    def __init__(
+        self,
+        roots: tuple[Path, ...],
+        paths: tuple[Mapping, ...],
+        stems: tuple[str, ...],
+        columns: tuple[str, ...],
+        matrix: np.ndarray,
+        owner: np.ndarray,
+        membership: np.ndarray,
+    ) -> None:
+        for arr in (matrix, owner, membership):
+            arr.setflags(write=False)
+        self.roots = roots
+        self.paths = paths
+        self.stems = stems
+        self.columns = columns
+        self.matrix = matrix
+        self.owner = owner
+        self.membership = membership
+        self.stem_index = {s: i for i, s in enumerate(stems)}
+
+    def __len__(self) -> int:
+        return len(self.stems)
+
+    def __repr__(self) -> str:
+        return f"FederatedIndex(roots={len(self.roots)}, stems={len(self.stems)})"
+
+    # --- Discovery (PATH-compatible names) ---
+    def __getitem__(self, name: str) -> Callable[[], list[Path]]:
+        """Federated discovery function by PATH name (e.g., 'g_tracked')."""
+        if name in _GLOBS:
+            return lambda: self.files(_GLOBS[name])
+        if name in _MISSING:
+            return lambda: self.missing(*_MISSING[name])
+        raise KeyError(f"Unknown federated discovery {name!r}. Available: {self.keys()}")
+
+    def keys(self) -> list[str]:
+        return list(_GLOBS) + list(_MISSING)
+
+    def _col(self, label: str) -> int:
+        try:
+            return self.columns.index(label)
+        except ValueError:
+            raise KeyError(f"Unknown column {label!r}. Available: {self.columns}") from None
+
+    def _paths_for(self, rows: np.ndarray, label: str) -> list[Path]:
+        """Artifact Paths of `label` for rows, each taken from its owner root."""
+        folder_key, suffix_key = _COLUMNS[label]
+        j = self._col(label)
+        out = []
+        for i in rows:
+            p = self.paths[self.owner[i, j]]
+            out.append(p[folder_key] / f"{self.stems[i]}{p[suffix_key]}")
+        return sorted(out)
+
+    def files(self, label: str) -> list[Path]:
+        """
+        Artifact Paths of one column over all roots (one per stem).
+
+        Returns:
+            Sorted Paths (first listed root wins for duplicated stems).
+        """
+        return self._paths_for(np.flatnonzero(self.matrix[:, self._col(label)]), label)
+
+    def missing(self, present: str, absent: str) -> list[Path]:
+        """
+        `present` Paths whose stem lacks `absent` in every root.
+
+        Examples:
+            FED.missing("tracked", "scored")    # == FED["g_tracked_missing_scored"]()
+        """
+        m = self.matrix
+        rows = np.flatnonzero(m[:, self._col(present)] & ~m[:, self._col(absent)])
+        return self._paths_for(rows, present)
+
+    # --- Provenance ---
+    def root_of(self, stem: str, label: str | None = None) -> Path | None:
+        """
+        Root a stem (or one of its artifacts) comes from.
+
+        Args:
+            stem: Base stem.
+            label: Column label; None → first root containing the stem at all.
+        """
+        i = self.stem_index.get(stem)
+        if i is None:
+            return None
+        if label is None:
+            return self.roots[int(np.argmax(self.membership[i]))]
+        r = self.owner[i, self._col(label)]
+        return None if r < 0 else self.roots[r]
+
+    def roots_of(self, stem: str) -> tuple[Path, ...]:
+        """All roots containing `stem` (priority order)."""
+        i = self.stem_index.get(stem)
+        if i is None:
+            return ()
+        return tuple(self.roots[r] for r in np.flatnonzero(self.membership[i]))
+
+    def duplicates(self) -> dict[str, tuple[Path, ...]]:
+        """Stems seen in more than one root → those roots."""
+        rows = np.flatnonzero(self.membership.sum(axis=1) > 1)
+        return {self.stems[i]: self.roots_of(self.stems[i]) for i in rows}
+
+    def counts(self) -> dict[str, int]:
+        """Per-column totals after deduplication."""
+        return dict(zip(self.columns, self.matrix.sum(axis=0).tolist()))
+
+    def root_counts(self) -> dict[Path, int]:
+        """Stems seen per root (before deduplication)."""
+        return dict(zip(self.roots, self.membership.sum(axis=0).tolist()))
+
+
+def _merge(roots: tuple[Path, ...], paths: tuple[Mapping, ...], pms: list) -> FederatedIndex:
+    """Align per-root presence matrices on the stem union and merge."""
+    columns = pms[0].columns if pms else tuple(_COLUMNS)
+    stems = tuple(sorted({s for pm in pms for s in pm.stems}))
+    pos = {s: i for i, s in enumerate(stems)}
+
+    stack = np.zeros((len(pms), len(stems), len(columns)), dtype=bool)
+    for r, pm in enumerate(pms):
+        if pm.stems:
+            idx = np.fromiter((pos[s] for s in pm.stems), dtype=np.int64, count=len(pm.stems))
+            stack[r, idx] = pm.matrix
+
+    matrix = stack.any(axis=0)
+    first = stack.argmax(axis=0) if pms else np.zeros(matrix.shape, dtype=np.int64)
+    owner = np.where(matrix, first, -1).astype(np.int16)
+    membership = stack.any(axis=2).T.copy()
+    return FederatedIndex(roots, paths, stems, columns, matrix, owner, membership)
+
+
+#%% CELL 04 — FEDERATION FUNCTION FACTORY
+
+def _create_federation_functions(build_path: Callable[[Path | None], Mapping]) -> dict[str, Callable]:
+    """
+    Create the federation entry point.
+
+    Args:
+        build_path: Coordinator configure() (root → PATH mapping).
+
+    Returns:
+        Dictionary with 1 federation function.
+    """
+
+    def federate(roots: Iterable[Path | str], max_workers: int | None = None) -> FederatedIndex:
+        """
+        Scan many experiment roots concurrently and merge their artifacts.
+
+        Args:
+            roots: Experiment roots in priority order (resolved as by
+                   detect_experiment_root(override=...)).
+            max_workers: Concurrent root scans (default: one per root, max 32).
+
+        Returns:
+            FederatedIndex.
+
+        Examples:
+            from Config.path import federate
+            FED = federate(sorted(Path("/data").glob("Exp*")))
+            todo = FED["g_tracked_missing_scored"]()
+            FED.duplicates()
+        """
+        def scan(root: Path | str):
+            p = build_path(Path(root))
+            return p, p["presence_matrix"]()
+
+        roots = list(roots)
+        if not roots:
+            return _merge((), (), [])
+        workers = max_workers or min(32, len(roots))
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            scanned = list(pool.map(scan, roots))
+
+        # Drop roots resolving to the same folder (keep first)
+        seen: dict[Path, tuple[Mapping, object]] = {}
+        for p, pm in scanned:
+            seen.setdefault(p["pExperimentalFolder"], (p, pm))
+        ordered = list(seen.items())
+        return _merge(
+            tuple(root for root, _ in ordered),
+            tuple(p for _, (p, _) in ordered),
+            [pm for _, (_, pm) in ordered],
+        )
+
+    return {
+        "federate": federate,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(build_path: Callable[[Path | None], Mapping]) -> dict[str, Callable]:
+    """
+    Generate the federation function.
+
+    Args:
+        build_path: Coordinator configure() (root → PATH mapping).
+
+    Returns:
+        Dictionary with 1 federation function.
+
+    Validation:
+        Asserts 1 function returned.
+    """
+    functions = _create_federation_functions(build_path)
+
+    # Validation
+    assert len(functions) == 1, f"Expected 1 federation function, got {len(functions)}"
+
+    return functions
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "FederatedIndex"]
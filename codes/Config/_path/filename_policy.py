@@ -6,13 +6,14 @@ filename_policy.py — Filename Suffix Policy
 Centralize all filename suffixes used across artifacts.
 
 Exports:
-    configure() → dict[str, str | tuple[str, ...]]
+    configure() → dict[str, str | tuple[str, ...] | Mapping]
     
-Suffix Constants (8 + 1):
+Suffix Constants (10 + 2):
     - SUFFIX_TRACKED, SUFFIX_SLEAP, SUFFIX_ARENAIMG, SUFFIX_FLYVIDEO, SUFFIX_CROPVIDEO
-    - SUFFIX_SCORED, SUFFIX_POSE
+    - SUFFIX_SCORED, SUFFIX_POSE, SUFFIX_SCORED_COMPACT
     - REPORT_ERROR_NAME, REPORT_FLAG_NAME
     - KNOWN_SUFFIXES (tuple of all suffixes)
+    - ARTIFACT_DEPENDENCIES (output suffix → input suffixes)
     
 Notes:
     These suffixes are appended to base stems like 'BASE_flyN'.
@@ -22,6 +23,8 @@ Notes:
 #%% CELL 01 — IMPORTS
 
 from __future__ import annotations
+from types import MappingProxyType
+from typing import Mapping
 
 #%% CELL 02 — USER CONSTANTS
 """
@@ -46,6 +49,7 @@ SUFFIX_CROPVIDEO: str = "_cropvideo.avi"
 # BehaviorClassification output suffixes
 SUFFIX_SCORED: str = "_scored.csv"
 SUFFIX_POSE: str = "_pose.csv"
+SUFFIX_SCORED_COMPACT: str = "_scored.npz"   # optional compact twin of *_scored.csv (float32 + RLE labels)
 
 # Report filenames (fixed CSV names)
 REPORT_ERROR_NAME: str = "REPORT_ERROR.csv"
@@ -60,30 +64,42 @@ KNOWN_SUFFIXES: tuple[str, ...] = (
     SUFFIX_CROPVIDEO,
     SUFFIX_SCORED,
     SUFFIX_POSE,
+    SUFFIX_SCORED_COMPACT,
 )
 
+# Build dependency rules (output suffix → input suffixes it is derived from).
+# An output is out of date when any of its inputs changed after it was written.
+ARTIFACT_DEPENDENCIES: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    SUFFIX_SCORED: (SUFFIX_TRACKED, SUFFIX_SLEAP),
+    SUFFIX_POSE: (SUFFIX_TRACKED, SUFFIX_SLEAP),
+    SUFFIX_SCORED_COMPACT: (SUFFIX_TRACKED, SUFFIX_SLEAP),
+})
+
 
 #%% CELL 04 — CONFIGURE
 
-def configure() -> dict[str, str | tuple[str, ...]]:
+def configure() -> dict[str, str | tuple[str, ...] | Mapping]:
     """
     Export filename suffix policy.
     
     Returns:
-        Dictionary with 9 suffix policy entries.
+        Dictionary with 12 suffix policy entries.
         
     Keys:
         - SUFFIX_TRACKED, SUFFIX_SLEAP, SUFFIX_ARENAIMG, SUFFIX_FLYVIDEO, SUFFIX_CROPVIDEO
-        - SUFFIX_SCORED, SUFFIX_POSE
+        - SUFFIX_SCORED, SUFFIX_POSE, SUFFIX_SCORED_COMPACT
         - REPORT_ERROR_NAME, REPORT_FLAG_NAME
         - KNOWN_SUFFIXES
+        - ARTIFACT_DEPENDENCIES
         
     Validation:
-        Asserts 9 entries and 7 items in KNOWN_SUFFIXES.
+        Asserts 12 entries, 8 items in KNOWN_SUFFIXES, and dependency
+        rules that only reference known suffixes.
         
     Notes:
         - Returns dict (not MappingProxyType) for coordinator assembly
         - KNOWN_SUFFIXES tuple used by stem_without_suffix and discovery functions
+        - ARTIFACT_DEPENDENCIES used by staleness checks
     """
     policy = {
         "SUFFIX_TRACKED": SUFFIX_TRACKED,
@@ -93,14 +109,20 @@ def configure() -> dict[str, str | tuple[str, ...]]:
         "SUFFIX_CROPVIDEO": SUFFIX_CROPVIDEO,
         "SUFFIX_SCORED": SUFFIX_SCORED,
         "SUFFIX_POSE": SUFFIX_POSE,
+        "SUFFIX_SCORED_COMPACT": SUFFIX_SCORED_COMPACT,
         "REPORT_ERROR_NAME": REPORT_ERROR_NAME,
         "REPORT_FLAG_NAME": REPORT_FLAG_NAME,
         "KNOWN_SUFFIXES": KNOWN_SUFFIXES,
+        "ARTIFACT_DEPENDENCIES": ARTIFACT_DEPENDENCIES,
     }
     
     # Validation
-    assert len(policy) == 10, f"Expected 10 policy entries, got {len(policy)}"
-    assert len(KNOWN_SUFFIXES) == 7, f"Expected 7 known suffixes, got {len(KNOWN_SUFFIXES)}"
+    assert len(policy) == 12, f"Expected 12 policy entries, got {len(policy)}"
+    assert len(KNOWN_SUFFIXES) == 8, f"Expected 8 known suffixes, got {len(KNOWN_SUFFIXES)}"
+    for out, deps in ARTIFACT_DEPENDENCIES.items():
+        assert out in KNOWN_SUFFIXES and set(deps) <= set(KNOWN_SUFFIXES), (
+            f"Dependency rule references unknown suffix: {out} ← {deps}"
+        )
     
     return policy
 
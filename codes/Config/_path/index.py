@@ -0,0 +1,479 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+index.py — Artifact Presence & BASE/Fly Index
+==============================================
+
+Experiment-wide artifact inventory from one scan (NumPy arrays).
+
+Exports:
+    configure(folders: dict, policy: dict, transforms: dict) → dict[str, callable]
+
+Index Functions (2 total):
+    - presence_matrix() → PresenceMatrix
+    - fly_index() → FlyIndex
+
+PresenceMatrix Layout (sorted by stem):
+    - matrix: bool[n_stems, 13] → stem has artifact in column location
+    - stems: tuple[str, ...] → row labels
+    - columns: tuple[str, ...] → 8 KNOWN_SUFFIXES kinds + 3 Flag + 2 Error
+    - stem_index: dict[str, int] → row lookup
+
+FlyIndex Layout (CSR-style, sorted by BASE then fly number):
+    - bases: tuple[str, ...] → one entry per BASE recording
+    - offsets: int64[n_bases + 1] → rows of BASE i are offsets[i]:offsets[i + 1]
+    - stems: tuple[str, ...] → stem of each row ('BASE_flyN')
+    - flies: int32[n_rows] → fly number per row (-1 when stem has no '_flyN')
+    - masks: uint16[n_rows] → artifact presence bitmask (bit k ↔ kinds[k])
+    - base_all / base_any: uint16[n_bases] → AND / OR of fly masks per BASE
+
+Notes:
+    - One os.scandir() per folder (no per-stem siblings()/exists() calls)
+    - Grouping uses parse_base_fly (same rule as the rest of PATH)
+    - Read-only (same contract as discovery globs)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import os
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for index.py.
+
+Why Empty?
+    Artifact kinds mirror the filename policy (fixed by design).
+    Dependencies passed via configure() from coordinator.
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - policy-derived kinds)
+
+#%% CELL 03 — PRESENCE MATRIX
+
+# Artifact kinds in canonical folders: (label, folder key, suffix key).
+# Labels match the keys returned by siblings().
+_KINDS: tuple[tuple[str, str, str], ...] = (
+    ("tracked", "pTracked", "SUFFIX_TRACKED"),
+    ("sleap", "pSleap", "SUFFIX_SLEAP"),
+    ("arenaimg", "pArenaImage", "SUFFIX_ARENAIMG"),
+    ("flyvideo", "pFlyVideo", "SUFFIX_FLYVIDEO"),
+    ("cropvideo", "pCropVideo", "SUFFIX_CROPVIDEO"),
+    ("scored", "pScored", "SUFFIX_SCORED"),
+    ("pose", "pPose", "SUFFIX_POSE"),
+    ("scored_compact", "pScored", "SUFFIX_SCORED_COMPACT"),
+)
+
+# QC locations (Flag outputs + Error input copies).
+_QC_KINDS: tuple[tuple[str, str, str], ...] = (
+    ("flag_scored", "pFlagScored", "SUFFIX_SCORED"),
+    ("flag_pose", "pFlagPose", "SUFFIX_POSE"),
+    ("flag_scored_compact", "pFlagScored", "SUFFIX_SCORED_COMPACT"),
+    ("error_tracked_copy", "pErrorTracked", "SUFFIX_TRACKED"),
+    ("error_pose_copy", "pErrorPose", "SUFFIX_SLEAP"),
+)
+
+
+class PresenceMatrix:
+    """
+    Immutable stems × artifact-locations boolean matrix.
+
+    Attributes:
+        matrix: bool[n_stems, n_columns] (read-only).
+        stems: Row labels (sorted).
+        columns: Column labels (kind/location names).
+        stem_index: Stem → row position.
+
+    Notes:
+        - Rows cover every stem seen in any scanned location
+        - Column lookups are dict-backed (constant time)
+    """
+
+    __slots__ = ("matrix", "stems", "columns", "stem_index", "_col_pos")
+
+    def __init__(self, matrix: np.ndarray, stems: tuple[str, ...], columns: tuple[str, ...]) -> None:
+        matrix.setflags(write=False)
+        self.matrix = matrix
+        self.stems = stems
+        self.columns = columns
+        self.stem_index = {s: i for i, s in enumerate(stems)}
+        self._col_pos = {c: j for j, c in enumerate(columns)}
+
+    def __len__(self) -> int:
+        """Number of stems (rows)."""
+        return len(self.stems)
+
+    def __repr__(self) -> str:
+        return f"PresenceMatrix(stems={len(self.stems)}, columns={self.columns})"
+
+    def column(self, label: str) -> np.ndarray:
+        """Boolean column for `label` (KeyError if unknown)."""
+        return self.matrix[:, self._col_pos[label]]
+
+    def row(self, stem: str) -> dict[str, bool]:
+        """Presence of every column for `stem` (KeyError if unknown)."""
+        values = self.matrix[self.stem_index[stem]]
+        return dict(zip(self.columns, values.tolist()))
+
+    def stems_with(self, label: str) -> tuple[str, ...]:
+        """Stems that have `label`."""
+        return tuple(self.stems[i] for i in np.flatnonzero(self.column(label)))
+
+    def stems_missing(self, label: str, among: str | None = None) -> tuple[str, ...]:
+        """
+        Stems lacking `label` (optionally only those that have `among`).
+
+        Example:
+            pm.stems_missing("scored", among="tracked")  # work to do
+        """
+        hits = ~self.column(label)
+        if among is not None:
+            hits &= self.column(among)
+        return tuple(self.stems[i] for i in np.flatnonzero(hits))
+
+    def counts(self) -> dict[str, int]:
+        """File count per column (one vectorized sum)."""
+        return dict(zip(self.columns, self.matrix.sum(axis=0).tolist()))
+
+    def select(self, columns: Iterable[str]) -> "PresenceMatrix":
+        """Sub-matrix with the given columns, dropping stems with none of them."""
+        cols = tuple(columns)
+        sub = self.matrix[:, [self._col_pos[c] for c in cols]]
+        keep = np.flatnonzero(sub.any(axis=1))
+        return PresenceMatrix(
+            np.ascontiguousarray(sub[keep]),
+            tuple(self.stems[i] for i in keep),
+            cols,
+        )
+
+
+def _scan_stems(folder: Path, suffix: str) -> list[str]:
+    """
+    Return stems of `*suffix` files in `folder` with a single scandir.
+
+    Notes:
+        - Missing folder → empty list (same as glob on a missing folder)
+        - Dot-files skipped (same as glob '*' pattern)
+    """
+    cut = len(suffix)
+    try:
+        with os.scandir(folder) as it:
+            return [
+                e.name[:-cut] for e in it
+                if e.name.endswith(suffix) and not e.name.startswith(".")
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _build_presence(stems_by_kind: dict[str, list[str]]) -> PresenceMatrix:
+    """
+    Assemble a PresenceMatrix from per-kind stem lists.
+
+    Args:
+        stems_by_kind: Column label → stems found for that column.
+
+    Returns:
+        PresenceMatrix with rows sorted by stem.
+    """
+    columns = tuple(stems_by_kind)
+    stems = tuple(sorted({s for found in stems_by_kind.values() for s in found}))
+    pos = {s: i for i, s in enumerate(stems)}
+
+    # One vectorized scatter per column
+    matrix = np.zeros((len(stems), len(columns)), dtype=bool)
+    for j, found in enumerate(stems_by_kind.values()):
+        if found:
+            idx = np.fromiter((pos[s] for s in found), dtype=np.int64, count=len(found))
+            matrix[idx, j] = True
+
+    return PresenceMatrix(matrix, stems, columns)
+
+
+#%% CELL 04 — FLY INDEX
+
+
+class FlyIndex:
+    """
+    Immutable BASE → fly → artifact-presence index.
+
+    Attributes:
+        kinds: Artifact kind labels (bit k of a mask ↔ kinds[k]).
+        bases: Sorted BASE names.
+        offsets: Row offsets per BASE (length len(bases) + 1).
+        stems: Stem of each row.
+        flies: Fly number of each row (-1 when no '_flyN').
+        masks: Presence bitmask of each row.
+        base_all: Bitwise AND of fly masks per BASE (kinds every fly has).
+        base_any: Bitwise OR of fly masks per BASE (kinds any fly has).
+
+    Notes:
+        - Arrays are read-only views (treat index as a snapshot)
+        - BASE lookups are dict-backed (constant time)
+    """
+
+    __slots__ = (
+        "kinds", "bases", "offsets", "stems", "flies", "masks",
+        "base_all", "base_any", "_base_pos", "_kind_bit",
+    )
+
+    def __init__(
+        self,
+        kinds: tuple[str, ...],
+        bases: tuple[str, ...],
+        offsets: np.ndarray,
+        stems: tuple[str, ...],
+        flies: np.ndarray,
+        masks: np.ndarray,
+    ) -> None:
+        for arr in (offsets, flies, masks):
+            arr.setflags(write=False)
+        self.kinds = kinds
+        self.bases = bases
+        self.offsets = offsets
+        self.stems = stems
+        self.flies = flies
+        self.masks = masks
+
+        # Per-BASE reductions (empty index → empty arrays)
+        if len(bases):
+            starts = offsets[:-1]
+            self.base_all = np.bitwise_and.reduceat(masks, starts).astype(np.uint16)
+            self.base_any = np.bitwise_or.reduceat(masks, starts).astype(np.uint16)
+        else:
+            self.base_all = np.zeros(0, dtype=np.uint16)
+            self.base_any = np.zeros(0, dtype=np.uint16)
+        self.base_all.setflags(write=False)
+        self.base_any.setflags(write=False)
+
+        self._base_pos = {b: i for i, b in enumerate(bases)}
+        self._kind_bit = {k: 1 << i for i, k in enumerate(kinds)}
+
+    def __len__(self) -> int:
+        """Number of BASE recordings."""
+        return len(self.bases)
+
+    def __contains__(self, base: object) -> bool:
+        return base in self._base_pos
+
+    def __repr__(self) -> str:
+        return f"FlyIndex(bases={len(self.bases)}, flies={len(self.stems)}, kinds={self.kinds})"
+
+    def kind_mask(self, kinds: Iterable[str] | None = None) -> int:
+        """
+        Bitmask for the given kind labels (all kinds if None).
+
+        Raises:
+            KeyError: If a label is not one of `kinds`.
+        """
+        if kinds is None:
+            return (1 << len(self.kinds)) - 1
+        mask = 0
+        for k in kinds:
+            mask |= self._kind_bit[k]
+        return mask
+
+    def rows(self, base: str) -> slice:
+        """Row slice for `base` (KeyError if unknown)."""
+        i = self._base_pos[base]
+        return slice(int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def flies_of(self, base: str) -> np.ndarray:
+        """Sorted fly numbers of `base` (read-only view)."""
+        return self.flies[self.rows(base)]
+
+    def stems_of(self, base: str) -> tuple[str, ...]:
+        """Stems of `base` in fly order."""
+        return self.stems[self.rows(base)]
+
+    def masks_of(self, base: str) -> np.ndarray:
+        """Presence bitmasks of `base` in fly order (read-only view)."""
+        return self.masks[self.rows(base)]
+
+    def has(self, base: str, kind: str) -> np.ndarray:
+        """Boolean array: which flies of `base` have artifact `kind`."""
+        return (self.masks_of(base) & self._kind_bit[kind]) != 0
+
+    def incomplete_bases(self, kinds: Iterable[str] | None = None) -> tuple[str, ...]:
+        """
+        BASE recordings where some fly lacks an artifact.
+
+        Args:
+            kinds: Kind labels that every fly must have. If None, a BASE is
+                   incomplete when any kind present for one fly is missing
+                   for another (base_all != base_any).
+
+        Returns:
+            Sorted tuple of BASE names.
+        """
+        if kinds is None:
+            hits = self.base_all != self.base_any
+        else:
+            required = self.kind_mask(kinds)
+            hits = (self.base_all & required) != required
+        return tuple(self.bases[i] for i in np.flatnonzero(hits))
+
+
+def _build_fly_index(
+    presence: PresenceMatrix,
+    parse_base_fly: Callable[[str], tuple[str, int | None]],
+) -> FlyIndex:
+    """
+    Assemble a FlyIndex from a presence matrix.
+
+    Args:
+        presence: PresenceMatrix (≤ 16 columns; column k → bit k).
+        parse_base_fly: Stem parser from transforms.py.
+
+    Returns:
+        FlyIndex sorted by (BASE, fly number, stem).
+    """
+    kinds = presence.columns
+    all_stems = presence.stems
+    n = len(all_stems)
+
+    # Presence bitmask (pack boolean columns into bits)
+    weights = (1 << np.arange(len(kinds), dtype=np.uint16)).astype(np.uint16)
+    masks = (presence.matrix.astype(np.uint16) * weights).sum(axis=1, dtype=np.uint16)
+
+    # Parse BASE/fly once per stem
+    base_list: list[str] = []
+    fly_arr = np.empty(n, dtype=np.int32)
+    for i, s in enumerate(all_stems):
+        base, fly = parse_base_fly(s)
+        base_list.append(base)
+        fly_arr[i] = -1 if fly is None else fly
+
+    if n == 0:
+        return FlyIndex(kinds, (), np.zeros(1, dtype=np.int64), (),
+                        np.zeros(0, dtype=np.int32), masks)
+
+    # Sort rows by (BASE, fly, stem)
+    order = np.array(
+        sorted(range(n), key=lambda i: (base_list[i], int(fly_arr[i]), all_stems[i])),
+        dtype=np.int64,
+    )
+    sorted_bases = [base_list[i] for i in order]
+
+    # Row offsets at each BASE boundary
+    starts = [0] + [i for i in range(1, n) if sorted_bases[i] != sorted_bases[i - 1]]
+    offsets = np.array(starts + [n], dtype=np.int64)
+
+    return FlyIndex(
+        kinds=kinds,
+        bases=tuple(sorted_bases[i] for i in starts),
+        offsets=offsets,
+        stems=tuple(all_stems[i] for i in order),
+        flies=fly_arr[order],
+        masks=masks[order],
+    )
+
+
+def _create_index_functions(folders: dict, policy: dict, transforms: dict) -> dict[str, Callable]:
+    """
+    Create presence/index functions bound to folder paths and suffix policy.
+
+    Args:
+        folders: Dictionary with pTracked, pScored, etc. (from folders.py).
+        policy: Dictionary with SUFFIX_* (from filename_policy.py).
+        transforms: Dictionary with parse_base_fly (from transforms.py).
+
+    Returns:
+        Dictionary with 2 index functions.
+
+    Notes:
+        - Uses closures to capture folder paths and suffixes
+        - Results are rebuilt on each call (snapshot of the tree)
+    """
+    parse_base_fly = transforms["parse_base_fly"]
+    canonical = tuple(
+        (label, folders[folder_key], policy[suffix_key])
+        for label, folder_key, suffix_key in _KINDS
+    )
+    qc = tuple(
+        (label, folders[folder_key], policy[suffix_key])
+        for label, folder_key, suffix_key in _QC_KINDS
+    )
+
+    def _scan(sources: tuple[tuple[str, Path, str], ...]) -> PresenceMatrix:
+        """One scandir per source folder → PresenceMatrix."""
+        return _build_presence({
+            label: _scan_stems(folder, suffix)
+            for label, folder, suffix in sources
+        })
+
+    def presence_matrix() -> PresenceMatrix:
+        """
+        Build the experiment-wide artifact presence matrix.
+
+        Returns:
+            PresenceMatrix with columns tracked, sleap, arenaimg, flyvideo,
+            cropvideo, scored, pose, scored_compact, flag_scored, flag_pose,
+            flag_scored_compact, error_tracked_copy, error_pose_copy.
+
+        Examples:
+            pm = PATH["presence_matrix"]()
+            pm.counts()                              # dashboard totals
+            pm.stems_missing("scored", among="tracked")
+            pm.row("BASE_fly1")["flag_scored"]
+        """
+        return _scan(canonical + qc)
+
+    def fly_index() -> FlyIndex:
+        """
+        Build the BASE/fly grouping index from one scan of canonical folders.
+
+        Returns:
+            FlyIndex with presence bits for tracked, sleap, arenaimg,
+            flyvideo, cropvideo, scored, pose, scored_compact (in that
+            bit order).
+
+        Examples:
+            idx = PATH["fly_index"]()
+            idx.flies_of("BASE")                    # → array([1, 2, 3], dtype=int32)
+            idx.incomplete_bases(["tracked", "sleap"])
+        """
+        return _build_fly_index(_scan(canonical), parse_base_fly)
+
+    return {
+        "presence_matrix": presence_matrix,
+        "fly_index": fly_index,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(folders: dict, policy: dict, transforms: dict) -> dict[str, Callable]:
+    """
+    Generate index functions from folders, policy, and transforms.
+
+    Args:
+        folders: Dictionary with pTracked, pScored, etc. (from folders.py).
+        policy: Dictionary with SUFFIX_* (from filename_policy.py).
+        transforms: Dictionary with parse_base_fly (from transforms.py).
+
+    Returns:
+        Dictionary with 2 index functions.
+
+    Validation:
+        Asserts 2 functions returned.
+
+    Notes:
+        - Called by coordinator after transforms (needs parse_base_fly)
+        - Returns dict (not MappingProxyType) for coordinator assembly
+    """
+    index = _create_index_functions(folders, policy, transforms)
+
+    # Validation
+    assert len(index) == 2, f"Expected 2 index functions, got {len(index)}"
+
+    return index
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure", "FlyIndex", "PresenceMatrix"]
+
@@ -8,12 +8,13 @@ Build filenames following suffix policy (strings only, no Paths).
 Exports:
     configure(policy: dict) → dict[str, callable]
     
-Name Builders (10 total):
+Name Builders (11 total):
     - stem_without_suffix(filename: str) → str
     - tracked_name(base: str) → str
     - sleap_name(base: str) → str
     - scored_name(base: str) → str
     - pose_name(base: str) → str
+    - scored_compact_name(base: str) → str
     - arenaimg_name(base: str) → str
     - flyvideo_name(base: str) → str
     - cropvideo_name(base: str) → str
@@ -53,7 +54,7 @@ def _create_name_builders(policy: dict) -> dict[str, Callable]:
         policy: Dictionary with SUFFIX_* and REPORT_* keys.
         
     Returns:
-        Dictionary with 10 name builder functions.
+        Dictionary with 11 name builder functions.
         
     Notes:
         - Uses closures to capture policy suffixes
@@ -68,6 +69,7 @@ def _create_name_builders(policy: dict) -> dict[str, Callable]:
     SUFFIX_CROPVIDEO = policy["SUFFIX_CROPVIDEO"]
     SUFFIX_SCORED = policy["SUFFIX_SCORED"]
     SUFFIX_POSE = policy["SUFFIX_POSE"]
+    SUFFIX_SCORED_COMPACT = policy["SUFFIX_SCORED_COMPACT"]
     REPORT_ERROR_NAME = policy["REPORT_ERROR_NAME"]
     REPORT_FLAG_NAME = policy["REPORT_FLAG_NAME"]
     KNOWN_SUFFIXES = policy["KNOWN_SUFFIXES"]
@@ -110,6 +112,10 @@ def _create_name_builders(policy: dict) -> dict[str, Callable]:
         """Build pose filename: base + '_pose.csv'"""
         return f"{base}{SUFFIX_POSE}"
     
+    def scored_compact_name(base: str) -> str:
+        """Build compact scored filename: base + '_scored.npz'"""
+        return f"{base}{SUFFIX_SCORED_COMPACT}"
+    
     def arenaimg_name(base: str) -> str:
         """Build arena image filename: base + '_arenaimg.png'"""
         return f"{base}{SUFFIX_ARENAIMG}"
@@ -137,6 +143,7 @@ def _create_name_builders(policy: dict) -> dict[str, Callable]:
         "sleap_name": sleap_name,
         "scored_name": scored_name,
         "pose_name": pose_name,
+        "scored_compact_name": scored_compact_name,
         "arenaimg_name": arenaimg_name,
         "flyvideo_name": flyvideo_name,
         "cropvideo_name": cropvideo_name,
@@ -155,10 +162,10 @@ def configure(policy: dict) -> dict[str, Callable]:
         policy: Dictionary with SUFFIX_* and REPORT_* keys (from filename_policy).
         
     Returns:
-        Dictionary with 10 name builder functions.
+        Dictionary with 11 name builder functions.
         
     Validation:
-        Asserts 10 functions returned.
+        Asserts 11 functions returned.
         
     Notes:
         - Called by coordinator with policy from filename_policy
@@ -168,7 +175,7 @@ def configure(policy: dict) -> dict[str, Callable]:
     builders = _create_name_builders(policy)
     
     # Validation
-    assert len(builders) == 10, f"Expected 10 name builders, got {len(builders)}"
+    assert len(builders) == 11, f"Expected 11 name builders, got {len(builders)}"
     
     return builders
 
@@ -8,11 +8,12 @@ Build canonical Paths by combining folder locations with filenames.
 Exports:
     configure(folders: dict, names: dict) → dict[str, callable]
     
-Path Builders (10 total):
+Path Builders (15 total):
     - tracked_path(base: str) → Path
     - sleap_path(base: str) → Path
     - scored_path(base: str) → Path
     - pose_path(base: str) → Path
+    - scored_compact_path(base: str) → Path
     - arenaimg_path(base: str) → Path
     - flyvideo_path(base: str) → Path
     - cropvideo_path(base: str) → Path
@@ -20,6 +21,7 @@ Path Builders (10 total):
     - report_flag_path() → Path
     - flag_scored_path(base: str) → Path
     - flag_pose_path(base: str) → Path
+    - flag_scored_compact_path(base: str) → Path
     - error_tracked_copy_path(original_filename: str) → Path
     - error_pose_copy_path(original_filename: str) → Path
     
@@ -57,7 +59,7 @@ def _create_path_builders(folders: dict, names: dict) -> dict[str, Callable]:
         names: Dictionary with tracked_name, scored_name, etc. (from name_builders.py).
         
     Returns:
-        Dictionary with 13 path builder functions.
+        Dictionary with 15 path builder functions.
         
     Notes:
         - Uses closures to capture folder paths and name functions
@@ -84,6 +86,7 @@ def _create_path_builders(folders: dict, names: dict) -> dict[str, Callable]:
     sleap_name = names["sleap_name"]
     scored_name = names["scored_name"]
     pose_name = names["pose_name"]
+    scored_compact_name = names["scored_compact_name"]
     arenaimg_name = names["arenaimg_name"]
     flyvideo_name = names["flyvideo_name"]
     cropvideo_name = names["cropvideo_name"]
@@ -107,6 +110,10 @@ def _create_path_builders(folders: dict, names: dict) -> dict[str, Callable]:
         """Canonical path for pose file: pPose / BASE_flyN_pose.csv"""
         return pPose / pose_name(base)
     
+    def scored_compact_path(base: str) -> Path:
+        """Canonical path for compact scored file: pScored / BASE_flyN_scored.npz"""
+        return pScored / scored_compact_name(base)
+    
     def arenaimg_path(base: str) -> Path:
         """Canonical path for arena image: pArenaImage / BASE_flyN_arenaimg.png"""
         return pArenaImage / arenaimg_name(base)
@@ -137,6 +144,10 @@ def _create_path_builders(folders: dict, names: dict) -> dict[str, Callable]:
         """Canonical path for flagged pose file: pFlagPose / BASE_flyN_pose.csv"""
         return pFlagPose / pose_name(base)
     
+    def flag_scored_compact_path(base: str) -> Path:
+        """Canonical path for flagged compact scored file: pFlagScored / BASE_flyN_scored.npz"""
+        return pFlagScored / scored_compact_name(base)
+    
     # --- Error input copy path builders ---
     def error_tracked_copy_path(original_filename: str) -> Path:
         """
@@ -167,6 +178,7 @@ def _create_path_builders(folders: dict, names: dict) -> dict[str, Callable]:
         "sleap_path": sleap_path,
         "scored_path": scored_path,
         "pose_path": pose_path,
+        "scored_compact_path": scored_compact_path,
         "arenaimg_path": arenaimg_path,
         "flyvideo_path": flyvideo_path,
         "cropvideo_path": cropvideo_path,
@@ -174,6 +186,7 @@ def _create_path_builders(folders: dict, names: dict) -> dict[str, Callable]:
         "report_flag_path": report_flag_path,
         "flag_scored_path": flag_scored_path,
         "flag_pose_path": flag_pose_path,
+        "flag_scored_compact_path": flag_scored_compact_path,
         "error_tracked_copy_path": error_tracked_copy_path,
         "error_pose_copy_path": error_pose_copy_path,
     }
@@ -190,10 +203,10 @@ def configure(folders: dict, names: dict) -> dict[str, Callable]:
         names: Dictionary with tracked_name, scored_name, etc. (from name_builders.py).
         
     Returns:
-        Dictionary with 13 path builder functions.
+        Dictionary with 15 path builder functions.
         
     Validation:
-        Asserts 13 functions returned.
+        Asserts 15 functions returned.
         
     Notes:
         - Called by coordinator with folders + names
@@ -203,7 +216,7 @@ def configure(folders: dict, names: dict) -> dict[str, Callable]:
     builders = _create_path_builders(folders, names)
     
     # Validation
-    assert len(builders) == 13, f"Expected 13 path builders, got {len(builders)}"
+    assert len(builders) == 15, f"Expected 15 path builders, got {len(builders)}"
     
     return builders
 
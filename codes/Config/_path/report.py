@@ -88,6 +88,7 @@ def _create_diagnostic_functions(folders: dict, policy: dict) -> dict[str, Calla
     SUFFIX_CROPVIDEO = policy["SUFFIX_CROPVIDEO"]
     SUFFIX_SCORED = policy["SUFFIX_SCORED"]
     SUFFIX_POSE = policy["SUFFIX_POSE"]
+    SUFFIX_SCORED_COMPACT = policy["SUFFIX_SCORED_COMPACT"]
     
     # --- Helper: Check existence ---
     def _exists_all(paths: Iterable[Path]) -> list[Path]:
@@ -133,6 +134,7 @@ def _create_diagnostic_functions(folders: dict, policy: dict) -> dict[str, Calla
             "CropVideo": len(list(pCropVideo.glob(f"*{SUFFIX_CROPVIDEO}"))) if pCropVideo.exists() else 0,
             "Scored": len(list(pScored.glob(f"*{SUFFIX_SCORED}"))) if pScored.exists() else 0,
             "Pose": len(list(pPose.glob(f"*{SUFFIX_POSE}"))) if pPose.exists() else 0,
+            "Scored/Compact": len(list(pScored.glob(f"*{SUFFIX_SCORED_COMPACT}"))) if pScored.exists() else 0,
             "Flag/Scored": len(list(pFlagScored.glob(f"*{SUFFIX_SCORED}"))) if pFlagScored.exists() else 0,
             "Flag/Pose": len(list(pFlagPose.glob(f"*{SUFFIX_POSE}"))) if pFlagPose.exists() else 0,
             "Error/Tracked": len(list(pErrorTracked.glob(f"*{SUFFIX_TRACKED}"))) if pErrorTracked.exists() else 0,
@@ -164,6 +166,7 @@ def _create_diagnostic_functions(folders: dict, policy: dict) -> dict[str, Calla
             "Sleap": _names(pSleap, f"*{SUFFIX_SLEAP}"),
             "Scored": _names(pScored, f"*{SUFFIX_SCORED}"),
             "Pose": _names(pPose, f"*{SUFFIX_POSE}"),
+            "Scored/Compact": _names(pScored, f"*{SUFFIX_SCORED_COMPACT}"),
             "ArenaImage": _names(pArenaImage, f"*{SUFFIX_ARENAIMG}"),
             "FlyVideo": _names(pFlyVideo, f"*{SUFFIX_FLYVIDEO}"),
             "CropVideo": _names(pCropVideo, f"*{SUFFIX_CROPVIDEO}"),
@@ -0,0 +1,357 @@
+#%% CELL 00 — HEADER & SCOPE
+"""
+staleness.py — Make-Style Staleness Detection
+==============================================
+
+Find outputs that are older than their inputs (ARTIFACT_DEPENDENCIES rules).
+
+Exports:
+    configure(folders: dict, policy: dict) → dict[str, callable]
+
+Staleness Functions (4 total):
+    - stale_outputs(method: str = "mtime", digests: Mapping | None = None) → dict[str, tuple[str, ...]]
+    - stale_stems(method: str = "mtime", digests: Mapping | None = None) → list[str]
+    - source_digests(stems: Iterable[str] | None = None) → dict[str, dict[str, str]]
+    - record_digests(stems: Iterable[str], digests: Mapping | None = None) → dict[str, dict[str, str]]
+
+Methods:
+    - "mtime": output stale if any existing input has a newer mtime
+    - "hash": output stale if any input's content digest differs from the
+              digest recorded when the output was built (the digest
+              manifest, or a caller-supplied one)
+
+Digest Manifest:
+    pBehaviorClassification/.source_digests.json   stem → {input suffix: digest}
+    - Written by record_digests (BC_SCHEDULER run_batch records every stem
+      whose tasks all finished ok / flag with unchanged inputs)
+    - Entries are merged (other stems are kept); written atomically
+    - Writers are serialised by an O_EXCL lock file ('.source_digests.json.lock'),
+      so concurrent run_batch calls on one root never drop each other's
+      entries; a lock older than _LOCK_STALE_SEC (dead writer) is removed
+    - method="hash" without digests reads it; stems never recorded are stale
+
+Notes:
+    - One os.scandir() per folder; mtimes compared as NumPy arrays
+    - Missing outputs are NOT stale (see g_tracked_missing_scored)
+    - Missing inputs are ignored (they cannot be newer than the output)
+    - Outputs are looked up in canonical and Flag folders (newest wins)
+    - Read-only except record_digests (which writes only the manifest)
+"""
+
+#%% CELL 01 — IMPORTS
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping
+
+import numpy as np
+
+#%% CELL 02 — USER CONSTANTS
+"""
+No user constants needed for staleness.py.
+
+Why Empty?
+    Dependency rules live in filename_policy.py (ARTIFACT_DEPENDENCIES).
+    Hash algorithm and chunk size are implementation details (below).
+    Pattern consistency requires CELL 02 even when empty.
+"""
+# (intentionally empty - policy-driven rules)
+
+#%% CELL 03 — SCAN HELPERS
+
+# Folders holding each suffix (suffix key → folder keys, canonical first)
+_SUFFIX_FOLDERS: dict[str, tuple[str, ...]] = {
+    "SUFFIX_TRACKED": ("pTracked",),
+    "SUFFIX_SLEAP": ("pSleap",),
+    "SUFFIX_SCORED": ("pScored", "pFlagScored"),
+    "SUFFIX_POSE": ("pPose", "pFlagPose"),
+    "SUFFIX_SCORED_COMPACT": ("pScored", "pFlagScored"),
+}
+
+# Content hashing (streamed; inputs can be hundreds of MB)
+_HASH_CHUNK_BYTES = 1 << 20
+
+# Digest manifest (under pBehaviorClassification; dot-file, hidden from discovery)
+_DIGEST_MANIFEST = ".source_digests.json"
+
+# Manifest writer lock: poll interval and age after which the holder is presumed dead
+_LOCK_POLL_SEC = 0.05
+_LOCK_STALE_SEC = 60.0
+
+
+@contextmanager
+def _exclusive(lock: Path) -> Iterator[None]:
+    """Hold `lock` (O_CREAT | O_EXCL file) for the block; waits for other holders."""
+    while True:
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            break
+        except FileExistsError:
+            try:
+                age = time.time() - lock.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if age > _LOCK_STALE_SEC:
+                lock.unlink(missing_ok=True)
+            else:
+                time.sleep(_LOCK_POLL_SEC)
+    try:
+        yield
+    finally:
+        lock.unlink(missing_ok=True)
+
+
+def _scan_mtimes(folders: tuple[Path, ...], suffix: str) -> dict[str, int]:
+    """
+    Return stem → newest mtime (ns) of `*suffix` files across `folders`.
+
+    Notes:
+        - One scandir per folder; missing folders are skipped
+        - Dot-files skipped (same as glob '*' pattern)
+    """
+    cut = len(suffix)
+    times: dict[str, int] = {}
+    for folder in folders:
+        try:
+            with os.scandir(folder) as it:
+                for e in it:
+                    name = e.name
+                    if not name.endswith(suffix) or name.startswith("."):
+                        continue
+                    stem = name[:-cut]
+                    t = e.stat().st_mtime_ns
+                    if t > times.get(stem, -1):
+                        times[stem] = t
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return times
+
+
+def _file_digest(path: Path) -> str:
+    """Stream `path` through BLAKE2b and return the hex digest."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+#%% CELL 04 — STALENESS FUNCTION FACTORY
+
+def _create_staleness_functions(folders: dict, policy: dict) -> dict[str, Callable]:
+    """
+    Create staleness functions bound to folders and dependency rules.
+
+    Args:
+        folders: Dictionary with pTracked, pScored, etc. (from folders.py).
+        policy: Dictionary with SUFFIX_* and ARTIFACT_DEPENDENCIES (from filename_policy.py).
+
+    Returns:
+        Dictionary with 4 staleness functions.
+
+    Notes:
+        - Uses closures to capture folder paths and rules
+        - Every call rescans (snapshot of the tree)
+    """
+    rules: Mapping[str, tuple[str, ...]] = policy["ARTIFACT_DEPENDENCIES"]
+
+    # Suffix string → folders holding it
+    where: dict[str, tuple[Path, ...]] = {
+        policy[key]: tuple(folders[f] for f in folder_keys)
+        for key, folder_keys in _SUFFIX_FOLDERS.items()
+    }
+    sources = tuple(dict.fromkeys(s for deps in rules.values() for s in deps))
+    manifest = folders["pBehaviorClassification"] / _DIGEST_MANIFEST
+
+    def _recorded() -> dict[str, dict[str, str]]:
+        """Digest manifest on disk ({} when absent or unreadable)."""
+        try:
+            return json.loads(manifest.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _check(method: str, digests: Mapping[str, Mapping[str, str]] | None) -> dict[str, tuple[str, ...]]:
+        """Shared implementation of stale_outputs/stale_stems."""
+        if method not in ("mtime", "hash"):
+            raise ValueError(f"Unknown staleness method {method!r} (expected 'mtime' or 'hash')")
+        if method == "hash" and digests is None:
+            digests = _recorded()
+
+        out_times = {suf: _scan_mtimes(where[suf], suf) for suf in rules}
+        stale: dict[str, list[str]] = {}
+
+        if method == "mtime":
+            src_times = {suf: _scan_mtimes(where[suf], suf) for suf in sources}
+            for out_suf, deps in rules.items():
+                stems = list(out_times[out_suf])
+                if not stems:
+                    continue
+                out = np.fromiter(out_times[out_suf].values(), dtype=np.int64, count=len(stems))
+                newest_src = np.full(len(stems), -1, dtype=np.int64)
+                for dep in deps:
+                    t = src_times[dep]
+                    np.maximum(
+                        newest_src,
+                        np.fromiter((t.get(s, -1) for s in stems), dtype=np.int64, count=len(stems)),
+                        out=newest_src,
+                    )
+                for i in np.flatnonzero(newest_src > out):
+                    stale.setdefault(stems[i], []).append(out_suf)
+        else:
+            built = {s for times in out_times.values() for s in times}
+            current = source_digests(built)
+            for out_suf, deps in rules.items():
+                for stem in out_times[out_suf]:
+                    recorded = digests.get(stem)
+                    now = current.get(stem, {})
+                    if recorded is None or any(
+                        now.get(dep) != recorded.get(dep) for dep in deps
+                    ):
+                        stale.setdefault(stem, []).append(out_suf)
+
+        return {stem: tuple(sufs) for stem, sufs in sorted(stale.items())}
+
+    def stale_outputs(
+        method: str = "mtime",
+        digests: Mapping[str, Mapping[str, str]] | None = None,
+    ) -> dict[str, tuple[str, ...]]:
+        """
+        Map each stem with out-of-date outputs to the stale output suffixes.
+
+        Args:
+            method: "mtime" (compare modification times) or "hash" (compare
+                    input digests against a recorded manifest).
+            digests: Manifest stem → {input suffix: digest} captured when the
+                     outputs were built (method="hash"; default: the digest
+                     manifest). Stems absent from it are reported stale.
+
+        Returns:
+            Sorted dict, e.g. {'BASE_fly1': ('_scored.csv', '_pose.csv')}.
+
+        Raises:
+            ValueError: Unknown method.
+        """
+        return _check(method, digests)
+
+    def stale_stems(
+        method: str = "mtime",
+        digests: Mapping[str, Mapping[str, str]] | None = None,
+    ) -> list[str]:
+        """
+        Stems whose outputs are out of date (work to redo).
+
+        Args:
+            method: "mtime" or "hash" (see stale_outputs).
+            digests: Manifest for method="hash" (see stale_outputs).
+
+        Returns:
+            Sorted list of stems.
+        """
+        return list(_check(method, digests))
+
+    def source_digests(stems: Iterable[str] | None = None) -> dict[str, dict[str, str]]:
+        """
+        Content digests of the existing inputs of each stem.
+
+        Args:
+            stems: Stems to hash (default: every stem with any input).
+
+        Returns:
+            Dict stem → {input suffix: BLAKE2b hex digest} (what
+            record_digests stores for method="hash").
+        """
+        found = {suf: _scan_mtimes(where[suf], suf) for suf in sources}
+        wanted = (
+            sorted({s for times in found.values() for s in times})
+            if stems is None else sorted(set(stems))
+        )
+        result: dict[str, dict[str, str]] = {}
+        for stem in wanted:
+            entry = {}
+            for suf in sources:
+                if stem in found[suf]:
+                    entry[suf] = _file_digest(where[suf][0] / f"{stem}{suf}")
+            result[stem] = entry
+        return result
+
+    def record_digests(
+        stems: Iterable[str],
+        digests: Mapping[str, Mapping[str, str]] | None = None,
+    ) -> dict[str, dict[str, str]]:
+        """
+        Record the input digests of freshly built stems in the manifest.
+
+        Args:
+            stems: Stems whose outputs were just published.
+            digests: Precomputed digests (default: source_digests(stems)).
+
+        Returns:
+            The entries written (stem → {input suffix: digest}).
+
+        Examples:
+            PATH["record_digests"](["BASE_fly1"])
+            PATH["stale_stems"](method="hash")
+        """
+        stems = list(stems)
+        fresh = source_digests(stems) if digests is None else {s: dict(digests[s]) for s in stems}
+        if not fresh:
+            return {}
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        with _exclusive(manifest.with_name(f"{manifest.name}.lock")):
+            merged = {**_recorded(), **fresh}
+            tmp = manifest.with_name(f"{manifest.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(merged, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, manifest)
+        return fresh
+
+    return {
+        "stale_outputs": stale_outputs,
+        "stale_stems": stale_stems,
+        "source_digests": source_digests,
+        "record_digests": record_digests,
+    }
+
+
+#%% CELL 05 — CONFIGURE
+
+def configure(folders: dict, policy: dict) -> dict[str, Callable]:
+    """
+    Generate staleness functions from folders and dependency rules.
+
+    Args:
+        folders: Dictionary with pTracked, pScored, etc. (from folders.py).
+        policy: Dictionary with SUFFIX_* and ARTIFACT_DEPENDENCIES (from filename_policy.py).
+
+    Returns:
+        Dictionary with 4 staleness functions.
+
+    Validation:
+        Asserts 4 functions returned and every rule suffix has a folder.
+
+    Notes:
+        - Called by coordinator with folders + policy
+        - Returns dict (not MappingProxyType) for coordinator assembly
+    """
+    known = {policy[key] for key in _SUFFIX_FOLDERS}
+    for out, deps in policy["ARTIFACT_DEPENDENCIES"].items():
+        assert out in known and set(deps) <= known, (
+            f"No folder mapping for dependency rule: {out} ← {deps}"
+        )
+
+    staleness = _create_staleness_functions(folders, policy)
+
+    # Validation
+    assert len(staleness) == 4, f"Expected 4 staleness functions, got {len(staleness)}"
+
+    return staleness
+
+
+#%% CELL 06 — EXPORTS
+
+__all__ = ["configure"]
+
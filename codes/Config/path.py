@@ -7,13 +7,18 @@ Canonical experiment folder map and filename API.
 
 Overview:
     - Declares experiment folder tree (26 folders)
-    - Centralizes filename suffix policy (9 constants)
-    - Provides helpers to derive related filenames (10 name builders)
-    - Provides canonical path builders (13 path builders)
-    - Glob discovery for artifacts (14 discovery functions)
+    - Centralizes filename suffix policy + dependency rules (12 constants)
+    - Provides helpers to derive related filenames (11 name builders)
+    - Provides canonical path builders (15 path builders)
+    - Glob discovery for artifacts (15 discovery functions)
     - Transform utilities (7 functions)
     - Diagnostic functions (4 functions)
-    - NO filesystem I/O except discovery globs — pure path math
+    - Artifact presence matrix + BASE/fly index (2 functions)
+    - Make-style staleness detection + source digest manifest (4 functions)
+    - Federated discovery across many roots (federate)
+    - Filesystem I/O only in discovery globs, presence / staleness scans
+      (one scandir per folder), input hashing (hash staleness) and the
+      digest manifest write (record_digests); everything else is pure path math
 
 Design:
     - Single source of truth for folder names and file suffixes
@@ -21,7 +26,7 @@ Design:
     - Controller + subpackage pattern (orchestrates _path/ workers)
     
 Architecture:
-    path.py (controller) → _path/ (coordinator) → 8 workers
+    path.py (controller) → _path/ (coordinator) → 10 workers
     
 Public API:
     Primary: PATH dictionary (immutable MappingProxyType)
@@ -43,6 +48,11 @@ Configuration:
     # Override experiment root
     from Config.path import configure
     PATH = configure(root=Path("/custom/experiment/folder"))
+    
+    # Many roots at once (meta-analysis)
+    from Config.path import federate
+    FED = federate([root_a, root_b, root_c])
+    FED["g_tracked_missing_scored"]()
 """
 
 #%% CELL 01 — IMPORTS
@@ -51,7 +61,7 @@ from __future__ import annotations
 import importlib
 from pathlib import Path
 from types import MappingProxyType
-from typing import Optional
+from typing import Iterable, Optional
 
 #%% CELL 02 — USER CONSTANTS
 """
@@ -91,7 +101,7 @@ def configure(root: Optional[Path] = None) -> MappingProxyType:
               - Jupyter/Local: {cwd}/Experiments
               
     Returns:
-        MappingProxyType with 87 path-related exports (immutable).
+        MappingProxyType with 99 path-related exports (immutable).
         
     Usage:
         # Override root
@@ -110,8 +120,36 @@ def configure(root: Optional[Path] = None) -> MappingProxyType:
     return _path.configure(root=root)
 
 
-#%% CELL 06 — EXPORTS
+#%% CELL 06 — FEDERATE FUNCTION (MULTI-ROOT)
+
+def federate(roots: Iterable[Path], max_workers: Optional[int] = None):
+    """
+    Merge artifact discovery over several experiment roots.
+    
+    Args:
+        roots: Experiment roots in priority order (each resolved as by
+               detect_experiment_root(override=...)).
+        max_workers: Concurrent root scans (default: one per root, max 32).
+              
+    Returns:
+        FederatedIndex with PATH-named discovery (FED["g_tracked"]() ...),
+        missing-output queries and per-stem root provenance.
+        
+    Usage:
+        from Config.path import federate
+        FED = federate(sorted(Path("/data").glob("Exp*")))
+        todo = FED["g_tracked_missing_scored"]()
+        FED.root_of("BASE_fly1")
+        
+    Notes:
+        - Roots scanned concurrently (one presence scan each)
+        - Stem in several roots → first listed root wins (see duplicates())
+    """
+    return _path.federate(roots, max_workers=max_workers)
+
+
+#%% CELL 07 — EXPORTS
 
-# Export PATH + configure function + all individual keys
-__all__ = ["PATH", "configure"] + list(PATH.keys())
+# Export PATH + configure/federate functions + all individual keys
+__all__ = ["PATH", "configure", "federate"] + list(PATH.keys())
 